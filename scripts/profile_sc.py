@@ -72,6 +72,83 @@ def run_write_manifest(pr, extra):
     os.remove(path)
 
 
+def run_rewrite_manifest(pr, extra):
+    import time
+
+    try:
+        repeats = int(extra)
+    except (ValueError, TypeError):
+        repeats = 50
+
+    proj = asic_demo.ASICDemo()
+
+    fd, path = tempfile.mkstemp(prefix='rewrite_manifest', suffix='.json')
+    os.close(fd)
+
+    proj.write_manifest(path)
+
+    pr.enable()
+    start = time.perf_counter()
+    for n in range(repeats):
+        # Typical update during a run
+        proj.set("metric", "errors", n, step="syn", index="0")
+        proj.set("record", "status", "success", step="syn", index="0")
+        proj.write_manifest(path)
+    write_time = time.perf_counter() - start
+    pr.disable()
+
+    os.remove(path)
+
+    print(f'write_manifest: {1000 * write_time / repeats:.3f} ms/call after updates')
+
+
+def run_compression(pr, extra):
+    import time
+    from siliconcompiler.utils.tarball import open_tarball
+
+    try:
+        size = int(extra)
+    except (ValueError, TypeError):
+        size = 256
+
+    proj = asic_demo.ASICDemo()
+
+    with tempfile.TemporaryDirectory() as d:
+        # Synthetic node outputs, size in MB, half of which compresses well
+        outputs = os.path.join(d, "outputs")
+        os.makedirs(outputs)
+        for n in range(size):
+            with open(os.path.join(outputs, f"file{n}.def"), "wb") as f:
+                f.write(os.urandom(512 * 1024))
+                f.write(f"ROW row{n} core 0 0 N DO 1 BY 1 STEP 1 0 ;\n".encode() * 10000)
+
+        pr.enable()
+        for ext in ("gz", "zst"):
+            path = os.path.join(d, f"manifest.json.{ext}")
+            start = time.perf_counter()
+            proj.write_manifest(path)
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            ASIC().read_manifest(path)
+            read_time = time.perf_counter() - start
+            print(f'manifest {ext}: write {1000 * write_time:.1f} ms, '
+                  f'read {1000 * read_time:.1f} ms, {os.path.getsize(path) / 1024:.1f} KiB')
+
+        for ext in ("tgz", "tar.zst"):
+            path = os.path.join(d, f"outputs.{ext}")
+            start = time.perf_counter()
+            with open_tarball(path, "w") as tar:
+                tar.add(outputs, arcname="outputs")
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            with open_tarball(path, "r") as tar:
+                tar.extractall(path=os.path.join(d, ext))
+            read_time = time.perf_counter() - start
+            print(f'archive {ext}: write {write_time:.3f} s, extract {read_time:.3f} s, '
+                  f'{os.path.getsize(path) / 1024 / 1024:.1f} MiB for {size} MB')
+        pr.disable()
+
+
 def run_check_filepaths(pr, extra):
     proj = asic_demo.ASICDemo()
 
@@ -82,6 +159,298 @@ def run_check_filepaths(pr, extra):
     pr.disable()
 
 
+def run_copy(pr, extra):
+    import time
+
+    try:
+        copies = int(extra)
+    except (ValueError, TypeError):
+        copies = 100
+
+    proj = asic_demo.ASICDemo()
+
+    # Set values on every key which can be set, as happens during a run
+    keys = [key for key in sorted(proj.allkeys())
+            if "default" not in key and
+            proj.get(*key, field="pernode").is_never() and
+            not proj.get(*key, field="lock")]
+    for key in keys:
+        proj.set(*key, proj.get(*key))
+
+    pr.enable()
+    start = time.perf_counter()
+    for n in range(copies):
+        proj_copy = proj.copy()
+        proj_copy.set("option", "jobname", f"job{n}")
+        proj_copy.set("record", "status", "success", step="syn", index="0")
+    copy_time = time.perf_counter() - start
+    pr.disable()
+
+    print(f'copy: {1000 * copy_time / copies:.3f} ms/call with {len(keys)} keys set')
+
+
+def run_get_set(pr, extra):
+    import time
+
+    try:
+        repeats = int(extra)
+    except (ValueError, TypeError):
+        repeats = 20
+
+    proj = asic_demo.ASICDemo()
+    keys = [key for key in sorted(proj.allkeys())
+            if "default" not in key and
+            proj.get(*key, field="pernode").is_never() and
+            not proj.get(*key, field="lock")]
+    values = [proj.get(*key) for key in keys]
+
+    pr.enable()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for key in keys:
+            proj.get(*key)
+    get_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for key, value in zip(keys, values):
+            proj.set(*key, value)
+    set_time = time.perf_counter() - start
+    pr.disable()
+
+    ops = repeats * len(keys)
+    print(f'get: {ops / get_time:.0f} calls/s, set: {ops / set_time:.0f} calls/s '
+          f'over {len(keys)} keys')
+
+
+def run_set_many(pr, extra):
+    import time
+    from siliconcompiler.schema import Journal
+
+    try:
+        count = int(extra)
+    except (ValueError, TypeError):
+        count = 100000
+
+    proj = asic_demo.ASICDemo()
+    metrics = [key for key in sorted(proj.allkeys("metric"))
+               if proj.get("metric", *key, field="type") in ("int", "float")]
+    values = [(("metric", *metrics[n % len(metrics)]), n,
+               f"step{n // (100 * len(metrics))}", str((n // len(metrics)) % 100))
+              for n in range(count)]
+
+    proj_set = proj.copy()
+    proj_set_many = proj.copy()
+    Journal.access(proj_set).start()
+    Journal.access(proj_set_many).start()
+
+    pr.enable()
+    start = time.perf_counter()
+    for keypath, value, step, index in values:
+        proj_set.set(*keypath, value, step=step, index=index)
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proj_set_many.set_many(values)
+    set_many_time = time.perf_counter() - start
+    pr.disable()
+
+    print(f'set: {set_time:.3f} s, set_many: {set_many_time:.3f} s '
+          f'for {count} per-node values ({set_time / set_many_time:.1f}x)')
+
+
+def run_normalize(pr, extra):
+    import time
+    from siliconcompiler.schema import Parameter
+    from siliconcompiler.schema.parametertype import NodeType
+
+    try:
+        count = int(extra)
+    except (ValueError, TypeError):
+        count = 100000
+
+    files = [f"rtl\\module{n % 1000}\\source{n}.v" for n in range(count)]
+    sctype = NodeType.parse("[file]")
+
+    pr.enable()
+    start = time.perf_counter()
+    NodeType.normalize(files, sctype)
+    normalize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    NodeType.normalize(files, sctype)
+    renormalize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Parameter("[file]").set(files)
+    set_time = time.perf_counter() - start
+    pr.disable()
+
+    print(f'normalize: {normalize_time:.3f} s, repeated normalize: {renormalize_time:.3f} s, '
+          f'set: {set_time:.3f} s for {count} [file] entries')
+
+
+def run_hash_files(pr, extra):
+    import hashlib
+    import time
+    from siliconcompiler.schema.filehash import FileHashCache
+
+    try:
+        size = int(extra)
+    except (ValueError, TypeError):
+        size = 10 * 1024
+
+    # Synthetic fileset of 256 MB files, size in MB
+    file_size = 256
+    block = os.urandom(1024 * 1024)
+    with tempfile.TemporaryDirectory() as d:
+        files = []
+        for n in range((size + file_size - 1) // file_size):
+            path = os.path.join(d, f"file{n}.gds")
+            with open(path, "wb") as f:
+                for _ in range(min(file_size, size - n * file_size)):
+                    f.write(block)
+            # Age the files so the hashes can be cached
+            os.utime(path, (time.time() - 10, time.time() - 10))
+            files.append(path)
+
+        pr.enable()
+        start = time.perf_counter()
+        for path in files:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(4096), b""):
+                    sha.update(chunk)
+        serial_time = time.perf_counter() - start
+
+        FileHashCache.clear()
+        with FileHashCache(os.path.join(d, "filehashes.db")) as cache:
+            start = time.perf_counter()
+            cache.hash_files(files, "sha256")
+            cold_time = time.perf_counter() - start
+
+        FileHashCache.clear()
+        with FileHashCache(os.path.join(d, "filehashes.db")) as cache:
+            start = time.perf_counter()
+            cache.hash_files(files, "sha256")
+            warm_time = time.perf_counter() - start
+        pr.disable()
+
+    print(f'4 KB serial: {serial_time:.3f} s, hash cache: {cold_time:.3f} s, '
+          f'unchanged: {1000 * warm_time:.3f} ms for {len(files)} files, {size} MB')
+
+
+def run_path_syscalls(pr, extra):
+    import collections
+    import contextlib
+    from unittest.mock import patch
+    from siliconcompiler.schema import BaseSchema, EditableSchema, Parameter
+    from siliconcompiler.schema.pathcache import PathResolutionCache
+
+    try:
+        count = int(extra)
+    except (ValueError, TypeError):
+        count = 10000
+
+    calls = collections.Counter()
+
+    @contextlib.contextmanager
+    def count_syscalls():
+        calls.clear()
+        with contextlib.ExitStack() as stack:
+            for name in ("stat", "lstat", "listdir", "scandir", "getcwd"):
+                def counted(*args, _name=name, _func=getattr(os, name), **kwargs):
+                    calls[_name] += 1
+                    return _func(*args, **kwargs)
+                stack.enter_context(patch.object(os, name, counted))
+            yield
+
+    def format_calls():
+        return f'{sum(calls.values())} ({", ".join(f"{k}: {v}" for k, v in sorted(calls.items()))})'
+
+    schema = BaseSchema()
+    EditableSchema(schema).insert("file", Parameter("[file]"))
+
+    with tempfile.TemporaryDirectory() as d:
+        collection_dir = os.path.join(d, "collected")
+        os.makedirs(collection_dir)
+        files = []
+        for n in range(count):
+            path = os.path.join(d, f"file{n}.v")
+            with open(path, "w"):
+                pass
+            files.append(path)
+        schema.set("file", files)
+
+        pr.enable()
+        with count_syscalls():
+            schema._find_files("file", collection_dir=collection_dir, cwd=d)
+        print(f'without memo: {format_calls()}')
+
+        with PathResolutionCache().active():
+            with count_syscalls():
+                schema._find_files("file", collection_dir=collection_dir, cwd=d)
+            print(f'with memo: {format_calls()}')
+
+            with count_syscalls():
+                schema._find_files("file", collection_dir=collection_dir, cwd=d)
+            print(f'with memo, repeated: {format_calls()}')
+        pr.disable()
+
+    print(f'syscalls for resolving {count} files')
+
+
+def run_allkeys(pr, extra):
+    import time
+
+    try:
+        repeats = int(extra)
+    except (ValueError, TypeError):
+        repeats = 100
+
+    proj = asic_demo.ASICDemo()
+
+    pr.enable()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        proj.allkeys()
+    allkeys_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        proj._allpathkeys()
+    pathkeys_time = time.perf_counter() - start
+    pr.disable()
+
+    print(f'allkeys: {1000 * allkeys_time / repeats:.3f} ms/call, '
+          f'path keys: {1000 * pathkeys_time / repeats:.3f} ms/call '
+          f'for {len(proj.allkeys())} keys')
+
+
+def run_memory(pr, extra):
+    import gc
+    import tracemalloc
+    from siliconcompiler.targets import freepdk45_demo
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    pr.enable()
+    design = Design("dummy")
+    design.set_topmodule("top", "rtl")
+    proj = ASIC(design)
+    freepdk45_demo(proj, place_np=8, route_np=8)
+    pr.disable()
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'Schema memory: {(current - start) / 1024 / 1024:.2f} MiB '
+          f'(peak {(peak - start) / 1024 / 1024:.2f} MiB) for {len(proj.allkeys())} keys')
+
+
 def run_asic_demo(pr, extra):
 
     pr.enable()
@@ -127,13 +496,120 @@ def run_large_flowgraph(pr, extra):
     pr.disable()
 
 
+def run_nop_flowgraph(pr, extra):
+    import time
+    from siliconcompiler.tools.builtin import nop
+
+    pool = False
+    if extra and extra.endswith(",pool"):
+        pool = True
+        extra = extra[:-len(",pool")]
+
+    try:
+        nodes = int(extra)
+    except (ValueError, TypeError):
+        nodes = 500
+
+    design = Design("dummy")
+    design.set_topmodule("top", "rtl")
+    proj = Project(design)
+    proj.add_fileset("rtl")
+
+    flow = Flowgraph("nop_flowgraph")
+    flow.node('start', nop.NOPTask())
+    for i in range(nodes - 1):
+        flow.node(step='nop', task=nop.NOPTask(), index=i)
+        flow.edge(tail='start', head='nop', head_index=i)
+
+    proj.set_flow(flow)
+    proj.set("option", "quiet", True)
+    proj.option.scheduler.set_workerpool(pool)
+
+    pr.enable()
+    start = time.perf_counter()
+    proj.run()
+    run_time = time.perf_counter() - start
+    pr.disable()
+
+    print(f'run: {run_time:.3f} s for {nodes} nodes ({1000 * run_time / nodes:.1f} ms/node)')
+
+
+def run_resume(pr, extra):
+    import glob
+    import time
+    from siliconcompiler.schema import Journal
+    from siliconcompiler.tools.builtin import nop
+
+    sidecars = True
+    if extra and extra.endswith(",manifests"):
+        sidecars = False
+        extra = extra[:-len(",manifests")]
+
+    try:
+        nodes = int(extra)
+    except (ValueError, TypeError):
+        nodes = 150
+
+    design = Design("dummy")
+    design.set_topmodule("top", "rtl")
+    proj = Project(design)
+    proj.add_fileset("rtl")
+
+    flow = Flowgraph("resume_flowgraph")
+    flow.node('start', nop.NOPTask())
+    for i in range(nodes - 1):
+        flow.node(step='nop', task=nop.NOPTask(), index=i)
+        flow.edge(tail='start', head='nop', head_index=i)
+
+    proj.set_flow(flow)
+    proj.set("option", "quiet", True)
+
+    with tempfile.TemporaryDirectory() as d:
+        # Synthetic build directory from a completed run
+        proj.set("option", "builddir", d)
+        proj.run()
+
+        if not sidecars:
+            for manifest in glob.glob(os.path.join(d, "**", "outputs", "*.pkg.json"),
+                                      recursive=True):
+                sidecar = Journal.get_sidecar_path(manifest)
+                if os.path.exists(sidecar):
+                    os.remove(sidecar)
+
+        pr.enable()
+        start = time.perf_counter()
+        proj.run()
+        resume_time = time.perf_counter() - start
+        pr.disable()
+
+    # Time spent collecting the results of the previous run, as profiled
+    collect_time = sum(
+        stats[3] for func, stats in pstats.Stats(pr).stats.items()
+        if func[2] == "__configure_collect_previous_information")
+
+    print(f'resume: {resume_time:.3f} s, collect: {collect_time:.3f} s for {nodes} '
+          f'completed nodes ({"with" if sidecars else "without"} journal sidecars)')
+
+
 if __name__ == "__main__":
     tests = {
         'read_manifest': run_read_manifest,
         'write_manifest': run_write_manifest,
+        'rewrite_manifest': run_rewrite_manifest,
         'asic_demo': run_asic_demo,
         'check_filepaths': run_check_filepaths,
+        'compression': run_compression,
+        'copy': run_copy,
+        'memory': run_memory,
+        'get_set': run_get_set,
+        'set_many': run_set_many,
+        'normalize': run_normalize,
+        'hash_files': run_hash_files,
+        'path_syscalls': run_path_syscalls,
+        'allkeys': run_allkeys,
         'large_flowgraph': run_large_flowgraph,
+        'nop_flowgraph': run_nop_flowgraph,
+        'resume': run_resume,
         'all': None
     }
 
@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 import sys
 import uuid
 
@@ -31,7 +32,7 @@ from siliconcompiler.scheduler import Scheduler, SCRuntimeError
 from siliconcompiler.utils.logging import SCColorLoggerFormatter, SCLoggerFormatter
 from siliconcompiler.utils import get_file_ext
 from siliconcompiler.utils.multiprocessing import MPManager
-from siliconcompiler.utils.paths import jobdir, workdir
+from siliconcompiler.utils.paths import jobdir, workdir, historydir
 from siliconcompiler.flows.showflow import ShowFlow
 
 
@@ -290,37 +291,6 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         """
         return Project.__name__
 
-    def _from_dict(self, manifest: Dict,
-                   keypath: Union[List[str], Tuple[str, ...]],
-                   version: Optional[Tuple[int, ...]] = None,
-                   lazyload: LazyLoad = LazyLoad.ON) \
-            -> Tuple[Set[Tuple[str, ...]], Set[Tuple[str, ...]]]:
-        """
-        Populates the project's schema from a dictionary representation.
-
-        This method is typically used during deserialization or when loading
-        a project state from a manifest. After loading the data, it ensures
-        that internal dependencies are correctly re-established.
-
-        Args:
-            manifest (dict): The dictionary containing the schema data.
-            keypath (list): The current keypath being processed (used internally
-                            for recursive loading).
-            version (str, optional): The schema version of the manifest. Defaults to None.
-
-        Returns:
-            Any: The result of the superclass's `_from_dict` method.
-        """
-        ret = super()._from_dict(manifest, keypath, version=version, lazyload=lazyload)
-
-        if not lazyload.is_enforced:
-            # Preserve logger in history
-            for history in self.getkeys("history"):
-                hist: "Project" = self.get("history", history, field="schema")
-                hist.__logger = self.__logger
-
-        return ret
-
     def add_dep(self, obj):
         """
         Adds a dependency object (e.g., a Design, Flowgraph, LibrarySchema,
@@ -593,6 +563,10 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         '''
         Returns a *mutable* reference to a historical job record as a Project object.
 
+        Job records are stored in the history directory, see :func:`.historydir`, and
+        are only read from there once they are accessed. Accessing a record whose file
+        has been removed raises a FileNotFoundError.
+
         Args:
             job (str): Name of the historical job to retrieve.
 
@@ -605,11 +579,21 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         if job not in self.getkeys("history"):
             raise KeyError(f"{job} is not a valid job")
 
-        return self.get("history", job, field="schema")
+        hist: "Project" = self.get("history", job, field="schema")
+
+        # Preserve logger in history
+        hist.__logger = self.__logger
+
+        return hist
 
     def _record_history(self):
         '''
         Copies the current project state into the history record.
+
+        The record is written into the history directory, see :func:`.historydir`,
+        under a new name each time, and the job manifests written by the scheduler
+        only reference it until it is modified. The records it replaces are removed
+        by :meth:`_remove_replaced_history`.
         '''
         job = self.get("option", "jobname")
         proj = self.copy()
@@ -625,6 +609,50 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
 
         EditableSchema(self).insert("history", job, proj, clobber=True)
 
+        try:
+            os.makedirs(historydir(self), exist_ok=True)
+            proj._write_external_manifest(
+                os.path.join(historydir(self), f"{job}-{uuid.uuid4().hex}.pkg.bin"))
+        except OSError as e:
+            self.logger.warning(f"Unable to store job {job} in the history directory, "
+                                f"it will be stored in the manifest: {e}")
+
+    def _remove_replaced_history(self):
+        '''
+        Removes the records of earlier runs of the current job from the history
+        directory, see :meth:`_record_history`, which are no longer referenced by the
+        job manifest of any job of the design.
+
+        This must be called after the job manifest of the current job is written.
+        Projects loaded from an earlier job manifest which still reference a removed
+        record raise a FileNotFoundError when the record is accessed, see :meth:`history`.
+        '''
+        job = self.get("option", "jobname")
+        directory = historydir(self)
+        record_re = re.compile(rf"{re.escape(job)}-[0-9a-f]{{32}}\.pkg\.bin")
+
+        try:
+            records = [name for name in os.listdir(directory) if record_re.fullmatch(name)]
+        except OSError:
+            return
+
+        # Job manifests reference the records relative to the job directory
+        for entry in os.scandir(os.path.dirname(directory)):
+            if not records:
+                return
+            try:
+                with open(os.path.join(entry.path, f"{self.name}.pkg.json"), "rb") as f:
+                    manifest = f.read()
+            except OSError:
+                continue
+            records = [name for name in records if name.encode() not in manifest]
+
+        for name in records:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError as e:
+                self.logger.warning(f"Unable to remove history record {name}: {e}")
+
     def __getstate__(self):
         """
         Prepares the project's state for serialization (pickling).
@@ -573,33 +573,30 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         '''
 
         # Ensure dataroots with python sources are copied
-        for key in self.__project.allkeys():
+        for key in self.__project._allpathkeys():
             if key[0] == "history":
                 continue
 
             param: Parameter = self.__project.get(*key, field=None)
-            key_type: str = param.get(field="type")
+            schema_obj = self.__project.get(*key[:-1], field="schema")
+            dataroot_objs = schema_obj._find_files_dataroot_resolvers(True)
 
-            if 'dir' in key_type or 'file' in key_type:
-                schema_obj = self.__project.get(*key[:-1], field="schema")
-                dataroot_objs = schema_obj._find_files_dataroot_resolvers(True)
-
-                for value, step, index in param.getvalues():
-                    if not value:
+            for value, step, index in param.getvalues():
+                if not value:
+                    continue
+                dataroots = param.get(field='dataroot', step=step, index=index)
+                if not isinstance(dataroots, list):
+                    dataroots = [dataroots]
+                force_copy = False
+                for dataroot in dataroots:
+                    if not dataroot:
                         continue
-                    dataroots = param.get(field='dataroot', step=step, index=index)
-                    if not isinstance(dataroots, list):
-                        dataroots = [dataroots]
-                    force_copy = False
-                    for dataroot in dataroots:
-                        if not dataroot:
-                            continue
-                        dataroot_resolver = dataroot_objs.get(dataroot, None)
-                        if isinstance(dataroot_resolver,
-                                      (PythonPathResolver, FileResolver, KeyPathResolver)):
-                            force_copy = True
-                    if force_copy:
-                        self.__project.set(*key, True, field='copy', step=step, index=index)
+                    dataroot_resolver = dataroot_objs.get(dataroot, None)
+                    if isinstance(dataroot_resolver,
+                                  (PythonPathResolver, FileResolver, KeyPathResolver)):
+                        force_copy = True
+                if force_copy:
+                    self.__project.set(*key, True, field='copy', step=step, index=index)
 
         # Collect inputs into a collection directory only for remote runs, since
         # we need to send inputs up to the server.
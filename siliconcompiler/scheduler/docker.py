@@ -66,28 +66,27 @@ def get_volumes_directories(project, cache_dir, workdir, step, index):
     """
     all_dirs = set()
     # Collect files
-    for key in project.allkeys():
+    for key in project._allpathkeys():
         sc_type = project.get(*key, field='type')
 
-        if 'file' in sc_type or 'dir' in sc_type:
-            cstep = step
-            cindex = index
-
-            if project.get(*key, field='pernode').is_never():
-                cstep = None
-                cindex = None
-
-            files = project.find_files(*key, step=cstep, index=cindex, missing_ok=True)
-            if files:
-                if not isinstance(files, list):
-                    files = [files]
-                for path in files:
-                    if path is None:
-                        continue
-                    if 'file' in sc_type:
-                        all_dirs.add(os.path.dirname(path))
-                    else:
-                        all_dirs.add(path)
+        cstep = step
+        cindex = index
+
+        if project.get(*key, field='pernode').is_never():
+            cstep = None
+            cindex = None
+
+        files = project.find_files(*key, step=cstep, index=cindex, missing_ok=True)
+        if files:
+            if not isinstance(files, list):
+                files = [files]
+            for path in files:
+                if path is None:
+                    continue
+                if 'file' in sc_type:
+                    all_dirs.add(os.path.dirname(path))
+                else:
+                    all_dirs.add(path)
 
     # Collect caches
     # for resolver in project.get('package', field="schema").get_resolvers().values():
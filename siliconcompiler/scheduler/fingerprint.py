@@ -0,0 +1,194 @@
+import hashlib
+import os
+import sqlite3
+
+try:
+    import orjson as json
+    _has_orjson = True
+except ModuleNotFoundError:
+    import json
+    _has_orjson = False
+
+from typing import Any, Dict, List, Optional
+
+import os.path
+
+
+class NodeFingerprints:
+    """
+    Store of the fingerprints of the nodes in a job directory.
+
+    A fingerprint records the information :meth:`SchedulerNode.requires_run` needs
+    from the input and output manifests of a previous run, such as the status of
+    the node, the tool and task, and digests of the values of the keys which
+    trigger a rerun. Each fingerprint is tied to the stats of the manifests it was
+    created from, so it is only used while those manifests are unchanged.
+
+    The fingerprints are stored in an sqlite database in the job directory,
+    errors accessing the database are ignored and the node is checked against
+    its manifests instead.
+
+    Args:
+        path (str): path to the database.
+    """
+
+    __TIMEOUT = 30
+
+    def __init__(self, path: str):
+        self.__path = path
+
+    @property
+    def path(self) -> str:
+        """str: path to the database."""
+        return self.__path
+
+    @staticmethod
+    def get_path(jobdir: str) -> str:
+        """
+        Returns the path to the fingerprint database of a job directory.
+
+        Args:
+            jobdir (str): path to the job directory.
+        """
+        return os.path.join(jobdir, "sc_fingerprints.db")
+
+    def __connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.__path, timeout=NodeFingerprints.__TIMEOUT)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "step TEXT NOT NULL, "
+            "idx TEXT NOT NULL, "
+            "manifests TEXT NOT NULL, "
+            "fingerprint BLOB NOT NULL, "
+            "PRIMARY KEY (step, idx))")
+        return conn
+
+    @staticmethod
+    def __dumps(value: Any) -> bytes:
+        if _has_orjson:
+            return json.dumps(value)
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def get(self, step: str, index: str, manifests: List[Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the fingerprint of a node, or None if the node does not have a
+        fingerprint for the manifests.
+
+        Args:
+            step (str): step name.
+            index (str): index.
+            manifests (list): stats of the manifests, see :meth:`get_stats`.
+        """
+        if not os.path.exists(self.__path):
+            return None
+
+        try:
+            conn = self.__connect()
+            try:
+                row = conn.execute(
+                    "SELECT manifests, fingerprint FROM fingerprints "
+                    "WHERE step = ? AND idx = ?", (step, index)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+        if row is None or row[0] != NodeFingerprints.__dumps(manifests).decode("utf-8"):
+            return None
+
+        try:
+            return json.loads(row[1])
+        except ValueError:
+            return None
+
+    def set(self, step: str, index: str, manifests: List[Any],
+            fingerprint: Dict[str, Any]) -> None:
+        """
+        Records the fingerprint of a node.
+
+        Args:
+            step (str): step name.
+            index (str): index.
+            manifests (list): stats of the manifests the fingerprint was created
+                from, see :meth:`get_stats`.
+            fingerprint (dict): fingerprint.
+        """
+        try:
+            conn = self.__connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)",
+                        (step, index, NodeFingerprints.__dumps(manifests).decode("utf-8"),
+                         NodeFingerprints.__dumps(fingerprint)))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    def remove(self, step: str, index: str) -> None:
+        """
+        Removes the fingerprint of a node.
+
+        Args:
+            step (str): step name.
+            index (str): index.
+        """
+        if not os.path.exists(self.__path):
+            return
+
+        try:
+            conn = self.__connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM fingerprints WHERE step = ? AND idx = ?",
+                                 (step, index))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def get_stats(paths: List[Optional[str]]) -> Optional[List[List[Any]]]:
+        """
+        Returns the path, modification time, and size of the paths, including the
+        contents of directories, or None if a path is missing.
+
+        Args:
+            paths (list of str): paths to stat.
+        """
+        stats = []
+        for path in paths:
+            if path is None:
+                return None
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            stats.append([path, stat.st_mtime_ns, stat.st_size])
+            if os.path.isdir(path):
+                for path_root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    for name in sorted(dirs + files):
+                        sub_path = os.path.join(path_root, name)
+                        try:
+                            stat = os.stat(sub_path)
+                        except OSError:
+                            return None
+                        stats.append([sub_path, stat.st_mtime_ns, stat.st_size])
+        return stats
+
+    @staticmethod
+    def digest(value: Any) -> str:
+        """
+        Returns the digest of a schema value.
+
+        Args:
+            value: value to digest.
+        """
+        if _has_orjson:
+            data = json.dumps(value, default=repr,
+                              option=json.OPT_SORT_KEYS | json.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(value, default=repr, sort_keys=True).encode("utf-8")
+        return hashlib.sha1(data).hexdigest()
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import uuid
+
+import os.path
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from siliconcompiler import utils
+from siliconcompiler.schema.filehash import FileHashCache
+
+
+class NodeCache:
+    """
+    Content-addressed cache of node results shared between jobs and build directories.
+
+    Each entry is stored under the key of the node, see :meth:`SchedulerNode.get_cache_key`,
+    and holds the files of the node along with an information file, such as the
+    metrics of the node and the digests of the files. Files are copied into the
+    cache and made read-only, and are hard linked out of the cache when possible,
+    otherwise they are copied. The digests are verified before an entry is
+    restored, and entries with modified files are removed.
+
+    Entries are inserted by renaming a completed entry into place, so concurrent
+    jobs never see partial entries, and the least recently used entries are
+    removed once the cache exceeds its maximum size.
+
+    Args:
+        path (str): path to the cache.
+        maxsize (int): maximum size of the cache in bytes, None for no limit.
+        hash_cache (:class:`FileHashCache`): cache to hash the files with, if not
+            provided the hashes are only kept in memory.
+    """
+
+    __INFO = "entry.json"
+    __ALGORITHM = "sha256"
+
+    def __init__(self, path: str, maxsize: Optional[int] = None,
+                 hash_cache: Optional[FileHashCache] = None):
+        self.__path = path
+        self.__maxsize = maxsize
+        if hash_cache is None:
+            hash_cache = FileHashCache()
+        self.__hash_cache = hash_cache
+
+    @property
+    def path(self) -> str:
+        """str: path to the cache."""
+        return self.__path
+
+    def __entry_path(self, key: str) -> str:
+        return os.path.join(self.__path, key[0:2], key)
+
+    def __tmp_path(self, key: str) -> str:
+        return os.path.join(self.__path, "tmp", f"{key}.{os.getpid()}.{uuid.uuid4().hex}")
+
+    @staticmethod
+    def get_key(data: Dict[str, Any]) -> str:
+        """
+        Returns the key of an entry.
+
+        Args:
+            data (dict): the information which determines the results of the node.
+        """
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def hash_directory(path: str, exclude: Optional[Set[str]] = None,
+                       hash_cache: Optional[FileHashCache] = None) -> str:
+        """
+        Returns the sha256 hash of the names and contents of the files in a directory.
+
+        Args:
+            path (str): path to the directory.
+            exclude (set of str): paths relative to the directory to leave out.
+            hash_cache (:class:`FileHashCache`): cache to hash the files with, if not
+                provided the hashes are only kept in memory.
+        """
+        files = NodeCache.__get_files(path, ["."])
+        if exclude:
+            files = {rel_path: file_path for rel_path, file_path in files.items()
+                     if rel_path not in exclude}
+
+        if hash_cache is None:
+            hash_cache = FileHashCache()
+        hashes = hash_cache.hash_files(list(files.values()), NodeCache.__ALGORITHM)
+
+        sha = hashlib.sha256()
+        for rel_path, filehash in sorted(zip(files.keys(), hashes)):
+            sha.update(rel_path.encode("utf-8"))
+            sha.update(filehash.encode("utf-8"))
+        return sha.hexdigest()
+
+    @staticmethod
+    def __get_files(root: str, paths: List[str]) -> Dict[str, str]:
+        """
+        Returns the files in the paths relative to root, mapped from their path
+        relative to root to their full path.
+        """
+        files = {}
+        for path in paths:
+            src = os.path.join(root, path)
+            if os.path.isfile(src):
+                files[os.path.normpath(path)] = src
+                continue
+            for path_root, _, names in os.walk(src):
+                for name in names:
+                    file_path = os.path.join(path_root, name)
+                    files[os.path.relpath(file_path, root)] = file_path
+        return files
+
+    @staticmethod
+    def __rmtree(path: str) -> None:
+        """
+        Removes a directory, including read-only files.
+        """
+        for path_root, _, names in os.walk(path):
+            for name in names:
+                try:
+                    os.chmod(os.path.join(path_root, name), stat.S_IWUSR | stat.S_IRUSR)
+                except OSError:
+                    pass
+        shutil.rmtree(path, ignore_errors=True)
+
+    def restore(self, key: str, workdir: str, paths: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Restores the files of an entry into a node directory.
+
+        Args:
+            key (str): key of the entry.
+            workdir (str): path to the node directory.
+            paths (list of str): files and directories in the node directory to restore.
+
+        Returns:
+            dict: the information stored with the entry, or None if the entry is not
+                in the cache or could not be restored.
+        """
+        entry = self.__entry_path(key)
+        info_path = os.path.join(entry, NodeCache.__INFO)
+        try:
+            with open(info_path, "r") as f:
+                info = json.load(f)
+            digests = info.pop("files")
+
+            prefixes = [os.path.normpath(path) for path in paths]
+            digests = {rel_path: filehash for rel_path, filehash in digests.items()
+                       if any(rel_path == prefix or rel_path.startswith(prefix + os.sep)
+                              for prefix in prefixes)}
+
+            files = NodeCache.__get_files(entry, paths)
+            hashes = self.__hash_cache.hash_files(list(files.values()), NodeCache.__ALGORITHM)
+            if dict(zip(files.keys(), hashes)) != digests:
+                # The files of the entry have been modified
+                self.remove(key)
+                return None
+
+            for path in paths:
+                if os.path.isdir(os.path.join(entry, path)):
+                    os.makedirs(os.path.join(workdir, path), exist_ok=True)
+
+            for rel_path, src in files.items():
+                dst = os.path.join(workdir, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                if os.path.lexists(dst):
+                    os.remove(dst)
+                utils.link_copy(src, dst)
+                if not os.path.exists(dst):
+                    raise FileNotFoundError(dst)
+
+            # Mark the entry as recently used
+            os.utime(info_path)
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+
+        return info
+
+    def insert(self, key: str, workdir: str, paths: List[str], info: Dict[str, Any],
+               exclude: Optional[Set[str]] = None) -> None:
+        """
+        Inserts the files of a node directory into the cache, if the key is not
+        already in the cache.
+
+        Args:
+            key (str): key of the entry.
+            workdir (str): path to the node directory.
+            paths (list of str): files and directories in the node directory to store.
+            info (dict): information to store with the entry.
+            exclude (set of str): files in the node directory to leave out.
+        """
+        entry = self.__entry_path(key)
+        if os.path.exists(entry):
+            return
+
+        files = NodeCache.__get_files(workdir, paths)
+        if exclude:
+            exclude = {os.path.normpath(path) for path in exclude}
+            files = {rel_path: file_path for rel_path, file_path in files.items()
+                     if rel_path not in exclude}
+
+        tmp = self.__tmp_path(key)
+        try:
+            for path in paths:
+                if os.path.isdir(os.path.join(workdir, path)):
+                    os.makedirs(os.path.join(tmp, path), exist_ok=True)
+
+            digests = self.__hash_cache.hash_files(list(files.values()), NodeCache.__ALGORITHM)
+
+            size = 0
+            for rel_path, src in files.items():
+                dst = os.path.join(tmp, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                # Copy rather than link, so the entry cannot be modified through the node
+                shutil.copy2(src, dst)
+                os.chmod(dst, stat.S_IMODE(os.stat(dst).st_mode) &
+                         ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+                size += os.path.getsize(dst)
+
+            os.makedirs(tmp, exist_ok=True)
+            with open(os.path.join(tmp, NodeCache.__INFO), "w") as f:
+                json.dump({**info, "size": size, "files": dict(zip(files.keys(), digests))}, f)
+
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            # Another job may have inserted the same entry in the meantime
+            os.rename(tmp, entry)
+        except OSError:
+            pass
+        finally:
+            if os.path.exists(tmp):
+                NodeCache.__rmtree(tmp)
+
+        self.evict()
+
+    def remove(self, key: str) -> None:
+        """
+        Removes an entry from the cache.
+
+        Args:
+            key (str): key of the entry.
+        """
+        entry = self.__entry_path(key)
+        tmp = self.__tmp_path(key)
+        try:
+            # Move the entry out of place first, so it is not restored while removed
+            os.makedirs(os.path.dirname(tmp), exist_ok=True)
+            os.rename(entry, tmp)
+        except OSError:
+            return
+        NodeCache.__rmtree(tmp)
+
+    def get_entries(self) -> List[Tuple[str, float, int]]:
+        """
+        Returns the key, last use time, and size of the entries in the cache.
+        """
+        entries = []
+        if not os.path.isdir(self.__path):
+            return entries
+
+        for prefix in os.scandir(self.__path):
+            if not prefix.is_dir() or len(prefix.name) != 2:
+                continue
+            for entry in os.scandir(prefix.path):
+                info_path = os.path.join(entry.path, NodeCache.__INFO)
+                try:
+                    used = os.path.getmtime(info_path)
+                    with open(info_path, "r") as f:
+                        size = json.load(f)["size"]
+                except (OSError, ValueError, KeyError):
+                    continue
+                entries.append((entry.name, used, size))
+        return entries
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache is within its
+        maximum size.
+        """
+        if self.__maxsize is None:
+            return
+
+        entries = self.get_entries()
+        size = sum(entry_size for _, _, entry_size in entries)
+        for key, _, entry_size in sorted(entries, key=lambda entry: entry[1]):
+            if size <= self.__maxsize:
+                break
+            self.remove(key)
+            size -= entry_size
@@ -12,13 +12,13 @@ project object, and executes the specified node's `run()` method.
 import argparse
 import os
 import sys
-import tarfile
 import os.path
 
 from siliconcompiler import Project
 from siliconcompiler.package import Resolver
 from siliconcompiler.scheduler import SchedulerNode
 from siliconcompiler import __version__
+from siliconcompiler.utils.tarball import open_tarball
 
 
 ##########################
@@ -30,7 +30,8 @@ def main():
     Parses CLI arguments to configure a Project (manifest, working directory, build/cache
     directories, step, index, remote id, and optional cache mappings), optionally
     unsets scheduler entries for local runs, executes the corresponding SchedulerNode,
-    and optionally writes a gzipped tar archive of results.
+    and optionally writes a compressed tar archive of results, see
+    :func:`siliconcompiler.utils.tarball.open_tarball`.
 
     Returns:
         int: Exit code — 0 on successful node execution, 1 if the node failed.
@@ -76,7 +77,7 @@ def main():
                         help="Record: remote job ID")
     parser.add_argument('-archive',
                         metavar='<file>',
-                        help='Generate archive')
+                        help='Generate archive, compressed with zstd for .tar.zst files')
     parser.add_argument('-include',
                         metavar='<path>',
                         nargs='+',
@@ -135,8 +136,7 @@ def main():
     finally:
         # Archive results upon completion, regardless of success or failure.
         if args.archive:
-            with tarfile.open(args.archive,
-                              mode='w:gz') as tf:
+            with open_tarball(args.archive, "w") as tf:
                 node.archive(tf, include=args.include)
 
     # Return a non-zero exit code on error.
@@ -1,7 +1,9 @@
 import io
 import logging
 import multiprocessing
+import multiprocessing.pool
 import os
+import queue
 import re
 import shutil
 import sys
@@ -12,7 +14,7 @@ import os.path
 
 from datetime import datetime
 
-from typing import Union, Dict, Optional, Tuple, List, Set, TYPE_CHECKING
+from typing import Any, Union, Dict, Optional, Tuple, List, Set, TYPE_CHECKING
 
 from siliconcompiler import NodeStatus
 from siliconcompiler.schema import Journal
@@ -316,8 +318,9 @@ class Scheduler:
             # Store run in history
             self.__project._record_history()
 
-            # Record final manifest
-            self.__project.write_manifest(self.manifest)
+            # Record final manifest, which references the history records
+            self.__project._write_linked_manifest(self.manifest)
+            self.__project._remove_replaced_history()
 
             send_messages.send(self.__project, 'summary', None, None)
         finally:
@@ -560,22 +563,73 @@ class Scheduler:
                 with self.__tasks[(step, index)].runtime():
                     self.__tasks[(step, index)].clean_directory()
 
-    def __configure_collect_previous_information(self) -> Dict[Tuple[str, str], "Project"]:
+    @staticmethod
+    def _read_previous_information(step: str, index: str, manifest: str) \
+            -> Optional[Tuple[Optional[str], List[Dict]]]:
+        """
+        Reads the information the scheduler needs from the output manifest of a
+        previous run of a node.
+
+        Only the journal of the manifest is read, using the journal sidecar when
+        available, and the status of the node is taken from the journal. The full
+        manifest is only loaded if the journal does not record the status.
+
+        Args:
+            step (str): The step of the node.
+            index (str): The index of the node.
+            manifest (str): The path to the output manifest.
+
+        Returns:
+            Tuple[Optional[str], List[Dict]]: The status of the node and the
+                journal records of the manifest, or None if the manifest does
+                not exist.
+        """
+        if not os.path.exists(manifest):
+            return None
+
+        records = Journal.read_file(manifest)
+
+        status = None
+        status_recorded = False
+        for record in records:
+            key = tuple(record["key"])
+            if record["type"] == "remove":
+                if key == ("record", "status")[0:len(key)]:
+                    status = None
+                    status_recorded = True
+            elif key == ("record", "status") and \
+                    record["step"] == step and record["index"] == index:
+                if record["type"] == "set":
+                    status = record["value"]
+                    status_recorded = True
+                elif record["type"] == "unset":
+                    status = None
+                    status_recorded = True
+
+        if not status_recorded:
+            from siliconcompiler import Project
+            status = Project.from_manifest(filepath=manifest).get(
+                'record', 'status', step=step, index=index)
+
+        return status, records
+
+    def __configure_collect_previous_information(self) \
+            -> Dict[Tuple[str, str], Tuple[Optional[str], List[Dict]]]:
         """Collects information from previous runs for nodes that won't be re-executed.
 
         This method identifies nodes that are marked for loading (not cleaning) and
         are not part of the current 'from' execution path. For each of these
-        nodes, it attempts to load its manifest from a previous run.
+        nodes, it reads the status and journal from the manifest of a previous run,
+        see :meth:`_read_previous_information`. The manifests are read in a thread
+        pool and the results are collected in flow order.
 
         Returns:
-            Dict[Tuple[str, str], "Project"]: A dictionary mapping (step, index)
-                tuples to their corresponding loaded Project objects from
-                previous runs.
+            Dict[Tuple[str, str], Tuple[Optional[str], List[Dict]]]: A dictionary
+                mapping (step, index) tuples to their status and journal records
+                from previous runs.
         """
-        from siliconcompiler import Project
         self.__print_status("Start - collect")
 
-        extra_setup_nodes = {}
         from_nodes = []
         if self.__project.get('option', 'clean'):
             if self.__project.get("option", "from"):
@@ -586,7 +640,7 @@ class Scheduler:
                 from_nodes = self.__flow_runtime.get_entry_nodes()
             load_nodes = self.__flow_load_runtime.get_nodes()
 
-        # Collect previous run information
+        nodes = []
         for step, index in self.__flow.get_nodes():
             if (step, index) not in load_nodes:
                 # Node not marked for loading
@@ -594,21 +648,35 @@ class Scheduler:
             if (step, index) in from_nodes:
                 # Node will be run so no need to load
                 continue
+            nodes.append((step, index, self.__tasks[(step, index)].get_manifest()))
 
-            manifest = self.__tasks[(step, index)].get_manifest()
-            if os.path.exists(manifest):
-                # ensure we setup these nodes again
-                try:
-                    extra_setup_nodes[(step, index)] = Project.from_manifest(filepath=manifest)
-                except Exception as e:
-                    self.__logger.debug(f"Reading {manifest} caused: {e}")
-                    pass
+        def read(node: Tuple[str, str, str]) -> Optional[Tuple[Optional[str], List[Dict]]]:
+            try:
+                return Scheduler._read_previous_information(*node)
+            except Exception as e:
+                self.__logger.debug(f"Reading {node[2]} caused: {e}")
+                return None
+
+        extra_setup_nodes = {}
+        if nodes:
+            cores = utils.get_cores()
+            pool_size = self.project.option.scheduler.get_maxthreads() or cores
+            pool_size = max(1, min(cores, pool_size, len(nodes)))
+
+            with multiprocessing.pool.ThreadPool(pool_size) as pool:
+                # Results are returned in the order of the nodes
+                for (step, index, _), info in zip(nodes, pool.map(read, nodes)):
+                    if info is not None:
+                        # ensure we setup these nodes again
+                        extra_setup_nodes[(step, index)] = info
 
         self.__print_status("End - collect")
 
         return extra_setup_nodes
 
-    def __configure_run_setup(self, extra_setup_nodes: Dict[Tuple[str, str], "Project"]) -> None:
+    def __configure_run_setup(
+            self,
+            extra_setup_nodes: Dict[Tuple[str, str], Tuple[Optional[str], List[Dict]]]) -> None:
         """Runs the setup() method for all flow nodes and forwards previous status.
 
         This method iterates through all nodes in execution order and calls
@@ -621,9 +689,9 @@ class Scheduler:
            `extra_setup_nodes`) into the current job's records.
 
         Args:
-            extra_setup_nodes (Dict[Tuple[str, str], "Project"]): A dictionary
-                of loaded Project objects from previous runs. This dictionary
-                may be modified in-place (nodes may be removed).
+            extra_setup_nodes (Dict[Tuple[str, str], Tuple[Optional[str], List[Dict]]]):
+                A dictionary of the status and journal records from previous runs.
+                This dictionary may be modified in-place (nodes may be removed).
         """
         self.__print_status("Start - setup")
         # Setup tools for all nodes to run
@@ -639,23 +707,22 @@ class Scheduler:
 
                 # Copy in old status information, this will be overwritten if needed
                 if (step, index) in extra_setup_nodes:
-                    schema = extra_setup_nodes[(step, index)]
-                    node_status = None
-                    try:
-                        node_status = schema.get('record', 'status', step=step, index=index)
-                    except:  # noqa E722
-                        pass
+                    node_status, _ = extra_setup_nodes[(step, index)]
                     if node_status:
                         # Forward old status
                         self.__record.set('status', node_status, step=step, index=index)
         self.__print_status("End - setup")
 
     @staticmethod
-    def _configure_run_required(task: SchedulerNode) \
+    def _configure_run_required(descriptor: Dict[str, Any]) \
             -> Optional[Union[SchedulerFlowReset, SchedulerNodeReset]]:
         """
-        Helper method to run requires_run() with threads.
+        Helper method to run requires_run() in a process pool.
+
+        Args:
+            descriptor (dict): The node descriptor, see :meth:`SchedulerNode.get_descriptor`.
         """
+        task: SchedulerNode = descriptor["cls"].from_descriptor(descriptor)
         with task.runtime():
             try:
                 task.requires_run()
@@ -666,13 +733,15 @@ class Scheduler:
     def __configure_check_run_required(self) -> List[Tuple[str, str]]:
         """Checks which nodes require a re-run and which can be replayed.
 
-        This method iterates through all nodes that are currently marked as
-        'SUCCESS' (typically from a previous run). It calls `requires_run()`
-        on each to determine if inputs, parameters, or other dependencies
-        have changed.
+        This method checks all nodes that are currently marked as 'SUCCESS'
+        (typically from a previous run) by calling `requires_run()` on each to
+        determine if inputs, parameters, or other dependencies have changed.
+        The checks run in a process pool and a node is checked as soon as the
+        checks of its input nodes have completed.
 
         - If `requires_run()` is True, the node is marked as 'pending' (and
-          will be re-executed).
+          will be re-executed) along with the nodes following it, which are
+          then not checked.
         - If `requires_run()` is False, the node is added to the 'replay' list,
           indicating its previous results can be reused.
 
@@ -685,24 +754,15 @@ class Scheduler:
 
         replay: List[Tuple[str, str]] = []
 
-        nodes: List[Tuple[str, str]] = []
-
-        def filter_nodes(nodes: List[Tuple[str, str]]) -> None:
-            for step, index in tuple(nodes):
-                # Only look at successful nodes
-                if self.__record.get("status", step=step, index=index) != NodeStatus.SUCCESS:
-                    nodes.remove((step, index))
-
-        def create_node_group(nodes: List[Tuple[str, str]], size: int) -> List[Tuple[str, str]]:
-            group = []
-            for _ in range(size):
-                if nodes:
-                    group.append(nodes.pop(0))
-            return group
+        def is_success(node: Tuple[str, str]) -> bool:
+            return self.__record.get("status", step=node[0], index=node[1]) == \
+                NodeStatus.SUCCESS
 
         # Collect initial list of nodes to process
+        nodes: List[Tuple[str, str]] = []
         for layer_nodes in self.__flow.get_execution_order():
             nodes.extend(layer_nodes)
+        order = {node: n for n, node in enumerate(nodes)}
 
         # Determine pool size
         cores = utils.get_cores()
@@ -710,7 +770,7 @@ class Scheduler:
         pool_size = max(1, min(cores, pool_size))
 
         # Limit based on number of nodes if less than number of cores
-        filter_nodes(nodes)
+        nodes = [node for node in nodes if is_success(node)]
         if not nodes:
             # No nodes left so just return
             return []
@@ -719,52 +779,108 @@ class Scheduler:
 
         self.__logger.debug(f"Check pool size: {pool_size}")
 
+        # Track the inputs of each node which have not been checked yet
+        unchecked_inputs: Dict[Tuple[str, str], int] = {}
+        dependents: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for node in nodes:
+            unchecked_inputs[node] = 0
+            for in_node in self.__flow.get_graph_node(*node).get_input():
+                if in_node in unchecked_inputs:
+                    unchecked_inputs[node] += 1
+                    dependents.setdefault(in_node, []).append(node)
+        ready = [node for node in nodes if unchecked_inputs[node] == 0]
+
         # Call this in case this was invoked without __main__
         multiprocessing.freeze_support()
 
-        with multiprocessing.get_context("spawn").Pool(pool_size) as pool:
-            while True:
-                # Filter nodes
-                filter_nodes(nodes)
-
-                # Generate a group of nodes to run
-                group = create_node_group(nodes, pool_size)
-                self.__logger.debug(f"Group to check: {group}")
-                if not group:
-                    # Group is empty
-                    break
-
-                tasks = [self.__tasks[(step, index)] for step, index in group]
-                # Suppress excess info messages during checks
-                cur_level = self.project.logger.level
-                self.project.logger.setLevel(logging.WARNING)
-                try:
-                    runcheck = pool.map(Scheduler._configure_run_required, tasks)
-                finally:
-                    self.project.logger.setLevel(cur_level)
-
-                for node, runrequired in zip(group, runcheck):
-                    if self.__record.get("status", step=node[0], index=node[1]) != \
-                            NodeStatus.SUCCESS:
-                        continue
+        # The nodes are sent to the pool as descriptors pointing to this manifest,
+        # along with the journal of the changes made since it was written, which is
+        # recorded separately from the project's own journal
+        journal = Journal()
+        manifest = os.path.join(jobdir(self.__project), f"{self.__name}.check.pkg.json")
+        manifest_written = False
+        os.makedirs(os.path.dirname(manifest), exist_ok=True)
+
+        def get_descriptor(node: Tuple[str, str]) -> Dict[str, Any]:
+            nonlocal manifest_written
+            if not manifest_written:
+                self.__project.write_manifest(manifest)
+                journal.start()
+                manifest_written = True
+            records = journal.get_records()
+
+            # Suppress excess info messages during checks
+            cur_level = self.project.logger.level
+            self.project.logger.setLevel(logging.WARNING)
+            try:
+                return self.__tasks[node].get_descriptor(manifest, journal=records or None)
+            finally:
+                self.project.logger.setLevel(cur_level)
 
-                    self.__logger.debug(f"  Result: {node} -> {runrequired}")
+        results = queue.Queue()
+
+        def checked(node: Tuple[str, str]) -> None:
+            for out_node in dependents.get(node, []):
+                unchecked_inputs[out_node] -= 1
+                if unchecked_inputs[out_node] == 0:
+                    ready.append(out_node)
+
+        Journal.access(self.__project).attach(journal)
+        try:
+            with multiprocessing.get_context("spawn").Pool(pool_size) as pool:
+                running = 0
+                while True:
+                    # Start the checks of the nodes whose inputs have been checked
+                    while ready:
+                        node = ready.pop(0)
+                        if not is_success(node):
+                            # Node has already been marked to run
+                            checked(node)
+                            continue
 
-                    if runrequired is not None:
-                        runrequired.log(self.__logger)
+                        self.__logger.debug(f"Check: {node}")
+                        pool.apply_async(
+                            Scheduler._configure_run_required, (get_descriptor(node),),
+                            callback=lambda result, node=node: results.put((node, result)),
+                            error_callback=lambda error, node=node: results.put((node, error)))
+                        running += 1
 
-                        if isinstance(runrequired, SchedulerFlowReset):
-                            raise runrequired from None
+                    if not running:
+                        break
 
-                        # This node must be run
-                        self.__mark_pending(*node)
-                    else:
-                        # import old information
-                        replay.append(node)
+                    node, runrequired = results.get()
+                    running -= 1
+
+                    if runrequired is not None and \
+                            not isinstance(runrequired, (SchedulerFlowReset, SchedulerNodeReset)):
+                        # Check failed
+                        raise runrequired
+
+                    if is_success(node):
+                        self.__logger.debug(f"  Result: {node} -> {runrequired}")
+
+                        if runrequired is not None:
+                            runrequired.log(self.__logger)
+
+                            if isinstance(runrequired, SchedulerFlowReset):
+                                raise runrequired from None
+
+                            # This node must be run
+                            self.__mark_pending(*node)
+                        else:
+                            # import old information
+                            replay.append(node)
+
+                    checked(node)
+        finally:
+            Journal.access(self.__project).detach(journal)
+            journal.stop()
+            if os.path.exists(manifest):
+                os.remove(manifest)
 
         self.__print_status("End - check")
 
-        return replay
+        return sorted(replay, key=lambda node: order[node])
 
     def configure_nodes(self) -> None:
         """
@@ -772,8 +888,8 @@ class Scheduler:
         running per-node setup, and marking nodes that require rerun.
 
         This method:
-        - Loads available node manifests from previous jobs and uses them to populate setup data
-          where appropriate.
+        - Loads the status and journal of node manifests from previous jobs and uses them to
+          populate setup data where appropriate.
         - Runs each node's setup routine to initialize tools and runtime state.
         - For nodes whose parameters or inputs have changed, marks them and all downstream nodes
           as pending so they will be re-executed.
@@ -796,7 +912,10 @@ class Scheduler:
             # Replay previous information
             for step, index in replay:
                 if (step, index) in extra_setup_nodes:
-                    Journal.access(extra_setup_nodes[(step, index)]).replay(self.__project)
+                    _, records = extra_setup_nodes[(step, index)]
+                    node_journal = Journal()
+                    node_journal.from_dict(records)
+                    node_journal.replay(self.__project)
         except SchedulerFlowReset:
             # Mark all nodes as pending
             self.__clean_build_dir_full(recheck=True)
@@ -817,7 +936,7 @@ class Scheduler:
 
         # Write configured manifest
         os.makedirs(os.path.dirname(self.manifest), exist_ok=True)
-        self.__project.write_manifest(self.manifest)
+        self.__project._write_linked_manifest(self.manifest)
 
         journal.stop()
 
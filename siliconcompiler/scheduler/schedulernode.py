@@ -9,18 +9,22 @@ import time
 
 import os.path
 
-from siliconcompiler.utils.multiprocessing import MPQueueHandler as QueueHandler
+from siliconcompiler.utils.multiprocessing import MPManager, MPQueueHandler as QueueHandler
 
-from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from siliconcompiler import utils, sc_open
 from siliconcompiler import NodeStatus
 from siliconcompiler.utils.logging import get_console_formatter, SCInRunLoggerFormatter
 
-from siliconcompiler.package import Resolver
+from siliconcompiler.package import Resolver, RemoteResolver
 from siliconcompiler.schema_support.record import RecordTime, RecordTool
 from siliconcompiler.schema import Journal, Parameter
+from siliconcompiler.schema.filehash import FileHashCache
+from siliconcompiler.schema.pathcache import PathResolutionCache
 from siliconcompiler.scheduler import send_messages
+from siliconcompiler.scheduler.fingerprint import NodeFingerprints
+from siliconcompiler.scheduler.nodecache import NodeCache
 from siliconcompiler.utils.paths import workdir, jobdir, collectiondir, cwdir
 
 if TYPE_CHECKING:
@@ -71,6 +75,14 @@ class SchedulerNode:
 
     __MAX_LOG_PRINT = 100  # Maximum number of warnings/error to print to log
 
+    # Metrics which describe the execution of the task, these are not restored
+    # from the node cache
+    __RUN_METRICS = ("exetime", "tasktime", "totaltime", "memory")
+
+    # Last manifest loaded by :meth:`from_descriptor` in this process, keyed by
+    # path, modification time, and size
+    __descriptor_manifest: Dict[Tuple[str, int, int], "Project"] = {}
+
     def __init__(self, project: "Project", step: str, index: str, replay: bool = False):
         """
         Initializes a SchedulerNode.
@@ -111,6 +123,8 @@ class SchedulerNode:
         self.__hash = self.__project.get("option", "hash")
         self.__breakpoint = self.__project.get("option", "breakpoint",
                                                step=self.__step, index=self.__index)
+        self.__nodecache = self.__project.get("option", "nodecache",
+                                              step=self.__step, index=self.__index)
         self.__builtin = False
 
         self.__enforce_inputfiles = True
@@ -162,6 +176,98 @@ class SchedulerNode:
         """
         return SchedulerNode(self.__project, step, index)
 
+    def get_descriptor(self, manifest: str,
+                       journal: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """
+        Creates a descriptor of this node to send to another process.
+
+        The descriptor holds the path to a manifest of the project instead of the
+        project itself, so it stays small regardless of the size of the project.
+        The node is recreated from it with :meth:`from_descriptor`.
+
+        Args:
+            manifest (str): Path to a manifest of the project.
+            journal (list): Journal records to replay onto the manifest to bring
+                it up to date with the project.
+
+        Returns:
+            dict: The node descriptor.
+        """
+        return {
+            "cls": type(self),
+            "manifest": manifest,
+            "journal": journal,
+            "step": self.__step,
+            "index": self.__index,
+            "replay": self.__replay,
+            "builtin": self.__builtin,
+            "cwd": self.__cwd,
+            "loglevel": self.logger.level,
+            "packages": Resolver.get_cache(self.__project),
+            "manager": MPManager._get_manager_address()
+        }
+
+    @classmethod
+    def from_descriptor(cls, descriptor: Dict[str, Any]) -> "SchedulerNode":
+        """
+        Recreates a node from a descriptor created by :meth:`get_descriptor`.
+
+        The project is loaded from the manifest in the descriptor, which is kept
+        so the following nodes using the same manifest in this process start
+        from a copy of it.
+
+        Args:
+            descriptor (dict): The node descriptor.
+
+        Returns:
+            SchedulerNode: The node.
+        """
+        from siliconcompiler import Project
+
+        # Connect to the manager before the project creates its logger
+        MPManager._set_manager_address(descriptor["manager"])
+
+        stat = os.stat(descriptor["manifest"])
+        key = (descriptor["manifest"], stat.st_mtime_ns, stat.st_size)
+        base = SchedulerNode.__descriptor_manifest.get(key, None)
+        if base is None:
+            base = Project.from_manifest(filepath=descriptor["manifest"])
+            # Do not keep journaling from the manifest
+            Journal.access(base).stop()
+            SchedulerNode.__descriptor_manifest.clear()
+            SchedulerNode.__descriptor_manifest[key] = base
+
+        project = base.copy()
+        project.logger.setLevel(descriptor["loglevel"])
+        project._Project__cwd = descriptor["cwd"]
+        if descriptor["journal"]:
+            journal = Journal()
+            journal.from_dict(descriptor["journal"])
+            journal.replay(project)
+
+        for package, path in descriptor["packages"].items():
+            Resolver.set_cache(project, package, path)
+
+        node = cls(project, descriptor["step"], descriptor["index"],
+                   replay=descriptor["replay"])
+        if descriptor["builtin"]:
+            node.set_builtin()
+        return node
+
+    @staticmethod
+    def run_descriptor(descriptor: Dict[str, Any], pipe=None, queue=None) -> None:
+        """
+        Recreates a node from a descriptor and runs it.
+
+        Args:
+            descriptor (dict): The node descriptor, see :meth:`get_descriptor`.
+            pipe: The pipe for sending data back to the parent process.
+            queue: The multiprocessing.Queue for handling log records.
+        """
+        node = descriptor["cls"].from_descriptor(descriptor)
+        node.set_queue(pipe, queue)
+        node.run()
+
     @property
     def is_local(self) -> bool:
         """bool: Returns True, indicating the node runs on the local machine."""
@@ -277,6 +383,26 @@ class SchedulerNode:
             return self.__manifests["input"]
         return self.__manifests["output"]
 
+    @property
+    def __output_manifest_names(self) -> Set[str]:
+        """Set[str]: The names of the output manifest and its journal sidecar."""
+        manifest = self.__manifests["output"]
+        return {os.path.basename(manifest),
+                os.path.basename(Journal.get_sidecar_path(manifest))}
+
+    def __write_output_manifest(self) -> None:
+        """
+        Compacts the journal and writes the output manifest and its journal sidecar.
+
+        The sidecar is written after the manifest, since it is only used while it
+        matches the manifest, see :meth:`.Journal.write_sidecar`. Until then the
+        journal is read from the manifest.
+        """
+        journal = Journal.access(self.__project)
+        journal.compact()
+        self.__project.write_manifest(self.__manifests["output"])
+        journal.write_sidecar(self.__manifests["output"])
+
     def get_log(self, type: str = "exe") -> str:
         """
         Gets the path to a specific log file for this node.
@@ -371,7 +497,7 @@ class SchedulerNode:
 
         self.__record.set("status", NodeStatus.ERROR, step=self.__step, index=self.__index)
         try:
-            self.__project.write_manifest(self.__manifests["output"])
+            self.__write_output_manifest()
         except FileNotFoundError:
             self.logger.error(f"Failed to write manifest for {self.__step}/{self.__index}.")
 
@@ -414,6 +540,23 @@ class SchedulerNode:
 
             return True
 
+    def __get_run_status(self) -> Dict[str, Any]:
+        """
+        Returns the information about the run of this node which is checked by
+        :meth:`check_previous_run_status`.
+        """
+        return {
+            "flow": self.__flow.name,
+            "tool": self.__task.tool(),
+            "task": self.__task.task(),
+            "status": self.__project.get("record", "status",
+                                         step=self.__step, index=self.__index),
+            "inputnode": self.__project.get("record", "inputnode",
+                                            step=self.__step, index=self.__index),
+            "toolversion": self.__project.get("record", "toolversion",
+                                              step=self.__step, index=self.__index)
+        }
+
     def check_previous_run_status(self, previous_run: "SchedulerNode") -> None:
         """
         Determine whether a prior run is compatible and completed successfully for use as
@@ -432,24 +575,32 @@ class SchedulerNode:
         Raises:
             SchedulerFlowReset: If the flow name differs and a full reset is required.
         """
+        self.__check_previous_run_status(previous_run.__get_run_status())
+
+    def __check_previous_run_status(self, previous_status: Dict[str, Any]) -> None:
+        """
+        Private helper for :meth:`check_previous_run_status`.
+
+        Args:
+            previous_status (dict): the run information of the previous run, see
+                :meth:`__get_run_status`.
+        """
         # Assume modified if flow does not match
-        if self.__flow.name != previous_run.__flow.name:
+        if self.__flow.name != previous_status["flow"]:
             raise SchedulerFlowReset("Flow name changed, require full reset")
 
         # Tool name
-        if self.__task.tool() != previous_run.__task.tool():
+        if self.__task.tool() != previous_status["tool"]:
             raise SchedulerNodeResetSilent("Tool name changed")
 
         # Task name
-        if self.__task.task() != previous_run.__task.task():
+        if self.__task.task() != previous_status["task"]:
             raise SchedulerNodeResetSilent("Task name changed")
 
-        previous_status = previous_run.__project.get("record", "status",
-                                                     step=self.__step, index=self.__index)
-        if not NodeStatus.is_done(previous_status):
+        if not NodeStatus.is_done(previous_status["status"]):
             raise SchedulerNodeResetSilent("Previous step did not complete")
 
-        if not NodeStatus.is_success(previous_status):
+        if not NodeStatus.is_success(previous_status["status"]):
             raise SchedulerNodeResetSilent("Previous step was not successful")
 
         # Check input nodes
@@ -457,11 +608,55 @@ class SchedulerNode:
         self.logger.setLevel(logging.CRITICAL)
         sel_inputs = self.__task.select_input_nodes()
         self.logger.setLevel(log_level)
-        if set(previous_run.__project.get("record", "inputnode",
-                                          step=self.__step, index=self.__index)) != set(sel_inputs):
+        if set(tuple(node) for node in previous_status["inputnode"]) != set(sel_inputs):
             raise SchedulerNodeReset(f'inputs to {self.__step}/{self.__index} has been '
                                      'modified from previous run')
 
+    def __get_key_states(self, project: "Project", keys: Set[Tuple[str, ...]]) \
+            -> Dict[Tuple[str, ...], Optional[Dict[str, Any]]]:
+        """
+        Returns the digests of the values of keys in the project of a previous run,
+        which are compared by :meth:`check_values_changed` and
+        :meth:`check_files_changed`.
+
+        Args:
+            project (Project): project of the previous run.
+            keys (set of tuples): keypaths to record.
+
+        Returns:
+            dict: keypath mapped to None if the key is missing in the previous run,
+                otherwise the digests of the value and, for file and dir keys, the
+                dataroot and file hashes.
+        """
+        states = {}
+        for key in keys:
+            if not project.valid(*key):
+                states[key] = None
+                continue
+
+            # The node values are accessed according to the current schema
+            if self.__project.valid(*key):
+                pernode = self.__project.get(*key, field="pernode")
+            else:
+                pernode = project.get(*key, field="pernode")
+            step, index = self.__step, self.__index
+            if pernode.is_never():
+                step, index = None, None
+
+            state = {
+                "global": step is None,
+                "value": NodeFingerprints.digest(project.get(*key, step=step, index=index))
+            }
+            keytype = project.get(*key, field="type")
+            if 'file' in keytype or 'dir' in keytype:
+                state["dataroot"] = NodeFingerprints.digest(
+                    project.get(*key, field="dataroot", step=step, index=index))
+                state["filehash"] = NodeFingerprints.digest(
+                    project.get(*key, field="filehash", step=step, index=index))
+            states[key] = state
+
+        return states
+
     def check_values_changed(self, previous_run: "SchedulerNode", keys: Set[Tuple[str, ...]]) \
             -> None:
         """
@@ -474,12 +669,26 @@ class SchedulerNode:
         Returns:
             bool: True if any value has changed, False otherwise.
         """
+        self.__check_values_changed(self.__get_key_states(previous_run.__project, keys), keys)
+
+    def __check_values_changed(self,
+                               previous_states: Dict[Tuple[str, ...], Optional[Dict[str, Any]]],
+                               keys: Set[Tuple[str, ...]]) -> None:
+        """
+        Private helper for :meth:`check_values_changed`.
+
+        Args:
+            previous_states (dict): the key digests of the previous run, see
+                :meth:`__get_key_states`.
+            keys (set of tuples): A set of keypaths to check for changes.
+        """
         def gen_reset(key):
             raise SchedulerNodeReset(f'[{",".join(key)}] in {self.__step}/{self.__index} has been '
                                      'modified from previous run')
 
         for key in sorted(keys):
-            if not self.__project.valid(*key) or not previous_run.__project.valid(*key):
+            previous_state = previous_states.get(key, None)
+            if not self.__project.valid(*key) or previous_state is None:
                 # Key is missing in either run
                 gen_reset(key)
 
@@ -489,13 +698,14 @@ class SchedulerNode:
                 step, index = None, None
 
             check_val = param.get(step=step, index=index)
-            prev_val = previous_run.__project.get(*key, step=step, index=index)
 
-            if check_val != prev_val:
+            if NodeFingerprints.digest(check_val) != previous_state["value"]:
                 gen_reset(key)
 
     def check_files_changed(self, previous_run: "SchedulerNode",
-                            previous_time: float, keys: Set[Tuple[str, ...]]) -> None:
+                            previous_time: float, keys: Set[Tuple[str, ...]],
+                            hashes: Optional[Dict[Tuple[str, ...], Dict[str, Any]]] = None) \
+            -> None:
         """
         Checks if any specified file-based parameters have changed.
 
@@ -505,12 +715,66 @@ class SchedulerNode:
             previous_run (SchedulerNode): The node object from a previous run.
             previous_time (float): The timestamp of the previous run's manifest.
             keys (set of tuples): A set of file/dir keypaths to check.
+            hashes (dict): If provided, the file hashes of each key along with the
+                stats of the files, used instead of hashing the files again while
+                the stats are unchanged, and updated with the new hashes.
 
         Returns:
             bool: True if any file has changed, False otherwise.
         """
-        use_hash = self.__hash and previous_run.__hash
+        self.__check_files_changed(self.__get_key_states(previous_run.__project, keys),
+                                   previous_time, keys,
+                                   self.__hash and previous_run.__hash,
+                                   hashes)
+
+    def __hash_key_files(self, key: Tuple[str, ...], step: Optional[str], index: Optional[str],
+                         hashes: Optional[Dict[Tuple[str, ...], Dict[str, Any]]]) -> Any:
+        """
+        Returns the hashes of the files of a key, see :meth:`check_files_changed`
+        for hashes.
+        """
+        if hashes is None:
+            return self.__project.hash_files(*key, update=False, check=False,
+                                             verbose=False,
+                                             step=step, index=index)
+
+        # Stat the files before hashing, so a change during hashing is detected later
+        files = self.__project.find_files(*key, missing_ok=True, step=step, index=index)
+        if not isinstance(files, (list, set, tuple)):
+            files = [files]
+        stats = NodeFingerprints.get_stats(files)
+        hashalgo = self.__project.get(*key, field="hashalgo")
+
+        cached = hashes.get(key, None)
+        if stats is not None and cached and cached["stats"] == stats and \
+                cached["hashalgo"] == hashalgo:
+            return cached["hash"]
+
+        check_hash = self.__project.hash_files(*key, update=False, check=False,
+                                               verbose=False,
+                                               step=step, index=index)
+        if stats is not None:
+            hashes[key] = {"stats": stats, "hashalgo": hashalgo, "hash": check_hash}
+        else:
+            hashes.pop(key, None)
+        return check_hash
+
+    def __check_files_changed(self,
+                              previous_states: Dict[Tuple[str, ...], Optional[Dict[str, Any]]],
+                              previous_time: float, keys: Set[Tuple[str, ...]],
+                              use_hash: bool,
+                              hashes: Optional[Dict[Tuple[str, ...], Dict[str, Any]]]) -> None:
+        """
+        Private helper for :meth:`check_files_changed`.
 
+        Args:
+            previous_states (dict): the key digests of the previous run, see
+                :meth:`__get_key_states`.
+            previous_time (float): The timestamp of the previous run's manifest.
+            keys (set of tuples): A set of file/dir keypaths to check.
+            use_hash (bool): If True, the file hashes are compared.
+            hashes (dict): the file hashes, see :meth:`check_files_changed`.
+        """
         def gen_warning(key, reason):
             raise SchedulerNodeReset(f'[{",".join(key)}] ({reason}) in {self.__step}/'
                                      f'{self.__index} has been modified from previous run')
@@ -530,23 +794,19 @@ class SchedulerNode:
             if param.get(field='pernode').is_never():
                 step, index = None, None
 
+            previous_state = previous_states.get(key, None) or {}
+
             if use_hash:
-                check_hash = self.__project.hash_files(*key, update=False, check=False,
-                                                       verbose=False,
-                                                       step=step, index=index)
-                prev_hash = previous_run.__project.get(*key, field='filehash',
-                                                       step=step, index=index)
+                check_hash = self.__hash_key_files(key, step, index, hashes)
 
-                if check_hash != prev_hash:
+                if NodeFingerprints.digest(check_hash) != previous_state.get("filehash", None):
                     gen_warning(key, "file hash")
             else:
                 # check package values
                 check_val = self.__project.get(*key, field='dataroot',
                                                step=step, index=index)
-                prev_val = previous_run.__project.get(*key, field='dataroot',
-                                                      step=step, index=index)
 
-                if check_val != prev_val:
+                if NodeFingerprints.digest(check_val) != previous_state.get("dataroot", None):
                     gen_warning(key, "file dataroot")
 
                 files = self.__project.find_files(*key, step=step, index=index)
@@ -606,6 +866,10 @@ class SchedulerNode:
         configuration parameters, and input files to decide if the node's
         task can be skipped.
 
+        The information needed from the previous run is recorded as a fingerprint
+        in the job directory, see :class:`NodeFingerprints`, so later checks do not
+        need to load the manifests of the previous run while they are unchanged.
+
         Returns:
             bool: True if a re-run is required, False otherwise.
         """
@@ -615,6 +879,21 @@ class SchedulerNode:
             # Breakpoint is set to must run
             raise SchedulerNodeResetSilent(f"Breakpoint is set on {self.__step}/{self.__index}")
 
+        fingerprints = NodeFingerprints(NodeFingerprints.get_path(self.__jobworkdir))
+        manifests = NodeFingerprints.get_stats([self.__manifests["input"],
+                                                self.__manifests["output"]])
+        if manifests is not None:
+            fingerprint = fingerprints.get(self.__step, self.__index, manifests)
+            if fingerprint is not None:
+                files = fingerprint["files"]
+                with self.runtime():
+                    checked = self.__check_fingerprint(
+                        fingerprint, os.path.getmtime(self.__manifests["input"]))
+                if checked:
+                    if files != fingerprint["files"]:
+                        fingerprints.set(self.__step, self.__index, manifests, fingerprint)
+                    return
+
         # Load previous manifest
         previous_node = None
         previous_node_time = time.time()
@@ -641,24 +920,93 @@ class SchedulerNode:
             raise SchedulerNodeResetSilent("Previous run did not generate output manifest")
 
         with self.runtime():
-            if previous_node_end:
-                with previous_node_end.runtime():
-                    self.check_previous_run_status(previous_node_end)
+            with previous_node_end.runtime():
+                self.check_previous_run_status(previous_node_end)
+                previous_status = previous_node_end.__get_run_status()
 
-            if previous_node:
-                with previous_node.runtime():
-                    # Generate key paths to check
-                    try:
-                        value_keys, path_keys = self.get_check_changed_keys()
-                        previous_value_keys, previous_path_keys = \
-                            previous_node.get_check_changed_keys()
-                        value_keys.update(previous_value_keys)
-                        path_keys.update(previous_path_keys)
-                    except KeyError:
-                        raise SchedulerNodeResetSilent("Failed to acquire keys")
+            with previous_node.runtime():
+                # Generate key paths to check
+                try:
+                    value_keys, path_keys = self.get_check_changed_keys()
+                    previous_value_keys, previous_path_keys = \
+                        previous_node.get_check_changed_keys()
+                    value_keys.update(previous_value_keys)
+                    path_keys.update(previous_path_keys)
+                except KeyError:
+                    raise SchedulerNodeResetSilent("Failed to acquire keys")
+
+                keys = value_keys.union(path_keys)
+                previous_states = self.__get_key_states(previous_node.__project, keys)
+                hashes = {}
+                self.__check_values_changed(previous_states, keys)
+                self.__check_files_changed(previous_states, previous_node_time, path_keys,
+                                           self.__hash and previous_node.__hash, hashes)
+
+        if manifests is not None:
+            fingerprints.set(self.__step, self.__index, manifests, {
+                "status": previous_status,
+                "hash": previous_node.__hash,
+                "value_keys": sorted(list(key) for key in previous_value_keys),
+                "path_keys": sorted(list(key) for key in previous_path_keys),
+                "keys": SchedulerNode.__keypath_items(previous_states),
+                "files": SchedulerNode.__keypath_items(hashes)
+            })
+
+    @staticmethod
+    def __keypath_items(values: Dict[Tuple[str, ...], Any]) -> List[List[Any]]:
+        """
+        Returns the keypaths and values of a dictionary as lists, which are stored
+        in a fingerprint, since keys may contain commas.
 
-                    self.check_values_changed(previous_node, value_keys.union(path_keys))
-                    self.check_files_changed(previous_node, previous_node_time, path_keys)
+        Args:
+            values (dict): keypaths mapped to values.
+        """
+        return [[list(key), value] for key, value in sorted(values.items())]
+
+    def __check_fingerprint(self, fingerprint: Dict[str, Any], previous_time: float) -> bool:
+        """
+        Private helper for :meth:`requires_run` which performs the checks against
+        the fingerprint of a previous run.
+
+        The file hashes in the fingerprint are updated with the files which
+        were hashed again.
+
+        Args:
+            fingerprint (dict): the fingerprint of the previous run.
+            previous_time (float): The timestamp of the previous run's manifest.
+
+        Returns:
+            bool: False if the fingerprint does not record the information needed
+                to check the node.
+        """
+        self.__check_previous_run_status(fingerprint["status"])
+
+        try:
+            value_keys, path_keys = self.get_check_changed_keys()
+        except KeyError:
+            raise SchedulerNodeResetSilent("Failed to acquire keys")
+        value_keys.update(tuple(key) for key in fingerprint["value_keys"])
+        path_keys.update(tuple(key) for key in fingerprint["path_keys"])
+        keys = value_keys.union(path_keys)
+
+        previous_states = {tuple(key): state for key, state in fingerprint["keys"]}
+        for key in keys:
+            if key not in previous_states:
+                # Key was not checked in the previous run
+                return False
+            previous_state = previous_states[key]
+            if previous_state is not None and self.__project.valid(*key) and \
+                    self.__project.get(*key, field="pernode").is_never() != \
+                    previous_state["global"]:
+                # Key was recorded for a different node
+                return False
+
+        hashes = {tuple(key): filehash for key, filehash in fingerprint["files"]}
+        self.__check_values_changed(previous_states, keys)
+        self.__check_files_changed(previous_states, previous_time, path_keys,
+                                   self.__hash and fingerprint["hash"], hashes)
+        fingerprint["files"] = SchedulerNode.__keypath_items(hashes)
+        return True
 
     def setup_input_directory(self) -> None:
         """
@@ -682,7 +1030,7 @@ class SchedulerNode:
                           f'{output_dir}')
 
             for outfile in os.scandir(output_dir):
-                if outfile.name == f'{self.__name}.pkg.json':
+                if outfile.name in self.__output_manifest_names:
                     # Dont forward manifest
                     continue
 
@@ -820,6 +1168,10 @@ class SchedulerNode:
 
         cwd = os.getcwd()
         with self.runtime():
+            # Results of the previous run are replaced
+            NodeFingerprints(NodeFingerprints.get_path(self.__jobworkdir)).remove(
+                self.__step, self.__index)
+
             # Setup run directory
             self.__task.setup_work_directory(self.__workdir, remove_exist=not self.__replay)
 
@@ -939,6 +1291,9 @@ class SchedulerNode:
 
         self.logger.info(f'Running in {self.__workdir}')
 
+        cache_key = None
+        restored = False
+
         try:
             self.__task.pre_process()
         except TaskSkip as skip:
@@ -957,7 +1312,7 @@ class SchedulerNode:
                 required_outputs = set(self.__task.get('output'))
                 in_workdir = workdir(self.__project, step=in_step, index=in_index)
                 for outfile in os.scandir(f"{in_workdir}/outputs"):
-                    if outfile.name == f'{self.__name}.pkg.json':
+                    if outfile.name in self.__output_manifest_names:
                         # Dont forward manifest
                         continue
 
@@ -990,24 +1345,31 @@ class SchedulerNode:
                 if toolpath:
                     self.__record.record_tool(self.__step, self.__index, toolpath, RecordTool.PATH)
 
-                send_messages.send(self.__project, "begin", self.__step, self.__index)
+                if self.__nodecache and not self.__breakpoint and not self.__replay:
+                    cache_key = self.get_cache_key(version)
+                    if cache_key:
+                        restored = self.__restore_from_cache(cache_key)
 
-                try:
-                    if not self.__replay:
-                        self.__task.generate_replay_script(self.__replay_script, self.__workdir)
-                    ret_code = self.__task.run_task(
-                        self.__workdir,
-                        self.__project.get('option', 'quiet',
-                                           step=self.__step, index=self.__index),
-                        self.__breakpoint,
-                        self.__project.get('option', 'nice',
-                                           step=self.__step, index=self.__index),
-                        self.__project.get('option', 'timeout',
-                                           step=self.__step, index=self.__index))
-                except Exception as e:
-                    raise e
+                if not restored:
+                    send_messages.send(self.__project, "begin", self.__step, self.__index)
 
-            if ret_code != 0:
+                    try:
+                        if not self.__replay:
+                            self.__task.generate_replay_script(self.__replay_script,
+                                                               self.__workdir)
+                        ret_code = self.__task.run_task(
+                            self.__workdir,
+                            self.__project.get('option', 'quiet',
+                                               step=self.__step, index=self.__index),
+                            self.__breakpoint,
+                            self.__project.get('option', 'nice',
+                                               step=self.__step, index=self.__index),
+                            self.__project.get('option', 'timeout',
+                                               step=self.__step, index=self.__index))
+                    except Exception as e:
+                        raise e
+
+            if not restored and ret_code != 0:
                 msg = f'Command failed with code {ret_code}.'
                 if os.path.exists(self.__logs["exe"]):
                     if self.__project.get('option', 'quiet', step=self.__step, index=self.__index):
@@ -1021,15 +1383,18 @@ class SchedulerNode:
                 self.logger.warning(msg)
                 self.__error = True
 
-            try:
-                self.__task.post_process()
-            except Exception as e:
-                self.logger.error(
-                    f"Post-processing failed for {self.__task.tool()}/{self.__task.task()}")
-                utils.print_traceback(self.logger, e)
-                self.__error = True
+            if not restored:
+                try:
+                    self.__task.post_process()
+                except Exception as e:
+                    self.logger.error(
+                        f"Post-processing failed for {self.__task.tool()}/{self.__task.task()}")
+                    utils.print_traceback(self.logger, e)
+                    self.__error = True
 
-        self.check_logfile()
+        if not restored:
+            # Restored metrics already include the log file results
+            self.check_logfile()
 
         if not self.__error and self.__hash:
             self.__hash_files_post_execute()
@@ -1049,7 +1414,7 @@ class SchedulerNode:
                 NodeStatus.SKIPPED:
             self.__record.set('status', NodeStatus.SUCCESS, step=self.__step, index=self.__index)
 
-        self.__project.write_manifest(self.__manifests["output"])
+        self.__write_output_manifest()
 
         self.summarize()
 
@@ -1066,10 +1431,158 @@ class SchedulerNode:
         if self.__error:
             self.halt()
 
+        if cache_key and not restored and \
+                self.__record.get('status', step=self.__step, index=self.__index) == \
+                NodeStatus.SUCCESS:
+            self.__insert_into_cache(cache_key)
+
         self.__report_output_files()
 
         send_messages.send(self.__project, "end", self.__step, self.__index)
 
+    @staticmethod
+    def __get_hash_cache() -> FileHashCache:
+        """Returns the file hash cache shared with :meth:`PathSchema.hash_files`."""
+        return FileHashCache(os.path.join(utils.default_cache_dir(), "filehashes.db"))
+
+    def __get_node_cache(self, hash_cache: FileHashCache) -> NodeCache:
+        """
+        Returns the node cache of the project.
+
+        Args:
+            hash_cache (:class:`FileHashCache`): cache to hash the files of the entries with.
+        """
+        maxsize = self.__project.get("option", "nodecachesize")
+        if maxsize is not None:
+            maxsize = maxsize * 1024 * 1024
+        return NodeCache(
+            os.path.join(str(RemoteResolver.determine_cache_dir(self.__project)), "nodes"),
+            maxsize=maxsize, hash_cache=hash_cache)
+
+    @property
+    def __cache_paths(self) -> List[str]:
+        """List[str]: The files and directories of the node stored in the node cache."""
+        return ["outputs", "reports", os.path.basename(self.__logs["exe"])]
+
+    def get_cache_key(self, version: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the key of the results of this node in the node cache.
+
+        The key is computed from the tool, tool version, task, the values of the keys
+        which trigger a rerun, see :meth:`get_check_changed_keys`, and the contents
+        of the files of those keys and of the input files of the node, so it must be
+        called once the inputs of the node have been set up.
+
+        Args:
+            version (str): version of the tool.
+
+        Returns:
+            str: the key, or None if the keys of the node could not be determined.
+        """
+        try:
+            value_keys, path_keys = self.get_check_changed_keys()
+        except KeyError:
+            return None
+
+        def get_node(key):
+            if self.__project.get(*key, field="pernode").is_never():
+                return None, None
+            return self.__step, self.__index
+
+        values = {}
+        for key in value_keys:
+            step, index = get_node(key)
+            values[",".join(key)] = self.__project.get(*key, step=step, index=index)
+
+        files = {}
+        for key in path_keys:
+            step, index = get_node(key)
+            files[",".join(key)] = self.__project.hash_files(
+                *key, update=False, check=False, verbose=False, missing_ok=True,
+                step=step, index=index)
+
+        input_manifest = os.path.basename(self.__manifests["input"])
+        with SchedulerNode.__get_hash_cache() as hash_cache:
+            inputs = NodeCache.hash_directory(
+                os.path.join(self.__workdir, "inputs"),
+                exclude={input_manifest, Journal.get_sidecar_path(input_manifest)},
+                hash_cache=hash_cache)
+
+        return NodeCache.get_key({
+            "tool": self.__task.tool(),
+            "task": self.__task.task(),
+            "version": version,
+            "step": self.__step,
+            "index": self.__index,
+            "name": self.__name,
+            "topmodule": self.__topmodule,
+            "values": values,
+            "files": files,
+            "inputs": inputs
+        })
+
+    def __restore_from_cache(self, key: str) -> bool:
+        """
+        Restores the results of this node from the node cache.
+
+        Args:
+            key (str): key of the node, see :meth:`get_cache_key`.
+
+        Returns:
+            bool: True if the results were restored.
+        """
+        with SchedulerNode.__get_hash_cache() as hash_cache:
+            info = self.__get_node_cache(hash_cache).restore(
+                key, self.__workdir, self.__cache_paths)
+        if info is None:
+            # Remove partially restored results
+            for path in ("outputs", "reports"):
+                path = os.path.join(self.__workdir, path)
+                shutil.rmtree(path, ignore_errors=True)
+                os.makedirs(path, exist_ok=True)
+            return False
+
+        for metric, value in info["metrics"].items():
+            if self.__metrics.valid(metric):
+                self.__metrics.set(metric, value, step=self.__step, index=self.__index)
+        for metric, files in info["reports"].items():
+            self.__task.set("report", metric, files)
+
+        self.logger.info(f"Restored results from node cache: {key}")
+        return True
+
+    def __insert_into_cache(self, key: str) -> None:
+        """
+        Stores the results of this node in the node cache.
+
+        Args:
+            key (str): key of the node, see :meth:`get_cache_key`.
+        """
+        metrics = {}
+        for metric in self.__metrics.getkeys():
+            if metric in SchedulerNode.__RUN_METRICS:
+                continue
+            value = self.__metrics.get(metric, step=self.__step, index=self.__index)
+            if value is not None:
+                metrics[metric] = value
+
+        reports = {}
+        for metric in self.__task.getkeys("report"):
+            files = self.__task.get("report", metric)
+            if files:
+                reports[metric] = files
+
+        exclude = {os.path.join("outputs", name) for name in self.__output_manifest_names}
+        with SchedulerNode.__get_hash_cache() as hash_cache:
+            self.__get_node_cache(hash_cache).insert(key, self.__workdir, self.__cache_paths, {
+                "step": self.__step,
+                "index": self.__index,
+                "tool": self.__task.tool(),
+                "task": self.__task.task(),
+                "metrics": metrics,
+                "reports": reports
+            }, exclude=exclude)
+
     def __generate_testcase(self) -> None:
         """
         Private helper to generate a test case upon failure.
@@ -1273,7 +1786,7 @@ class SchedulerNode:
                               "is missing.")
             error = True
 
-        outputs = set(outputs)
+        outputs = set(outputs).difference(self.__output_manifest_names)
 
         output_files = set(self.__task.get('output'))
 
@@ -1327,6 +1840,11 @@ class SchedulerNode:
                 self.__task.generate_replay_script(self.__replay_script, self.__workdir)
 
         for manifest in self.__manifests.values():
+            # the journal sidecar belongs to the source manifest and might be a hard link
+            sidecar = Journal.get_sidecar_path(manifest)
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+
             if os.path.exists(manifest):
                 schema = Project.from_manifest(filepath=manifest)
                 # delete file as it might be a hard link
@@ -1461,25 +1979,26 @@ class SchedulerNode:
         requires = self.get_required_path_keys()
 
         error = False
-        for key in sorted(requires):
-            param: Parameter = self.__project.get(*key, field=None)
-            check_step, check_index = self.step, self.index
-            if param.get(field='pernode').is_never():
-                check_step, check_index = None, None
+        with PathResolutionCache().active():
+            for key in sorted(requires):
+                param: Parameter = self.__project.get(*key, field=None)
+                check_step, check_index = self.step, self.index
+                if param.get(field='pernode').is_never():
+                    check_step, check_index = None, None
+
+                abspath = self.__project.find_files(*key,
+                                                    missing_ok=True,
+                                                    step=check_step, index=check_index)
+
+                unresolved_paths = param.get(step=check_step, index=check_index)
+                if not isinstance(abspath, list):
+                    abspath = [abspath]
+                    unresolved_paths = [unresolved_paths]
 
-            abspath = self.__project.find_files(*key,
-                                                missing_ok=True,
-                                                step=check_step, index=check_index)
-
-            unresolved_paths = param.get(step=check_step, index=check_index)
-            if not isinstance(abspath, list):
-                abspath = [abspath]
-                unresolved_paths = [unresolved_paths]
-
-            for path, setpath in zip(abspath, unresolved_paths):
-                if path is None:
-                    self.logger.error(f'Cannot resolve path {setpath} in '
-                                      f'required file keypath [{",".join(key)}] '
-                                      f'for {self.step}/{self.index}.')
-                    error = True
+                for path, setpath in zip(abspath, unresolved_paths):
+                    if path is None:
+                        self.logger.error(f'Cannot resolve path {setpath} in '
+                                          f'required file keypath [{",".join(key)}] '
+                                          f'for {self.step}/{self.index}.')
+                        error = True
         return not error
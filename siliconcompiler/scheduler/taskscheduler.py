@@ -1,11 +1,15 @@
+import functools
+import heapq
 import logging
 import multiprocessing
+import multiprocessing.connection
 import sys
 import time
 
 import os.path
 
-from typing import List, Dict, Tuple, Optional, Callable, ClassVar, Any, Literal, TYPE_CHECKING
+from typing import List, Dict, Set, Tuple, Optional, Callable, ClassVar, Any, Literal, \
+    TYPE_CHECKING
 
 from logging.handlers import QueueListener
 
@@ -18,12 +22,14 @@ from siliconcompiler.schema import Journal
 
 from siliconcompiler.utils.logging import SCBlankLoggerFormatter, SCBlankColorlessLoggerFormatter
 from siliconcompiler.utils.multiprocessing import MPManager
+from siliconcompiler.utils.paths import jobdir
 from siliconcompiler.scheduler import SCRuntimeError
+from siliconcompiler.scheduler.schedulernode import SchedulerNode
+from siliconcompiler.scheduler.workerpool import WorkerPool, WorkerTask
 
 if TYPE_CHECKING:
     from siliconcompiler import Flowgraph
     from siliconcompiler.project import Project
-    from siliconcompiler.scheduler import SchedulerNode
     from siliconcompiler.schema_support.record import RecordSchema
 
 
@@ -42,6 +48,18 @@ class TaskScheduler:
         "post_run": lambda project: None,
     }
 
+    # Estimated task durations in seconds for each tool, used to prioritize nodes
+    # when no historical metrics are available
+    __tool_durations: ClassVar[Dict[str, float]] = {
+        "builtin": 0.0
+    }
+    __default_duration: ClassVar[float] = 60.0
+
+    __MB: ClassVar[int] = 1024 * 1024
+
+    # Number of journal records sent with node descriptors before a new manifest is written
+    __max_dispatch_records: ClassVar[int] = 1000
+
     @staticmethod
     def register_callback(hook: Literal["pre_run", "pre_node", "post_node", "post_run"],
                           func: Callable[..., None]) -> None:
@@ -86,6 +104,11 @@ class TaskScheduler:
             self.__max_parallel_run = utils.get_cores()
         # clip max parallel jobs to 1 <= jobs <= max_cores
         self.__max_parallel_run = max(1, min(self.__max_parallel_run, self.__max_cores))
+        self.__max_memory = self.__project.option.scheduler.get_maxmemory()
+        if self.__max_memory:
+            self.__max_memory *= TaskScheduler.__MB
+        else:
+            self.__max_memory = utils.get_available_memory()
 
         self.__runtime_flow = RuntimeFlowgraph(
             self.__flow,
@@ -97,7 +120,12 @@ class TaskScheduler:
 
         self.__nodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self.__startTimes: Dict[Optional[Tuple[str, str]], float] = {}
-        self.__dwellTime: float = 0.1
+
+        self.__pool: Optional[WorkerPool] = None
+        # Manifests written for node descriptors and the changes made to the project
+        # since the last one, see __get_descriptor
+        self.__dispatch_manifests: List[str] = []
+        self.__dispatch_journal = Journal()
 
         self.__create_nodes(tasks)
 
@@ -108,6 +136,12 @@ class TaskScheduler:
         This method iterates through the tasks identified by the main Scheduler,
         creates a multiprocessing.Process for each one, and sets up pipes for
         inter-process communication (primarily for logging and package resolution).
+        If :keypath:`option,scheduler,workerpool` is set, the local nodes are run
+        in a :class:`WorkerPool` instead.
+
+        Local nodes are sent to the worker or new process as a descriptor, see
+        :meth:`SchedulerNode.get_descriptor`, unless the process is forked from
+        this process.
 
         Args:
             tasks (dict): A dictionary of SchedulerNode objects.
@@ -117,6 +151,9 @@ class TaskScheduler:
             from_steps=set([step for step, _ in self.__flow.get_entry_nodes()]),
             prune_nodes=self.__project.option.get_prune())
 
+        use_pool = self.__project.option.scheduler.get_workerpool()
+        use_descriptor = multiprocessing.get_start_method() != "fork"
+        pooled = []
         for step, index in self.__runtime_flow.get_nodes():
             if self.__record.get('status', step=step, index=index) != NodeStatus.PENDING:
                 continue
@@ -127,7 +164,9 @@ class TaskScheduler:
                 "proc": None,
                 "parent_pipe": None,
                 "threads": None,
+                "memory": 0,
                 "running": False,
+                "packages": None,
                 "manifest": None,
                 "node": tasks[(step, index)]
             }
@@ -139,12 +178,30 @@ class TaskScheduler:
                 threads = self.__max_threads
             task["threads"] = max(1, min(threads, self.__max_threads))
 
-            task["parent_pipe"], pipe = multiprocessing.Pipe()
-            task["node"].set_queue(pipe, self.__log_queue)
+            if use_pool and task["node"].is_local:
+                # The worker is given the node when the node is launched
+                pooled.append((step, index))
+            elif use_descriptor and task["node"].is_local:
+                task["parent_pipe"], pipe = multiprocessing.Pipe()
+
+                # The process is created with the descriptor when the node is launched
+                task["process_args"] = (pipe, self.__log_queue)
+            else:
+                task["parent_pipe"], pipe = multiprocessing.Pipe()
+                task["node"].set_queue(pipe, self.__log_queue)
 
-            task["proc"] = multiprocessing.Process(target=task["node"].run)
+                task["proc"] = multiprocessing.Process(target=task["node"].run)
             self.__nodes[(step, index)] = task
 
+        if pooled:
+            self.__pool = WorkerPool(
+                min(len(pooled), self.__max_parallel_run),
+                recycle=self.__project.option.scheduler.get_workerrecycle(),
+                queue=self.__log_queue)
+            for node in pooled:
+                self.__nodes[node]["proc"] = self.__pool.task(
+                    functools.partial(self.__get_descriptor, node))
+
         # Create ordered list of nodes
         self.__ordered_nodes: List[Tuple[str, str]] = []
         for levelnodes in self.__runtime_flow.get_execution_order():
@@ -152,6 +209,197 @@ class TaskScheduler:
                 if node in self.__nodes:
                     self.__ordered_nodes.append(node)
 
+        self.__waiting: Set[Tuple[str, str]] = set(self.__ordered_nodes)
+        self.__running: Set[Tuple[str, str]] = set()
+        self.__running_threads = 0
+        self.__running_memory = 0
+
+        # Track the inputs managed by this scheduler which have not completed yet,
+        # nodes are moved to the ready queue once all of them have completed
+        self.__order: Dict[Tuple[str, str], int] = {}
+        self.__dependents: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self.__unfinished_inputs: Dict[Tuple[str, str], int] = {}
+        for order, node in enumerate(self.__ordered_nodes):
+            self.__order[node] = order
+            self.__unfinished_inputs[node] = 0
+            for in_node in self.__nodes[node]["inputs"]:
+                if in_node in self.__nodes:
+                    self.__dependents.setdefault(in_node, []).append(node)
+                    self.__unfinished_inputs[node] += 1
+
+        # Only local nodes wait for resources, so the history of earlier jobs is only
+        # read to estimate the needs of local nodes, in a single pass over the jobs
+        memory = self.__declared_memory()
+        node_durations, peak_memory = self.__read_history(
+            durations=any(info["node"].is_local for info in self.__nodes.values()),
+            memory_nodes=set(node for node, info in self.__nodes.items()
+                             if info["node"].is_local and node not in memory))
+        for node, peak in peak_memory.items():
+            memory.setdefault(node, peak)
+        for node, node_memory in memory.items():
+            self.__nodes[node]["memory"] = node_memory
+
+        # Rank nodes by the longest estimated path from the node to the end of the flow
+        durations = self.__estimate_durations(node_durations)
+        self.__priority: Dict[Tuple[str, str], float] = {}
+        for node in reversed(self.__ordered_nodes):
+            self.__priority[node] = durations[node] + max(
+                [self.__priority[out_node] for out_node in self.__dependents.get(node, [])],
+                default=0.0)
+
+        self.__ready: List[Tuple[float, int, Tuple[str, str]]] = []
+        for node in self.__ordered_nodes:
+            if self.__unfinished_inputs[node] == 0:
+                self.__ready.append(self.__ready_entry(node))
+        heapq.heapify(self.__ready)
+
+    def __read_history(self, durations: bool, memory_nodes: Set[Tuple[str, str]]) \
+            -> Tuple[Dict[Tuple[str, str], List[float]], Dict[Tuple[str, str], int]]:
+        """
+        Private helper to read the metrics recorded for the nodes in the jobs stored
+        in history.
+
+        Each job record is read from the history directory when it is first accessed,
+        so all the metrics are read in one pass and the pass is skipped when no metrics
+        are needed.
+
+        Args:
+            durations (bool): if True, read the tasktime (or exetime) of every node.
+            memory_nodes (set): nodes to read the peak memory of.
+
+        Returns:
+            tuple: the durations in seconds recorded for each node, and the largest
+            peak memory in bytes recorded for each node, keyed by (step, index).
+        """
+        node_durations: Dict[Tuple[str, str], List[float]] = {}
+        peak_memory: Dict[Tuple[str, str], int] = {}
+        if not durations and not memory_nodes:
+            return node_durations, peak_memory
+
+        for job in self.__project.getkeys("history"):
+            try:
+                history = self.__project.history(job)
+            except FileNotFoundError:
+                # Record was removed from the history directory
+                continue
+
+            if durations:
+                for step, index in self.__nodes:
+                    duration = None
+                    for metric in ("tasktime", "exetime"):
+                        try:
+                            duration = history.get("metric", metric, step=step, index=index)
+                        except KeyError:
+                            continue
+                        if duration is not None:
+                            break
+                    if duration is not None:
+                        node_durations.setdefault((step, index), []).append(duration)
+
+            for step, index in memory_nodes:
+                try:
+                    peak = history.get("metric", "memory", step=step, index=index)
+                except KeyError:
+                    continue
+                if peak:
+                    peak_memory[(step, index)] = max(int(peak),
+                                                     peak_memory.get((step, index), 0))
+
+        return node_durations, peak_memory
+
+    def __estimate_durations(self, node_durations: Dict[Tuple[str, str], List[float]]) \
+            -> Dict[Tuple[str, str], float]:
+        """
+        Private helper to estimate how long each node will take to run.
+
+        The estimate is the average duration recorded for the node in the jobs stored
+        in history, see :meth:`__read_history`. Nodes without records use the average
+        for the same tool, and otherwise a default duration for the tool.
+
+        Args:
+            node_durations (dict): durations in seconds recorded for each node.
+
+        Returns:
+            dict: estimated duration in seconds keyed by (step, index).
+        """
+        tool_durations: Dict[str, List[float]] = {}
+        for node, samples in node_durations.items():
+            tool_durations.setdefault(self.__flow.get(*node, "tool"), []).extend(samples)
+
+        durations = {}
+        for node in self.__nodes:
+            tool = self.__flow.get(*node, "tool")
+            samples = node_durations.get(node, tool_durations.get(tool, None))
+            if samples:
+                durations[node] = sum(samples) / len(samples)
+            else:
+                durations[node] = TaskScheduler.__tool_durations.get(
+                    tool, TaskScheduler.__default_duration)
+        return durations
+
+    def __declared_memory(self) -> Dict[Tuple[str, str], int]:
+        """
+        Private helper to get the memory declared for each local node in
+        :keypath:`option,scheduler,memory`.
+
+        Local nodes without a declared memory use the largest peak memory recorded
+        for the node in the jobs stored in history, see :meth:`__read_history`, and
+        are otherwise not expected to use any memory.
+
+        Returns:
+            dict: declared memory in bytes keyed by (step, index).
+        """
+        memory: Dict[Tuple[str, str], int] = {}
+        for node, info in self.__nodes.items():
+            if not info["node"].is_local:
+                continue
+            declared = self.__project.option.scheduler.get_memory(step=node[0], index=node[1])
+            if declared:
+                memory[node] = declared * TaskScheduler.__MB
+        return memory
+
+    def __ready_entry(self, node: Tuple[str, str]) -> Tuple[float, int, Tuple[str, str]]:
+        """
+        Private helper to create the ready queue entry for a node.
+
+        Nodes on the longest remaining path are launched first, ties are launched
+        in execution order.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        return (-self.__priority[node], self.__order[node], node)
+
+    def __get_descriptor(self, node: Tuple[str, str]) -> Dict[str, Any]:
+        """
+        Private helper to create the descriptor of a node being launched.
+
+        The descriptor points to a manifest of the project written by this scheduler
+        and carries the journal of the changes made to the project since then, which
+        is recorded separately from the project's own journal. A new manifest is
+        written once the journal grows too large.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        records = None
+        if self.__dispatch_manifests:
+            records = self.__dispatch_journal.get_records()
+            if len(records) > TaskScheduler.__max_dispatch_records:
+                records = None
+
+        if records is None:
+            manifest = os.path.join(
+                jobdir(self.__project),
+                f"{self.__project.name}.dispatch{len(self.__dispatch_manifests)}.pkg.json")
+            os.makedirs(os.path.dirname(manifest), exist_ok=True)
+            self.__project.write_manifest(manifest)
+            self.__dispatch_manifests.append(manifest)
+            self.__dispatch_journal.start()
+
+        return self.__nodes[node]["node"].get_descriptor(self.__dispatch_manifests[-1],
+                                                         journal=records or None)
+
     def run(self, job_log_handler: logging.Handler) -> None:
         """
         The main entry point for the task scheduling loop.
@@ -183,7 +431,12 @@ class TaskScheduler:
 
         TaskScheduler.__callbacks["pre_run"](self.__project)
 
+        # Record the changes to the project for node descriptors
+        Journal.access(self.__project).attach(self.__dispatch_journal)
+
         try:
+            if self.__pool:
+                self.__pool.start()
             self.__run_loop()
             TaskScheduler.__callbacks["post_run"](self.__project)
         except KeyboardInterrupt:
@@ -191,6 +444,16 @@ class TaskScheduler:
             log_listener.stop()
             sys.exit(0)
         finally:
+            if self.__pool:
+                self.__pool.close()
+
+            Journal.access(self.__project).detach(self.__dispatch_journal)
+            self.__dispatch_journal.stop()
+            for manifest in self.__dispatch_manifests:
+                if os.path.exists(manifest):
+                    os.remove(manifest)
+            self.__dispatch_manifests.clear()
+
             # Cleanup logger
             try:
                 log_listener.stop()
@@ -207,11 +470,12 @@ class TaskScheduler:
 
         This loop continues as long as there are nodes running or waiting to
         run. In each iteration, it processes completed nodes and launches new
-        ones whose dependencies have been met.
+        ones whose dependencies have been met, and then waits until a running
+        node completes.
         """
         self.__startTimes = {None: time.time()}
 
-        while len(self.get_nodes_waiting_to_run()) > 0 or len(self.get_running_nodes()) > 0:
+        while self.__waiting or self.__running:
             changed = self.__process_completed_nodes()
             changed |= self.__launch_nodes()
 
@@ -219,20 +483,51 @@ class TaskScheduler:
                 # Update dashboard if the manifest changed
                 self.__dashboard.update_manifest(payload={"starttimes": self.__startTimes})
 
-            running_nodes = self.get_running_nodes()
-
             # Check for situation where we have stuff left to run but don't
             # have any nodes running. This can happen when the flow generated an error
-            if len(self.get_nodes_waiting_to_run()) > 0 and len(running_nodes) == 0:
+            if not self.__running:
                 # Stop execution loop and report error
                 break
 
-            if len(running_nodes) == 1:
-                # if there is only one node running, just join the thread
-                self.__nodes[running_nodes[0]]["proc"].join()
-            elif len(running_nodes) > 1:
-                # if there are more than 1, join the first with a timeout
-                self.__nodes[running_nodes[0]]["proc"].join(timeout=self.__dwellTime)
+            self.__wait_for_nodes()
+
+    def __wait_for_nodes(self) -> None:
+        """
+        Private helper to block until a running node completes.
+
+        The node processes and their result pipes are waited on together, so
+        results sent by a node are received while it is still running.
+        """
+        waitables = {}
+        for node in self.__running:
+            info = self.__nodes[node]
+            waitables[info["proc"].sentinel] = info
+            if info["parent_pipe"] and info["packages"] is None:
+                waitables[info["parent_pipe"]] = info
+
+        for ready in multiprocessing.connection.wait(list(waitables)):
+            info = waitables[ready]
+            if ready is info["parent_pipe"]:
+                self.__receive_packages(info)
+            else:
+                # The sentinel is ready as the process exits, wait for it to finish
+                info["proc"].join()
+
+    @staticmethod
+    def __receive_packages(info: Dict[str, Any]) -> None:
+        """
+        Private helper to receive the package cache sent by a node.
+
+        Args:
+            info (dict): The node information.
+        """
+        info["packages"] = {}
+        try:
+            packages = info["parent_pipe"].recv()
+            if isinstance(packages, dict):
+                info["packages"] = packages
+        except:  # noqa E722
+            pass
 
     def get_nodes(self) -> List[Tuple[str, str]]:
         """Gets an ordered list of all nodes managed by this scheduler.
@@ -248,12 +543,7 @@ class TaskScheduler:
         Returns:
             list: A list of (step, index) tuples for running nodes.
         """
-        nodes = []
-        for node in self.get_nodes():
-            info = self.__nodes[node]
-            if info["running"]:
-                nodes.append(node)
-        return nodes
+        return sorted(self.__running, key=self.__order.get)
 
     def get_nodes_waiting_to_run(self) -> List[Tuple[str, str]]:
         """Gets an ordered list of all nodes that are pending execution.
@@ -261,12 +551,7 @@ class TaskScheduler:
         Returns:
             list: A list of (step, index) tuples for pending nodes.
         """
-        nodes = []
-        for node in self.get_nodes():
-            info = self.__nodes[node]
-            if not info["running"] and info["proc"]:
-                nodes.append(node)
-        return nodes
+        return sorted(self.__waiting, key=self.__order.get)
 
     def __process_completed_nodes(self) -> bool:
         """
@@ -275,7 +560,8 @@ class TaskScheduler:
         This method iterates through running nodes, checks if their process has
         terminated, and if so, merges their results (manifest and package cache)
         back into the main project object. It updates the node's status based on
-        the process exit code.
+        the process exit code, and queues the nodes which depend on it once all
+        of their inputs have completed.
 
         Returns:
             bool: True if any node's status changed, False otherwise.
@@ -295,14 +581,14 @@ class TaskScheduler:
                     self.__schema.unset("arg", "step")
                     self.__schema.unset("arg", "index")
 
-                if info["parent_pipe"] and info["parent_pipe"].poll(1):
-                    try:
-                        packages = info["parent_pipe"].recv()
-                        if isinstance(packages, dict):
-                            for package, path in packages.items():
-                                Resolver.set_cache(self.__project, package, path)
-                    except:  # noqa E722
-                        pass
+                if isinstance(info["proc"], WorkerTask):
+                    info["packages"] = info["proc"].packages
+                elif info["parent_pipe"] and info["packages"] is None and \
+                        info["parent_pipe"].poll():
+                    self.__receive_packages(info)
+                if info["packages"]:
+                    for package, path in info["packages"].items():
+                        Resolver.set_cache(self.__project, package, path)
 
                 step, index = node
                 if info["proc"].exitcode > 0:
@@ -316,6 +602,14 @@ class TaskScheduler:
 
                 info["running"] = False
                 info["proc"] = None
+                self.__running.remove(node)
+                self.__running_threads -= info["threads"]
+                self.__running_memory -= info["memory"]
+
+                for out_node in self.__dependents.get(node, []):
+                    self.__unfinished_inputs[out_node] -= 1
+                    if self.__unfinished_inputs[out_node] == 0:
+                        heapq.heappush(self.__ready, self.__ready_entry(out_node))
 
                 changed = True
 
@@ -328,7 +622,10 @@ class TaskScheduler:
         Private helper to check if a node is allowed to start based on resources.
 
         This method checks if launching a new node would exceed the configured
-        maximum number of parallel jobs or the total available CPU cores.
+        maximum number of parallel jobs, the total available CPU cores, or the
+        memory budget. Nodes are only held back for memory while other nodes with
+        expected memory are running, so a node which needs more than the budget
+        still runs on its own.
 
         Args:
             node (tuple): The (step, index) of the node to check.
@@ -342,18 +639,23 @@ class TaskScheduler:
             # using a different scheduler, so allow
             return True
 
-        running_nodes = self.get_running_nodes()
-
-        if len(running_nodes) >= self.__max_parallel_run:
+        if len(self.__running) >= self.__max_parallel_run:
             # exceeding machine resources
             return False
 
-        current_threads = sum([self.__nodes[run_node]["threads"] for run_node in running_nodes])
-
-        if info["threads"] + current_threads > self.__max_cores:
+        if info["threads"] + self.__running_threads > self.__max_cores:
             # delay until there are enough core available
             return False
 
+        if info["memory"] and self.__running_memory:
+            if info["memory"] + self.__running_memory > self.__max_memory:
+                # delay until the running nodes release their memory
+                return False
+
+            if info["memory"] > utils.get_available_memory():
+                # delay until there is enough memory available
+                return False
+
         # allow
         return True
 
@@ -361,15 +663,20 @@ class TaskScheduler:
         """
         Private helper to launch new nodes whose dependencies are met.
 
-        This method iterates through pending nodes, checks if all their input
-        nodes have completed successfully, and if system resources are available.
+        This method iterates through the queued nodes, starting with the nodes on
+        the longest remaining path, checks if all their input nodes have completed
+        successfully, and if system resources are available.
         If all conditions are met, it starts the node's process.
 
         Returns:
             bool: True if any new node was launched, False otherwise.
         """
         changed = False
-        for node in self.get_nodes_waiting_to_run():
+        delayed = []
+        while self.__ready:
+            entry = heapq.heappop(self.__ready)
+            node = entry[-1]
+
             # TODO: breakpoint logic:
             # if node is breakpoint, then don't launch while len(running_nodes) > 0
 
@@ -399,11 +706,16 @@ class TaskScheduler:
 
             if not able_to_run:
                 info["proc"] = None
+                self.__waiting.remove(node)
+                continue
+
+            if not ready:
+                # Inputs completed without finishing, so this node will never be ready
                 continue
 
             # If there are no dependencies left, launch this node and
             # remove from nodes_to_run.
-            if ready and self.__allow_start(node):
+            if self.__allow_start(node):
                 self.__logger.debug(f'Launching {info["name"]}')
 
                 TaskScheduler.__callbacks['pre_node'](self.__project, step, index)
@@ -412,9 +724,23 @@ class TaskScheduler:
                 self.__startTimes[node] = time.time()
                 changed = True
 
+                if "process_args" in info and info["proc"] is None:
+                    info["proc"] = multiprocessing.Process(
+                        target=SchedulerNode.run_descriptor,
+                        args=(self.__get_descriptor(node), *info["process_args"]))
+
                 # Start the process
                 info["running"] = True
+                self.__waiting.remove(node)
+                self.__running.add(node)
+                self.__running_threads += info["threads"]
+                self.__running_memory += info["memory"]
                 info["proc"].start()
+            else:
+                delayed.append(entry)
+
+        for entry in delayed:
+            heapq.heappush(self.__ready, entry)
 
         return changed
 
@@ -0,0 +1,234 @@
+import multiprocessing
+import traceback
+
+import os.path
+
+from queue import Queue
+from typing import Any, Callable, List, Set, Optional, Dict, TYPE_CHECKING
+
+from siliconcompiler.package import Resolver
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+
+def _worker_main(conn: "Connection", queue: Optional[Queue]) -> None:
+    """
+    Entry point for a pool worker process.
+
+    The worker runs the nodes described by the descriptors it receives, see
+    :meth:`SchedulerNode.get_descriptor`, until the pool sends None or closes
+    the connection. After each node the worker sends back the exit code of the
+    node and the package cache of the project.
+
+    Args:
+        conn (Connection): The connection to the pool.
+        queue (Queue): The queue to send log records to.
+    """
+    cwd = os.getcwd()
+    while True:
+        node = None
+        exitcode = 0
+        packages = None
+        try:
+            descriptor = conn.recv()
+            if descriptor is None:
+                return
+            node = descriptor["cls"].from_descriptor(descriptor)
+            node.set_queue(None, queue)
+            node.run()
+            packages = Resolver.get_cache(node.project)
+        except (EOFError, KeyboardInterrupt):
+            return
+        except SystemExit as e:
+            if e.code is None:
+                exitcode = 0
+            elif isinstance(e.code, int):
+                exitcode = e.code
+            else:
+                exitcode = 1
+        except BaseException:
+            traceback.print_exc()
+            exitcode = 1
+        finally:
+            # Restore the worker for the next node
+            os.chdir(cwd)
+            if node is not None:
+                for handler in list(node.logger.handlers):
+                    handler.close()
+                    node.logger.removeHandler(handler)
+
+        try:
+            conn.send((exitcode, packages))
+        except (BrokenPipeError, EOFError):
+            return
+
+
+class _Worker:
+    """
+    A worker process of a :class:`WorkerPool`.
+
+    Args:
+        context: The multiprocessing context used to start the process.
+        queue (Queue): The queue to send log records to.
+    """
+    def __init__(self, context, queue: Optional[Queue]):
+        self.conn, child_conn = context.Pipe()
+        self.proc = context.Process(target=_worker_main, args=(child_conn, queue))
+        self.proc.start()
+        # Close the parent copy so the pool receives EOF if the worker exits
+        child_conn.close()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the worker process.
+
+        Args:
+            timeout (float): Time in seconds to wait for the worker to exit
+                before terminating it, None terminates it immediately.
+        """
+        if timeout is not None and self.proc.is_alive():
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            self.proc.join(timeout)
+        if self.proc.is_alive():
+            self.proc.terminate()
+            self.proc.join()
+        self.conn.close()
+
+
+class WorkerTask:
+    """
+    Runs a node on a worker from a :class:`WorkerPool`.
+
+    This provides the subset of the :class:`multiprocessing.Process` interface used by
+    the :class:`TaskScheduler`, so pooled nodes are managed like nodes running in
+    their own process.
+
+    Args:
+        pool (WorkerPool): The pool to run the node on.
+        get_descriptor (function): Returns the descriptor of the node to run, called
+            when the task starts so the descriptor is up to date.
+    """
+    def __init__(self, pool: "WorkerPool", get_descriptor: Callable[[], Dict[str, Any]]):
+        self.__pool = pool
+        self.__get_descriptor = get_descriptor
+        self.__worker: Optional[_Worker] = None
+
+        self.exitcode: Optional[int] = None
+        self.packages: Optional[Dict[str, str]] = None
+
+    @property
+    def sentinel(self) -> "Connection":
+        """Connection: ready once the node completes or the worker exits."""
+        return self.__worker.conn
+
+    def start(self) -> None:
+        """Sends the node to an idle worker."""
+        descriptor = self.__get_descriptor()
+        self.__worker = self.__pool._acquire()
+        try:
+            self.__worker.conn.send(descriptor)
+        except (BrokenPipeError, EOFError, OSError):
+            # Worker exited before receiving the node
+            self.__complete(1, None)
+
+    def is_alive(self) -> bool:
+        """Returns True if the node is still running."""
+        if self.exitcode is not None:
+            return False
+        if self.__worker.conn.poll() or not self.__worker.proc.is_alive():
+            self.join()
+            return False
+        return True
+
+    def join(self) -> None:
+        """Waits for the node to complete."""
+        if self.exitcode is not None:
+            return
+
+        try:
+            exitcode, packages = self.__worker.conn.recv()
+        except (EOFError, OSError):
+            # Worker exited while running the node
+            exitcode, packages = 1, None
+        self.__complete(exitcode, packages)
+
+    def __complete(self, exitcode: int, packages: Optional[Dict[str, str]]) -> None:
+        self.exitcode = exitcode
+        self.packages = packages
+        self.__pool._release(self.__worker, retire=exitcode != 0)
+
+
+class WorkerPool:
+    """
+    A pool of started worker processes for running nodes.
+
+    Starting a process for every node means the process has to start and import
+    siliconcompiler and the tool modules before the node can run. The workers in
+    the pool are started ahead of time and reused for the following nodes.
+
+    Args:
+        size (int): The number of workers in the pool.
+        recycle (bool): If True, each worker is replaced after running one node,
+            so nodes do not share a process.
+        queue (Queue): The queue the nodes send log records to.
+    """
+    def __init__(self, size: int, recycle: bool = False, queue: Optional[Queue] = None):
+        self.__context = multiprocessing.get_context()
+        self.__queue = queue
+        self.__size = max(1, size)
+        self.__recycle = recycle
+
+        self.__idle: List[_Worker] = []
+        self.__busy: Set[_Worker] = set()
+
+    def start(self) -> None:
+        """Starts the workers of the pool."""
+        while len(self.__idle) + len(self.__busy) < self.__size:
+            self.__idle.append(_Worker(self.__context, self.__queue))
+
+    def task(self, get_descriptor: Callable[[], Dict[str, Any]]) -> WorkerTask:
+        """
+        Creates a task which runs a node on the pool once started.
+
+        Args:
+            get_descriptor (function): Returns the descriptor of the node to run.
+        """
+        return WorkerTask(self, get_descriptor)
+
+    def _acquire(self) -> _Worker:
+        """Returns an idle worker, starting a new worker if none is idle."""
+        if self.__idle:
+            worker = self.__idle.pop()
+        else:
+            worker = _Worker(self.__context, self.__queue)
+        self.__busy.add(worker)
+        return worker
+
+    def _release(self, worker: _Worker, retire: bool = False) -> None:
+        """
+        Returns a worker to the pool once its node has completed.
+
+        Args:
+            worker (_Worker): The worker.
+            retire (bool): If True, the worker is replaced by a new worker.
+        """
+        self.__busy.discard(worker)
+        if retire or self.__recycle:
+            worker.close(timeout=1)
+            if len(self.__idle) + len(self.__busy) < self.__size:
+                self.__idle.append(_Worker(self.__context, self.__queue))
+        else:
+            self.__idle.append(worker)
+
+    def close(self) -> None:
+        """Stops all workers, workers still running a node are terminated."""
+        for worker in self.__idle:
+            worker.close(timeout=1)
+        for worker in self.__busy:
+            worker.close()
+        self.__idle.clear()
+        self.__busy.clear()
@@ -8,6 +8,7 @@ import contextlib
 import copy
 import importlib
 import logging
+import weakref
 
 try:
     import gzip
@@ -15,6 +16,12 @@ try:
 except ModuleNotFoundError:
     _has_gzip = False
 
+try:
+    import zstandard
+    _has_zstd = True
+except ModuleNotFoundError:
+    _has_zstd = False
+
 try:
     import orjson as json
     _has_orjson = True
@@ -24,12 +31,18 @@ except ModuleNotFoundError:
 
 import os.path
 
+from collections.abc import Mapping
 from enum import Enum, auto
 from functools import cache
-from typing import Dict, Type, Tuple, Union, Set, Callable, List, Optional, TextIO, Iterable, Any
+from typing import Dict, Type, Tuple, Union, Set, Callable, List, Optional, Iterable, Any, \
+    FrozenSet, Iterator
 
 from .parameter import Parameter, NodeValue
+from .parametervalue import PathNodeValue
+from .filehash import FileHashCache
+from .pathcache import PathResolutionCache
 from .journal import Journal
+from . import binarymanifest
 from ._metadata import version
 
 
@@ -60,6 +73,186 @@ class LazyLoad(Enum):
         return self == LazyLoad.ON
 
 
+class _CopyState:
+    '''
+    Copy-on-write state of a schema section, see :meth:`BaseSchema.copy`.
+
+    This is shared between shallow copies of a section, since they share
+    the same children, and is never copied or serialized.
+    '''
+    __slots__ = ("borrowed", "borrowers")
+
+    def __init__(self):
+        # Keys of the children still owned by the section this was copied from
+        self.borrowed: Set[str] = set()
+        # Sections borrowing this section as a child: (id, key) -> reference
+        self.borrowers: Dict[Tuple[int, str], weakref.ref] = {}
+
+    def __reduce__(self):
+        return (_CopyState, ())
+
+    def __deepcopy__(self, memo):
+        return _CopyState()
+
+
+class _KeypathIndex:
+    '''
+    Flat lookup from keypath to parameter for a schema section, which allows
+    repeated accesses to skip the search through the schema.
+
+    Every index is cleared when the structure of any schema changes, see :meth:`invalidate`,
+    and an index is cleared when a section it reaches replaces a child borrowed from
+    another schema, see :meth:`BaseSchema.copy`.
+    This is never copied or serialized.
+    '''
+    __slots__ = ("version", "read", "write")
+
+    __version = 0
+
+    def __init__(self):
+        self.version = _KeypathIndex.__version
+        # Parameters found with default keys as wildcards
+        self.read: Dict[Tuple[str, ...], Parameter] = {}
+        # Parameters found for writing, the path to these is owned by the section
+        self.write: Dict[Tuple[str, ...], Parameter] = {}
+
+    @staticmethod
+    def invalidate() -> None:
+        '''
+        Marks all indexes as stale, must be called before keys are added or removed
+        in any schema.
+        '''
+        _KeypathIndex.__version += 1
+
+    def clear(self) -> None:
+        '''
+        Clears this index.
+        '''
+        self.read.clear()
+        self.write.clear()
+
+    def __check_version(self) -> None:
+        if self.version != _KeypathIndex.__version:
+            self.version = _KeypathIndex.__version
+            self.clear()
+
+    def get(self, keypath: Tuple[str, ...], writeable: bool = False) -> Optional[Parameter]:
+        '''
+        Returns the parameter for the keypath if it is in the index.
+
+        Args:
+            keypath (list of str): keypath to lookup
+            writeable (bool): if true, only return parameters found for writing
+        '''
+        self.__check_version()
+        try:
+            param = self.write.get(keypath, None)
+            if param is None and not writeable:
+                param = self.read.get(keypath, None)
+        except TypeError:
+            # Unhashable keypath
+            return None
+        return param
+
+    def add(self, keypath: Tuple[str, ...], param: Parameter, writeable: bool = False) -> None:
+        '''
+        Adds a parameter to the index.
+
+        Args:
+            keypath (list of str): keypath to the parameter
+            param (:class:`Parameter`): parameter found
+            writeable (bool): if true, the parameter was found for writing
+        '''
+        self.__check_version()
+        if writeable:
+            self.write[keypath] = param
+        else:
+            self.read[keypath] = param
+
+    def __reduce__(self):
+        return (_KeypathIndex, ())
+
+    def __deepcopy__(self, memo):
+        return _KeypathIndex()
+
+
+class _KeyCache:
+    '''
+    Keypaths below a schema section, see :meth:`BaseSchema.allkeys`.
+
+    This is cleared when keys are added or removed in the section or any section
+    below it, and is never copied or serialized.
+    '''
+    __slots__ = ("keys",)
+
+    def __init__(self):
+        # (include_default, paths_only) -> keypaths
+        self.keys: Dict[Tuple[bool, bool], FrozenSet[Tuple[str, ...]]] = {}
+
+    def __reduce__(self):
+        return (_KeyCache, ())
+
+    def __deepcopy__(self, memo):
+        return _KeyCache()
+
+
+class _SectionEncoding:
+    '''
+    Cached JSON encoding of a schema section, see :meth:`BaseSchema.write_manifest`.
+
+    This is cleared when the section or any section below it is modified, and is
+    never copied or serialized.
+    '''
+    __slots__ = ("key", "meta", "pieces", "externals", "external")
+
+    def __init__(self):
+        # Encoder and indentation used
+        self.key: Optional[Tuple[bool, int]] = None
+        # Meta section included in the encoding
+        self.meta: Optional[Dict] = None
+        # Fragments of the encoding, which are joined to form the section
+        self.pieces: Optional[Tuple[bytes, ...]] = None
+        # How the sections below stored in separate manifests were written, see
+        # :meth:`BaseSchema._write_linked_manifest`
+        self.externals: Optional[Tuple[bool, str, bool]] = None
+        # Manifest holding the section, see :meth:`BaseSchema._write_external_manifest`
+        self.external: Optional[str] = None
+
+    def clear(self) -> None:
+        '''
+        Drops the cached encoding.
+        '''
+        self.key = None
+        self.meta = None
+        self.pieces = None
+        self.externals = None
+        self.external = None
+
+    def __reduce__(self):
+        return (_SectionEncoding, ())
+
+    def __deepcopy__(self, memo):
+        return _SectionEncoding()
+
+
+def _encode_json(value: Any, depth: int = 0) -> bytes:
+    '''
+    Returns the indented JSON encoding of a value.
+
+    Args:
+        value (any): value to encode
+        depth (int): indentation level the value is placed at
+    '''
+    if _has_orjson:
+        data = json.dumps(value, option=json.OPT_INDENT_2)
+    else:
+        data = json.dumps(value, indent=2).encode("utf-8")
+    if depth:
+        # Newlines in strings are escaped, so these only occur between items
+        data = data.replace(b"\n", b"\n" + b"  " * depth)
+    return data
+
+
 class BaseSchema:
     '''
     This class maintains the access and file IO operations for the schema.
@@ -77,6 +270,16 @@ class BaseSchema:
         self.__active: Optional[Dict] = None
         self.__key: Optional[str] = None
         self.__lazy: Optional[Tuple[Optional[Tuple[int, ...]], Dict]] = None
+        self.__cow: _CopyState = _CopyState()
+        self.__index: Optional[_KeypathIndex] = None
+        self.__keycache: _KeyCache = _KeyCache()
+        self.__encoding: _SectionEncoding = _SectionEncoding()
+
+    def __reduce_ex__(self, protocol):
+        # Serialized and deep copied schemas must own all their children
+        for key in list(self.__cow.borrowed):
+            self.__cow_own(key)
+        return super().__reduce_ex__(protocol)
 
     @property
     def __is_root(self) -> bool:
@@ -191,7 +394,8 @@ class BaseSchema:
     def __extractversion(manifest: Dict) -> Optional[Tuple[int, ...]]:
         schema_version = manifest.get(BaseSchema._version_key, None)
         if schema_version:
-            param = Parameter.from_dict(schema_version,
+            # Copy since decoding the parameter modifies the manifest
+            param = Parameter.from_dict(copy.deepcopy(schema_version),
                                         tuple([BaseSchema._version_key]),
                                         None)
             return tuple([int(v) for v in param.get().split('.')])
@@ -202,10 +406,25 @@ class BaseSchema:
             return
 
         version, manifest = self.__lazy
+        if "__external__" in manifest and not os.path.exists(manifest["__external__"]):
+            raise FileNotFoundError(f"{self.__format_key()} is stored in "
+                                    f"{manifest['__external__']}, which does not exist")
         self.__lazy = None
 
+        # Loading a section does not modify it, so sections stored in external
+        # manifests can still be referenced afterwards
+        externals: List[Tuple["BaseSchema", str]] = []
+        schema = self.__parent
+        while schema is not None:
+            if schema.__encoding.external:
+                externals.append((schema, schema.__encoding.external))
+            schema = schema.__parent
+
         self._from_dict(manifest, self._keypath, version=version, lazyload=LazyLoad.FORWARD)
 
+        for schema, external in externals:
+            schema.__encoding.external = external
+
     def _from_dict(self, manifest: Dict,
                    keypath: Union[List[str], Tuple[str, ...]],
                    version: Optional[Tuple[int, ...]] = None,
@@ -219,6 +438,8 @@ class BaseSchema:
             keypath (list of str): Path to the current keypath.
             version ((int, int, int)): Version of the dictionary schema
         '''
+        self.__keys_changed()
+
         # find schema version
         if not version:
             version = BaseSchema.__extractversion(manifest)
@@ -226,6 +447,18 @@ class BaseSchema:
             if version is None:
                 version = BaseSchema.__version
 
+        if "__external__" in manifest:
+            # Section is stored in a separate manifest, which is read once the section
+            # is accessed if it is missing
+            external = manifest["__external__"]
+            if lazyload == LazyLoad.ON or not os.path.exists(external):
+                self.__lazy = (version, manifest)
+                return set(), set()
+            ret = self._from_dict(BaseSchema._read_manifest(external, lazy=True), keypath,
+                                  lazyload=lazyload)
+            self.__encoding.external = external
+            return ret
+
         handled = set()
         missing = set()
 
@@ -240,26 +473,29 @@ class BaseSchema:
 
         if "__meta__" in manifest:
             del manifest["__meta__"]
+        if "__linked__" in manifest:
+            del manifest["__linked__"]
 
         if self.__default:
             data = manifest.pop("default", None)
             if data:
-                if isinstance(self.__default, BaseSchema):
-                    self.__default._from_dict(data, tuple([*keypath, "default"]), version=version,
-                                              lazyload=lazyload.next)
+                default = self.__cow_own("default")
+                if isinstance(default, BaseSchema):
+                    default._from_dict(data, tuple([*keypath, "default"]), version=version,
+                                       lazyload=lazyload.next)
                 else:
-                    self.__default._from_dict(data, tuple([*keypath, "default"]), version=version)
+                    default._from_dict(data, tuple([*keypath, "default"]), version=version)
                 handled.add("default")
 
         for key, data in manifest.items():
             data_keypath = tuple([*keypath, key])
-            obj = self.__manifest.get(key, None)
-            if not obj and isinstance(data, dict) and "__meta__" in data:
+            obj = self.__cow_own(key)
+            if not obj and isinstance(data, Mapping) and "__meta__" in data:
                 # Lookup object, use class first, then type
                 cls = BaseSchema.__process_meta_section(data["__meta__"])
                 if cls is BaseSchema and self.__default:
                     # Use default when BaseSchema is the class
-                    obj = self.__default.copy(key=data_keypath)
+                    obj = self.__copy_default(data_keypath)
                     self.__manifest[key] = obj
                 elif cls:
                     # Create object and connect to schema
@@ -270,7 +506,7 @@ class BaseSchema:
 
             # Use default if it is available
             if not obj and self.__default:
-                obj = self.__default.copy(key=data_keypath)
+                obj = self.__copy_default(data_keypath)
                 self.__manifest[key] = obj
 
             if obj:
@@ -304,7 +540,7 @@ class BaseSchema:
             raise RuntimeError("filepath or dictionary is required")
 
         if filepath:
-            cfg = BaseSchema._read_manifest(filepath)
+            cfg = BaseSchema._read_manifest(filepath, lazy=lazyload)
 
         new_cls = None
         if "__meta__" in cfg:
@@ -324,35 +560,109 @@ class BaseSchema:
 
         return schema
 
+    # Leading bytes of compressed manifests
+    __GZIP_MAGIC = b"\x1f\x8b"
+    __ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+    # zstd compression level, see :meth:`write_manifest`
+    __ZSTD_LEVEL = 3
+
     @staticmethod
-    def __open_file(filepath: str, is_read: bool = True) -> TextIO:
+    def __compress(filepath: str, data: bytes) -> bytes:
         _, ext = os.path.splitext(filepath)
-        if ext.lower() == ".gz":
+        ext = ext.lower()
+        if ext == ".gz":
             if not _has_gzip:
                 raise RuntimeError("gzip is not available")
-            return gzip.open(filepath, mode="rt" if is_read else "wt", encoding="utf-8")
-        return open(filepath, mode="r" if is_read else "w", encoding="utf-8")
+            return gzip.compress(data)
+        if ext == ".zst":
+            if not _has_zstd:
+                raise RuntimeError("zstd is not available, install siliconcompiler[zstd]")
+            # Compressed on all available cores
+            return zstandard.ZstdCompressor(level=BaseSchema.__ZSTD_LEVEL,
+                                            threads=-1).compress(data)
+        return data
+
+    @staticmethod
+    def __decompress(data: bytes) -> bytes:
+        if data.startswith(BaseSchema.__GZIP_MAGIC):
+            if not _has_gzip:
+                raise RuntimeError("gzip is not available")
+            return gzip.decompress(data)
+        if data.startswith(BaseSchema.__ZSTD_MAGIC):
+            if not _has_zstd:
+                raise RuntimeError("zstd is not available, install siliconcompiler[zstd]")
+            # Files compressed by other tools can hold several frames, and a
+            # decompression object stops at the end of the first one
+            decompressor = zstandard.ZstdDecompressor()
+            frames = []
+            while data:
+                decompressobj = decompressor.decompressobj()
+                frames.append(decompressobj.decompress(data))
+                data = decompressobj.unused_data
+            return b"".join(frames)
+        return data
 
     def __format_key(self, *key: str):
         return f"[{','.join([*self._keypath, *key])}]"
 
     @staticmethod
-    def _read_manifest(filepath: str) -> Dict:
+    def _read_manifest(filepath: str, lazy: bool = False) -> Dict:
         """
         Reads a manifest from disk and returns dictionary.
 
+        Manifests which start with the binary manifest header are read as binary
+        manifests, see :mod:`.binarymanifest`. Other manifests are read as JSON, which is
+        decompressed if it is compressed with gzip or zstd. The extension is not used.
+
+        References to sections stored in separate manifests are resolved relative to the
+        directory of the manifest, see :meth:`_write_linked_manifest`.
+
         Args:
             filename (path): Path to a manifest file to be loaded.
+            lazy (bool): If true, binary manifests are returned as a
+                :class:`.binarymanifest.BinaryManifestSection` which only decodes
+                the sections which are accessed.
         """
 
-        fin = BaseSchema.__open_file(filepath)
-        try:
-            manifest = json.loads(fin.read())
-        finally:
-            fin.close()
+        with open(filepath, "rb") as fin:
+            data = fin.read(len(binarymanifest.MAGIC))
+            if binarymanifest.is_binary_data(data):
+                manifest = binarymanifest.read_file(fin, filepath)
+            else:
+                manifest = None
+                data += fin.read()
+
+        if manifest is not None:
+            BaseSchema.__resolve_references(manifest, os.path.dirname(os.path.abspath(filepath)))
+            if lazy:
+                return manifest
+            return manifest.to_dict()
 
+        manifest = json.loads(BaseSchema.__decompress(data))
+        BaseSchema.__resolve_references(manifest, os.path.dirname(os.path.abspath(filepath)))
         return manifest
 
+    @staticmethod
+    def __resolve_references(manifest: Dict, base: str) -> None:
+        """
+        Makes the references to separate manifests in a manifest absolute.
+
+        Args:
+            manifest (dict): manifest read.
+            base (path): directory of the manifest.
+        """
+        if not isinstance(manifest, Mapping):
+            return
+
+        for key in manifest.get("__linked__", ()):
+            section = manifest[key]
+            if "__external__" in section:
+                section["__external__"] = os.path.normpath(
+                    os.path.join(base, section["__external__"]))
+            else:
+                BaseSchema.__resolve_references(section, base)
+
     def read_manifest(self, filepath: str) -> None:
         """
         Reads a manifest from disk and replaces the current data with the data in the file.
@@ -365,12 +675,20 @@ class BaseSchema:
             Loads the file mychip.json into the current Schema object.
         """
 
-        self._from_dict(BaseSchema._read_manifest(filepath), [])
+        self.__cow_prepare_write()
+        self.__cow_detach(recursive=True)
+        self._from_dict(BaseSchema._read_manifest(filepath, lazy=True), [])
 
     def write_manifest(self, filepath: str) -> None:
         '''
         Writes the manifest to a file.
 
+        The manifest is written as JSON, unless the filepath has a ``.pkg.bin`` extension,
+        in which case the binary manifest encoding is used, see :mod:`.binarymanifest`.
+        JSON manifests with a ``.gz`` extension are compressed with gzip and those with
+        a ``.zst`` extension are compressed with zstd, which requires the ``zstandard``
+        package.
+
         Args:
             filename (filepath): Output filepath.
 
@@ -379,25 +697,175 @@ class BaseSchema:
             Dumps the current manifest into mydump.json
         '''
 
-        fout = BaseSchema.__open_file(filepath, is_read=False)
+        self.__write_manifest(filepath, False)
+
+    def _write_linked_manifest(self, filepath: str) -> None:
+        '''
+        Writes the manifest to a file, like :meth:`write_manifest`, with references to
+        the sections stored in separate manifests instead of including them, see
+        :meth:`_write_external_manifest`.
+
+        References are stored relative to the directory of the manifest, so the
+        manifest remains valid as long as it is moved along with the separate manifests.
+
+        Args:
+            filepath (path): Output filepath.
+        '''
+        self.__write_manifest(filepath, True)
+
+    def __write_manifest(self, filepath: str, link: bool) -> None:
+        '''
+        Writes the manifest to a file.
+
+        Args:
+            filepath (path): Output filepath.
+            link (bool): if true, sections stored in separate manifests are referenced.
+        '''
+        base = os.path.dirname(os.path.abspath(filepath))
+
+        if binarymanifest.is_binary_manifest(filepath):
+            manifest, _ = self.__getdict_manifest(link, base)
+            binarymanifest.write(filepath, manifest)
+            return
+
+        pieces, _, _ = self.__getdict_encoded(0, link, base)
+        data = BaseSchema.__compress(filepath, b"".join(pieces))
+
+        with open(filepath, "wb") as fout:
+            fout.write(data)
+
+    def _write_external_manifest(self, filepath: str) -> None:
+        '''
+        Writes this section into a separate manifest, which is referenced by the
+        manifests written with :meth:`_write_linked_manifest` instead of including
+        the section. The separate manifest is only read once the section is accessed.
+
+        The section is included again once it is modified.
+
+        Args:
+            filepath (path): path to the manifest holding the section.
+        '''
+        filepath = os.path.abspath(filepath)
+        self.__encoding.external = None
+        self.write_manifest(filepath)
+        self.__encoding.external = filepath
+
+    def __external_reference(self, meta: Optional[Dict], link: bool,
+                             base: str) -> Optional[Dict]:
+        '''
+        Returns the reference to the separate manifest holding this section, or None
+        if the section is included in the manifest.
+
+        Sections which have not been read yet are referenced even if they are included,
+        when the separate manifest is missing.
+
+        Args:
+            meta (dict): meta section of this section
+            link (bool): if true, sections stored in separate manifests are referenced.
+            base (path): directory of the manifest being written.
+        '''
+        if self.__lazy and "__external__" in self.__lazy[1]:
+            external = self.__lazy[1]["__external__"]
+            if not link and os.path.exists(external):
+                return None
+        else:
+            external = self.__encoding.external
+            if not external or not link:
+                return None
+
+            journal = self.__journal
+            if journal.has_journaling() or \
+                    (journal._Journal__parent is journal and journal.is_journaling()):
+                return None
 
         try:
-            if _has_orjson:
-                manifest_str = json.dumps(self.getdict(), option=json.OPT_INDENT_2).decode()
+            external = os.path.relpath(external, base)
+        except ValueError:
+            # On a different drive
+            pass
+
+        reference = {"__external__": external}
+        if meta is not None:
+            reference["__meta__"] = meta
+        return reference
+
+    def __ensure_external_elab(self) -> None:
+        '''
+        Loads this section if it has not been loaded yet and it holds references to
+        separate manifests, which are written according to the manifest being written.
+        '''
+        if self.__lazy and ("__external__" in self.__lazy[1] or "__linked__" in self.__lazy[1]):
+            self.__ensure_lazy_elab()
+
+    def __getdict_manifest(self, link: bool, base: str) -> Tuple[Dict, bool]:
+        '''
+        Returns :meth:`getdict` for :meth:`write_manifest`, and whether it holds references
+        to separate manifests.
+
+        Args:
+            link (bool): if true, sections stored in separate manifests are referenced.
+            base (path): directory of the manifest being written.
+        '''
+        meta = self.__getdict_meta_section()
+        reference = self.__external_reference(meta, link, base)
+        if reference is not None:
+            return reference, True
+
+        self.__ensure_external_elab()
+        if self.__lazy:
+            manifest = self.__lazy[1]
+            if isinstance(manifest, binarymanifest.BinaryManifestSection):
+                return manifest.to_dict(), False
+            return manifest, False
+
+        manifest = {}
+        linked = []
+        children = list(self.__manifest.items())
+        if self.__default:
+            children.insert(0, ("default", self.__default))
+        for key, item in children:
+            if isinstance(item, BaseSchema):
+                manifest[key], item_linked = item.__getdict_manifest(link, base)
+                if item_linked:
+                    linked.append(key)
             else:
-                manifest_str = json.dumps(self.getdict(), indent=2)
-            fout.write(manifest_str)
-        finally:
-            fout.close()
+                manifest[key] = item.getdict()
+
+        if self.__journal.has_journaling():
+            manifest["__journal__"] = self.__journal.get()
+        if linked:
+            manifest["__linked__"] = linked
+        if meta is not None:
+            manifest["__meta__"] = meta
+
+        return manifest, bool(linked)
 
     # Accessor methods
+    @property
+    def __keypath_index(self) -> _KeypathIndex:
+        '''
+        Returns the keypath index for this section
+        '''
+        if self.__index is None:
+            self.__index = _KeypathIndex()
+        return self.__index
+
     def __search(self,
                  *keypath: str,
                  insert_defaults: bool = False,
                  use_default: bool = False,
                  require_leaf: bool = True,
                  complete_path: Optional[List[str]] = None,
-                 elaborate_leaf: bool = True) -> Union["BaseSchema", Parameter]:
+                 elaborate_leaf: bool = True,
+                 writeable: bool = False) -> Union["BaseSchema", Parameter]:
+
+        writeable = writeable or insert_defaults
+        if writeable:
+            if complete_path is None:
+                self.__cow_prepare_write()
+                self.__values_changed()
+            else:
+                self.__encoding.clear()
 
         if len(keypath) == 0:
             if require_leaf:
@@ -413,7 +881,9 @@ class BaseSchema:
             complete_path = []
         complete_path.append(keypath[0])
 
-        if keypath[0] == "default":
+        if writeable:
+            key_param = self.__cow_own(keypath[0])
+        elif keypath[0] == "default":
             key_param = self.__default
         else:
             key_param = self.__manifest.get(keypath[0], None)
@@ -421,13 +891,19 @@ class BaseSchema:
             if insert_defaults and self.__default:
                 if isinstance(self.__default, Parameter) and self.__default.get(field='lock'):
                     raise KeyError
-                key_param = self.__default.copy(key=complete_path)
+                key_param = self.__copy_default(complete_path)
+                self.__keys_changed()
                 self.__manifest[keypath[0]] = key_param
             elif use_default and self.__default:
-                key_param = self.__default
+                if writeable:
+                    key_param = self.__cow_own("default")
+                else:
+                    key_param = self.__default
             else:
                 raise KeyError
         if isinstance(key_param, BaseSchema):
+            if writeable:
+                key_param.__cow_detach()
             if len(keypath) == 1:
                 if require_leaf:
                     raise KeyError
@@ -439,10 +915,15 @@ class BaseSchema:
                                       insert_defaults=insert_defaults,
                                       use_default=use_default,
                                       require_leaf=require_leaf,
-                                      complete_path=complete_path)
+                                      complete_path=complete_path,
+                                      writeable=writeable)
         elif len(keypath) != 1:
             # Key extends beyond parameter
             raise KeyError
+        if writeable:
+            # Parameters found for writing can be modified without going through
+            # this section, see __param_changed
+            key_param._set_owner(self.__param_changed)
         return key_param
 
     def get(self, *keypath: str, field: Optional[str] = 'value',
@@ -471,27 +952,34 @@ class BaseSchema:
             Returns the value of [pdk,virtual,foundry].
         """
 
-        try:
-            require_leaf = True
-            insert_defaults = False
-            if field == 'schema':
-                require_leaf = False
-                insert_defaults = True
-            param = self.__search(
-                *keypath,
-                insert_defaults=insert_defaults,
-                use_default=True,
-                require_leaf=require_leaf)
-            if field == 'schema':
-                if isinstance(param, Parameter):
-                    raise ValueError(f"{self.__format_key(*keypath)} is a complete keypath")
-                self.__journal.record("get", keypath, field=field, step=step, index=index)
-                param.__journal = self.__journal.get_child(*keypath)
+        param = None
+        if field is not None and field != 'schema':
+            param = self.__keypath_index.get(keypath)
+
+        if param is None:
+            try:
+                require_leaf = True
+                insert_defaults = False
+                if field == 'schema':
+                    require_leaf = False
+                    insert_defaults = True
+                param = self.__search(
+                    *keypath,
+                    insert_defaults=insert_defaults,
+                    use_default=True,
+                    require_leaf=require_leaf,
+                    writeable=field is None)
+                if field == 'schema':
+                    if isinstance(param, Parameter):
+                        raise ValueError(f"{self.__format_key(*keypath)} is a complete keypath")
+                    self.__journal.record("get", keypath, field=field, step=step, index=index)
+                    param.__journal = self.__journal.get_child(*keypath)
+                    return param
+            except KeyError:
+                raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+            if field is None:
                 return param
-        except KeyError:
-            raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
-        if field is None:
-            return param
+            self.__keypath_index.add(keypath, param)
 
         try:
             get_ret = param.get(field, step=step, index=index)
@@ -531,10 +1019,14 @@ class BaseSchema:
 
         *keypath, value = args
 
-        try:
-            param: Parameter = self.__search(*keypath, insert_defaults=True)
-        except KeyError:
-            raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+        keypath = tuple(keypath)
+        param = self.__keypath_index.get(keypath, writeable=True)
+        if param is None:
+            try:
+                param: Parameter = self.__search(*keypath, insert_defaults=True)
+            except KeyError:
+                raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+            self.__keypath_index.add(keypath, param, writeable=True)
 
         try:
             set_ret = param.set(value, field=field, clobber=clobber,
@@ -549,6 +1041,102 @@ class BaseSchema:
             e.args = (new_msg, *e.args[1:])
             raise e
 
+    def set_many(self, values: Iterable[Tuple], field: str = 'value',
+                 clobber: bool = True) -> None:
+        '''
+        Sets multiple schema parameter fields.
+
+        The entries are applied grouped by parameter, with the parameters in the
+        order they first appear and the entries of each parameter in the order given,
+        so each parameter is only looked up once. When every entry is set, the result
+        is the same as calling :meth:`set` for each entry. The transactions which
+        were applied are journaled together, in the order of the entries.
+
+        If an entry cannot be set, the error is raised once the group of its
+        parameter has been applied up to that entry. The entries for the parameters
+        applied before it remain set, including entries given after the failing
+        entry, while the remaining entries of its parameter and the entries of
+        parameters which first appear after it are not set.
+
+        Args:
+            values (list of tuple): entries of ``(keypath, value)`` or
+                ``(keypath, value, step, index)``, where keypath is a tuple of keys.
+            field (str): Parameter field to set.
+            clobber (bool): Existing values are overwritten if True.
+
+        Examples:
+            >>> schema.set_many([(('metric', 'errors'), 0, 'syn', '0'),
+            ...                  (('metric', 'errors'), 2, 'place', '0')])
+            Sets the [metric,errors] value for syn/0 and place/0
+        '''
+
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+
+        # Group the entries by parameter, the order within each parameter is preserved.
+        # Each group holds the values, steps, indices and positions of its entries in
+        # separate lists, so no objects are created for the entries.
+        entries: Dict[Tuple[str, ...], Tuple[List, List, List, List[int]]] = {}
+        for position, entry in enumerate(values):
+            keypath = entry[0]
+            if keypath.__class__ is not tuple:
+                keypath = tuple(keypath)
+            group = entries.get(keypath, None)
+            if group is None:
+                group = entries[keypath] = ([], [], [], [])
+            group[0].append(entry[1])
+            if len(entry) == 2:
+                group[1].append(None)
+                group[2].append(None)
+            else:
+                group[1].append(entry[2])
+                group[2].append(entry[3])
+            group[3].append(position)
+
+        # Return value of each entry which has been applied, in the order given
+        applied: List = len(values) * [None]
+
+        def applied_records() -> Iterator[Tuple]:
+            for entry, set_ret in zip(values, applied):
+                if not set_ret:
+                    continue
+                keypath = entry[0]
+                if len(entry) == 2:
+                    yield keypath, entry[1], field, None, None
+                else:
+                    yield keypath, entry[1], field, entry[2], entry[3]
+
+        actives = self.__get_active()
+        try:
+            for keypath, (group_values, steps, indices, positions) in entries.items():
+                param = self.__keypath_index.get(keypath, writeable=True)
+                if param is None:
+                    try:
+                        param: Parameter = self.__search(*keypath, insert_defaults=True)
+                    except KeyError:
+                        raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+                    self.__keypath_index.add(keypath, param, writeable=True)
+
+                set_rets = []
+                try:
+                    param._set_many(zip(group_values, steps, indices), field=field,
+                                    clobber=clobber, ret=set_rets)
+                except Exception as e:
+                    new_msg = f"error while setting {self.__format_key(*keypath)}: {e.args[0]}"
+                    e.args = (new_msg, *e.args[1:])
+                    raise e
+                finally:
+                    for position, set_ret in zip(positions, set_rets):
+                        applied[position] = set_ret
+                    if actives:
+                        for set_ret in set_rets:
+                            if set_ret:
+                                self.__apply_active(actives, param, set_ret)
+        finally:
+            # Journal the entries which have been set, in the order they were given,
+            # the records are only built if the journal records them
+            self.__journal.record_many("set", applied_records())
+
     def add(self, *args, field: str = 'value',
             step: Optional[str] = None, index: Optional[Union[int, str]] = None) \
             -> Optional[Union[List[NodeValue], NodeValue]]:
@@ -577,10 +1165,14 @@ class BaseSchema:
 
         *keypath, value = args
 
-        try:
-            param: Parameter = self.__search(*keypath, insert_defaults=True)
-        except KeyError:
-            raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+        keypath = tuple(keypath)
+        param = self.__keypath_index.get(keypath, writeable=True)
+        if param is None:
+            try:
+                param: Parameter = self.__search(*keypath, insert_defaults=True)
+            except KeyError:
+                raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
+            self.__keypath_index.add(keypath, param, writeable=True)
 
         try:
             add_ret = param.add(value, field=field, step=step, index=index)
@@ -623,7 +1215,7 @@ class BaseSchema:
         '''
 
         try:
-            param = self.__search(*keypath, use_default=True)
+            param = self.__search(*keypath, use_default=True, writeable=True)
         except KeyError:
             raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
 
@@ -649,7 +1241,7 @@ class BaseSchema:
             return
 
         try:
-            key_param = self.__search(*search_path, require_leaf=False)
+            key_param = self.__search(*search_path, require_leaf=False, writeable=True)
         except KeyError:
             raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
 
@@ -662,6 +1254,8 @@ class BaseSchema:
         if any([key_param.get(*key, field='lock') for key in key_param.allkeys()]):
             return
 
+        key_param.__keys_changed()
+        key_param.__cow_release(removal_key)
         del key_param.__manifest[removal_key]
         self.__journal.record("remove", keypath)
 
@@ -691,6 +1285,9 @@ class BaseSchema:
             Returns True, even if "foo" and "0" aren't in current configuration.
         """
 
+        if self.__keypath_index.get(keypath, writeable=not default_valid) is not None:
+            return True
+
         try:
             param = self.__search(*keypath, use_default=default_valid, require_leaf=False)
         except KeyError:
@@ -737,6 +1334,27 @@ class BaseSchema:
         Arg:
             keypath (list of str): Keypath prefix to search under. The
                 returned keypaths do not include the prefix.
+            include_default (bool): If true will include the default keypaths.
+        '''
+        try:
+            key_param = self.__search(*keypath, require_leaf=False)
+        except KeyError:
+            return set()
+
+        if isinstance(key_param, Parameter):
+            return set()
+
+        return set(key_param.__allkeys(include_default, False))
+
+    def _allpathkeys(self, *keypath: str,
+                     include_default: bool = True) -> Set[Tuple[str, ...]]:
+        '''
+        Returns all keypaths to file and directory parameters in the schema as a set of tuples.
+
+        Arg:
+            keypath (list of str): Keypath prefix to search under. The
+                returned keypaths do not include the prefix.
+            include_default (bool): If true will include the default keypaths.
         '''
         try:
             key_param = self.__search(*keypath, require_leaf=False)
@@ -746,21 +1364,75 @@ class BaseSchema:
         if isinstance(key_param, Parameter):
             return set()
 
+        return set(key_param.__allkeys(include_default, True))
+
+    def __allkeys(self, include_default: bool, paths_only: bool) -> FrozenSet[Tuple[str, ...]]:
+        '''
+        Returns the cached keypaths below this section.
+
+        Args:
+            include_default (bool): If true will include the default keypaths.
+            paths_only (bool): If true will only include file and directory parameters.
+        '''
+        cache_key = (include_default, paths_only)
+        keys = self.__keycache.keys.get(cache_key, None)
+        if keys is not None:
+            return keys
+
         def add(keys: List[Tuple[str, ...]],
                 key: str,
                 item: Union["BaseSchema", Parameter]) -> None:
             if isinstance(item, Parameter):
+                if paths_only:
+                    sctype: str = item.get(field="type")
+                    if "file" not in sctype and "dir" not in sctype:
+                        return
                 keys.append((key,))
             else:
-                for subkeypath in item.allkeys(include_default=include_default):
+                item.__ensure_lazy_elab()
+                for subkeypath in item.__allkeys(include_default, paths_only):
                     keys.append((key, *subkeypath))
 
         keys = []
-        if include_default and key_param.__default:
-            add(keys, "default", key_param.__default)
-        for key, item in key_param.__manifest.items():
+        if include_default and self.__default:
+            add(keys, "default", self.__default)
+        for key, item in self.__manifest.items():
             add(keys, key, item)
-        return set(keys)
+
+        keys = frozenset(keys)
+        self.__keycache.keys[cache_key] = keys
+        return keys
+
+    def __keys_changed(self) -> None:
+        '''
+        Clears the cached keypaths and encodings of this section and its parents, must be
+        called before keys are added or removed in this section.
+        '''
+        _KeypathIndex.invalidate()
+
+        schema = self
+        while schema is not None:
+            try:
+                schema.__keycache.keys.clear()
+                schema.__encoding.clear()
+                schema = schema.__parent
+            except AttributeError:
+                # Guard against partially setup parents during serialization
+                break
+
+    def __values_changed(self) -> None:
+        '''
+        Clears the cached encodings of this section and its parents, must be called before
+        values are modified in this section.
+        '''
+        schema = self
+        while schema is not None:
+            try:
+                schema.__encoding.clear()
+                schema = schema.__parent
+            except AttributeError:
+                # Guard against partially setup parents during serialization
+                break
 
     @classmethod
     def _getdict_type(cls) -> str:
@@ -805,8 +1477,12 @@ class BaseSchema:
                     return key_param.getdict(include_default=include_default,
                                              values_only=values_only)
 
+                key_param.__ensure_external_elab()
                 if key_param.__lazy:
-                    return key_param.__lazy[1]
+                    manifest = key_param.__lazy[1]
+                    if isinstance(manifest, binarymanifest.BinaryManifestSection):
+                        return manifest.to_dict()
+                    return manifest
             else:
                 key_param = self.__search(*keypath, require_leaf=False)
         except KeyError:
@@ -830,44 +1506,357 @@ class BaseSchema:
         if not values_only and key_param.__journal.has_journaling():
             manifest["__journal__"] = key_param.__journal.get()
 
-        if not values_only and key_param.__class__ is not BaseSchema:
-            manifest["__meta__"] = {}
+        if not values_only:
+            meta = key_param.__getdict_meta_section()
+            if meta is not None:
+                manifest["__meta__"] = meta
 
-            try:
-                cls_meta = key_param._getdict_meta()
-                manifest["__meta__"].update(cls_meta)
-            except NotImplementedError:
-                pass
+        return manifest
 
-            manifest["__meta__"]["class"] = \
-                f"{key_param.__class__.__module__}/{key_param.__class__.__name__}"
-            try:
-                manifest["__meta__"]["sctype"] = key_param._getdict_type()
-            except NotImplementedError:
-                pass
+    def __getdict_meta_section(self) -> Optional[Dict[str, Optional[Union[str, int, float]]]]:
+        '''
+        Returns the meta section for :meth:`getdict`, or None if this section does not
+        have one.
+        '''
+        if self.__class__ is BaseSchema:
+            return None
 
-        return manifest
+        meta = {}
+
+        try:
+            cls_meta = self._getdict_meta()
+            meta.update(cls_meta)
+        except NotImplementedError:
+            pass
+
+        meta["class"] = f"{self.__class__.__module__}/{self.__class__.__name__}"
+        try:
+            meta["sctype"] = self._getdict_type()
+        except NotImplementedError:
+            pass
+
+        return meta
+
+    def __getdict_encoded(self, depth: int, link: bool, base: str) \
+            -> Tuple[Tuple[bytes, ...], bool, Optional[Tuple[bool, str, bool]]]:
+        '''
+        Returns the JSON encoding of :meth:`getdict` as fragments to be joined, whether
+        the encoding can be reused, and how the sections stored in separate manifests
+        were written, as the link and base used and whether they are referenced, or None
+        if there are no such sections.
+
+        The encoding of each section and parameter is kept until it is modified, so only the
+        modified parts of the schema need to be encoded again.
+
+        Args:
+            depth (int): indentation level of this section
+            link (bool): if true, sections stored in separate manifests are referenced.
+            base (path): directory of the manifest being written.
+        '''
+        key = (_has_orjson, depth)
+        meta = self.__getdict_meta_section()
+
+        reference = self.__external_reference(meta, link, base)
+        if reference is not None:
+            return (_encode_json(reference, depth),), True, (link, base, True)
+
+        self.__ensure_external_elab()
+
+        journal = self.__journal
+        # Sections which record their own journal change without being modified
+        cacheable = not journal.has_journaling() and \
+            not (journal._Journal__parent is journal and journal.is_journaling())
+
+        encoding = self.__encoding
+        # This section is written the same way, regardless of the link, when it is
+        # included
+        own_externals = (link, base, False) if encoding.external else None
+
+        externals = encoding.externals
+        if cacheable and encoding.key == key and encoding.meta == meta and \
+                (externals is None or
+                 (externals[0] == link and (not externals[2] or externals[1] == base))):
+            return encoding.pieces, True, externals or own_externals
+
+        externals = None
+        if self.__lazy:
+            manifest = self.__lazy[1]
+            if isinstance(manifest, binarymanifest.BinaryManifestSection):
+                manifest = manifest.to_dict()
+            pieces = [_encode_json(manifest, depth)]
+        else:
+            def encode_param(manifest: Dict) -> bytes:
+                return _encode_json(manifest, depth + 1)
+
+            children = list(self.__manifest.items())
+            if self.__default:
+                children.insert(0, ("default", self.__default))
+
+            entries = []
+            linked = []
+            for child_key, child in children:
+                if isinstance(child, Parameter):
+                    entries.append((child_key, (child._getdict_encoded(encode_param, key),)))
+                else:
+                    child_pieces, child_cacheable, child_externals = \
+                        child.__getdict_encoded(depth + 1, link, base)
+                    entries.append((child_key, child_pieces))
+                    if child_externals is not None:
+                        if child_externals[2]:
+                            linked.append(child_key)
+                        externals = (link, base, bool(linked))
+                    cacheable = cacheable and child_cacheable
+
+            if journal.has_journaling():
+                entries.append(("__journal__", (_encode_json(journal.get(), depth + 1),)))
+            if linked:
+                entries.append(("__linked__", (_encode_json(linked, depth + 1),)))
+            if meta is not None:
+                entries.append(("__meta__", (_encode_json(meta, depth + 1),)))
+
+            if entries:
+                indent = b"\n" + b"  " * (depth + 1)
+                pieces = []
+                separator = b"{"
+                for child_key, child_pieces in entries:
+                    pieces.append(separator + indent + _encode_json(child_key) + b": ")
+                    pieces.extend(child_pieces)
+                    separator = b","
+                pieces.append(b"\n" + b"  " * depth + b"}")
+            else:
+                pieces = [b"{}"]
+
+        pieces = tuple(pieces)
+        if cacheable:
+            encoding.key = key
+            encoding.meta = meta
+            encoding.pieces = pieces
+            encoding.externals = externals
+        return pieces, cacheable, externals or own_externals
 
     # Utility functions
     def copy(self, key: Optional[Tuple[str, ...]] = None) -> "BaseSchema":
         """
         Returns a copy of this schema.
 
+        The sections below this schema are shared between this schema and the copy
+        until either one of them is modified, at which point only the sections along
+        the modified keypath are duplicated.
+
         Args:
             key (list of str): keypath to this schema
         """
 
-        parent = self.__parent
-        self.__parent = None
-        schema_copy = copy.deepcopy(self)
-        self.__parent = parent
-        schema_copy.__parent = self.__parent
+        return self.__cow_clone(self.__parent, key[-1] if key else self.__key)
+
+    def __cow_clone(self, parent: Optional["BaseSchema"], key: Optional[str],
+                    rebind_journal: bool = False) -> "BaseSchema":
+        '''
+        Returns a shallow copy of this schema section, which borrows all its children
+        from this section.
+
+        Args:
+            parent (:class:`BaseSchema`): parent of the copy
+            key (str): key of the copy in the parent
+            rebind_journal (bool): if true, a journal which is attached to the parent's journal
+                will be attached to the journal of the new parent.
+        '''
+        self.__ensure_lazy_elab()
 
-        if key:
-            schema_copy.__key = key[-1]
+        # Use the same state the copy module would use
+        new_obj, args, state = object.__reduce_ex__(self, 4)[0:3]
+        schema_copy = new_obj(*args)
+
+        state = dict(state)
+        manifest = state.pop("_BaseSchema__manifest")
+        default = state.pop("_BaseSchema__default")
+        journal = state.pop("_BaseSchema__journal")
+        del state["_BaseSchema__parent"]
+        del state["_BaseSchema__cow"]
+        state = copy.deepcopy(state)
+
+        cow = _CopyState()
+        schema_copy.__cow = cow
+
+        def borrow(child_key: str,
+                   child: Union["BaseSchema", Parameter]) -> Union["BaseSchema", Parameter]:
+            if isinstance(child, Parameter):
+                return child.copy()
+            cow.borrowed.add(child_key)
+            child.__cow.borrowers[(id(schema_copy), child_key)] = weakref.ref(schema_copy)
+            return child
+
+        state["_BaseSchema__manifest"] = {
+            child_key: borrow(child_key, child) for child_key, child in manifest.items()}
+        state["_BaseSchema__default"] = borrow("default", default) if default else default
+        state["_BaseSchema__parent"] = parent
+        state["_BaseSchema__key"] = key
+        state["_BaseSchema__cow"] = cow
+
+        journal_root = journal._Journal__parent
+        if rebind_journal and journal_root is not journal and self.__parent is not None and \
+                journal_root is self.__parent.__journal._Journal__parent:
+            state["_BaseSchema__journal"] = copy.copy(journal)
+            state["_BaseSchema__journal"]._Journal__parent = parent.__journal._Journal__parent
+        else:
+            state["_BaseSchema__journal"] = copy.deepcopy(journal)
+
+        if hasattr(schema_copy, "__setstate__"):
+            schema_copy.__setstate__(state)
+        else:
+            schema_copy.__dict__.update(state)
 
         return schema_copy
 
+    def __copy_default(self, key: Tuple[str, ...]) -> Union["BaseSchema", Parameter]:
+        '''
+        Returns a copy of the default child, to be inserted into this section at key.
+
+        Args:
+            key (list of str): keypath to the new child
+        '''
+        # The default may still be borrowed, in which case its parent is the
+        # section of the lender
+        child = self.__cow_own("default").copy(key=key)
+        if isinstance(child, BaseSchema):
+            child.__parent = self
+        return child
+
+    def __cow_own(self, key: str) -> Optional[Union["BaseSchema", Parameter]]:
+        '''
+        Returns the child at key, after replacing it with a private copy if it
+        is still borrowed from another schema.
+
+        Args:
+            key (str): key of the child
+        '''
+        if key == "default":
+            child = self.__default
+        else:
+            child = self.__manifest.get(key, None)
+
+        if key not in self.__cow.borrowed:
+            return child
+
+        self.__cow_release(key)
+        if child is None:
+            return None
+
+        child = child.__cow_clone(self, key, rebind_journal=True)
+        if key == "default":
+            self.__default = child
+        else:
+            self.__manifest[key] = child
+        self.__index_changed()
+        return child
+
+    def __index_changed(self) -> None:
+        '''
+        Clears the keypath indexes which can reach the children of this section, must
+        be called after a child is replaced.
+
+        These are the indexes of this section, its parents and the sections borrowing
+        any of them.
+        '''
+        seen: Set[int] = set()
+        schemas: List["BaseSchema"] = [self]
+        while schemas:
+            schema = schemas.pop()
+            if id(schema) in seen:
+                continue
+            seen.add(id(schema))
+            try:
+                if schema.__index is not None:
+                    schema.__index.clear()
+                parent = schema.__parent
+                borrowers = schema.__cow.borrowers
+            except AttributeError:
+                # Guard against partially setup parents during serialization
+                continue
+            if parent is not None:
+                schemas.append(parent)
+            for borrower_ref in borrowers.values():
+                borrower = borrower_ref()
+                if borrower is not None:
+                    schemas.append(borrower)
+
+    def __cow_release(self, key: str) -> None:
+        '''
+        Marks the child at key as no longer borrowed, before it gets replaced or removed.
+
+        Args:
+            key (str): key of the child
+        '''
+        if key not in self.__cow.borrowed:
+            return
+
+        self.__cow.borrowed.discard(key)
+        if key == "default":
+            child = self.__default
+        else:
+            child = self.__manifest.get(key, None)
+        if child is not None:
+            child.__cow.borrowers.pop((id(self), key), None)
+
+    def __cow_detach(self, recursive: bool = False) -> None:
+        '''
+        Replaces this section with private copies in all the sections borrowing it.
+
+        Args:
+            recursive (bool): if true, also detach all the sections owned by this one
+        '''
+        borrowers = self.__cow.borrowers
+        if borrowers:
+            self.__cow.borrowers = {}
+            for (_, key), borrower_ref in borrowers.items():
+                borrower: Optional[BaseSchema] = borrower_ref()
+                if borrower is None or key not in borrower.__cow.borrowed:
+                    continue
+                if key == "default":
+                    child = borrower.__default
+                else:
+                    child = borrower.__manifest.get(key, None)
+                if child is not None and child.__cow is self.__cow:
+                    borrower.__cow_own(key)
+
+        if not recursive:
+            return
+
+        children = list(self.__manifest.items())
+        if self.__default:
+            children.append(("default", self.__default))
+        for key, child in children:
+            if isinstance(child, BaseSchema) and key not in self.__cow.borrowed:
+                child.__cow_detach(recursive=True)
+
+    def __param_changed(self) -> None:
+        '''
+        Prepares this section for a modification made to a parameter which has been
+        found for writing, since it can be modified without going through this section,
+        see :meth:`Parameter._set_owner`.
+        '''
+        self.__cow_prepare_write()
+        self.__values_changed()
+
+    def __cow_prepare_write(self) -> None:
+        '''
+        Ensures no other schema is borrowing this section or any of its parents,
+        before this section is modified.
+        '''
+        schemas: List["BaseSchema"] = []
+        schema = self
+        while schema is not None:
+            try:
+                parent = schema.__parent
+                schema.__cow
+            except AttributeError:
+                # Guard against partially setup parents during serialization
+                break
+            schemas.append(schema)
+            schema = parent
+        for schema in reversed(schemas):
+            schema.__cow_detach()
+
     def _find_files_search_paths(self, key: str,
                                  step: Optional[str],
                                  index: Optional[Union[int, str]]) -> List[str]:
@@ -946,7 +1935,8 @@ class BaseSchema:
                              dataroots: Optional[Dict[str, Union[str, Callable]]] = None,
                              collection_dir: Optional[str] = None,
                              cwd: Optional[str] = None,
-                             hash: bool = False) \
+                             hash: bool = False,
+                             hash_cache: Optional[FileHashCache] = None) \
             -> Union[Optional[str], List[Optional[str]], Set[Optional[str]]]:
         """
         Returns absolute paths to files or directories based on the keypath
@@ -969,6 +1959,8 @@ class BaseSchema:
             cwd (path): optional path to current working directory, this will default
                 to os.getcwd() if not provided.
             hash (bool): hash the files insteasd of getting the paths
+            hash_cache (:class:`FileHashCache`): cache to hash the files with, if not
+                provided the hashes are only cached in memory
 
         Returns:
             If keys points to a scalar entry, returns an absolute path to that
@@ -1004,9 +1996,15 @@ class BaseSchema:
             else:
                 paths = []
 
+        resolve_cache = PathResolutionCache.get_active()
+
         # Ignore collection directory if it does not exist
-        if collection_dir and not os.path.exists(collection_dir):
-            collection_dir = None
+        if collection_dir:
+            if resolve_cache is not None:
+                if resolve_cache.listdir(collection_dir) is None:
+                    collection_dir = None
+            elif not os.path.exists(collection_dir):
+                collection_dir = None
 
         if cwd is None:
             cwd = os.getcwd()
@@ -1014,6 +2012,9 @@ class BaseSchema:
         if dataroots is None:
             dataroots = base_schema._find_files_dataroot_resolvers()
 
+        # Dataroots are only resolved once for all the paths
+        dataroot_paths: Dict[str, Tuple[Optional[str], Optional[Exception]]] = {}
+
         resolved_paths = []
         root_search_paths = base_schema._find_files_search_paths(keypath[-1], step, index)
         for path in paths:
@@ -1022,32 +2023,20 @@ class BaseSchema:
             dataroot: Optional[str] = path.get(field="dataroot")
             dataroot_except: Optional[Exception] = None
             if dataroot:
-                if dataroot not in dataroots:
-                    raise ValueError(f"Resolver for {dataroot} not provided: "
-                                     f"{self.__format_key(*keypath)}")
-                dataroot_path = dataroots[dataroot]
-                if isinstance(dataroot_path, str):
-                    search_paths.append(os.path.abspath(dataroot_path))
-                elif callable(dataroot_path):
-                    try:
-                        search_paths.append(dataroot_path())
-                    except Exception as e:
-                        dataroot_except = e
-                else:
-                    raise TypeError(f"Resolver for {dataroot} is not a recognized type: "
-                                    f"{self.__format_key(*keypath)}")
+                if dataroot not in dataroot_paths:
+                    dataroot_paths[dataroot] = self.__resolve_dataroot(
+                        dataroot, dataroots, keypath)
+                dataroot_path, dataroot_except = dataroot_paths[dataroot]
+                if dataroot_path is not None:
+                    search_paths.append(dataroot_path)
             else:
                 if cwd:
                     search_paths.append(os.path.abspath(cwd))
 
             try:
-                if hash:
-                    resolved = path.hash(hashalgo,
-                                         search=search_paths,
-                                         collection_dir=collection_dir)
-                else:
-                    resolved = path.resolve_path(search=search_paths,
-                                                 collection_dir=collection_dir)
+                resolved = path.resolve_path(search=search_paths,
+                                             collection_dir=collection_dir,
+                                             cache=resolve_cache)
             except FileNotFoundError:
                 resolved = None
                 if not missing_ok:
@@ -1066,12 +2055,54 @@ class BaseSchema:
                             f'{report_paths}')
             resolved_paths.append(resolved)
 
+        if hash:
+            resolved_paths = self.__hash_paths(paramtype, resolved_paths, hashalgo, hash_cache)
+
         if not is_list:
             if not resolved_paths:
                 return None
             return resolved_paths[0]
         return resolved_paths
 
+    def __resolve_dataroot(self, dataroot: str,
+                           dataroots: Dict[str, Union[str, Callable]],
+                           keypath: Tuple[str, ...]) \
+            -> Tuple[Optional[str], Optional[Exception]]:
+        """
+        Returns the path of a dataroot, or the exception raised while resolving it.
+        """
+        if dataroot not in dataroots:
+            raise ValueError(f"Resolver for {dataroot} not provided: "
+                             f"{self.__format_key(*keypath)}")
+        dataroot_path = dataroots[dataroot]
+        if isinstance(dataroot_path, str):
+            return os.path.abspath(dataroot_path), None
+        if callable(dataroot_path):
+            try:
+                return dataroot_path(), None
+            except Exception as e:
+                return None, e
+        raise TypeError(f"Resolver for {dataroot} is not a recognized type: "
+                        f"{self.__format_key(*keypath)}")
+
+    @staticmethod
+    def __hash_paths(paramtype: str, paths: List[Optional[str]], hashalgo: str,
+                     hash_cache: Optional[FileHashCache]) -> List[Optional[str]]:
+        """
+        Returns the hashes of the resolved paths of a parameter, the files are hashed
+        concurrently, see :meth:`FileHashCache.hash_files` and
+        :meth:`FileHashCache.hash_directory`.
+        """
+        if hash_cache is None:
+            hash_cache = FileHashCache()
+
+        if 'dir' in paramtype:
+            return [PathNodeValue.hash_directory(path, hashfunction=hashalgo, cache=hash_cache)
+                    if path else None for path in paths]
+
+        hashes = iter(hash_cache.hash_files([path for path in paths if path], hashalgo))
+        return [next(hashes) if path else None for path in paths]
+
     def _check_filepaths(self, ignore_keys: Optional[Iterable[Tuple[str, ...]]] = None,
                          logger: Optional[logging.Logger] = None,
                          dataroots: Optional[Dict[str, Union[str, Callable]]] = None,
@@ -1102,47 +2133,50 @@ class BaseSchema:
 
         error = False
 
-        for keypath in self.allkeys():
-            if keypath in ignore_keys:
-                continue
+        if PathResolutionCache.get_active() is None:
+            # Paths shared between parameters are only resolved once
+            resolve_scope = PathResolutionCache().active()
+        else:
+            resolve_scope = contextlib.nullcontext()
 
-            param: Parameter = self.get(*keypath, field=None)
-            paramtype: str = param.get(field='type')
+        with resolve_scope:
+            for keypath in self._allpathkeys():
+                if keypath in ignore_keys:
+                    continue
 
-            if 'file' not in paramtype and 'dir' not in paramtype:
-                continue
+                param: Parameter = self.get(*keypath, field=None)
 
-            for check_files, step, index in param.getvalues():
-                if not check_files:
-                    # nothing set so continue
-                    continue
+                for check_files, step, index in param.getvalues():
+                    if not check_files:
+                        # nothing set so continue
+                        continue
+
+                    found_files = BaseSchema._find_files(
+                        self, *keypath, missing_ok=True, step=step, index=index,
+                        dataroots=dataroots, collection_dir=collection_dir, cwd=cwd)
 
-                found_files = BaseSchema._find_files(
-                    self, *keypath, missing_ok=True, step=step, index=index,
-                    dataroots=dataroots, collection_dir=collection_dir, cwd=cwd)
-
-                if not param.is_list():
-                    check_files = [check_files]
-                    found_files = [found_files]
-
-                for check_file, found_file in zip(check_files, found_files):
-                    if not found_file:
-                        error = True
-                        if logger:
-                            node_indicator = ""
-                            if step is not None:
-                                if index is None:
-                                    node_indicator = f" ({step})"
-                                else:
-                                    node_indicator = f" ({step}/{index})"
-
-                            name = ""
-                            if hasattr(self, "name"):
-                                name = f"({self.name}) "
-
-                            logger.error(f"Parameter {name}"
-                                         f"{self.__format_key(*keypath)}{node_indicator} "
-                                         f"path {check_file} is invalid")
+                    if not param.is_list():
+                        check_files = [check_files]
+                        found_files = [found_files]
+
+                    for check_file, found_file in zip(check_files, found_files):
+                        if not found_file:
+                            error = True
+                            if logger:
+                                node_indicator = ""
+                                if step is not None:
+                                    if index is None:
+                                        node_indicator = f" ({step})"
+                                    else:
+                                        node_indicator = f" ({step}/{index})"
+
+                                name = ""
+                                if hasattr(self, "name"):
+                                    name = f"({self.name}) "
+
+                                logger.error(f"Parameter {name}"
+                                             f"{self.__format_key(*keypath)}{node_indicator} "
+                                             f"path {check_file} is invalid")
 
         return not error
 
@@ -1150,7 +2184,8 @@ class BaseSchema:
                     step: Optional[str] = None, index: Optional[Union[int, str]] = None,
                     dataroots: Optional[Dict[str, Union[str, Callable]]] = None,
                     collection_dir: Optional[str] = None,
-                    cwd: Optional[str] = None):
+                    cwd: Optional[str] = None,
+                    hash_cache: Optional[FileHashCache] = None):
         '''Generates hash values for a list of parameter files.
 
         Generates a hash value for each file found in the keypath. If existing
@@ -1179,6 +2214,8 @@ class BaseSchema:
             collection_dir (path): optional path to a collections directory
             cwd (path): optional path to current working directory, this will default
                 to os.getcwd() if not provided.
+            hash_cache (:class:`FileHashCache`): cache to hash the files with, if not
+                provided the hashes are only cached in memory
 
         Returns:
             A list of hash values.
@@ -1192,7 +2229,7 @@ class BaseSchema:
             step=step, index=index,
             dataroots=dataroots,
             collection_dir=collection_dir,
-            cwd=cwd, hash=True)
+            cwd=cwd, hash=True, hash_cache=hash_cache)
 
     def _parent(self, root: bool = False) -> "BaseSchema":
         '''
@@ -1284,6 +2321,13 @@ class BaseSchema:
         if actives is None:
             return
 
+        self.__apply_active(actives, param, nodevalues)
+
+    def __apply_active(self, actives: Dict[str, Any], param: Parameter,
+                       nodevalues: Optional[Union[List[NodeValue],
+                                                  Set[NodeValue],
+                                                  Tuple[NodeValue, ...],
+                                                  NodeValue]]) -> None:
         if not isinstance(nodevalues, (list, set, tuple)):
             # Make everything a list
             nodevalues = [nodevalues]
@@ -1304,8 +2348,8 @@ class BaseSchema:
             if field not in nodevalues_fields:
                 continue
 
-            for param in nodevalues:
-                param.set(value, field=field)
+            for nodevalue in nodevalues:
+                nodevalue.set(value, field=field)
 
     def _generate_doc(self, doc,
                       ref_root: str = "",
@@ -0,0 +1,378 @@
+# Copyright 2025 Silicon Compiler Authors. All Rights Reserved.
+
+# NOTE: this file cannot rely on any third-party dependencies, including other
+# SC dependencies outside of its directory, since it may be used by tool drivers
+# that have isolated Python environments.
+
+'''
+Binary manifest encoding.
+
+The file starts with a header followed by the root section. Sections are stored
+as a table of their keys with the offset and length of each value, followed by
+the encoded values. Offsets are relative to the start of the section, so a
+section can be decoded without reading anything outside of it. Parameters and
+all other values are stored as JSON.
+
+Loading a manifest memory maps the file and only decodes the sections which are
+accessed, see :class:`BinaryManifestSection`. The map is closed before the file
+is rewritten, once the values which have not been accessed have been decoded.
+'''
+
+import mmap
+import os
+import struct
+import threading
+import weakref
+
+try:
+    import orjson as json
+    _has_orjson = True
+except ModuleNotFoundError:
+    import json
+    _has_orjson = False
+
+from collections.abc import MutableMapping
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+# Start of every binary manifest, see :func:`is_binary_data`
+MAGIC = b"SCPKGBIN"
+_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sI")
+_COUNT = struct.Struct("<I")
+_ENTRY = struct.Struct("<IQQ")  # key length, value offset, value length
+
+_VALUE = 0
+_SECTION = 1
+
+# Memory maps of the manifests which have been read, by path
+_mappings_lock = threading.Lock()
+_mappings: Dict[str, List["weakref.ref[_Mapping]"]] = {}
+
+
+def is_binary_manifest(filepath: str) -> bool:
+    '''
+    Returns true if manifests written to the filepath use the binary manifest encoding.
+
+    Args:
+        filepath (path): path to the manifest
+    '''
+    return str(filepath).lower().endswith(".pkg.bin")
+
+
+def is_binary_data(data: bytes) -> bool:
+    '''
+    Returns true if the data starts with the header of a binary manifest.
+
+    Args:
+        data (bytes): start of the manifest
+    '''
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def _check_header(header: Union[bytes, mmap.mmap], size: int) -> None:
+    '''
+    Raises a ValueError if a manifest of the given size does not start with a
+    supported header and a value.
+    '''
+    if len(header) < _HEADER.size or not is_binary_data(header):
+        raise ValueError("not a binary manifest")
+    _, version = _HEADER.unpack_from(header, 0)
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"unsupported binary manifest version: {version}")
+    if size <= _HEADER.size:
+        raise ValueError("truncated binary manifest")
+
+
+def _get_key(filepath: str) -> str:
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+def _dumps(value: Any) -> bytes:
+    if _has_orjson:
+        return json.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _is_section(value: Any) -> bool:
+    '''
+    Returns true if the value should be stored as a section.
+    Parameters and dictionaries without nested dictionaries are stored as values.
+    '''
+    if not isinstance(value, dict):
+        return False
+    if isinstance(value.get("type", None), str) and isinstance(value.get("node", None), dict):
+        # Parameter
+        return False
+    return any(isinstance(item, dict) for item in value.values())
+
+
+def _encode(value: Any) -> bytes:
+    if not _is_section(value):
+        return bytes([_VALUE]) + _dumps(value)
+
+    keys = [key.encode("utf-8") for key in value.keys()]
+    values = [_encode(item) for item in value.values()]
+
+    offset = 1 + _COUNT.size + sum(_ENTRY.size + len(key) for key in keys)
+    data = [bytes([_SECTION]), _COUNT.pack(len(keys))]
+    for key, item in zip(keys, values):
+        data.append(_ENTRY.pack(len(key), offset, len(item)))
+        data.append(key)
+        offset += len(item)
+    data.extend(values)
+
+    return b"".join(data)
+
+
+def encode(manifest: Dict) -> bytes:
+    '''
+    Returns the binary encoding of a manifest.
+
+    Args:
+        manifest (dict): manifest to encode
+    '''
+    return _HEADER.pack(MAGIC, _FORMAT_VERSION) + _encode(manifest)
+
+
+def _decode(buffer: Union[bytes, mmap.mmap], start: int, end: int,
+            mapping: Optional["_Mapping"] = None) -> Any:
+    if start >= end:
+        raise ValueError("corrupt binary manifest")
+    if buffer[start] == _SECTION:
+        return BinaryManifestSection(buffer, start, end, mapping=mapping)
+    return json.loads(buffer[start + 1:end])
+
+
+def decode(buffer: Union[bytes, mmap.mmap]) -> "BinaryManifestSection":
+    '''
+    Returns the root section of a binary manifest.
+
+    Args:
+        buffer (bytes): encoded manifest
+    '''
+    return _decode_root(buffer, None)
+
+
+def _decode_root(buffer: Union[bytes, mmap.mmap],
+                 mapping: Optional["_Mapping"]) -> "BinaryManifestSection":
+    _check_header(buffer, len(buffer))
+
+    root = _decode(buffer, _HEADER.size, len(buffer), mapping=mapping)
+    if not isinstance(root, BinaryManifestSection):
+        # Manifests without sections
+        root = BinaryManifestSection.from_dict(root)
+    return root
+
+
+def read(filepath: str) -> "BinaryManifestSection":
+    '''
+    Memory maps a binary manifest and returns the root section.
+
+    Args:
+        filepath (path): path to the manifest
+    '''
+    with open(filepath, "rb") as fin:
+        return read_file(fin, filepath)
+
+
+def read_file(fin: BinaryIO, filepath: str) -> "BinaryManifestSection":
+    '''
+    Memory maps a binary manifest from an open file and returns the root section.
+
+    The header and size of the file are checked before it is mapped.
+
+    Args:
+        fin (file): manifest opened for reading in binary mode
+        filepath (path): path to the manifest, which the map is recorded for, see
+            :func:`write`
+    '''
+    fin.seek(0)
+    header = fin.read(_HEADER.size)
+    _check_header(header, os.fstat(fin.fileno()).st_size)
+
+    mapping = _Mapping(mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ))
+    root = _decode_root(mapping.buffer, mapping)
+
+    with _mappings_lock:
+        refs = [ref for ref in _mappings.get(_get_key(filepath), []) if ref() is not None]
+        refs.append(weakref.ref(mapping))
+        _mappings[_get_key(filepath)] = refs
+    return root
+
+
+def _release(filepath: str) -> None:
+    '''
+    Closes the memory maps of a manifest, see :meth:`_Mapping.release`.
+    '''
+    with _mappings_lock:
+        refs = _mappings.pop(_get_key(filepath), [])
+    for ref in refs:
+        mapping = ref()
+        if mapping is not None:
+            mapping.release()
+
+
+def write(filepath: str, manifest: Dict) -> None:
+    '''
+    Writes a binary manifest.
+
+    The file is replaced rather than overwritten. Existing memory maps of it are
+    closed first, since a mapped file cannot be replaced on all platforms, and the
+    sections read from them remain valid.
+
+    Args:
+        filepath (path): path to the manifest
+        manifest (dict): manifest to write
+    '''
+    data = encode(manifest)
+    _release(filepath)
+
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filepath, "wb") as fout:
+            fout.write(data)
+        os.replace(tmp_filepath, filepath)
+    finally:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+
+
+class _Mapping:
+    '''
+    Memory map of a binary manifest and the sections decoded from it.
+    '''
+    __slots__ = ("buffer", "sections", "__weakref__")
+
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        # Sections are mutable mappings, which cannot be hashed
+        self.sections: List["weakref.ref[BinaryManifestSection]"] = []
+
+    def release(self) -> None:
+        '''
+        Decodes the values of the sections which have not been decoded yet, and
+        closes the map.
+        '''
+        # Decoding values adds their sections
+        while self.sections:
+            sections, self.sections = self.sections, []
+            for ref in sections:
+                section = ref()
+                if section is not None:
+                    section._release()
+        self.buffer.close()
+
+
+class _Encoded:
+    '''
+    Location of a value which has not been decoded yet.
+    '''
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+
+
+class BinaryManifestSection(MutableMapping):
+    '''
+    Dictionary view of a section in a binary manifest.
+
+    Values are decoded the first time they are accessed. Checking for a key,
+    iterating over the keys and removing values does not decode anything.
+
+    Args:
+        buffer (bytes): encoded manifest
+        start (int): start of the section in the buffer
+        end (int): end of the section in the buffer
+        mapping (:class:`_Mapping`): memory map the buffer belongs to
+    '''
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], start: int, end: int,
+                 mapping: Optional[_Mapping] = None):
+        self.__items: Dict[str, Any] = {}
+
+        try:
+            count, = _COUNT.unpack_from(buffer, start + 1)
+            pos = start + 1 + _COUNT.size
+            for _ in range(count):
+                key_len, offset, length = _ENTRY.unpack_from(buffer, pos)
+                pos += _ENTRY.size
+                if pos + key_len > end or start + offset + length > end:
+                    raise ValueError("corrupt binary manifest")
+                key = bytes(buffer[pos:pos + key_len]).decode("utf-8")
+                pos += key_len
+                self.__items[key] = _Encoded(start + offset, start + offset + length)
+        except struct.error:
+            raise ValueError("corrupt binary manifest") from None
+
+        self.__buffer = buffer
+        self.__mapping = mapping
+        if mapping is not None:
+            mapping.sections.append(weakref.ref(self))
+
+    @classmethod
+    def from_dict(cls, manifest: Dict) -> "BinaryManifestSection":
+        '''
+        Returns a section holding the values of a dictionary.
+
+        Args:
+            manifest (dict): values for the section
+        '''
+        section = cls.__new__(cls)
+        section.__items = dict(manifest)
+        section.__buffer = None
+        section.__mapping = None
+        return section
+
+    def _release(self) -> None:
+        '''
+        Decodes the values which have not been decoded yet and drops the buffer,
+        see :meth:`_Mapping.release`.
+        '''
+        for key in list(self.__items.keys()):
+            self[key]
+        self.__buffer = None
+        self.__mapping = None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.__items[key]
+        if isinstance(value, _Encoded):
+            value = _decode(self.__buffer, value.start, value.end, mapping=self.__mapping)
+            self.__items[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.__items[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.__items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__items)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.__items.keys())})"
+
+    def to_dict(self) -> Dict:
+        '''
+        Returns the section as a dictionary, decoding all values.
+        '''
+        manifest = {}
+        for key in self.__items.keys():
+            value = self[key]
+            if isinstance(value, BinaryManifestSection):
+                value = value.to_dict()
+            manifest[key] = value
+        return manifest
+
+    def __reduce__(self) -> Tuple:
+        # Memory maps cannot be serialized, so store the decoded section
+        return (dict, (self.to_dict(),))
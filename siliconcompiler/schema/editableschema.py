@@ -32,10 +32,15 @@ class EditableSchema:
         key = keypath[0]
         keypath = keypath[1:]
 
+        self.__schema._BaseSchema__cow_detach()
+        self.__schema._BaseSchema__keys_changed()
+
         if len(keypath) == 0:
             if key in self.__schema._BaseSchema__manifest and not clobber:
                 raise KeyError(f"[{','.join(fullkey)}] is already defined")
 
+            self.__schema._BaseSchema__cow_release(key)
+
             if isinstance(value, BaseSchema):
                 value._BaseSchema__parent = self.__schema
                 value._BaseSchema__key = key
@@ -55,11 +60,13 @@ class EditableSchema:
         new_schema._BaseSchema__parent = self.__schema
         if key == "default":
             if self.__schema._BaseSchema__default:
-                new_schema = self.__schema._BaseSchema__default
+                new_schema = self.__schema._BaseSchema__cow_own(key)
             else:
                 self.__schema._BaseSchema__default = new_schema
+        elif key in self.__schema._BaseSchema__manifest:
+            new_schema = self.__schema._BaseSchema__cow_own(key)
         else:
-            new_schema = self.__schema._BaseSchema__manifest.setdefault(key, new_schema)
+            self.__schema._BaseSchema__manifest[key] = new_schema
         new_schema._BaseSchema__key = key
         EditableSchema(new_schema).__insert(keypath, value, fullkey, clobber)
 
@@ -67,15 +74,16 @@ class EditableSchema:
         key = keypath[0]
         keypath = keypath[1:]
 
-        if key == "default":
-            next_param = self.__schema._BaseSchema__default
-        else:
-            next_param = self.__schema._BaseSchema__manifest.get(key, None)
+        self.__schema._BaseSchema__cow_detach()
+        self.__schema._BaseSchema__keys_changed()
+
+        next_param = self.__schema._BaseSchema__cow_own(key)
 
         if not next_param:
             raise KeyError(f"[{','.join(fullkey)}] cannot be found")
 
         if len(keypath) == 0:
+            self.__schema._BaseSchema__cow_release(key)
             if key == "default":
                 self.__schema._BaseSchema__default = None
             else:
@@ -110,6 +118,7 @@ class EditableSchema:
         if not isinstance(value, (Parameter, BaseSchema)):
             raise ValueError(f"Value ({type(value)}) must be schema type: Parameter, BaseSchema")
 
+        self.__schema._BaseSchema__cow_prepare_write()
         self.__insert(keypath, value, keypath, clobber=clobber)
 
     def remove(self, *keypath: str) -> None:
@@ -130,6 +139,7 @@ class EditableSchema:
         if any([not isinstance(key, str) for key in keypath]):
             raise ValueError("Keypath must only be strings")
 
+        self.__schema._BaseSchema__cow_prepare_write()
         self.__remove(keypath, keypath)
 
     def search(self, *keypath: str) -> Union[BaseSchema, Parameter]:
@@ -151,7 +161,8 @@ class EditableSchema:
         if any([not isinstance(key, str) for key in keypath]):
             raise ValueError("Keypath must only be strings")
 
-        return self.__schema._BaseSchema__search(*keypath, require_leaf=False)
+        return self.__schema._BaseSchema__search(*keypath, require_leaf=False,
+                                                 writeable=True)
 
     def copy(self) -> BaseSchema:
         '''
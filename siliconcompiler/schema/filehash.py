@@ -0,0 +1,258 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import os.path
+
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from typing import Dict, List, Optional, Tuple
+
+
+class FileHashCache:
+    """
+    Cache of file and directory hashes.
+
+    A hash is tied to the resolved path, size, modification time, and inode of
+    the file along with the hashing algorithm, so an unchanged file only costs a
+    stat. Hashes are kept in memory, up to a limit after which the least recently
+    used hashes are dropped, and, when a path is provided, in an sqlite database
+    so they are shared between processes and runs.
+
+    Files modified within the last few seconds are hashed but not cached, since a
+    second change within the resolution of the modification time would not be
+    detected. Errors accessing the database are ignored and the file is hashed
+    instead. The database is only accessed from the thread which uses the cache.
+
+    Args:
+        path (str): path to the database, None to only keep hashes in memory.
+    """
+
+    __TIMEOUT = 30
+    __MAX_THREADS = 8
+    __MIN_AGE = 2 * 1000000000
+    __MAX_HASHES = 100000
+
+    __lock = threading.Lock()
+    __hashes: "OrderedDict[Tuple[str, int, int, int, str], str]" = OrderedDict()
+
+    def __init__(self, path: Optional[str] = None):
+        self.__path = path
+        self.__conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Optional[str]:
+        """str: path to the database."""
+        return self.__path
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Clears the hashes kept in memory.
+        """
+        with FileHashCache.__lock:
+            FileHashCache.__hashes.clear()
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        if self.__conn is not None:
+            self.__conn.close()
+            self.__conn = None
+
+    def __enter__(self) -> "FileHashCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @staticmethod
+    def __get_key(filename: str, algorithm: str) -> Optional[Tuple[str, int, int, int, str]]:
+        try:
+            path = os.path.realpath(filename)
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return path, stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm
+
+    def __connect(self) -> sqlite3.Connection:
+        if self.__conn is None:
+            if os.path.dirname(self.__path):
+                os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            conn = sqlite3.connect(self.__path, timeout=FileHashCache.__TIMEOUT)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "mtime INTEGER NOT NULL, "
+                "inode INTEGER NOT NULL, "
+                "algorithm TEXT NOT NULL, "
+                "hash TEXT NOT NULL, "
+                "PRIMARY KEY (path, algorithm))")
+            self.__conn = conn
+        return self.__conn
+
+    @staticmethod
+    def __remember(key: Tuple[str, int, int, int, str], filehash: str) -> None:
+        """
+        Keeps a hash in memory, dropping the least recently used hashes over the limit.
+        """
+        with FileHashCache.__lock:
+            FileHashCache.__hashes[key] = filehash
+            FileHashCache.__hashes.move_to_end(key)
+            while len(FileHashCache.__hashes) > FileHashCache.__MAX_HASHES:
+                FileHashCache.__hashes.popitem(last=False)
+
+    def __get(self, key: Tuple[str, int, int, int, str]) -> Optional[str]:
+        with FileHashCache.__lock:
+            filehash = FileHashCache.__hashes.get(key, None)
+            if filehash is not None:
+                FileHashCache.__hashes.move_to_end(key)
+        if filehash is not None or self.__path is None or not os.path.exists(self.__path):
+            return filehash
+
+        try:
+            row = self.__connect().execute(
+                "SELECT size, mtime, inode, hash FROM hashes "
+                "WHERE path = ? AND algorithm = ?", (key[0], key[4])).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None or tuple(row[0:3]) != key[1:4]:
+            return None
+
+        FileHashCache.__remember(key, row[3])
+        return row[3]
+
+    def __set(self, records: List[Tuple[str, Tuple[str, int, int, int, str], str]]) -> None:
+        rows = []
+        for filename, key, filehash in records:
+            if time.time_ns() - key[2] < FileHashCache.__MIN_AGE:
+                # Recently modified
+                continue
+
+            if FileHashCache.__get_key(filename, key[4]) != key:
+                # Modified while hashing
+                continue
+
+            FileHashCache.__remember(key, filehash)
+            rows.append((*key, filehash))
+
+        if self.__path is None or not rows:
+            return
+
+        try:
+            conn = self.__connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)", rows)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def hash_file(self, filename: str, algorithm: str) -> str:
+        """
+        Returns the hash of a file, see :meth:`PathNodeValue.hash_file`.
+
+        Args:
+            filename (path): file to hash.
+            algorithm (str): name of the hashing function.
+        """
+        return self.hash_files([filename], algorithm)[0]
+
+    def hash_files(self, filenames: List[str], algorithm: str) -> List[str]:
+        """
+        Returns the hashes of files, see :meth:`PathNodeValue.hash_file`.
+
+        The files which are not in the cache are hashed concurrently.
+
+        Args:
+            filenames (list of path): files to hash.
+            algorithm (str): name of the hashing function.
+        """
+        from .parametervalue import PathNodeValue
+
+        hashes: List[Optional[str]] = []
+        missing: List[int] = []
+        keys: List[Optional[Tuple[str, int, int, int, str]]] = []
+        for n, filename in enumerate(filenames):
+            key = FileHashCache.__get_key(filename, algorithm)
+            keys.append(key)
+            filehash = None
+            if key is not None:
+                filehash = self.__get(key)
+            if filehash is None:
+                missing.append(n)
+            hashes.append(filehash)
+
+        def hash_file(n: int) -> str:
+            return PathNodeValue.hash_file(filenames[n], hashfunction=algorithm)
+
+        if len(missing) > 1:
+            with ThreadPool(min(len(missing), FileHashCache.__MAX_THREADS)) as pool:
+                missing_hashes = pool.map(hash_file, missing)
+        else:
+            missing_hashes = [hash_file(n) for n in missing]
+
+        records = []
+        for n, filehash in zip(missing, missing_hashes):
+            hashes[n] = filehash
+            if keys[n] is not None:
+                records.append((filenames[n], keys[n], filehash))
+        self.__set(records)
+
+        return hashes
+
+    def hash_directory(self, dirname: str, algorithm: str) -> Optional[str]:
+        """
+        Returns the hash of a directory.
+
+        The hash of a directory is computed from the names, types, and hashes of
+        its entries, sorted by name, where subdirectories are hashed the same way.
+        A change to a file only changes the hashes of the file and the directories
+        containing it, and the unchanged files are taken from the cache. The files
+        which are not in the cache are hashed concurrently, see :meth:`hash_files`.
+
+        Symbolic links to directories are not followed.
+
+        Args:
+            dirname (path): directory to hash.
+            algorithm (str): name of the hashing function.
+
+        Returns:
+            The hash of the directory, or None if it does not exist or does not
+            contain any files.
+        """
+        hashfunc = getattr(hashlib, algorithm)
+
+        entries: Dict[str, Tuple[List[str], List[str]]] = {}
+        filenames: List[str] = []
+        for root, dirs, files in os.walk(dirname):
+            entries[root] = (dirs, files)
+            filenames.extend([os.path.join(root, name) for name in files])
+
+        if not filenames:
+            # A directory without any files has no hash
+            return None
+
+        filehashes = dict(zip(filenames, self.hash_files(filenames, algorithm)))
+
+        # Subdirectories are walked after their parents, so combine in reverse
+        dirhashes: Dict[str, str] = {}
+        for root in reversed(list(entries.keys())):
+            dirs, files = entries[root]
+            root_entries = []
+            for name in dirs:
+                path = os.path.join(root, name)
+                if path in dirhashes:
+                    root_entries.append((name, "d", dirhashes.pop(path)))
+            for name in files:
+                root_entries.append((name, "f", filehashes[os.path.join(root, name)]))
+
+            hashobj = hashfunc()
+            for name, entry_type, entry_hash in sorted(root_entries):
+                hashobj.update(f"{entry_type} {entry_hash} {name}\0".encode("utf-8"))
+            dirhashes[root] = hashobj.hexdigest()
+
+        return dirhashes[dirname]
@@ -1,12 +1,34 @@
 import copy
-import json
+import os
 
-from typing import Tuple, Set, Dict, List, Optional, Union, TYPE_CHECKING
+try:
+    import orjson as json
+    _has_orjson = True
+except ModuleNotFoundError:
+    import json
+    _has_orjson = False
+
+from typing import Any, Iterable, Tuple, Set, Dict, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .baseschema import BaseSchema
 
 
+class _JournalRecorders(list):
+    '''
+    Journals which also record the transactions of a journal, see :meth:`Journal.attach`.
+
+    These are never copied or serialized.
+    '''
+    __slots__ = ()
+
+    def __reduce__(self):
+        return (_JournalRecorders, ())
+
+    def __deepcopy__(self, memo):
+        return _JournalRecorders()
+
+
 class Journal:
     """
     This class provides the ability to record the schema transactions:
@@ -17,6 +39,11 @@ class Journal:
         keyprefix (list of str): keypath to prefix on to recorded path
     """
 
+    # Parameter fields which are not stored per step and index, see :meth:`Parameter.set`
+    __PARAMETER_FIELDS = frozenset((
+        "lock", "type", "scope", "switch", "example", "shorthelp", "help", "notes",
+        "pernode", "unit", "hashalgo", "copy", "require"))
+
     def __init__(self, keyprefix: Optional[Union[List[str], Tuple[str, ...]]] = None):
         if not keyprefix:
             self.__keyprefix = tuple()
@@ -26,6 +53,10 @@ class Journal:
         self.__parent = self
 
         self.__record_types = set()
+        # Number of records written to each sidecar, see :meth:`write_sidecar`
+        self.__sidecars: Dict[str, int] = {}
+        # Journals which also record the transactions, see :meth:`attach`
+        self.__recorders = _JournalRecorders()
         self.stop()
 
     @property
@@ -65,6 +96,15 @@ class Journal:
 
         return copy.deepcopy(self.__parent.__journal)
 
+    def get_records(self) -> List[Dict]:
+        """
+        Returns the records of the current journal without copying them.
+
+        The records must not be modified.
+        """
+
+        return self.__parent.__journal or []
+
     def has_journaling(self) -> bool:
         """
         Returns true if the schema is currently setup and is the root of the journal and has data
@@ -121,32 +161,93 @@ class Journal:
         Record the schema transaction
         '''
 
-        if self.__parent.__journal is None:
+        self.record_many(record_type, ((key, value, field, step, index),))
+
+    def record_many(self,
+                    record_type: str,
+                    records: Iterable[Tuple[Union[List[str], Tuple[str, ...]], Any,
+                                            Optional[str], Optional[str],
+                                            Optional[Union[int, str]]]]) -> None:
+        '''
+        Record multiple schema transactions of the same type
+
+        Args:
+            record_type (str): transaction type
+            records (list of (key, value, field, step, index)): transactions to record
+        '''
+
+        parent = self.__parent
+        if parent.__journal is None and not parent.__recorders:
             return
 
-        if record_type not in self.__parent.__record_types:
+        journals = [journal.__journal for journal in (parent, *parent.__recorders)
+                    if journal.__journal is not None and record_type in journal.__record_types]
+        if not journals:
             return
 
-        if isinstance(value, set):
-            value = list(value)
+        keyprefix = self.__keyprefix
+        append = journals[0].append if len(journals) == 1 else None
+
+        last_key = None
+        for key, value, field, step, index in records:
+            if key is not last_key:
+                # Consecutive records often share the same key
+                last_key = key
+                if keyprefix:
+                    journal_key = tuple([*keyprefix, *key])
+                else:
+                    journal_key = tuple(key)
+
+            if isinstance(value, set):
+                value = list(value)
+
+            if index is not None and isinstance(index, int):
+                index = str(index)
+
+            record = {
+                "type": record_type,
+                "key": journal_key,
+                "value": value,
+                "field": field,
+                "step": step,
+                "index": index
+            }
+            if append is not None:
+                append(record)
+            else:
+                for journal in journals:
+                    journal.append(record)
 
-        if index is not None and isinstance(index, int):
-            index = str(index)
+    def attach(self, journal: "Journal") -> None:
+        '''
+        Records the schema transactions into another journal as well, which is not
+        stored with the schema. The other journal only records the transactions while
+        it is started, see :meth:`start`, and this journal does not need to be started.
 
-        self.__parent.__journal.append({
-            "type": record_type,
-            "key": tuple([*self.__keyprefix, *key]),
-            "value": value,
-            "field": field,
-            "step": step,
-            "index": index
-        })
+        Args:
+            journal (:class:`Journal`): journal to record the transactions into
+        '''
+        self.__parent.__recorders.append(journal)
+
+    def detach(self, journal: "Journal") -> None:
+        '''
+        Stops recording the schema transactions into another journal, see :meth:`attach`.
+
+        Args:
+            journal (:class:`Journal`): journal to stop recording the transactions into
+        '''
+        recorders = self.__parent.__recorders
+        for n, recorder in enumerate(recorders):
+            if recorder is journal:
+                del recorders[n]
+                return
 
     def start(self) -> None:
         '''
         Start journaling the schema transactions
         '''
         self.__parent.__journal = []
+        self.__parent.__sidecars.clear()
         self.add_type("set")
         self.add_type("add")
         self.add_type("remove")
@@ -159,22 +260,224 @@ class Journal:
         self.__parent.__journal = None
         self.__parent.__record_types.clear()
 
+    @staticmethod
+    def __compact(records: List[Dict]) -> List[Dict]:
+        '''
+        Returns the records without the writes which are superseded by a later set.
+
+        A set replaces the value of a field for a step and index, so the sets and adds
+        before it on the same field, step, and index are dropped, provided no other
+        record for that step and index occurred in between. Unsets, removes, and sets
+        on parameter fields, such as lock, are kept and earlier records are never
+        dropped across them.
+        '''
+        drop = set()
+        # keypath -> (step, index) -> (field, positions of the records on that field)
+        pending: Dict[Tuple[str, ...], Dict[Tuple[str, str], Tuple[Optional[str], List[int]]]] = {}
+
+        for n, record in enumerate(records):
+            record_type = record["type"]
+            key = tuple(record["key"])
+
+            if record_type == "remove":
+                for keypath in [keypath for keypath in pending
+                                if keypath[0:len(key)] == key]:
+                    del pending[keypath]
+                continue
+
+            if record_type not in ("set", "add", "unset"):
+                continue
+
+            if record_type != "unset" and record["field"] in Journal.__PARAMETER_FIELDS:
+                pending.pop(key, None)
+                continue
+
+            step = record["step"]
+            index = record["index"]
+            node = ("global" if step is None else step,
+                    "global" if index is None else str(index))
+
+            nodes = pending.setdefault(key, {})
+            if record_type == "unset":
+                nodes.pop(node, None)
+                continue
+
+            field = record["field"]
+            current = nodes.get(node, None)
+            if current is None or current[0] != field:
+                current = (field, [])
+                nodes[node] = current
+
+            if record_type == "set":
+                drop.update(current[1])
+                current[1].clear()
+            current[1].append(n)
+
+        if not drop:
+            return records
+        return [record for n, record in enumerate(records) if n not in drop]
+
+    def compact(self) -> None:
+        '''
+        Removes the records which are superseded by later records.
+
+        Replaying the compacted journal results in the same schema as replaying
+        the full journal.
+        '''
+        if not self.__parent.__journal:
+            return
+
+        records = Journal.__compact(self.__parent.__journal)
+        if records is not self.__parent.__journal:
+            self.__parent.__journal[:] = records
+            # Records previously written to sidecars have changed
+            self.__parent.__sidecars.clear()
+
+    @staticmethod
+    def get_sidecar_path(filepath: str) -> str:
+        '''
+        Returns the path to the journal sidecar of a manifest
+
+        Args:
+            filepath (path): path to manifest
+        '''
+        return f"{filepath}.journal"
+
+    @staticmethod
+    def __manifest_stamp(filepath: str) -> Optional[List[int]]:
+        '''
+        Returns the size and modification time of a manifest, or None if it does not exist.
+
+        Args:
+            filepath (path): path to manifest
+        '''
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def __dumps(record: Union[Dict, List]) -> bytes:
+        if _has_orjson:
+            return json.dumps(record)
+        return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+    def write_sidecar(self, filepath: str) -> None:
+        '''
+        Writes the journal into a sidecar file next to a manifest, which allows the
+        journal to be replayed without reading the manifest, see :meth:`replay_file`.
+
+        The sidecar holds one record per line. Records written by a previous call since
+        journaling started are not written again, the new records are appended instead.
+        Each write ends with a line holding the number of records in the file, so readers
+        only use complete writes, and the size and modification time of the manifest,
+        so readers ignore the sidecar once the manifest has been written again.
+        The sidecar must therefore be written after the manifest.
+
+        Args:
+            filepath (path): path to manifest
+        '''
+        records = self.__parent.__journal or []
+        path = Journal.get_sidecar_path(filepath)
+
+        written = self.__parent.__sidecars.get(path, None)
+        if written is not None and (written > len(records) or not os.path.exists(path)):
+            written = None
+
+        lines = [Journal.__dumps(record) for record in records[written or 0:]]
+        lines.append(Journal.__dumps({"__records__": len(records),
+                                      "__manifest__": Journal.__manifest_stamp(filepath)}))
+        data = b"\n".join(lines) + b"\n"
+
+        if written is None:
+            # Replace any previous sidecar in one step
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        else:
+            with open(path, "ab") as f:
+                f.write(data)
+
+        self.__parent.__sidecars[path] = len(records)
+
+    @staticmethod
+    def read_sidecar(filepath: str) -> Optional[List[Dict]]:
+        '''
+        Returns the journal records from the sidecar of a manifest, or None if the
+        manifest does not have a sidecar with complete records which was written for
+        the current manifest.
+
+        Args:
+            filepath (path): path to manifest
+        '''
+        path = Journal.get_sidecar_path(filepath)
+        try:
+            with open(path, "rb") as f:
+                lines = f.read().split(b"\n")
+        except FileNotFoundError:
+            return None
+
+        records = []
+        complete = None
+        stamp = None
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Incomplete write
+                break
+            if "__records__" in record:
+                if record["__records__"] != len(records):
+                    break
+                complete = len(records)
+                stamp = record.get("__manifest__", None)
+            else:
+                records.append(record)
+
+        if complete is None:
+            return None
+        if stamp != Journal.__manifest_stamp(filepath):
+            # Sidecar of a different manifest
+            return None
+        return records[:complete]
+
+    @staticmethod
+    def read_file(filepath: str) -> List[Dict]:
+        '''
+        Returns the journal records of a manifest.
+
+        The journal is read from the sidecar of the manifest if available,
+        see :meth:`write_sidecar`, otherwise it is read from the manifest.
+
+        Args:
+            filepath (path): path to manifest
+        '''
+        records = Journal.read_sidecar(filepath)
+        if records is None:
+            from .baseschema import BaseSchema
+            data = BaseSchema._read_manifest(filepath, lazy=True)
+            if "__journal__" not in data:
+                return []
+            records = data["__journal__"]
+        return records
+
     @staticmethod
     def replay_file(schema: "BaseSchema", filepath: str) -> None:
         '''
-        Replay a journal into a schema from a manifest
+        Replay a journal into a schema from a manifest, see :meth:`read_file`.
 
         Args:
             schema (:class:`BaseSchema`): schema to replay transactions to
             filepath (path): path to manifest
         '''
-        with open(filepath, "r") as fid:
-            data = json.load(fid)
-        if "__journal__" not in data:
-            return
-
         journal = Journal()
-        journal.from_dict(data["__journal__"])
+        journal.from_dict(Journal.read_file(filepath))
         journal.replay(schema)
 
     def replay(self, schema: "BaseSchema") -> None:
@@ -192,26 +495,38 @@ class Journal:
         if not self.__parent.__journal:
             return
 
-        for action in self.__parent.__journal:
+        # Consecutive set records on the same field are applied together
+        sets = []
+        sets_field = None
+        for action in Journal.__compact(self.__parent.__journal):
             record_type = action['type']
             keypath = action['key']
             value = action['value']
             field = action['field']
             step = action['step']
             index = action['index']
+            if record_type == 'get':
+                continue
+
+            if sets and (record_type != 'set' or field != sets_field):
+                schema.set_many(sets, field=sets_field)
+                sets = []
+
             if record_type == 'set':
-                schema.set(*keypath, value, field=field, step=step, index=index)
+                sets_field = field
+                sets.append((keypath, value, step, index))
             elif record_type == 'add':
                 schema.add(*keypath, value, field=field, step=step, index=index)
             elif record_type == 'unset':
                 schema.unset(*keypath, step=step, index=index)
             elif record_type == 'remove':
                 schema.remove(*keypath)
-            elif record_type == 'get':
-                continue
             else:
                 raise ValueError(f'Unknown record type {record_type}')
 
+        if sets:
+            schema.set_many(sets, field=sets_field)
+
     @staticmethod
     def access(schema: "BaseSchema") -> "Journal":
         '''
@@ -94,7 +94,7 @@ class NamedSchema(BaseSchema):
             name (str): name of the schema.
         '''
         if filepath and not cfg:
-            cfg = BaseSchema._read_manifest(filepath)
+            cfg = BaseSchema._read_manifest(filepath, lazy=lazyload)
 
         meta_name = NamedSchema.__get_meta_name(cfg)
         schema = super().from_manifest(filepath=None, cfg=cfg, lazyload=lazyload)
@@ -8,9 +8,10 @@ import argparse
 import copy
 import re
 import shlex
+import weakref
 
 from enum import Enum
-from typing import Tuple, Optional, Union, List, Dict, Any, Set
+from typing import Tuple, Optional, Union, List, Dict, Any, Set, Callable, Iterable
 
 from .parametervalue import NodeValue, DirectoryNodeValue, FileNodeValue, NodeListValue, \
     NodeSetValue
@@ -41,6 +42,156 @@ class PerNode(Enum):
         return self == PerNode.NEVER
 
 
+class _ParameterMetadata:
+    '''
+    Immutable per-definition information for a parameter.
+
+    Instances are interned, so all parameters created from the same definition,
+    including every copy of a ``default`` template, share a single object.
+    Use :meth:`get` to create a new instance and :meth:`replace` to change a field.
+    '''
+
+    __slots__ = ("type", "scope", "require", "switch", "shorthelp", "example", "help",
+                 "notes", "pernode", "unit", "hashalgo", "copy", "__weakref__")
+
+    __fields = __slots__[:-1]
+    __interned: "weakref.WeakValueDictionary[Tuple, _ParameterMetadata]" = \
+        weakref.WeakValueDictionary()
+
+    @staticmethod
+    def get(type, scope: Scope, require: bool,
+            switch: List[str], shorthelp: Optional[str],
+            example: List[str], help: Optional[str], notes: Optional[str],
+            pernode: PerNode, unit: Optional[str],
+            hashalgo: Optional[str], copy: Optional[bool]) -> "_ParameterMetadata":
+        '''
+        Returns the shared metadata object for these fields.
+        '''
+        switch = tuple(switch)
+        example = tuple(example)
+
+        key = (type.__class__, NodeType.encode(type), scope, require, switch, shorthelp,
+               example, help, notes, pernode, unit, hashalgo, copy)
+        meta = _ParameterMetadata.__interned.get(key)
+        if meta is None:
+            meta = _ParameterMetadata()
+            for field, value in zip(_ParameterMetadata.__fields,
+                                    (type, scope, require, switch, shorthelp, example, help,
+                                     notes, pernode, unit, hashalgo, copy)):
+                object.__setattr__(meta, field, value)
+            _ParameterMetadata.__interned[key] = meta
+        return meta
+
+    def replace(self, **fields) -> "_ParameterMetadata":
+        '''
+        Returns the shared metadata object with the provided fields updated.
+        '''
+        values = {field: getattr(self, field) for field in _ParameterMetadata.__fields}
+        values.update(fields)
+        return _ParameterMetadata.get(**values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{name} is read only")
+
+    def __copy__(self) -> "_ParameterMetadata":
+        return self
+
+    def __deepcopy__(self, memo) -> "_ParameterMetadata":
+        return self
+
+    def __reduce__(self):
+        # Re-intern when loaded
+        return (_ParameterMetadata.get,
+                tuple(getattr(self, field) for field in _ParameterMetadata.__fields))
+
+
+class _ParameterEncoding:
+    '''
+    Cached encoding of a parameter dictionary, see :meth:`Parameter._getdict_encoded`.
+
+    Instances are never modified, so they can be shared by copies of a parameter.
+    This is never serialized.
+    '''
+
+    __slots__ = ("key", "data")
+
+    def __init__(self, key: Any = None, data: Any = None):
+        self.key = key
+        self.data = data
+
+    def __deepcopy__(self, memo) -> "_ParameterEncoding":
+        return self
+
+    def __reduce__(self):
+        return (_ParameterEncoding, ())
+
+
+class _ParameterShare:
+    '''
+    Copy-on-write state of the values shared by copies of a parameter, see
+    :meth:`Parameter.copy`.
+
+    This is never copied or serialized, only the number of holders is kept.
+    '''
+
+    __slots__ = ("count", "holders")
+
+    def __init__(self, count: int = 1):
+        # Parameters holding the values
+        self.count = count
+        # References to the parameters holding the values, only kept when one of them
+        # has handed out node values, see :meth:`Parameter.__make_unique`
+        self.holders: Optional[List["weakref.ref[Parameter]"]] = None
+
+    def __reduce__(self):
+        return (_ParameterShare, (self.count,))
+
+
+class _ParameterExposure:
+    '''
+    Tracks the node values a parameter has handed out, which can be modified without
+    going through the parameter, and the schema section it has been handed out from,
+    see :meth:`Parameter._set_owner`.
+
+    Node values which have been handed out call this before they are modified, see
+    :meth:`.NodeValue._set_owner`. Copies of this do not refer to any parameter.
+    '''
+
+    __slots__ = ("param", "owner", "handed_out", "modifying")
+
+    def __init__(self, param: Optional["Parameter"] = None):
+        self.param = param
+        self.owner: Optional[weakref.WeakMethod] = None
+        # True once node values have been handed out
+        self.handed_out = False
+        # True while the parameter modifies its node values itself
+        self.modifying = False
+
+    def __call__(self) -> None:
+        '''
+        Prepares the parameter for a modification made directly to a node value.
+        '''
+        if self.param is not None and not self.modifying:
+            self.param._Parameter__value_changed()
+
+    def notify(self) -> None:
+        '''
+        Notifies the schema section the parameter has been handed out from that it
+        is about to be modified.
+        '''
+        if self.owner is None:
+            return
+        owner = self.owner()
+        if owner is not None:
+            owner()
+
+    def __deepcopy__(self, memo) -> "_ParameterExposure":
+        return _ParameterExposure()
+
+    def __reduce__(self):
+        return (_ParameterExposure, ())
+
+
 class Parameter:
     '''
     Leaf nodes in the schema. This holds all the information for a given keypath.
@@ -66,6 +217,10 @@ class Parameter:
 
     GLOBAL_KEY = 'global'
 
+    # __dict__ is only allocated if an attribute outside the slots is assigned
+    __slots__ = ("__meta", "__lock", "__node", "__defvalue", "__shared", "__exposed",
+                 "__encoded", "__dict__", "__weakref__")
+
     def __init__(self,
                  type: str,
                  require: bool = False,
@@ -83,77 +238,229 @@ class Parameter:
                  pernode: PerNode = PerNode.NEVER,
                  **kwargs):
 
-        self.__type = NodeType.parse(type)
-        self.__scope = Scope(scope)
+        type = NodeType.parse(type)
         self.__lock = lock
-        self.__require = require
 
         if switch is None:
             switch = []
         elif isinstance(switch, str):
             switch = [switch]
-        self.__switch = switch
-
-        self.__shorthelp = shorthelp
 
         if example is None:
             example = []
         elif isinstance(example, str):
             example = [example]
-        self.__example = example
-
-        self.__help = help
 
-        self.__notes = notes
-
-        if self.__type == 'bool':
+        if type == 'bool':
             if defvalue is None:
                 defvalue = False
 
-        self.__pernode = PerNode(pernode)
+        if unit is not None and \
+                (NodeType.contains(type, 'int') or NodeType.contains(type, 'float')):
+            unit = str(unit)
+        else:
+            unit = None
+
+        if NodeType.contains(type, 'dir') or NodeType.contains(type, 'file'):
+            hashalgo = str(hashalgo)
+            copy = bool(copy)
+        else:
+            hashalgo = None
+            copy = None
+
+        self.__meta = _ParameterMetadata.get(
+            type=type,
+            scope=Scope(scope),
+            require=require,
+            switch=switch,
+            shorthelp=shorthelp,
+            example=example,
+            help=help,
+            notes=notes,
+            pernode=PerNode(pernode),
+            unit=unit,
+            hashalgo=hashalgo,
+            copy=copy)
 
         self.__setdefvalue(defvalue, **kwargs)
 
         self.__node = {}
 
-        self.__unit = None
-        if unit is not None and \
-                (NodeType.contains(self.__type, 'int') or NodeType.contains(self.__type, 'float')):
-            self.__unit = str(unit)
+        # Copy-on-write state, shared by all copies of this parameter which have not
+        # been modified yet, see :meth:`copy`
+        self.__shared: Optional[_ParameterShare] = None
+        # Node values and schema section this has been handed out to, see :meth:`_set_owner`
+        self.__exposed: Optional[_ParameterExposure] = None
+        # Encoded dictionary, cleared whenever this parameter is modified
+        self.__encoded: Optional[_ParameterEncoding] = None
+
+    def __make_unique(self, copy_values: bool = True) -> None:
+        '''
+        Ensures the values of this parameter are not shared with any of its copies.
 
-        self.__hashalgo = None
-        self.__copy = None
-        if NodeType.contains(self.__type, 'dir') or NodeType.contains(self.__type, 'file'):
-            self.__hashalgo = str(hashalgo)
-            self.__copy = bool(copy)
+        Node values which have been handed out remain with this parameter, so the
+        copies take duplicates of the values instead.
+
+        Args:
+            copy_values (bool): if true, the shared values are duplicated, otherwise
+                the caller is responsible for replacing them.
+        '''
+        shared = self.__shared
+        if shared is None:
+            return
+
+        self.__shared = None
+        shared.count -= 1
+        if shared.count == 0:
+            # Last holder of the values
+            return
+
+        if self.__is_exposed():
+            holders = [holder for holder in (ref() for ref in shared.holders or ())
+                       if holder is not None and holder.__shared is shared]
+            if not holders:
+                return
+            node, defvalue = copy.deepcopy((self.__node, self.__defvalue))
+            holders_shared = _ParameterShare(len(holders)) if len(holders) > 1 else None
+            for holder in holders:
+                holder.__node = node
+                holder.__defvalue = defvalue
+                holder.__shared = holders_shared
+            return
+
+        if copy_values:
+            self.__copy_values()
+
+    def __copy_values(self) -> None:
+        '''
+        Replaces the values of this parameter with private copies.
+        '''
+        self.__node, self.__defvalue = copy.deepcopy((self.__node, self.__defvalue))
+
+    def __changed(self) -> None:
+        '''
+        Clears the cached encoding, must be called before this parameter is modified.
+        '''
+        self.__encoded = None
+        if self.__exposed is not None:
+            self.__exposed.notify()
+
+    def __value_changed(self) -> None:
+        '''
+        Prepares this parameter for a modification made directly to a node value it
+        has handed out.
+        '''
+        self.__changed()
+        self.__make_unique()
+
+    def __prepare_expose(self) -> None:
+        '''
+        Prepares the node values to be handed out.
+        '''
+        self.__changed()
+        self.__make_unique()
+
+    def __modify_node(self, modify: Callable[..., Any], value: Any, field: str) -> Any:
+        '''
+        Modifies a node value from this parameter, which has already been prepared
+        for the modification, so the node value does not notify it again.
+
+        Args:
+            modify (function): bound set or add method of the node value
+            value (any): value to pass to the method
+            field (str): field to pass to the method
+        '''
+        exposure = self.__exposed
+        if exposure is None:
+            return modify(value, field=field)
+        exposure.modifying = True
+        try:
+            return modify(value, field=field)
+        finally:
+            exposure.modifying = False
+
+    def __get_exposure(self) -> _ParameterExposure:
+        '''
+        Returns the exposure state of this parameter.
+        '''
+        exposure = self.__exposed
+        if exposure is None or exposure.param is not self:
+            # Copied along with this parameter
+            exposure = self.__exposed = _ParameterExposure(self)
+        return exposure
+
+    def __expose(self, values):
+        '''
+        Records node values which have been handed out and returns them.
+
+        The values notify this parameter before they are modified directly.
+
+        Args:
+            values (any): node value, or list of node values handed out.
+        '''
+        if isinstance(values, (list, tuple)):
+            handed_out = [value for value in values
+                          if isinstance(value, (NodeValue, NodeListValue, NodeSetValue))]
+        elif isinstance(values, (NodeValue, NodeListValue, NodeSetValue)):
+            handed_out = [values]
+        else:
+            return values
+
+        if handed_out:
+            exposure = self.__get_exposure()
+            exposure.handed_out = True
+            for value in handed_out:
+                value._set_owner(exposure)
+        return values
+
+    def __is_exposed(self) -> bool:
+        '''
+        Returns true if node values have been handed out, which can be modified
+        without going through this parameter.
+        '''
+        return self.__exposed is not None and self.__exposed.handed_out
+
+    def _set_owner(self, notify: Callable[[], None]) -> None:
+        '''
+        Records the schema section this parameter has been handed out from, which is
+        notified before this parameter is modified, since modifications made directly
+        to this parameter do not go through the schema.
+
+        Args:
+            notify (function): bound method to call before this parameter is modified.
+        '''
+        exposure = self.__get_exposure()
+        owner = exposure.owner
+        if owner is None or owner() != notify:
+            exposure.owner = weakref.WeakMethod(notify)
 
     def __setdefvalue(self, defvalue, **kwargs) -> None:
-        if NodeType.contains(self.__type, 'file'):
-            if isinstance(self.__type, list):
+        if NodeType.contains(self.__meta.type, 'file'):
+            if isinstance(self.__meta.type, list):
                 self.__defvalue = NodeListValue(FileNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__meta.type, set):
                 self.__defvalue = NodeSetValue(FileNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = FileNodeValue(defvalue, **kwargs)
-        elif NodeType.contains(self.__type, 'dir'):
-            if isinstance(self.__type, list):
+        elif NodeType.contains(self.__meta.type, 'dir'):
+            if isinstance(self.__meta.type, list):
                 self.__defvalue = NodeListValue(DirectoryNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__meta.type, set):
                 self.__defvalue = NodeSetValue(DirectoryNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = DirectoryNodeValue(defvalue, **kwargs)
         else:
             kwargs = {}
-            if isinstance(self.__type, list):
-                self.__defvalue = NodeListValue(NodeValue(self.__type[0], **kwargs))
+            if isinstance(self.__meta.type, list):
+                self.__defvalue = NodeListValue(NodeValue(self.__meta.type[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
-            elif isinstance(self.__type, set):
-                self.__defvalue = NodeSetValue(NodeValue(list(self.__type)[0], **kwargs))
+            elif isinstance(self.__meta.type, set):
+                self.__defvalue = NodeSetValue(NodeValue(list(self.__meta.type)[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
             else:
-                self.__defvalue = NodeValue(self.__type, value=defvalue, **kwargs)
+                self.__defvalue = NodeValue(self.__meta.type, value=defvalue, **kwargs)
 
     def __str__(self) -> str:
         return str(self.getvalues())
@@ -167,19 +474,19 @@ class Parameter:
         from docutils import nodes
         from sphinx.util.nodes import nested_parse_with_titles
 
-        entries = [[strong('Description'), para(self.__shorthelp)]]
-        type_str = NodeType.encode(self.__type)
+        entries = [[strong('Description'), para(self.__meta.shorthelp)]]
+        type_str = NodeType.encode(self.__meta.type)
         allowed = []
-        if NodeType.contains(self.__type, NodeEnumType):
+        if NodeType.contains(self.__meta.type, NodeEnumType):
             type_str = "enum"
             if self.is_list():
                 type_str = "[enum]"
-                values = list(self.__type)[0].values
+                values = list(self.__meta.type)[0].values
             elif self.is_set():
                 type_str = "{enum}"
-                values = list(self.__type)[0].values
+                values = list(self.__meta.type)[0].values
             else:
-                values = self.__type.values
+                values = self.__meta.type.values
             allowed = sorted(values)
 
         entries.append([strong('Type'), para(type_str)])
@@ -187,21 +494,21 @@ class Parameter:
             entries.append([strong('Allowed values'), build_list([para(a) for a in allowed])])
 
         if self.get(field='pernode').is_never():
-            entries.append([strong('Per step/index'), para(str(self.__pernode.value).lower())])
+            entries.append([strong('Per step/index'), para(str(self.__meta.pernode.value).lower())])
 
-        entries.append([strong('Scope'), para(str(self.__scope.value).lower())])
+        entries.append([strong('Scope'), para(str(self.__meta.scope.value).lower())])
 
-        if self.__unit:
-            entries.append([strong('Unit'), para(self.__unit)])
+        if self.__meta.unit:
+            entries.append([strong('Unit'), para(self.__meta.unit)])
 
         entries.append([strong('Default Value'), para(self.__defvalue.get())])
 
-        switch_list = [code(switch) for switch in self.__switch]
+        switch_list = [code(switch) for switch in self.__meta.switch]
         if switch_list:
             entries.append([strong('CLI Switch'), build_list(switch_list)])
 
         examples = {}
-        for example in self.__example:
+        for example in self.__meta.example:
             name, ex = example.split(':', 1)
             examples.setdefault(name, []).append(ex)
 
@@ -220,8 +527,8 @@ class Parameter:
 
         rst = ViewList()
         # use fake filename 'inline' for error # reporting
-        if self.__help:
-            for i, line in enumerate(self.__help.splitlines()):
+        if self.__meta.help:
+            for i, line in enumerate(self.__meta.help.splitlines()):
                 rst.append(line, 'inline', i)
         body = nodes.paragraph()
         nested_parse_with_titles(doc.state, rst, body)
@@ -255,10 +562,15 @@ class Parameter:
             if isinstance(index, int):
                 index = str(index)
 
+            if field is None:
+                # Returning the node values, which can be edited directly
+                self.__prepare_expose()
+                return self.__expose(self.__find_value(step, index).get(field=None))
+
             try:
                 return self.__node[step][index].get(field=field)
             except KeyError:
-                if self.__pernode == PerNode.REQUIRED:
+                if self.__meta.pernode == PerNode.REQUIRED:
                     return self.__defvalue.get(field=field)
 
             try:
@@ -271,34 +583,55 @@ class Parameter:
             except KeyError:
                 return self.__defvalue.get(field=field)
         elif field == "type":
-            return NodeType.encode(self.__type)
+            return NodeType.encode(self.__meta.type)
         elif field == "scope":
-            return self.__scope
+            return self.__meta.scope
         elif field == "lock":
             return self.__lock
         elif field == "switch":
-            return copy.deepcopy(self.__switch)
+            return list(self.__meta.switch)
         elif field == "shorthelp":
-            return self.__shorthelp
+            return self.__meta.shorthelp
         elif field == "example":
-            return copy.deepcopy(self.__example)
+            return list(self.__meta.example)
         elif field == "help":
-            return self.__help
+            return self.__meta.help
         elif field == "notes":
-            return self.__notes
+            return self.__meta.notes
         elif field == "pernode":
-            return self.__pernode
+            return self.__meta.pernode
         elif field == "unit":
-            return self.__unit
+            return self.__meta.unit
         elif field == "hashalgo":
-            return self.__hashalgo
+            return self.__meta.hashalgo
         elif field == "copy":
-            return self.__copy
+            return self.__meta.copy
         elif field == "require":
-            return self.__require
+            return self.__meta.require
 
         raise ValueError(f'"{field}" is not a valid field')
 
+    def __find_value(self, step: Optional[str], index: Optional[str]) \
+            -> Union[NodeValue, NodeSetValue, NodeListValue]:
+        '''
+        Returns the node value used for a step and index, see :meth:`get`.
+        '''
+        try:
+            return self.__node[step][index]
+        except KeyError:
+            if self.__meta.pernode == PerNode.REQUIRED:
+                return self.__defvalue
+
+        try:
+            return self.__node[step][Parameter.GLOBAL_KEY]
+        except KeyError:
+            pass
+
+        try:
+            return self.__node[Parameter.GLOBAL_KEY][Parameter.GLOBAL_KEY]
+        except KeyError:
+            return self.__defvalue
+
     def __assert_step_index(self, field: Optional[str],
                             step: Optional[str],
                             index: Optional[Union[int, str]]) -> None:
@@ -309,10 +642,10 @@ class Parameter:
                     f': {", ".join([field for field in self.__defvalue.fields if field])}')
             return
 
-        if self.__pernode == PerNode.NEVER and (step is not None or index is not None):
+        if self.__meta.pernode == PerNode.NEVER and (step is not None or index is not None):
             raise KeyError('use of step and index are not valid')
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__meta.pernode == PerNode.REQUIRED and (step is None or index is None):
             raise KeyError('step and index are required')
 
         if step is None and index is not None:
@@ -356,6 +689,9 @@ class Parameter:
 
         self.__assert_step_index(field, step, index)
 
+        self.__changed()
+        self.__make_unique()
+
         if field in self.__defvalue.fields:
             if isinstance(index, int):
                 index = str(index)
@@ -368,47 +704,114 @@ class Parameter:
             if index not in self.__node[step]:
                 self.__node[step][index] = self.__defvalue.copy()
 
-            return self.__node[step][index].set(value, field=field)
-        elif field == "type":
-            self.__type = NodeType.normalize(value, "str")
-        elif field == "scope":
-            if isinstance(value, Scope):
-                self.__scope = value
-            else:
-                self.__scope = Scope(NodeType.normalize(value,
-                                                        NodeEnumType(*[v.value for v in Scope])))
+            return self.__expose(self.__modify_node(self.__node[step][index].set, value, field))
         elif field == "lock":
             self.__lock = NodeType.normalize(value, "bool")
-        elif field == "switch":
-            self.__switch = NodeType.normalize(value, ["str"])
-        elif field == "shorthelp":
-            self.__shorthelp = NodeType.normalize(value, "str")
-        elif field == "example":
-            self.__example = NodeType.normalize(value, ["str"])
-        elif field == "help":
-            self.__help = NodeType.normalize(value, "str")
-        elif field == "notes":
-            self.__notes = NodeType.normalize(value, "str")
+        elif field == "type":
+            self.__meta = self.__meta.replace(type=NodeType.normalize(value, "str"))
+        elif field == "scope":
+            if not isinstance(value, Scope):
+                value = Scope(NodeType.normalize(value, NodeEnumType(*[v.value for v in Scope])))
+            self.__meta = self.__meta.replace(scope=value)
+        elif field in ("switch", "example"):
+            self.__meta = self.__meta.replace(**{field: NodeType.normalize(value, ["str"])})
+        elif field in ("shorthelp", "help", "notes", "unit", "hashalgo"):
+            self.__meta = self.__meta.replace(**{field: NodeType.normalize(value, "str")})
         elif field == "pernode":
-            if isinstance(value, PerNode):
-                self.__pernode = value
-            else:
-                self.__pernode = PerNode(NodeType.normalize(value,
-                                                            NodeEnumType(
-                                                                *[v.value for v in PerNode])))
-        elif field == "unit":
-            self.__unit = NodeType.normalize(value, "str")
-        elif field == "hashalgo":
-            self.__hashalgo = NodeType.normalize(value, "str")
-        elif field == "copy":
-            self.__copy = NodeType.normalize(value, "bool")
-        elif field == "require":
-            self.__require = NodeType.normalize(value, "bool")
+            if not isinstance(value, PerNode):
+                value = PerNode(NodeType.normalize(value,
+                                                   NodeEnumType(*[v.value for v in PerNode])))
+            self.__meta = self.__meta.replace(pernode=value)
+        elif field in ("copy", "require"):
+            self.__meta = self.__meta.replace(**{field: NodeType.normalize(value, "bool")})
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
         return True
 
+    def _set_many(self, values: Iterable[Tuple[Any, Optional[str], Optional[Union[int, str]]]],
+                  field: str = 'value',
+                  clobber: bool = True,
+                  ret: Optional[List[Union[bool, List[NodeValue], NodeValue]]] = None) \
+            -> List[Union[bool, List[NodeValue], NodeValue]]:
+        '''
+        Sets a parameter field for multiple steps and indices.
+
+        This is equivalent to calling :meth:`set` for each entry in order, so if an
+        entry cannot be set, the entries before it remain set.
+
+        Args:
+            values (list of (value, step, index)): values to set.
+            field (str): Parameter field to set.
+            clobber (bool): Existing value is overwritten if True.
+            ret (list): list to append the return values to, which holds the return
+                values of the entries set before an error.
+
+        Returns:
+            list of the return value of :meth:`set` for each entry.
+        '''
+        if ret is None:
+            ret = []
+        append = ret.append
+
+        if field not in self.__defvalue.fields:
+            for value, step, index in values:
+                append(self.set(value, field=field, step=step, index=index, clobber=clobber))
+            return ret
+
+        if self.__lock:
+            for _ in values:
+                append(False)
+            return ret
+
+        self.__changed()
+        self.__make_unique()
+
+        nodes = self.__node
+        defvalue = self.__defvalue
+        checked_node = False
+
+        # New scalar values are created already holding their normalized value
+        normalize = None
+        if field == "value" and defvalue.__class__ is NodeValue:
+            normalize = NodeType.compile(defvalue.type)
+
+        try:
+            for value, step, index in values:
+                if not clobber and self.is_set(step, index):
+                    append(False)
+                    continue
+
+                if step is None or index is None:
+                    self.__assert_step_index(field, step, index)
+                    if step is None:
+                        step = Parameter.GLOBAL_KEY
+                    if index is None:
+                        index = Parameter.GLOBAL_KEY
+                elif not checked_node or step == "default" or index == "default":
+                    # Other steps and indices are checked the same way
+                    self.__assert_step_index(field, step, index)
+                    checked_node = True
+
+                if isinstance(index, int):
+                    index = str(index)
+
+                step_nodes = nodes.get(step, None)
+                if step_nodes is None:
+                    step_nodes = nodes[step] = {}
+                node = step_nodes.get(index, None)
+                if node is None:
+                    if normalize is not None:
+                        node = step_nodes[index] = defvalue._copy_normalized(normalize(value))
+                        append(node)
+                        continue
+                    node = step_nodes[index] = defvalue.copy()
+
+                append(self.__modify_node(node.set, value, field))
+        finally:
+            self.__expose(ret)
+        return ret
+
     def add(self, value,
             field: str = 'value',
             step: Optional[str] = None,
@@ -434,6 +837,9 @@ class Parameter:
 
         self.__assert_step_index(field, step, index)
 
+        self.__changed()
+        self.__make_unique()
+
         if field in self.__defvalue.fields:
             if not self.is_list() and field == 'value':
                 raise ValueError("add can only be used on lists or sets")
@@ -449,11 +855,10 @@ class Parameter:
             if index not in self.__node[step]:
                 self.__node[step][index] = self.__defvalue.copy()
 
-            return self.__node[step][index].add(value, field=field)
-        elif field == "switch":
-            self.__switch.extend(NodeType.normalize(value, ["str"]))
-        elif field == "example":
-            self.__example.extend(NodeType.normalize(value, ["str"]))
+            return self.__expose(self.__modify_node(self.__node[step][index].add, value, field))
+        elif field in ("switch", "example"):
+            self.__meta = self.__meta.replace(
+                **{field: [*getattr(self.__meta, field), *NodeType.normalize(value, ["str"])]})
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
@@ -493,6 +898,9 @@ class Parameter:
         step = step if step is not None else Parameter.GLOBAL_KEY
         index = index if index is not None else Parameter.GLOBAL_KEY
 
+        self.__changed()
+        self.__make_unique()
+
         try:
             del self.__node[step][index]
         except KeyError:
@@ -505,6 +913,8 @@ class Parameter:
         """
         Resets a parameter back to its default state
         """
+        self.__changed()
+        self.__make_unique()
         self.__node = {}
 
     def getdict(self, include_default: bool = True, values_only: bool = False) -> Dict:
@@ -536,16 +946,16 @@ class Parameter:
             return dictvals
 
         dictvals = {
-            "type": NodeType.encode(self.__type),
-            "require": self.__require,
-            "scope": self.__scope.value,
+            "type": NodeType.encode(self.__meta.type),
+            "require": self.__meta.require,
+            "scope": self.__meta.scope.value,
             "lock": self.__lock,
-            "switch": self.__switch.copy(),
-            "shorthelp": self.__shorthelp,
-            "example": self.__example.copy(),
-            "help": self.__help,
-            "notes": self.__notes,
-            "pernode": self.__pernode.value,
+            "switch": list(self.__meta.switch),
+            "shorthelp": self.__meta.shorthelp,
+            "example": list(self.__meta.example),
+            "help": self.__meta.help,
+            "notes": self.__meta.notes,
+            "pernode": self.__meta.pernode.value,
             "node": {}
         }
 
@@ -557,14 +967,32 @@ class Parameter:
         if include_default:
             dictvals["node"].setdefault("default", {})["default"] = self.__defvalue.getdict()
 
-        if self.__unit:
-            dictvals["unit"] = self.__unit
-        if self.__hashalgo:
-            dictvals["hashalgo"] = self.__hashalgo
-        if self.__copy is not None:
-            dictvals["copy"] = self.__copy
+        if self.__meta.unit:
+            dictvals["unit"] = self.__meta.unit
+        if self.__meta.hashalgo:
+            dictvals["hashalgo"] = self.__meta.hashalgo
+        if self.__meta.copy is not None:
+            dictvals["copy"] = self.__meta.copy
         return dictvals
 
+    def _getdict_encoded(self, encoder: Callable[[Dict], Any], key: Any) -> Any:
+        """
+        Returns the encoded schema dictionary.
+
+        The encoding is kept until this parameter, or a node value it has handed out,
+        is modified.
+
+        Args:
+            encoder (function): function to encode the dictionary from :meth:`getdict`
+            key (any): identifies the encoder
+        """
+
+        encoded = self.__encoded
+        if encoded is None or encoded.key != key:
+            encoded = _ParameterEncoding(key, encoder(self.getdict()))
+            self.__encoded = encoded
+        return encoded.data
+
     @classmethod
     def from_dict(cls,
                   manifest: Dict,
@@ -600,31 +1028,38 @@ class Parameter:
         if self.__lock:
             return
 
+        # All values are replaced below
+        self.__changed()
+        self.__make_unique(copy_values=False)
+
         if version and version > (0, 50, 0):
-            self.__type = NodeType.parse(manifest["type"])
+            sctype = NodeType.parse(manifest["type"])
         else:
             if "enum" in manifest:
-                self.__type = NodeType.parse(
+                sctype = NodeType.parse(
                     re.sub("enum", f"<{','.join(manifest['enum'])}>", manifest['type']))
             else:
-                self.__type = NodeType.parse(manifest["type"])
-
-        self.__require = manifest.get("require", self.__require)
-        self.__scope = Scope(manifest.get("scope", self.__scope))
+                sctype = NodeType.parse(manifest["type"])
+
+        meta = self.__meta
+        self.__meta = _ParameterMetadata.get(
+            type=sctype,
+            require=manifest.get("require", meta.require),
+            scope=Scope(manifest.get("scope", meta.scope)),
+            switch=manifest.get("switch", meta.switch),
+            shorthelp=manifest.get("shorthelp", meta.shorthelp),
+            example=manifest.get("example", meta.example),
+            help=manifest.get("help", meta.help),
+            notes=manifest.get("notes", meta.notes),
+            pernode=PerNode(manifest.get("pernode", meta.pernode)),
+            unit=manifest.get("unit", meta.unit),
+            hashalgo=manifest.get("hashalgo", meta.hashalgo),
+            copy=manifest.get("copy", meta.copy))
         self.__lock = manifest.get("lock", self.__lock)
-        self.__switch = manifest.get("switch", self.__switch)
-        self.__shorthelp = manifest.get("shorthelp", self.__shorthelp)
-        self.__example = manifest.get("example", self.__example)
-        self.__help = manifest.get("help", self.__help)
-        self.__notes = manifest.get("notes", self.__notes)
-        self.__pernode = PerNode(manifest.get("pernode", self.__pernode))
         self.__node = {}
 
-        self.__unit = manifest.get("unit", self.__unit)
-        self.__hashalgo = manifest.get("hashalgo", self.__hashalgo)
-        self.__copy = manifest.get("copy", self.__copy)
-
-        requires_set = NodeType.contains(self.__type, tuple) or NodeType.contains(self.__type, set)
+        requires_set = NodeType.contains(self.__meta.type, tuple) or \
+            NodeType.contains(self.__meta.type, set)
 
         try:
             defvalue = manifest["node"]["default"]["default"]
@@ -661,7 +1096,7 @@ class Parameter:
                 on a per-node basis.
         """
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__meta.pernode == PerNode.REQUIRED and (step is None or index is None):
             return None
 
         if isinstance(index, int):
@@ -670,7 +1105,7 @@ class Parameter:
         try:
             return self.__node[step][index].gettcl()
         except KeyError:
-            if self.__pernode == PerNode.REQUIRED:
+            if self.__meta.pernode == PerNode.REQUIRED:
                 return self.__defvalue.gettcl()
 
         try:
@@ -696,6 +1131,10 @@ class Parameter:
         list in place of a global value if a global value is not set.
         """
 
+        if not return_values:
+            # Returning the node values, which can be edited directly
+            self.__prepare_expose()
+
         vals = []
         has_global = False
         for step in self.__node:
@@ -709,23 +1148,48 @@ class Parameter:
                 else:
                     vals.append((self.__node[step][index], step_arg, index_arg))
 
-        if self.__pernode != PerNode.REQUIRED and not has_global and return_defvalue:
+        if self.__meta.pernode != PerNode.REQUIRED and not has_global and return_defvalue:
             if return_values:
                 vals.append((self.__defvalue.get(), None, None))
             else:
                 vals.append((self.__defvalue, None, None))
 
+        if not return_values:
+            self.__expose([value for value, _, _ in vals])
+
         return vals
 
     def copy(self, key: Optional[Tuple[str, ...]] = None) -> "Parameter":
         """
         Returns a copy of this parameter.
 
+        The values are shared between this parameter and the copy until either
+        one of them, or a node value handed out by this parameter, is modified.
+
         Args:
             key (list of str): keypath to this schema
         """
 
-        return copy.deepcopy(self)
+        shared = self.__shared
+        if shared is None:
+            shared = self.__shared = _ParameterShare()
+            if self.__is_exposed():
+                # Copies must be reachable to hand them duplicates, see __make_unique
+                shared.holders = [weakref.ref(self)]
+
+        holders = shared.holders
+        if holders is not None and len(holders) > 2 * shared.count + 16:
+            # Drop the holders which no longer exist or have made their values unique
+            holders[:] = [ref for ref in holders
+                          if getattr(ref(), "_Parameter__shared", None) is shared]
+            shared.count = len(holders)
+        shared.count += 1
+
+        param_copy: Parameter = copy.copy(self)
+        param_copy.__exposed = None
+        if holders is not None:
+            holders.append(weakref.ref(param_copy))
+        return param_copy
 
     # Utility functions
     def is_list(self) -> bool:
@@ -733,7 +1197,7 @@ class Parameter:
         Returns true is this parameter is a list type
         """
 
-        return isinstance(self.__type, (list, set))
+        return isinstance(self.__meta.type, (list, set))
 
     def is_empty(self) -> bool:
         '''
@@ -782,7 +1246,7 @@ class Parameter:
         try:
             return self.__node[step][index].has_value
         except KeyError:
-            if self.__pernode == PerNode.REQUIRED:
+            if self.__meta.pernode == PerNode.REQUIRED:
                 return self.__defvalue.has_value
 
         try:
@@ -800,14 +1264,15 @@ class Parameter:
         """
         Gets a copy of the default value.
         """
-        return self._default.copy()
+        return self.__defvalue.copy()
 
     @property
     def _default(self) -> Union[NodeValue, NodeSetValue, NodeListValue]:
         """
         Gets an editable version the default value.
         """
-        return self.__defvalue
+        self.__prepare_expose()
+        return self.__expose(self.__defvalue)
 
     def add_commandline_arguments(self,
                                   argparser: argparse.ArgumentParser,
@@ -827,7 +1292,7 @@ class Parameter:
             dest (str): key for argument parsing to lookup values in.
             switches (list of str): list of switches added.
         '''
-        if not self.__switch:
+        if not self.__meta.switch:
             # no switches available to this parameter
             return None, None
 
@@ -838,7 +1303,7 @@ class Parameter:
 
         switches = []
         metavar = None
-        for switch in self.__switch:
+        for switch in self.__meta.switch:
             switchmatch = re.match(r'(-[\w_]+)\s+(\'([\w]+\s)*<.*>\'|<.*>)', switch)
             gccmatch = re.match(r'(-[\w_]+)(<.*>)', switch)
             plusmatch = re.match(r'(\+[\w_\+]+)(<.*>)', switch)
@@ -866,16 +1331,16 @@ class Parameter:
         # argparse 'dest' must be a string, so join keypath with commas
         dest = '_'.join(keypath)
 
-        if self.__type == "bool":
+        if self.__meta.type == "bool":
             # Boolean type arguments
-            if self.__pernode.is_never():
+            if self.__meta.pernode.is_never():
                 argparser.add_argument(
                     *switches,
                     nargs='?',
                     metavar=metavar,
                     dest=dest,
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__meta.shorthelp,
                     default=argparse.SUPPRESS)
             else:
                 argparser.add_argument(
@@ -885,16 +1350,16 @@ class Parameter:
                     dest=dest,
                     action='append',
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__meta.shorthelp,
                     default=argparse.SUPPRESS)
-        elif isinstance(self.__type, list) or self.__pernode != PerNode.NEVER:
+        elif isinstance(self.__meta.type, list) or self.__meta.pernode != PerNode.NEVER:
             # list type arguments
             argparser.add_argument(
                 *switches,
                 metavar=metavar,
                 dest=dest,
                 action='append',
-                help=self.__shorthelp,
+                help=self.__meta.shorthelp,
                 default=argparse.SUPPRESS)
         else:
             # all the rest
@@ -902,7 +1367,7 @@ class Parameter:
                 *switches,
                 metavar=metavar,
                 dest=dest,
-                help=self.__shorthelp,
+                help=self.__meta.shorthelp,
                 default=argparse.SUPPRESS)
 
         return dest, switches
@@ -917,11 +1382,12 @@ class Parameter:
             keypath (list of str): keypath to this parameter
         """
         num_free_keys = keypath.count('default')
+        switches = "/".join(self.__meta.switch)
 
         if num_free_keys > 0:
             valueitem = shlex.split(value)
             if len(valueitem) != num_free_keys + 1:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}')
+                raise ValueError(f'Invalid value "{value}" for switch {switches}')
 
             free_keys = valueitem[0:num_free_keys]
             remainder = valueitem[-1]
@@ -930,19 +1396,19 @@ class Parameter:
             remainder = value
 
         step, index = None, None
-        if self.__pernode == PerNode.REQUIRED:
+        if self.__meta.pernode == PerNode.REQUIRED:
             try:
                 step, index, val = shlex.split(remainder)
             except ValueError:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Requires step and index before final value')
-        elif self.__pernode == PerNode.OPTIONAL:
+        elif self.__meta.pernode == PerNode.OPTIONAL:
             # Split on spaces, preserving items that are grouped in quotes
             items = shlex.split(remainder)
             if len(items) > 3:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Too many arguments')
-            if self.__type == 'bool':
+            if self.__meta.type == 'bool':
                 if len(items) == 3:
                     step, index, val = items
                 elif len(items) == 2:
@@ -1,6 +1,7 @@
 import re
 from collections.abc import Iterable
 from pathlib import Path, PureWindowsPath
+from typing import Any, Callable, Dict, List
 
 
 class NodeType:
@@ -15,6 +16,10 @@ class NodeType:
     __set = re.compile(r"^\{(.*)\}$")
     __enum = re.compile(r"^<(.*)>$")
     __basetypes = re.compile(r"^(<(.*)>|int|float|str|bool|file|dir)$")
+    # Python types which are already normalized for a schema type
+    __normalized = {"int": int, "float": float, "str": str, "bool": bool}
+    # Normalizers for each type definition, see :meth:`compile`
+    __compiled: Dict[Any, Callable[[Any], Any]] = {}
 
     def __init__(self, sctype):
         if isinstance(sctype, NodeType):
@@ -178,43 +183,95 @@ class NodeType:
         Normalizes a value into the appropriate datatype.
         """
 
+        if sctype.__class__ is str:
+            normalizer = NodeType.__compiled.get(sctype, None)
+            if normalizer is not None:
+                return normalizer(value)
+
+        return NodeType.compile(sctype)(value)
+
+    @staticmethod
+    def compile(sctype) -> Callable[[Any], Any]:
+        """
+        Returns a function which normalizes a value into the appropriate datatype.
+
+        The function is equivalent to calling :meth:`normalize` with this type and
+        is shared by all types with the same definition.
+        """
+
         if isinstance(sctype, NodeType):
-            return NodeType.normalize(value, sctype.type)
+            sctype = sctype.type
 
-        if isinstance(sctype, list):
-            sctype = sctype[0]
+        try:
+            key = NodeType.__compile_key(sctype)
+        except TypeError:
+            # Not a recognized type, errors are reported when normalizing a value
+            return NodeType.__compile(sctype)
 
-            # Need to try 2 different recursion strategies - if value is a list already, then we can
-            # recurse on it directly. However, if that doesn't work, then it might be a
-            # list-of-lists/tuples that needs to be wrapped in an outer list, so we try that.
-            if isinstance(value, (list, set, tuple)):
-                try:
-                    return [NodeType.normalize(v, sctype) for v in value]
-                except ValueError:
-                    pass
+        normalizer = NodeType.__compiled.get(key, None)
+        if normalizer is None:
+            normalizer = NodeType.__compile(sctype)
+            NodeType.__compiled[key] = normalizer
+        return normalizer
 
-            return [NodeType.normalize(v, sctype) for v in [value]]
+    @staticmethod
+    def __compile_key(sctype):
+        if sctype.__class__ is str:
+            return sctype
+        if isinstance(sctype, list):
+            return ("[]", NodeType.__compile_key(sctype[0]))
+        if isinstance(sctype, set):
+            return ("{}", NodeType.__compile_key(list(sctype)[0]))
+        if isinstance(sctype, tuple):
+            return ("()", *[NodeType.__compile_key(sct) for sct in sctype])
+        if isinstance(sctype, NodeEnumType):
+            return ("<>", frozenset(sctype.values))
+        raise TypeError(f"{sctype} not a recognized type")
+
+    @staticmethod
+    def __compile(sctype) -> Callable[[Any], Any]:
+        if isinstance(sctype, list):
+            return NodeType.__compile_list(NodeType.compile(sctype[0]), sctype[0], list)
 
         if isinstance(sctype, set):
             sctype = list(sctype)[0]
+            return NodeType.__compile_list(NodeType.compile(sctype), sctype, set)
+
+        if isinstance(sctype, tuple):
+            return NodeType.__compile_tuple([NodeType.compile(sct) for sct in sctype])
+
+        return NodeType.__compile_base(sctype)
 
-            # Need to try 2 different recursion strategies - if value is a list already, then we can
-            # recurse on it directly. However, if that doesn't work, then it might be a
+    @staticmethod
+    def __compile_list(normalize_item: Callable[[Any], Any], sctype,
+                       container: type) -> Callable[[Any], Any]:
+        normalized = NodeType.__normalized.get(sctype, None) if sctype.__class__ is str else None
+
+        def normalize(value):
+            # Need to try 2 different recursion strategies - if value is a list already, then we
+            # can recurse on it directly. However, if that doesn't work, then it might be a
             # list-of-lists/tuples that needs to be wrapped in an outer list, so we try that.
             if isinstance(value, (list, set, tuple)):
                 try:
-                    return set([NodeType.normalize(v, sctype) for v in value])
+                    if normalized is not None:
+                        return container([v if v.__class__ is normalized else normalize_item(v)
+                                          for v in value])
+                    return container([normalize_item(v) for v in value])
                 except ValueError:
                     pass
 
-            return set([NodeType.normalize(v, sctype) for v in [value]])
+            return container([normalize_item(value)])
 
-        if isinstance(sctype, tuple):
+        return normalize
+
+    @staticmethod
+    def __compile_tuple(normalize_items: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+        entries = len(normalize_items)
+
+        def normalize(value):
             if value is None:
                 return None
 
-            sctype = [*sctype]
-
             if isinstance(value, str):
                 if NodeType.__tuple.match(value):
                     value = value[1:-1].split(',')
@@ -226,68 +283,102 @@ class NodeType:
                     value = ",".join(value)
                 raise ValueError(f"({value}) ({valuetype}) cannot be converted to tuple")
 
-            if len(value) != len(sctype):
-                raise ValueError(f"({','.join(value)}) does not have {len(sctype)} entries")
+            if len(value) != entries:
+                raise ValueError(f"({','.join(value)}) does not have {entries} entries")
             return tuple(
-                NodeType.normalize(v, base_type)
-                for v, base_type in zip(value, sctype))
+                normalize_item(v)
+                for v, normalize_item in zip(value, normalize_items))
 
-        if value is None:
-            return None
-
-        if isinstance(value, (list, tuple, set)):
-            if len(value) == 1:
-                return NodeType.normalize(list(value)[0], sctype)
-            raise ValueError(f"\"{type(value)}\" unable to convert to {sctype}")
+        return normalize
 
+    @staticmethod
+    def __compile_base(sctype) -> Callable[[Any], Any]:
         if sctype == 'bool':
-            if isinstance(value, bool):
+            def convert(value):
+                if isinstance(value, bool):
+                    return value
+                if isinstance(value, str):
+                    value = value.strip().lower()
+                    if value == 'true' or value == 't':
+                        return True
+                    if value == 'false' or value == 'f':
+                        return False
+                if isinstance(value, (int, float)):
+                    return value != 0
+                raise ValueError(f"\"{value}\" unable to convert to boolean")
+        elif sctype in ('int', 'float'):
+            pytype = NodeType.__normalized[sctype]
+
+            def convert(value):
+                try:
+                    return pytype(value)
+                except ValueError:
+                    raise ValueError(f"\"{value}\" unable to convert to {sctype}")
+        elif sctype == 'str':
+            def convert(value):
+                if isinstance(value, str):
+                    return value
+                elif isinstance(value, bool):
+                    return str(value).lower()
+                else:
+                    return str(value)
+        elif sctype in ('file', 'dir'):
+            def convert(value):
+                if isinstance(value, str):
+                    return _normalize_path(value)
+                if isinstance(value, Path):
+                    return PureWindowsPath(value).as_posix()
+                raise ValueError(f"{sctype} must be a string or Path, not {type(value)}")
+        elif isinstance(sctype, NodeEnumType):
+            def convert(value):
+                if isinstance(value, str):
+                    if value in sctype.values:
+                        return value
+                    valid = ", ".join(sorted(sctype.values))
+                    raise ValueError(f'{value} is not a member of: {valid}')
+                else:
+                    raise ValueError(f"enum must be a string, not a {type(value)}")
+        else:
+            def convert(value):
+                raise ValueError(f'Invalid type specifier: {sctype}')
+
+        normalized = NodeType.__normalized.get(sctype, None) if sctype.__class__ is str else None
+
+        def normalize(value):
+            if value.__class__ is normalized:
                 return value
-            if isinstance(value, str):
-                value = value.strip().lower()
-                if value == 'true' or value == 't':
-                    return True
-                if value == 'false' or value == 'f':
-                    return False
-            if isinstance(value, (int, float)):
-                return value != 0
-            raise ValueError(f"\"{value}\" unable to convert to boolean")
 
-        try:
-            if sctype == 'int':
-                return int(value)
+            if value is None:
+                return None
 
-            if sctype == 'float':
-                return float(value)
-        except ValueError:
-            raise ValueError(f"\"{value}\" unable to convert to {sctype}")
+            if isinstance(value, (list, tuple, set)):
+                if len(value) == 1:
+                    return normalize(list(value)[0])
+                raise ValueError(f"\"{type(value)}\" unable to convert to {sctype}")
 
-        if sctype == 'str':
-            if isinstance(value, str):
-                return value
-            elif isinstance(value, bool):
-                return str(value).lower()
-            else:
-                return str(value)
+            return convert(value)
 
-        if sctype in ('file', 'dir'):
-            if isinstance(value, (str, Path)):
-                # Cast everything to a windows path and convert to posix.
-                # https://stackoverflow.com/questions/73682260
-                return PureWindowsPath(value).as_posix()
-            else:
-                raise ValueError(f"{sctype} must be a string or Path, not {type(value)}")
+        return normalize
 
-        if isinstance(sctype, NodeEnumType):
-            if isinstance(value, str):
-                if value in sctype.values:
-                    return value
-                valid = ", ".join(sorted(sctype.values))
-                raise ValueError(f'{value} is not a member of: {valid}')
-            else:
-                raise ValueError(f"enum must be a string, not a {type(value)}")
 
-        raise ValueError(f'Invalid type specifier: {sctype}')
+def _normalize_path(value: str) -> str:
+    # Cast everything to a windows path and convert to posix.
+    # https://stackoverflow.com/questions/73682260
+    if ":" in value or value[:2].replace("\\", "/") == "//":
+        # Drives and UNC paths
+        return PureWindowsPath(value).as_posix()
+
+    if value and "\\" not in value and "//" not in value and "./" not in value and \
+            value[-1] != "/" and not value.endswith("/.") and value != ".":
+        # Already normalized
+        return value
+
+    # Same as as_posix for paths without a drive
+    root = "/" if value[:1] in ("/", "\\") else ""
+    parts = [part for part in value.replace("\\", "/").split("/") if part and part != "."]
+    if not parts:
+        return root or "."
+    return root + "/".join(parts)
 
 
 class NodeEnumType:
@@ -5,10 +5,14 @@ import pathlib
 
 import os.path
 
-from typing import Dict, List, Tuple, Union, Optional
+from typing import Callable, Dict, List, Tuple, Union, Optional, TYPE_CHECKING
 
 from .parametertype import NodeType
 
+if TYPE_CHECKING:
+    from .filehash import FileHashCache
+    from .pathcache import PathResolutionCache
+
 try:
     from base64 import b64encode, b64decode
     from hashlib import blake2b
@@ -25,9 +29,12 @@ class NodeListValue:
         base (:class:`NodeValue`): base type for this list.
     '''
 
+    __slots__ = ("__base", "__values", "__owner")
+
     def __init__(self, base: Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]):
         self.__base = base
         self.__values = []
+        self.__owner = None
 
     def getdict(self) -> Dict:
         """
@@ -67,6 +74,7 @@ class NodeListValue:
             sctype (str): schema type for this value
         '''
 
+        self.__changed()
         self.__values.clear()
         for n in range(len(manifest["value"])):
             param = self.__base.copy()
@@ -79,6 +87,7 @@ class NodeListValue:
                 if len(manifest[field]) <= n:
                     continue
                 param.set(manifest[field][n], field=field)
+        self.__own(self.__values)
 
     def get(self, field: Optional[str] = 'value'):
         """
@@ -123,6 +132,7 @@ class NodeListValue:
         value = NodeType.normalize(value, self.type)
 
         if field == 'value':
+            self.__changed()
             self.__values.clear()
         else:
             if len(value) != len(self.__values):
@@ -134,6 +144,8 @@ class NodeListValue:
                 self.__values.append(self.__base.copy())
             self.__values[n].set(value[n], field=field)
             modified.append(self.__values[n])
+        if field == 'value':
+            self.__own(modified)
         return tuple(modified)
 
     def add(self, value, field: str = 'value') \
@@ -152,11 +164,13 @@ class NodeListValue:
         modified = list()
         if field == 'value':
             value = NodeType.normalize(value, self.type)
+            self.__changed()
 
             for n in range(len(value)):
                 self.__values.append(self.__base.copy())
                 self.__values[-1].set(value[n], field=field)
                 modified.append(self.__values[-1])
+            self.__own(modified)
         else:
             for val in self.__values:
                 val.add(value, field=field)
@@ -198,7 +212,39 @@ class NodeListValue:
         Returns a copy of this value.
         """
 
-        return copy.deepcopy(self)
+        value = NodeListValue.__new__(type(self))
+        value.__base = self.__base.copy()
+        value.__values = [val.copy() for val in self.__values]
+        value.__owner = None
+        return value
+
+    def _set_owner(self, notify: Optional[Callable[[], None]]) -> None:
+        '''
+        Records the function to call before this value or any of the values it holds
+        is modified, see :meth:`NodeValue._set_owner`.
+
+        Args:
+            notify (function): function to call before a value is modified.
+        '''
+        self.__owner = notify
+        self.__base._set_owner(notify)
+        self.__own(self.__values)
+
+    def __own(self, values: List[Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]]) \
+            -> None:
+        '''
+        Passes the owner of this value to values it holds, which are created without one.
+        '''
+        if self.__owner is not None:
+            for val in values:
+                val._set_owner(self.__owner)
+
+    def __changed(self) -> None:
+        '''
+        Notifies the owner before this value is modified, see :meth:`_set_owner`.
+        '''
+        if self.__owner is not None:
+            self.__owner()
 
     def _set_type(self, sctype) -> None:
         sctype = NodeType.parse(sctype)[0]
@@ -222,9 +268,12 @@ class NodeSetValue:
         base (:class:`NodeValue`): base type for this set.
     '''
 
+    __slots__ = ("__base", "__values", "__owner")
+
     def __init__(self, base: Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]):
         self.__base = base
         self.__values = []
+        self.__owner = None
 
     def getdict(self) -> Dict:
         """
@@ -264,6 +313,7 @@ class NodeSetValue:
             sctype (str): schema type for this value
         '''
 
+        self.__changed()
         self.__values.clear()
         for n in range(len(manifest["value"])):
             param = self.__base.copy()
@@ -276,6 +326,7 @@ class NodeSetValue:
                 if len(manifest[field]) <= n:
                     continue
                 param.set(manifest[field][n], field=field)
+        self.__own(self.__values)
 
     def get(self, field: Optional[str] = 'value'):
         """
@@ -311,6 +362,7 @@ class NodeSetValue:
         value = NodeType.normalize(value, [self.__base.type])
 
         if field == 'value':
+            self.__changed()
             self.__values.clear()
         else:
             if len(value) != len(self.__values):
@@ -332,6 +384,8 @@ class NodeSetValue:
             self.__values[m].set(value[n], field=field)
             modified.append(self.__values[m])
             m += 1
+        if field == 'value':
+            self.__own(modified)
         return tuple(modified)
 
     def add(self, value, field: str = 'value') \
@@ -354,6 +408,7 @@ class NodeSetValue:
         modified = list()
         if field == 'value':
             value = NodeType.normalize(value, [self.__base.type])
+            self.__changed()
 
             for n in range(len(value)):
                 if value[n] in current_values:
@@ -363,6 +418,7 @@ class NodeSetValue:
                 self.__values[-1].set(value[n], field=field)
                 current_values.append(value[n])
                 modified.append(self.__values[-1])
+            self.__own(modified)
         else:
             for val in self.__values:
                 val.add(value, field=field)
@@ -404,7 +460,39 @@ class NodeSetValue:
         Returns a copy of this value.
         """
 
-        return copy.deepcopy(self)
+        value = NodeSetValue.__new__(type(self))
+        value.__base = self.__base.copy()
+        value.__values = [val.copy() for val in self.__values]
+        value.__owner = None
+        return value
+
+    def _set_owner(self, notify: Optional[Callable[[], None]]) -> None:
+        '''
+        Records the function to call before this value or any of the values it holds
+        is modified, see :meth:`NodeValue._set_owner`.
+
+        Args:
+            notify (function): function to call before a value is modified.
+        '''
+        self.__owner = notify
+        self.__base._set_owner(notify)
+        self.__own(self.__values)
+
+    def __own(self, values: List[Union["NodeValue", "FileNodeValue", "DirectoryNodeValue"]]) \
+            -> None:
+        '''
+        Passes the owner of this value to values it holds, which are created without one.
+        '''
+        if self.__owner is not None:
+            for val in values:
+                val._set_owner(self.__owner)
+
+    def __changed(self) -> None:
+        '''
+        Notifies the owner before this value is modified, see :meth:`_set_owner`.
+        '''
+        if self.__owner is not None:
+            self.__owner()
 
     def _set_type(self, sctype):
         sctype = NodeType.parse(sctype)[0]
@@ -429,10 +517,13 @@ class NodeValue:
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__type", "__value", "__signature", "__owner")
+
     def __init__(self, sctype, value=None):
         self._set_type(sctype)
         self.__value = value
         self.__signature = None
+        self.__owner = None
 
     @classmethod
     def from_dict(cls,
@@ -521,10 +612,16 @@ class NodeValue:
             field (str): field to set
         """
         if field == 'value':
-            self.__value = NodeType.normalize(value, self.type)
+            value = NodeType.normalize(value, self.type)
+            if self.__owner is not None:
+                self.__owner()
+            self.__value = value
             return self
         if field == 'signature':
-            self.__signature = NodeType.normalize(value, "str")
+            value = NodeType.normalize(value, "str")
+            if self.__owner is not None:
+                self.__owner()
+            self.__signature = value
             return self
         raise ValueError(f"{field} is not a valid field")
 
@@ -559,7 +656,53 @@ class NodeValue:
         Returns a copy of this value.
         """
 
-        return copy.deepcopy(self)
+        # Types are never modified in place and normalized values are immutable,
+        # so the copy can share them
+        value = NodeValue.__new__(type(self))
+        value.__type = self.__type
+        value.__value = self.__value
+        if self.__value is not None and not isinstance(self.__value, (str, int, float, tuple)):
+            value.__value = copy.deepcopy(self.__value)
+        value.__signature = self.__signature
+        value.__owner = None
+        return value
+
+    def _copy_normalized(self, value) -> "NodeValue":
+        """
+        Returns a copy of this value holding a new value, which has already been
+        normalized for the type of this value, see :meth:`NodeType.compile`.
+
+        Only valid for :class:`NodeValue`, since subclasses hold more data.
+
+        Args:
+            value (any): normalized value to hold
+        """
+        new_value = NodeValue.__new__(NodeValue)
+        new_value.__type = self.__type
+        new_value.__value = value
+        new_value.__signature = self.__signature
+        new_value.__owner = None
+        return new_value
+
+    def _set_owner(self, notify: Optional[Callable[[], None]]) -> None:
+        '''
+        Records the function to call before this value is modified, which is used by
+        the parameter this value has been handed out from, since modifications made
+        directly to this value do not go through the parameter.
+
+        Copies of this value do not have an owner.
+
+        Args:
+            notify (function): function to call before this value is modified.
+        '''
+        self.__owner = notify
+
+    def _changed(self) -> None:
+        '''
+        Notifies the owner before this value is modified, see :meth:`_set_owner`.
+        '''
+        if self.__owner is not None:
+            self.__owner()
 
     def _set_type(self, sctype) -> None:
         self.__type = NodeType.parse(sctype)
@@ -597,6 +740,7 @@ class NodeValue:
         digest = self.__compute_signature(person=bperson, key=bkey, salt=bsalt)
         encode_person = b64encode(bperson).decode("utf-8")
         encode_salt = b64encode(bsalt).decode("utf-8")
+        self._changed()
         self.__signature = f"{encode_person}:{encode_salt}:{digest}"
 
     def verify_signature(self, person: str, key: str) -> bool:
@@ -646,6 +790,11 @@ class PathNodeValue(NodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__filehash", "__dataroot")
+
+    # Size of the blocks files are read in while hashing
+    __HASH_BLOCKSIZE = 1024 * 1024
+
     def __init__(self, type, value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
         super().__init__(type, value=value)
@@ -659,6 +808,12 @@ class PathNodeValue(NodeValue):
             "dataroot": self.get(field="dataroot")
         }
 
+    def copy(self) -> "PathNodeValue":
+        value = super().copy()
+        value.__filehash = self.__filehash
+        value.__dataroot = self.__dataroot
+        return value
+
     def _from_dict(self,
                    manifest: Dict,
                    keypath: Tuple[str, ...],
@@ -677,20 +832,29 @@ class PathNodeValue(NodeValue):
 
     def set(self, value, field: str = 'value') -> "PathNodeValue":
         if field == 'filehash':
-            self.__filehash = NodeType.normalize(value, "str")
+            value = NodeType.normalize(value, "str")
+            self._changed()
+            self.__filehash = value
             return self
         if field == 'dataroot':
-            self.__dataroot = NodeType.normalize(value, "str")
+            value = NodeType.normalize(value, "str")
+            self._changed()
+            self.__dataroot = value
             return self
         return super().set(value, field=field)
 
     def __resolve_collection_path(self, path: Union[str, pathlib.Path],
-                                  collection_dir: str) -> Optional[str]:
-        try:
-            collected_paths = os.listdir(collection_dir)
-            if not collected_paths:
-                return None
-        except FileNotFoundError:
+                                  collection_dir: str,
+                                  cache: Optional["PathResolutionCache"] = None) \
+            -> Optional[str]:
+        if cache is not None:
+            collected_paths = cache.listdir(collection_dir)
+        else:
+            try:
+                collected_paths = os.listdir(collection_dir)
+            except FileNotFoundError:
+                collected_paths = None
+        if not collected_paths:
             return None
 
         path_paths = pathlib.PurePosixPath(path).parts
@@ -716,7 +880,8 @@ class PathNodeValue(NodeValue):
         return None
 
     def resolve_path(self, search: Optional[List[str]] = None,
-                     collection_dir: Optional[str] = None) -> Optional[str]:
+                     collection_dir: Optional[str] = None,
+                     cache: Optional["PathResolutionCache"] = None) -> Optional[str]:
         """
         Resolve the path of this value.
 
@@ -725,24 +890,45 @@ class PathNodeValue(NodeValue):
         Args:
             search (list of paths): list of paths to search to check for the path.
             collection_dir (path): path to collection directory.
+            cache (:class:`PathResolutionCache`): memo of previous resolutions to use.
         """
         value: Optional[Union[str, pathlib.Path]] = self.get()
         if value is None:
             return None
 
+        # Search for file
+        if search is None:
+            search = [os.getcwd()]
+
+        if cache is None:
+            return self.__resolve_path(value, search, collection_dir, None)
+
+        key = (value, self.__dataroot, tuple(search), collection_dir)
+        found, path = cache.get(key)
+        if not found:
+            try:
+                path = self.__resolve_path(value, search, collection_dir, cache)
+            except FileNotFoundError:
+                path = None
+            cache.set(key, path)
+
+        if path is None:
+            # File not found
+            raise FileNotFoundError(value)
+        return path
+
+    def __resolve_path(self, value: Union[str, pathlib.Path], search: List[str],
+                       collection_dir: Optional[str],
+                       cache: Optional["PathResolutionCache"]) -> str:
         # Check collections path
         if collection_dir:
-            collect_path = self.__resolve_collection_path(value, collection_dir)
+            collect_path = self.__resolve_collection_path(value, collection_dir, cache=cache)
             if collect_path:
                 return str(pathlib.Path(collect_path))
 
         if os.path.isabs(value) and os.path.exists(value):
             return str(pathlib.Path(value))
 
-        # Search for file
-        if search is None:
-            search = [os.getcwd()]
-
         for searchdir in search:
             abspath = os.path.abspath(os.path.join(searchdir, value))
             if os.path.exists(abspath):
@@ -810,41 +996,37 @@ class PathNodeValue(NodeValue):
     @staticmethod
     def hash_directory(dirname: Optional[Union[str, pathlib.Path]],
                        hashobj=None,
-                       hashfunction: Optional[str] = None) -> Optional[str]:
+                       hashfunction: Optional[str] = None,
+                       cache: Optional["FileHashCache"] = None) -> Optional[str]:
         """
-        Compute the hash for this directory.
+        Compute the hash for this directory, see :meth:`FileHashCache.hash_directory`.
 
         Args:
             dirname (path): directory to hash
-            hashobj (hashlib.): hashing object
+            hashobj (hashlib.): hashing object, only used to select the hashing function
             hashfunction (str): name of hashing function to use
+            cache (:class:`FileHashCache`): cache to hash the directory with, if not
+                provided the hashes are only cached in memory
         """
 
         if dirname is None:
             return None
 
-        if not hashobj:
-            if hashfunction is None:
-                raise ValueError("hashfunction must be a string")
+        if hashobj:
+            hashfunction = hashobj.name
 
-            hashfunc = getattr(hashlib, hashfunction, None)
-            if not hashfunc:
-                raise RuntimeError("Unable to hash directory due to missing "
-                                   f"hash function: {hashfunction}")
-            hashobj = hashfunc()
+        if hashfunction is None:
+            raise ValueError("hashfunction must be a string")
+
+        if not getattr(hashlib, hashfunction, None):
+            raise RuntimeError("Unable to hash directory due to missing "
+                               f"hash function: {hashfunction}")
 
-        all_files = []
-        for root, _, files in os.walk(dirname):
-            all_files.extend([os.path.join(root, f) for f in files])
-        dirhash = None
-        hashobj = hashfunc()
-        for file in sorted(all_files):
-            # Cast everything to a windows path and convert to posix.
-            # https://stackoverflow.com/questions/73682260
-            posix_path = pathlib.PureWindowsPath(os.path.relpath(file, dirname)).as_posix()
-            hashobj.update(posix_path.encode("utf-8"))
-            dirhash = PathNodeValue.hash_file(file, hashobj=hashobj)
-        return dirhash
+        if cache is None:
+            from .filehash import FileHashCache
+            cache = FileHashCache()
+
+        return cache.hash_directory(str(dirname), hashfunction)
 
     @staticmethod
     def hash_file(filename: Optional[Union[str, pathlib.Path]],
@@ -872,9 +1054,14 @@ class PathNodeValue(NodeValue):
                                    f"hash function: {hashfunction}")
             hashobj = hashfunc()
 
-        with open(filename, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                hashobj.update(byte_block)
+        buffer = bytearray(PathNodeValue.__HASH_BLOCKSIZE)
+        view = memoryview(buffer)
+        with open(filename, "rb", buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hashobj.update(view[:size])
         return hashobj.hexdigest()
 
     @property
@@ -894,6 +1081,8 @@ class DirectoryNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ()
+
     def __init__(self,
                  value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
@@ -924,6 +1113,8 @@ class FileNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__date", "__author")
+
     def __init__(self,
                  value: Optional[Union[str, pathlib.Path]] = None,
                  dataroot: Optional[str] = None):
@@ -938,6 +1129,12 @@ class FileNodeValue(PathNodeValue):
             "author": self.get(field="author")
         }
 
+    def copy(self) -> "FileNodeValue":
+        value = super().copy()
+        value.__date = self.__date
+        value.__author = self.__author.copy()
+        return value
+
     def _from_dict(self,
                    manifest: Dict,
                    keypath: Tuple[str, ...],
@@ -956,10 +1153,14 @@ class FileNodeValue(PathNodeValue):
 
     def set(self, value, field: str = 'value') -> "FileNodeValue":
         if field == 'date':
-            self.__date = NodeType.normalize(value, "str")
+            value = NodeType.normalize(value, "str")
+            self._changed()
+            self.__date = value
             return self
         if field == 'author':
-            self.__author = NodeType.normalize(value, ["str"])
+            value = NodeType.normalize(value, ["str"])
+            self._changed()
+            self.__author = value
             return self
         return super().set(value, field=field)
 
@@ -976,7 +1177,9 @@ class FileNodeValue(PathNodeValue):
         """
 
         if field == 'author':
-            self.__author.extend(NodeType.normalize(value, ["str"]))
+            value = NodeType.normalize(value, ["str"])
+            self._changed()
+            self.__author.extend(value)
             return self
         return super().add(value, field=field)
 
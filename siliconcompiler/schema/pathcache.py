@@ -0,0 +1,121 @@
+import contextlib
+import contextvars
+import os
+import threading
+
+from typing import Dict, FrozenSet, Hashable, Iterator, Optional, Tuple
+
+
+class PathResolutionCache:
+    """
+    Memo of path resolutions, see :meth:`PathNodeValue.resolve_path`.
+
+    A resolution is tied to the value, dataroot, search paths, and collection
+    directory of a path, and the listing of each collection directory is read
+    once. Paths which were not found are remembered as well.
+
+    The memo does not track changes to the filesystem or to the current working
+    directory, so it is only meant to be used for the duration of a phase which
+    resolves many paths, see :meth:`active`. Changes made during that phase must be
+    followed by a call to :meth:`invalidate`.
+    """
+
+    __active: contextvars.ContextVar = contextvars.ContextVar(
+        "PathResolutionCache", default=None)
+
+    # Marks a path which was not found
+    __MISSING = object()
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__paths: Dict[Tuple[Hashable, ...], object] = {}
+        self.__listings: Dict[str, Optional[FrozenSet[str]]] = {}
+
+    @staticmethod
+    def get_active() -> Optional["PathResolutionCache"]:
+        """
+        Returns the memo in use by the current context, or None.
+        """
+        return PathResolutionCache.__active.get()
+
+    @contextlib.contextmanager
+    def active(self) -> Iterator["PathResolutionCache"]:
+        """
+        Uses this memo to resolve paths in the current context, see
+        :meth:`BaseSchema._find_files`.
+
+        Examples:
+            >>> with PathResolutionCache().active():
+            ...     schema.find_files('input', 'verilog')
+        """
+        token = PathResolutionCache.__active.set(self)
+        try:
+            yield self
+        finally:
+            PathResolutionCache.__active.reset(token)
+
+    def invalidate(self, collection_dir: Optional[str] = None) -> None:
+        """
+        Removes remembered resolutions.
+
+        Args:
+            collection_dir (path): collection directory which changed, if not
+                provided all resolutions are removed, such as when the current
+                working directory changes.
+        """
+        with self.__lock:
+            if collection_dir is None:
+                self.__paths.clear()
+                self.__listings.clear()
+                return
+
+            self.__listings.pop(collection_dir, None)
+            for key in [key for key in self.__paths if key[-1] == collection_dir]:
+                del self.__paths[key]
+
+    def listdir(self, path: str) -> Optional[FrozenSet[str]]:
+        """
+        Returns the names in a collection directory, or None if it does not exist.
+
+        Args:
+            path (path): collection directory.
+        """
+        with self.__lock:
+            if path in self.__listings:
+                return self.__listings[path]
+
+        try:
+            listing = frozenset(os.listdir(path))
+        except FileNotFoundError:
+            listing = None
+
+        with self.__lock:
+            self.__listings[path] = listing
+        return listing
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Optional[str]]:
+        """
+        Returns whether a resolution is remembered and the resolved path, which
+        is None if the path was not found.
+
+        Args:
+            key (tuple): value, dataroot, search paths, and collection directory.
+        """
+        with self.__lock:
+            path = self.__paths.get(key, None)
+        if path is None:
+            return False, None
+        if path is PathResolutionCache.__MISSING:
+            return True, None
+        return True, path
+
+    def set(self, key: Tuple[Hashable, ...], path: Optional[str]) -> None:
+        """
+        Remembers a resolution.
+
+        Args:
+            key (tuple): value, dataroot, search paths, and collection directory.
+            path (path): resolved path, None if the path was not found.
+        """
+        with self.__lock:
+            self.__paths[key] = PathResolutionCache.__MISSING if path is None else path
@@ -41,6 +41,8 @@ class SafeSchema(BaseSchema):
         if not isinstance(manifest, dict):
             return set(), set()
 
+        self._BaseSchema__keys_changed()
+
         if "__meta__" in manifest:
             del manifest["__meta__"]
 
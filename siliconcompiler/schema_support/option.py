@@ -189,6 +189,54 @@ class SchedulerSchema(BaseSchema):
                 Maximum number of threads for each task in a job. If not set this will default
                 to the number of cpu cores available."""))
 
+        schema.insert(
+            'maxmemory',
+            Parameter(
+                'int',
+                unit='MB',
+                scope=Scope.GLOBAL,
+                shorthelp="Option: maximum memory for concurrent nodes",
+                switch="-maxmemory <int>",
+                example=["cli: -maxmemory 64000",
+                         "api: option.set('maxmemory', 64000)"],
+                help="""
+                Maximum amount of memory, specified in MB, which the concurrent nodes in a job
+                running on the local machine are expected to use. The memory expected for a
+                node is taken from :keypath:`option,scheduler,memory` or the peak
+                :keypath:`metric,memory` of the node in previous jobs. Nodes are held back
+                while the expected memory would exceed this limit or the memory currently
+                available, unless no other nodes are running. If not set this will default
+                to the memory available when the job starts."""))
+
+        schema.insert(
+            'workerpool',
+            Parameter(
+                'bool',
+                scope=Scope.GLOBAL,
+                shorthelp="Option: run nodes in a worker pool",
+                switch="-workerpool <bool>",
+                example=["cli: -workerpool",
+                         "api: option.set('workerpool', True)"],
+                help="""
+                Run the nodes in a job which execute on the local machine in a pool of worker
+                processes, which are started when the job starts and reused for the following
+                nodes. This avoids starting a new process for every node. The number of workers
+                is limited by :keypath:`option,scheduler,maxnodes`."""))
+
+        schema.insert(
+            'workerrecycle',
+            Parameter(
+                'bool',
+                scope=Scope.GLOBAL,
+                shorthelp="Option: replace pool workers after each node",
+                switch="-workerrecycle <bool>",
+                example=["cli: -workerrecycle",
+                         "api: option.set('workerrecycle', True)"],
+                help="""
+                Replace each worker in the :keypath:`option,scheduler,workerpool` after it
+                runs a node, so nodes never share a process. Replacement workers are started
+                while the other nodes run."""))
+
     def get_name(self, step: Optional[str] = None, index: Optional[str] = None) -> str:
         """Gets the scheduler platform name.
 
@@ -402,6 +450,54 @@ class SchedulerSchema(BaseSchema):
         """
         self.set('maxnodes', value)
 
+    def get_maxmemory(self) -> int:
+        """Gets the maximum memory for the concurrent nodes in a job in megabytes.
+
+        Returns:
+            int: The maximum memory in MB.
+        """
+        return self.get('maxmemory')
+
+    def set_maxmemory(self, value: int):
+        """Sets the maximum memory for the concurrent nodes in a job in megabytes.
+
+        Args:
+            value (int): The maximum memory in MB to set.
+        """
+        self.set('maxmemory', value)
+
+    def get_workerpool(self) -> bool:
+        """Gets the flag to run nodes in a worker pool.
+
+        Returns:
+            bool: True if nodes run in a worker pool.
+        """
+        return self.get('workerpool')
+
+    def set_workerpool(self, value: bool):
+        """Sets the flag to run nodes in a worker pool.
+
+        Args:
+            value (bool): The value to set for the worker pool flag.
+        """
+        self.set('workerpool', value)
+
+    def get_workerrecycle(self) -> bool:
+        """Gets the flag to replace pool workers after each node.
+
+        Returns:
+            bool: True if pool workers are replaced after each node.
+        """
+        return self.get('workerrecycle')
+
+    def set_workerrecycle(self, value: bool):
+        """Sets the flag to replace pool workers after each node.
+
+        Args:
+            value (bool): The value to set for the worker recycle flag.
+        """
+        self.set('workerrecycle', value)
+
     def get_maxthreads(self) -> int:
         """Gets the maximum number of threads for each task in a job.
 
@@ -663,6 +759,39 @@ class OptionSchema(BaseSchema):
                 compilation. The hash values are stored in the hashvalue
                 field of the individual parameters."""))
 
+        schema.insert(
+            'nodecache',
+            Parameter(
+                'bool',
+                scope=Scope.GLOBAL,
+                pernode=PerNode.OPTIONAL,
+                shorthelp="Option: node result cache",
+                switch="-nodecache <bool>",
+                example=["cli: -nodecache",
+                         "api: option.set('nodecache', True)"],
+                help="""
+                Enables the cache of node results in the ``nodes`` directory of
+                :keypath:`option,cachedir`, which is shared between jobs and build directories.
+                Results are stored under a key computed from the tool, tool version, task
+                parameters, and the contents of the input files of the node. When a node with
+                the same key runs again, the outputs, reports, and metrics of the node are
+                restored from the cache instead of executing the task."""))
+
+        schema.insert(
+            'nodecachesize',
+            Parameter(
+                'int',
+                unit='MB',
+                scope=Scope.GLOBAL,
+                defvalue=10240,
+                shorthelp="Option: node result cache size",
+                switch="-nodecachesize <int>",
+                example=["cli: -nodecachesize 20480",
+                         "api: option.set('nodecachesize', 20480)"],
+                help="""
+                Maximum size, specified in MB, of the :keypath:`option,nodecache`. The least
+                recently used results are removed once the cache exceeds this size."""))
+
         schema.insert(
             'nodisplay',
             Parameter(
@@ -1104,6 +1233,44 @@ class OptionSchema(BaseSchema):
         """
         self.set('hash', value)
 
+    def get_nodecache(self, step: Optional[str] = None, index: Optional[str] = None) -> bool:
+        """Gets the node result cache flag for a step.
+
+        Args:
+            step (str, optional): The flowgraph step. Defaults to None.
+            index (str, optional): The flowgraph step index. Defaults to None.
+
+        Returns:
+            bool: True if the node result cache is enabled.
+        """
+        return self.get('nodecache', step=step, index=index)
+
+    def set_nodecache(self, value: bool, step: Optional[str] = None, index: Optional[str] = None):
+        """Sets the node result cache flag for a step.
+
+        Args:
+            value (bool): The value to set for the node cache flag.
+            step (str, optional): The flowgraph step. Defaults to None.
+            index (str, optional): The flowgraph step index. Defaults to None.
+        """
+        self.set('nodecache', value, step=step, index=index)
+
+    def get_nodecachesize(self) -> int:
+        """Gets the maximum size of the node result cache.
+
+        Returns:
+            int: The maximum size in MB.
+        """
+        return self.get('nodecachesize')
+
+    def set_nodecachesize(self, value: int):
+        """Sets the maximum size of the node result cache.
+
+        Args:
+            value (int): The maximum size in MB.
+        """
+        self.set('nodecachesize', value)
+
     def get_nodisplay(self) -> bool:
         """Gets the headless execution (no-display) flag.
 
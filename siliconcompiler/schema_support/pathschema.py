@@ -6,11 +6,13 @@ import os.path
 from typing import Tuple, Union, List, Optional, Dict, Callable
 
 from siliconcompiler.schema.baseschema import BaseSchema
+from siliconcompiler.schema.filehash import FileHashCache
 from siliconcompiler.schema.editableschema import EditableSchema
 from siliconcompiler.schema.parameter import Parameter, Scope
 from siliconcompiler.schema.utils import trim
 
 from siliconcompiler.package import Resolver
+from siliconcompiler.utils import default_cache_dir
 from siliconcompiler.utils.paths import collectiondir, cwdirsafe
 
 
@@ -95,7 +97,9 @@ class PathSchemaBase(BaseSchema):
         parameter, following the order dictated by the files within the 'value'
         parameter field.
 
-        Files are located using the find_files() function.
+        Files are located using the find_files() function. File hashes are
+        cached in the user cache directory, see :class:`FileHashCache`, so
+        unchanged files are not hashed again.
 
         The file hash calculation is performed based on the 'algo' setting.
         Supported algorithms include SHA1, SHA224, SHA256, SHA384, SHA512,
@@ -129,11 +133,13 @@ class PathSchemaBase(BaseSchema):
         if verbose:
             logger.info(f"Computing hash value for [{','.join([*self._keypath, *keypath])}]")
 
-        hashes = super()._hash_files(*keypath,
-                                     missing_ok=missing_ok,
-                                     step=step, index=index,
-                                     collection_dir=collectiondir(schema_root),
-                                     cwd=cwdirsafe(schema_root))
+        with FileHashCache(os.path.join(default_cache_dir(), "filehashes.db")) as hash_cache:
+            hashes = super()._hash_files(*keypath,
+                                         missing_ok=missing_ok,
+                                         step=step, index=index,
+                                         collection_dir=collectiondir(schema_root),
+                                         cwd=cwdirsafe(schema_root),
+                                         hash_cache=hash_cache)
 
         if check:
             check_hashes = self.get(*keypath, field="filehash", step=step, index=index)
@@ -197,7 +203,9 @@ class PathSchemaSimpleBase(PathSchemaBase):
         parameter, following the order dictated by the files within the 'value'
         parameter field.
 
-        Files are located using the find_files() function.
+        Files are located using the find_files() function. File hashes are
+        cached in the user cache directory, see :class:`FileHashCache`, so
+        unchanged files are not hashed again.
 
         The file hash calculation is performed based on the 'algo' setting.
         Supported algorithms include SHA1, SHA224, SHA256, SHA384, SHA512,
@@ -38,11 +38,13 @@ from pathlib import Path
 from siliconcompiler.schema import BaseSchema, NamedSchema, Journal, DocsSchema, LazyLoad
 from siliconcompiler.schema import EditableSchema, Parameter, PerNode, Scope
 from siliconcompiler.schema.parametertype import NodeType
+from siliconcompiler.schema.pathcache import PathResolutionCache
 from siliconcompiler.schema.utils import trim
 
 from siliconcompiler import utils, NodeStatus, Flowgraph
 from siliconcompiler import sc_open
 from siliconcompiler.utils import paths
+from siliconcompiler.utils.toolcache import ToolCache
 
 from siliconcompiler.schema_support.pathschema import PathSchema
 from siliconcompiler.schema_support.record import RecordTool, RecordSchema
@@ -370,7 +372,7 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         # Collect PATH from environment variables
         env = self.get_runtime_environmental_variables(include_path=True)
 
-        fullexe = shutil.which(exe, path=env["PATH"])
+        fullexe = ToolCache.which(exe, env["PATH"])
 
         if not fullexe:
             self._exe_not_found_handler()
@@ -393,6 +395,11 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         """
         Gets the version of the task's executable by running it with a version switch.
 
+        The output of the version switch is cached for the executable and its
+        environment once it has been parsed, see :class:`.ToolCache`, so the
+        executable is only run again once it changes. Output which cannot be parsed
+        is not cached, so failed checks are repeated.
+
         Raises:
             TaskExecutableNotFound: If the executable is not found.
             NotImplementedError: If the `parse_version` method is not implemented.
@@ -414,29 +421,42 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         cmdlist = [exe]
         cmdlist.extend(veropt)
 
-        self.logger.debug(f'Running {self.tool()}/{self.task()} version check: '
-                          f'{" ".join(cmdlist)}')
-
-        proc = subprocess.run(cmdlist,
-                              stdin=subprocess.DEVNULL,
-                              stdout=subprocess.PIPE,
-                              stderr=subprocess.STDOUT,
-                              universal_newlines=True)
+        env = self.get_runtime_environmental_variables(include_path=True)
+        cache = ToolCache()
+        probe = cache.get(exe, veropt, env)
+        cached = probe is not None
+        if not cached:
+            self.logger.debug(f'Running {self.tool()}/{self.task()} version check: '
+                              f'{" ".join(cmdlist)}')
+
+            proc = subprocess.run(cmdlist,
+                                  stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT,
+                                  universal_newlines=True)
+            probe = (proc.returncode, proc.stdout)
+        else:
+            self.logger.debug(f'Using cached {self.tool()}/{self.task()} version check: '
+                              f'{" ".join(cmdlist)}')
 
-        if proc.returncode != 0:
+        returncode, stdout = probe
+        if returncode != 0:
             self.logger.warning(f"Version check on '{exe_base}' ended with "
-                                f"code {proc.returncode}")
+                                f"code {returncode}")
 
         try:
-            version = self.parse_version(proc.stdout)
+            version = self.parse_version(stdout)
         except NotImplementedError:
             raise NotImplementedError(f'{self.tool()}/{self.task()} does not implement '
                                       'parse_version()')
         except Exception as e:
             self.logger.error(f'{self.tool()}/{self.task()} failed to parse version string: '
-                              f'{proc.stdout}')
+                              f'{stdout}')
             raise e from None
 
+        if not cached:
+            cache.set(exe, veropt, env, returncode, stdout)
+
         self.logger.info(f"Tool '{exe_base}' found with version '{version}' "
                          f"in directory '{exe_path}'")
 
@@ -783,7 +803,7 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         # Generate a schema with absolute paths for the manifest
         schema = self.__abspath_schema()
 
-        if re.search(r'\.json(\.gz)?$', manifest_path):
+        if re.search(r'\.json(\.gz|\.zst)?$', manifest_path):
             schema.write_manifest(manifest_path)
         else:
             # Format-specific dumping
@@ -813,31 +833,28 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         root = self.project
         schema = root.copy()
 
-        for keypath in root.allkeys():
-            if keypath[0] == "history":
-                # Ignore history as this is not relevant to the task
-                continue
-
-            paramtype: str = schema.get(*keypath, field='type')
-            if 'file' not in paramtype and 'dir' not in paramtype:
-                continue
-
-            for value, step, index in root.get(*keypath, field=None).getvalues():
-                if not value:
+        with PathResolutionCache().active():
+            for keypath in root._allpathkeys():
+                if keypath[0] == "history":
+                    # Ignore history as this is not relevant to the task
                     continue
-                abspaths = root.find_files(*keypath, missing_ok=True, step=step, index=index)
-                if isinstance(abspaths, (set, list)) and None in abspaths:
-                    schema.set(*keypath, [], step=step, index=index)
-                else:
-                    if self.__relpath:
-                        if isinstance(abspaths, (set, list)):
-                            abspaths = [os.path.relpath(path, self.__relpath) for path in abspaths
-                                        if path]
-                        elif abspaths:
-                            abspaths = os.path.relpath(abspaths, self.__relpath)
-                        else:
-                            abspaths = None
-                    schema.set(*keypath, abspaths, step=step, index=index)
+
+                for value, step, index in root.get(*keypath, field=None).getvalues():
+                    if not value:
+                        continue
+                    abspaths = root.find_files(*keypath, missing_ok=True, step=step, index=index)
+                    if isinstance(abspaths, (set, list)) and None in abspaths:
+                        schema.set(*keypath, [], step=step, index=index)
+                    else:
+                        if self.__relpath:
+                            if isinstance(abspaths, (set, list)):
+                                abspaths = [os.path.relpath(path, self.__relpath)
+                                            for path in abspaths if path]
+                            elif abspaths:
+                                abspaths = os.path.relpath(abspaths, self.__relpath)
+                            else:
+                                abspaths = None
+                        schema.set(*keypath, abspaths, step=step, index=index)
 
         return schema
 
@@ -485,6 +485,17 @@ def get_cores(physical: bool = False) -> int:
     return cores
 
 
+def get_available_memory() -> int:
+    '''
+    Get the amount of memory currently available on this machine.
+
+    Returns:
+        int: The available memory in bytes.
+    '''
+
+    return psutil.virtual_memory().available
+
+
 def print_traceback(logger: logging.Logger, exception: Exception):
     """
     Prints the full traceback of an exception to the provided logger.
@@ -1,5 +1,4 @@
 import shutil
-import tarfile
 
 import os.path
 
@@ -7,8 +6,10 @@ from typing import List, Optional, TYPE_CHECKING
 
 from siliconcompiler.schema import BaseSchema, Parameter
 from siliconcompiler.schema.parametervalue import NodeListValue, NodeSetValue
+from siliconcompiler.schema.pathcache import PathResolutionCache
 from siliconcompiler.utils import FilterDirectories
 from siliconcompiler.utils.paths import collectiondir, cwdir
+from siliconcompiler.utils.tarball import open_tarball
 from siliconcompiler.scheduler import SchedulerNode
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
@@ -66,24 +67,25 @@ def collect(project: "Project",
         Find the files in the filesystem, otherwise look in previous collection
         """
         e = None
-        try:
-            return BaseSchema._find_files(project, *key, step=step, index=index,
-                                          cwd=cwd,
-                                          collection_dir=directory)
-        except FileNotFoundError as err:
-            e = err
-        if prev_dir:
-            # Try previous location next
-            return BaseSchema._find_files(project, *key, step=step, index=index,
-                                          cwd=cwd,
-                                          collection_dir=prev_dir)
+        with resolve_cache.active():
+            try:
+                return BaseSchema._find_files(project, *key, step=step, index=index,
+                                              cwd=cwd,
+                                              collection_dir=directory)
+            except FileNotFoundError as err:
+                e = err
+            if prev_dir:
+                # Try previous location next
+                return BaseSchema._find_files(project, *key, step=step, index=index,
+                                              cwd=cwd,
+                                              collection_dir=prev_dir)
         if e:
             raise e from None
 
     dirs = {}
     files = {}
 
-    for key in project.allkeys():
+    for key in project._allpathkeys():
         if key[0] == 'history':
             # skip history
             continue
@@ -103,12 +105,7 @@ def collect(project: "Project",
             continue
 
         param: Parameter = project.get(*key, field=None)
-        leaftype: str = param.get(field='type')
-        is_dir = "dir" in leaftype
-        is_file = "file" in leaftype
-
-        if not is_dir and not is_file:
-            continue
+        is_dir = "dir" in param.get(field='type')
 
         if not param.get(field='copy'):
             continue
@@ -127,6 +124,8 @@ def collect(project: "Project",
             else:
                 files[(key, step, index)] = values
 
+    # Paths are resolved once, the collection directory changes with each copy
+    resolve_cache = PathResolutionCache()
     try:
         path_filter = FilterDirectories(project)
         for key, step, index in sorted(dirs.keys()):
@@ -170,6 +169,7 @@ def collect(project: "Project",
                 path_filter.abspath = abs_path
                 shutil.copytree(abs_path, import_path, ignore=path_filter.filter)
                 path_filter.abspath = None
+                resolve_cache.invalidate(directory)
 
         for key, step, index in sorted(files.keys()):
             abs_paths = find_files(*key, step=step, index=index)
@@ -195,6 +195,7 @@ def collect(project: "Project",
                 if verbose:
                     project.logger.info(f"  Collecting file: {abs_path}")
                 shutil.copy2(abs_path, import_path)
+                resolve_cache.invalidate(directory)
     finally:
         if prev_dir:
             # Delete existing directory
@@ -209,7 +210,8 @@ def archive(project: "Project",
 
     Creates a single compressed archive (.tgz) based on the specified job.
     By default, only outputs, reports, log files, and the final manifest
-    are archived.
+    are archived. Archives with a ``.tar.zst`` extension are compressed with zstd,
+    see :func:`.tarball.open_tarball`.
 
     Args:
         jobname (str, optional): The job to archive. By default, archives the job specified
@@ -249,6 +251,6 @@ def archive(project: "Project",
 
     project.logger.info(f'Creating archive {archive_name}...')
 
-    with tarfile.open(archive_name, "w:gz") as tar:
+    with open_tarball(archive_name, "w") as tar:
         for step, index in flowgraph_nodes:
             SchedulerNode(history, step, index).archive(tar, include, True)
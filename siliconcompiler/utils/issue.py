@@ -44,7 +44,7 @@ def generate_testcase(project: "Project",
 
     project.option.set_continue(True)
     if hash_files:
-        for key in project.allkeys():
+        for key in project._allpathkeys():
             if key[0] == 'history':
                 continue
             if len(key) > 1:
@@ -52,9 +52,6 @@ def generate_testcase(project: "Project",
                     continue
                 if key[-2] == 'option' and key[-1] == 'cachedir':
                     continue
-            sc_type: str = project.get(*key, field='type')
-            if 'file' not in sc_type and 'dir' not in sc_type:
-                continue
             for _, key_step, key_index in project.get(*key, field=None).getvalues():
                 project.hash_files(
                     *key,
@@ -110,14 +107,10 @@ def generate_testcase(project: "Project",
 
         return copy
 
-    for keypath in project.allkeys():
+    for keypath in project._allpathkeys():
         if 'default' in keypath:
             continue
 
-        sctype: str = project.get(*keypath, field='type')
-        if 'file' not in sctype and 'dir' not in sctype:
-            continue
-
         project.set(
             *keypath,
             determine_copy(*keypath,
@@ -156,3 +156,26 @@ def collectiondir(project: "Project") -> Union[None, str]:
         return os.path.join(jobdir(project), "sc_collected_files")
     except TypeError:
         return None
+
+
+def historydir(project: "Project") -> str:
+    """
+    Returns the absolute path to the job history directory.
+
+    The directory structure is typically:
+    `<build_dir>/<design_name>/sc_history/`
+
+    This directory is shared between the jobs of the design and holds the
+    records of the jobs stored in the project history.
+
+    Args:
+        project (Project): The SiliconCompiler project object.
+
+    Returns:
+        str: The absolute path to the history directory.
+
+    Raises:
+        TypeError: If the provided project is not a valid Project object.
+        ValueError: If the project name has not been set.
+    """
+    return os.path.join(os.path.dirname(jobdir(project)), "sc_history")
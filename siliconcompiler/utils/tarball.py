@@ -0,0 +1,83 @@
+import contextlib
+import tarfile
+
+from typing import Iterator
+
+try:
+    import zstandard
+    _has_zstd = True
+except ModuleNotFoundError:
+    _has_zstd = False
+
+
+# Extensions of tarballs compressed with zstd
+ZSTD_EXTENSIONS = (".tar.zst", ".tzst")
+
+# Leading bytes of a zstd frame
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd compression level
+_ZSTD_LEVEL = 3
+
+
+def is_zstd(path: str) -> bool:
+    """
+    Returns true if the path has the extension of a zstd compressed tarball.
+
+    Args:
+        path (path): path to the tarball.
+    """
+    return path.lower().endswith(ZSTD_EXTENSIONS)
+
+
+@contextlib.contextmanager
+def open_tarball(path: str, mode: str = "r") -> Iterator[tarfile.TarFile]:
+    """
+    Opens a compressed tarball.
+
+    Tarballs with a ``.tar.zst`` or ``.tzst`` extension are written with zstd
+    compression, using all available cores, which requires the ``zstandard``
+    package. All other tarballs are written with gzip compression.
+
+    When reading, the compression is detected from the contents of the file.
+    zstd compressed tarballs are read as a stream, so members must be accessed
+    in order, such as with :meth:`tarfile.TarFile.extractall`.
+
+    Args:
+        path (path): path to the tarball.
+        mode (str): "r" to read or "w" to write.
+
+    Examples:
+        >>> with open_tarball("outputs.tar.zst", "w") as tar:
+        ...     tar.add("outputs")
+    """
+    if mode not in ("r", "w"):
+        raise ValueError(f"{mode} is not a valid mode")
+
+    if mode == "r":
+        with open(path, "rb") as f:
+            zstd = f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+    else:
+        zstd = is_zstd(path)
+
+    if not zstd:
+        with tarfile.open(path, "r:*" if mode == "r" else "w:gz") as tar:
+            yield tar
+        return
+
+    if not _has_zstd:
+        raise RuntimeError(f"zstd is not available to open {path}, "
+                           "install siliconcompiler[zstd]")
+
+    if mode == "r":
+        with open(path, "rb") as f, \
+                zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True) \
+                as reader, \
+                tarfile.open(fileobj=reader, mode="r|") as tar:
+            yield tar
+    else:
+        with open(path, "wb") as f, \
+                zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1).stream_writer(f) \
+                as writer, \
+                tarfile.open(fileobj=writer, mode="w|") as tar:
+            yield tar
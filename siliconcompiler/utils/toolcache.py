@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+
+import os.path
+
+from typing import Dict, List, Optional, Tuple
+
+from siliconcompiler.utils import default_cache_dir
+
+
+class ToolCache:
+    """
+    Cache of the executable lookups and version probes of tools.
+
+    Executable lookups are kept in memory for each executable name and search
+    path. Version probes are kept in memory and in an sqlite database, so they
+    are shared between nodes, processes, and runs. A probe is tied to the resolved
+    path, modification time, size, and inode of the executable, along with the
+    version switch and environment used to run it, so probes are repeated once the
+    executable changes.
+
+    Errors accessing the database are ignored and the executable is probed instead.
+
+    Args:
+        path (str): path to the database, defaults to :meth:`get_path`.
+    """
+
+    __TIMEOUT = 30
+
+    __lock = threading.Lock()
+    __exes: Dict[Tuple[str, str], str] = {}
+    __probes: Dict[str, Tuple[int, str]] = {}
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = ToolCache.get_path()
+        self.__path = path
+
+    @property
+    def path(self) -> str:
+        """str: path to the database."""
+        return self.__path
+
+    @staticmethod
+    def get_path() -> str:
+        """
+        Returns the path to the version probe database in the user cache directory.
+        """
+        return os.path.join(default_cache_dir(), "toolversions.db")
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Clears the in-memory caches.
+        """
+        with ToolCache.__lock:
+            ToolCache.__exes.clear()
+            ToolCache.__probes.clear()
+
+    @staticmethod
+    def which(exe: str, path: str) -> Optional[str]:
+        """
+        Returns the path to an executable, see :func:`shutil.which`.
+
+        Previous lookups are reused as long as the executable is still present.
+
+        Args:
+            exe (str): name of the executable.
+            path (str): search path.
+        """
+        key = (exe, path)
+        with ToolCache.__lock:
+            fullexe = ToolCache.__exes.get(key, None)
+        if fullexe and os.path.isfile(fullexe) and os.access(fullexe, os.X_OK):
+            return fullexe
+
+        fullexe = shutil.which(exe, path=path)
+        if fullexe and os.path.isfile(fullexe):
+            with ToolCache.__lock:
+                ToolCache.__exes[key] = fullexe
+        return fullexe
+
+    @staticmethod
+    def __get_stat(exe: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns the resolved path and stats of an executable, or None if
+        it cannot be accessed.
+        """
+        try:
+            path = os.path.realpath(exe)
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return path, f"{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}"
+
+    @staticmethod
+    def __get_key(path: str, stat: str, args: List[str], env: Dict[str, str]) -> str:
+        return hashlib.sha1(json.dumps([path, stat, args, env], sort_keys=True)
+                            .encode("utf-8")).hexdigest()
+
+    def __connect(self) -> sqlite3.Connection:
+        if os.path.dirname(self.__path):
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+        conn = sqlite3.connect(self.__path, timeout=ToolCache.__TIMEOUT)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS probes ("
+            "key TEXT PRIMARY KEY, "
+            "path TEXT NOT NULL, "
+            "stat TEXT NOT NULL, "
+            "returncode INTEGER NOT NULL, "
+            "output TEXT NOT NULL)")
+        return conn
+
+    def get(self, exe: str, args: List[str], env: Dict[str, str]) -> Optional[Tuple[int, str]]:
+        """
+        Returns the return code and output of a previous version probe, or None
+        if the executable has not been probed since it last changed.
+
+        Args:
+            exe (str): path to the executable.
+            args (list of str): version switch.
+            env (dict): environment the executable is run with.
+        """
+        stat = ToolCache.__get_stat(exe)
+        if stat is None:
+            return None
+        key = ToolCache.__get_key(*stat, args, env)
+
+        with ToolCache.__lock:
+            probe = ToolCache.__probes.get(key, None)
+        if probe is not None:
+            return probe
+
+        if not os.path.exists(self.__path):
+            return None
+
+        try:
+            conn = self.__connect()
+            try:
+                row = conn.execute(
+                    "SELECT returncode, output FROM probes WHERE key = ?", (key,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        probe = (row[0], row[1])
+        with ToolCache.__lock:
+            ToolCache.__probes[key] = probe
+        return probe
+
+    def set(self, exe: str, args: List[str], env: Dict[str, str],
+            returncode: int, output: str) -> None:
+        """
+        Records the return code and output of a version probe.
+
+        Args:
+            exe (str): path to the executable.
+            args (list of str): version switch.
+            env (dict): environment the executable was run with.
+            returncode (int): return code of the probe.
+            output (str): output of the probe.
+        """
+        stat = ToolCache.__get_stat(exe)
+        if stat is None:
+            return
+        path, stat = stat
+        key = ToolCache.__get_key(path, stat, args, env)
+
+        with ToolCache.__lock:
+            ToolCache.__probes[key] = (returncode, output)
+
+        try:
+            conn = self.__connect()
+            try:
+                with conn:
+                    # Remove the probes of previous versions of the executable
+                    conn.execute("DELETE FROM probes WHERE path = ? AND stat != ?",
+                                 (path, stat))
+                    conn.execute("INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?, ?)",
+                                 (key, path, stat, returncode, output))
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
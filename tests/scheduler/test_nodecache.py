@@ -0,0 +1,278 @@
+import json
+import os
+import pytest
+import stat
+import time
+
+import os.path
+
+from siliconcompiler import Project, Flowgraph, Design, NodeStatus, Task
+from siliconcompiler.scheduler.nodecache import NodeCache
+from siliconcompiler.schema.filehash import FileHashCache
+
+
+class CountingTask(Task):
+    def __init__(self):
+        super().__init__()
+        self.add_parameter("text", "str", "text to write")
+
+    def tool(self):
+        return "counting"
+
+    def task(self):
+        return "write"
+
+    def setup(self):
+        super().setup()
+        self.add_required_key("var", "text")
+        self.add_output_file(ext="txt")
+
+    def run(self):
+        with open("../../../runs.txt", "a") as f:
+            f.write(f"{self.step}\n")
+        with open(f"outputs/{self.design_topmodule}.txt", "w") as f:
+            f.write(self.get("var", "text"))
+        with open("reports/report.txt", "w") as f:
+            f.write("warnings 3")
+        self.record_metric("warnings", 3, source_file="reports/report.txt")
+        return 0
+
+
+@pytest.fixture
+def cache_project():
+    flow = Flowgraph("testflow")
+    flow.node("stepone", CountingTask())
+    flow.node("steptwo", CountingTask())
+    flow.edge("stepone", "steptwo")
+
+    design = Design("testdesign")
+    with design.active_fileset("rtl"):
+        design.set_topmodule("top")
+
+    proj = Project(design)
+    proj.add_fileset("rtl")
+    proj.set_flow(flow)
+
+    proj.set("option", "cachedir", os.path.abspath("cache"))
+    proj.set("option", "nodecache", True)
+
+    return proj
+
+
+def run(project, jobname, text="hello", step=None):
+    project.set("option", "jobname", jobname)
+    CountingTask.find_task(project).set("var", "text", "hello")
+    if step:
+        CountingTask.find_task(project).set("var", "text", text, step=step)
+    return project.run()
+
+
+def get_runs(project):
+    path = os.path.join(project.option.get_builddir(), "testdesign", "runs.txt")
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return f.read().split()
+
+
+def write_node(path, text):
+    os.makedirs(os.path.join(path, "outputs"), exist_ok=True)
+    with open(os.path.join(path, "outputs", "out.txt"), "w") as f:
+        f.write(text)
+
+
+def test_get_key():
+    assert NodeCache.get_key({"a": 1, "b": [1, 2]}) == NodeCache.get_key({"b": [1, 2], "a": 1})
+    assert NodeCache.get_key({"a": 1}) != NodeCache.get_key({"a": 2})
+
+
+def test_hash_directory():
+    os.makedirs("dir/sub")
+    with open("dir/sub/file.txt", "w") as f:
+        f.write("test")
+    with open("dir/skip.txt", "w") as f:
+        f.write("test")
+
+    check = NodeCache.hash_directory("dir")
+    assert NodeCache.hash_directory("dir", exclude={"skip.txt"}) != check
+
+    with open("dir/skip.txt", "w") as f:
+        f.write("changed")
+    assert NodeCache.hash_directory("dir") != check
+
+
+def test_hash_directory_hash_cache():
+    os.makedirs("dir/sub")
+    with open("dir/sub/file.txt", "w") as f:
+        f.write("test")
+
+    with FileHashCache("hashes.db") as hash_cache:
+        assert NodeCache.hash_directory("dir", hash_cache=hash_cache) == \
+            NodeCache.hash_directory("dir")
+
+
+def test_insert_restore():
+    write_node("node", "test")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs", "missing"], {"metrics": {"warnings": 3}})
+
+    info = cache.restore("abcd", "restored", ["outputs", "missing"])
+    assert info == {"metrics": {"warnings": 3}, "size": 4}
+    with open("restored/outputs/out.txt") as f:
+        assert f.read() == "test"
+    assert not os.path.exists("restored/missing")
+
+
+def test_insert_read_only():
+    write_node("node", "test")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {})
+
+    cached = os.path.join("cache", "ab", "abcd", "outputs", "out.txt")
+    assert not os.stat(cached).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    assert not os.path.samefile(cached, "node/outputs/out.txt")
+
+    # Modifying the node does not modify the entry
+    write_node("node", "changed")
+    cache.restore("abcd", "restored", ["outputs"])
+    with open("restored/outputs/out.txt") as f:
+        assert f.read() == "test"
+
+
+def test_restore_modified_entry():
+    write_node("node", "test")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {})
+
+    cached = os.path.join("cache", "ab", "abcd", "outputs", "out.txt")
+    os.chmod(cached, stat.S_IWUSR | stat.S_IRUSR)
+    with open(cached, "w") as f:
+        f.write("corrupt")
+
+    assert cache.restore("abcd", "restored", ["outputs"]) is None
+    assert not os.path.exists("restored/outputs/out.txt")
+    assert cache.get_entries() == []
+
+
+def test_restore_removed_file():
+    write_node("node", "test")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {})
+
+    os.remove(os.path.join("cache", "ab", "abcd", "outputs", "out.txt"))
+
+    assert cache.restore("abcd", "restored", ["outputs"]) is None
+    assert cache.get_entries() == []
+
+
+def test_insert_exclude():
+    write_node("node", "test")
+    with open("node/outputs/skip.txt", "w") as f:
+        f.write("skip")
+
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {}, exclude={"outputs/skip.txt"})
+
+    assert cache.restore("abcd", "restored", ["outputs"]) == {"size": 4}
+    assert os.listdir("restored/outputs") == ["out.txt"]
+
+
+def test_insert_existing():
+    write_node("node", "test")
+    write_node("other", "other")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {})
+    cache.insert("abcd", "other", ["outputs"], {})
+
+    cache.restore("abcd", "restored", ["outputs"])
+    with open("restored/outputs/out.txt") as f:
+        assert f.read() == "test"
+    assert not os.listdir("cache/tmp")
+
+
+def test_restore_missing():
+    assert NodeCache("cache").restore("abcd", "restored", ["outputs"]) is None
+
+
+def test_remove():
+    write_node("node", "test")
+    cache = NodeCache("cache")
+    cache.insert("abcd", "node", ["outputs"], {})
+    cache.remove("abcd")
+
+    assert cache.get_entries() == []
+    assert cache.restore("abcd", "restored", ["outputs"]) is None
+
+
+def test_evict_least_recently_used():
+    write_node("node", "test")
+    cache = NodeCache("cache", maxsize=8)
+    for key in ("aaaa", "bbbb"):
+        cache.insert(key, "node", ["outputs"], {})
+        time.sleep(0.01)
+
+    # Use the oldest entry
+    assert cache.restore("aaaa", "restored", ["outputs"])
+
+    cache.insert("cccc", "node", ["outputs"], {})
+    assert sorted(key for key, _, _ in cache.get_entries()) == ["aaaa", "cccc"]
+
+
+@pytest.mark.timeout(90)
+def test_run_restored_from_cache(cache_project):
+    assert run(cache_project, "job0")
+    assert get_runs(cache_project) == ["stepone", "steptwo"]
+
+    assert run(cache_project, "job1")
+    assert get_runs(cache_project) == ["stepone", "steptwo"]
+
+    history = cache_project.history("job1")
+    for step in ("stepone", "steptwo"):
+        assert history.get("record", "status", step=step, index="0") == NodeStatus.SUCCESS
+        assert history.get("metric", "warnings", step=step, index="0") == 3
+        assert history.get("tool", "counting", "task", "write", "report", "warnings",
+                           step=step, index="0") == ["reports/report.txt"]
+
+    node_dir = os.path.join(cache_project.option.get_builddir(), "testdesign", "job1",
+                            "steptwo", "0")
+    with open(os.path.join(node_dir, "outputs", "top.txt")) as f:
+        assert f.read() == "hello"
+    assert os.path.exists(os.path.join(node_dir, "reports", "report.txt"))
+    assert os.path.exists(os.path.join(node_dir, "outputs", "testdesign.pkg.json"))
+
+
+@pytest.mark.timeout(90)
+def test_run_cache_value_changed(cache_project):
+    assert run(cache_project, "job0")
+    assert run(cache_project, "job1", text="changed", step="steptwo")
+    assert get_runs(cache_project) == ["stepone", "steptwo", "steptwo"]
+
+    node_dir = os.path.join(cache_project.option.get_builddir(), "testdesign", "job1",
+                            "steptwo", "0")
+    with open(os.path.join(node_dir, "outputs", "top.txt")) as f:
+        assert f.read() == "changed"
+
+
+@pytest.mark.timeout(90)
+def test_run_cache_disabled(cache_project):
+    cache_project.set("option", "nodecache", False)
+    assert run(cache_project, "job0")
+    assert run(cache_project, "job1")
+    assert get_runs(cache_project) == ["stepone", "steptwo", "stepone", "steptwo"]
+    assert not os.path.exists(os.path.join("cache", "nodes"))
+
+
+@pytest.mark.timeout(90)
+def test_run_cache_entry_contents(cache_project):
+    assert run(cache_project, "job0")
+
+    cache = NodeCache(os.path.join("cache", "nodes"))
+    entries = cache.get_entries()
+    assert len(entries) == 2
+
+    for key, _, _ in entries:
+        entry = os.path.join("cache", "nodes", key[0:2], key)
+        assert sorted(os.listdir(os.path.join(entry, "outputs"))) == ["top.txt"]
+        with open(os.path.join(entry, "entry.json")) as f:
+            info = json.load(f)
+        assert info["metrics"] == {"warnings": 3}
@@ -11,10 +11,10 @@ from unittest.mock import patch
 
 from siliconcompiler import Project, Flowgraph, Design, NodeStatus
 from siliconcompiler.scheduler import Scheduler, SCRuntimeError, SlurmSchedulerNode
-from siliconcompiler.schema import EditableSchema, Parameter
+from siliconcompiler.schema import EditableSchema, Journal, Parameter
 
 from siliconcompiler.tools.builtin.nop import NOPTask
-from siliconcompiler.utils.paths import jobdir
+from siliconcompiler.utils.paths import jobdir, historydir
 from siliconcompiler.tool import TaskExecutableNotReceived, TaskSkip, Task
 
 
@@ -695,6 +695,44 @@ def test_check_flowgraph_io_with_files_multple_input(basic_project_no_flow, monk
     assert "Invalid flow: steptwo/0 receives test.v from multiple input tasks" in caplog.text
 
 
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize("clean", [True, False])
+def test_rerun_replaces_history_record(basic_project, clean):
+    basic_project.set("option", "clean", clean)
+
+    assert basic_project.run()
+    records = os.listdir(historydir(basic_project))
+    assert len(records) == 1
+
+    assert basic_project.run()
+    assert len(os.listdir(historydir(basic_project))) == 1
+    assert os.listdir(historydir(basic_project)) != records
+
+
+@pytest.mark.timeout(60)
+def test_rerun_from_replaces_history_record(basic_project):
+    assert basic_project.run()
+    records = os.listdir(historydir(basic_project))
+
+    basic_project.set("option", "from", "stepone")
+    assert basic_project.run()
+    assert len(os.listdir(historydir(basic_project))) == 1
+    assert os.listdir(historydir(basic_project)) != records
+
+
+@pytest.mark.timeout(60)
+def test_rerun_removes_history_of_loaded_project(basic_project):
+    assert basic_project.run()
+    loaded = Project.from_manifest(
+        os.path.join(jobdir(basic_project), f"{basic_project.name}.pkg.json"))
+
+    assert basic_project.run()
+    with pytest.raises(FileNotFoundError, match=r"^\[history,job0\] is stored in .*, "
+                       r"which does not exist$"):
+        loaded.history("job0")
+    assert basic_project.history("job0").get("option", "jobname") == "job0"
+
+
 @pytest.mark.timeout(60)
 def test_rerun(gcd_nop_project):
     '''Regression test for #458.'''
@@ -746,6 +784,53 @@ def test_resume_normal(gcd_nop_project):
         NodeStatus.SUCCESS
 
 
+@pytest.mark.timeout(60)
+def test_resume_without_journal_sidecar(gcd_nop_project):
+    assert gcd_nop_project.run()
+    run_copy = gcd_nop_project.copy()
+    time.sleep(1)  # delay to ensure timestamps differ
+
+    for manifest in Path(jobdir(gcd_nop_project)).glob("*/*/outputs/*.pkg.json"):
+        os.remove(Journal.get_sidecar_path(str(manifest)))
+
+    assert gcd_nop_project.run()
+
+    for step in ("steptwo", "stepthree", "stepfour"):
+        assert run_copy.history("job0").get("record", "endtime", step=step, index="0") == \
+            gcd_nop_project.history("job0").get("record", "endtime", step=step, index="0")
+        assert gcd_nop_project.history("job0").get("record", "status", step=step, index="0") == \
+            NodeStatus.SUCCESS
+
+
+def test_read_previous_information(gcd_nop_project):
+    assert gcd_nop_project.run()
+
+    manifest = str(next(Path(jobdir(gcd_nop_project)).glob("steptwo/0/outputs/*.pkg.json")))
+    status, records = Scheduler._read_previous_information("steptwo", "0", manifest)
+    assert status == NodeStatus.SUCCESS
+    assert records == Journal.read_sidecar(manifest)
+
+    # Read from the manifest
+    os.remove(Journal.get_sidecar_path(manifest))
+    assert Scheduler._read_previous_information("steptwo", "0", manifest) == (status, records)
+
+
+def test_read_previous_information_status_not_recorded(gcd_nop_project):
+    assert gcd_nop_project.run()
+
+    manifest = str(next(Path(jobdir(gcd_nop_project)).glob("steptwo/0/outputs/*.pkg.json")))
+    journal = Journal()
+    journal.from_dict([])
+    journal.write_sidecar(manifest)
+
+    assert Scheduler._read_previous_information("steptwo", "0", manifest) == \
+        (NodeStatus.SUCCESS, [])
+
+
+def test_read_previous_information_missing():
+    assert Scheduler._read_previous_information("steptwo", "0", "missing.pkg.json") is None
+
+
 @pytest.mark.timeout(60)
 def test_resume_afterskipped(gcd_design):
     project = Project(gcd_design)
@@ -859,6 +944,43 @@ def test_resume_value_changed(gcd_nop_project):
         NodeStatus.SUCCESS
 
 
+@pytest.mark.timeout(60)
+def test_resume_value_changed_branch(gcd_design):
+    project = Project(gcd_design)
+    project.add_fileset("rtl")
+    project.add_fileset("sdc")
+    EditableSchema(project).insert("option", "testing", Parameter("str"))
+
+    flow = Flowgraph("branchflow")
+    flow.node("stepone", NOPTask())
+    for branch in ("a", "b"):
+        flow.node(f"{branch}two", NOPTask())
+        flow.node(f"{branch}three", NOPTask())
+        flow.edge("stepone", f"{branch}two")
+        flow.edge(f"{branch}two", f"{branch}three")
+    project.set_flow(flow)
+
+    assert project.run()
+    run_copy = project.copy()
+    time.sleep(1)  # delay to ensure timestamps differ
+
+    # Change require list of one branch
+    assert project.set("tool", "builtin", "task", "nop", "require", "option,testing",
+                       step="atwo", index="0")
+    assert project.set("option", "testing", "thistest")
+    assert project.run()
+
+    for step in ("stepone", "btwo", "bthree"):
+        assert run_copy.history("job0").get("record", "endtime", step=step, index="0") == \
+            project.history("job0").get("record", "endtime", step=step, index="0")
+    for step in ("atwo", "athree"):
+        assert run_copy.history("job0").get("record", "endtime", step=step, index="0") != \
+            project.history("job0").get("record", "endtime", step=step, index="0")
+    for step in ("stepone", "atwo", "athree", "btwo", "bthree"):
+        assert project.history("job0").get("record", "status", step=step, index="0") == \
+            NodeStatus.SUCCESS
+
+
 def test_check_tool_requirements_local(gcd_nop_project, monkeypatch, caplog):
     monkeypatch.setattr(gcd_nop_project, "_Project__logger", logging.getLogger())
     gcd_nop_project.logger.setLevel(logging.INFO)
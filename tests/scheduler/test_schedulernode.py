@@ -1,5 +1,6 @@
 import logging
 import os
+import pickle
 import pytest
 import re
 import shutil
@@ -19,7 +20,9 @@ from siliconcompiler.tools.builtin.nop import NOPTask
 from siliconcompiler.tools.builtin.join import JoinTask
 from scheduler.tools.echo import EchoTask
 
+from siliconcompiler.schema import Journal
 from siliconcompiler.scheduler import SchedulerNode
+from siliconcompiler.scheduler.fingerprint import NodeFingerprints
 from siliconcompiler.scheduler.schedulernode import SchedulerFlowReset, \
     SchedulerNodeReset, SchedulerNodeResetSilent
 from siliconcompiler.utils.paths import jobdir, workdir
@@ -178,6 +181,59 @@ def test_set_builtin(project):
     assert node.is_builtin is True
 
 
+def test_descriptor(project):
+    node = SchedulerNode(project, "steptwo", "0", replay=True)
+    node.set_builtin()
+    project.write_manifest("base.pkg.json")
+
+    descriptor = node.get_descriptor("base.pkg.json")
+    assert descriptor["manifest"] == "base.pkg.json"
+    assert descriptor["journal"] is None
+
+    copy = SchedulerNode.from_descriptor(descriptor)
+    assert type(copy) is SchedulerNode
+    assert copy.step == "steptwo"
+    assert copy.index == "0"
+    assert copy.is_builtin
+    assert copy.is_replay
+    assert copy.project is not project
+    assert copy.project.name == "testdesign"
+    assert copy.project_cwd == node.project_cwd
+    assert not Journal.access(copy.project).is_journaling()
+
+    # Nodes from the same manifest do not share a project
+    other = SchedulerNode.from_descriptor(descriptor)
+    assert other.project is not copy.project
+    copy.project.set("option", "quiet", True)
+    assert other.project.get("option", "quiet") is False
+
+
+def test_descriptor_with_journal(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    project.write_manifest("base.pkg.json")
+
+    journal = Journal.access(project)
+    journal.start()
+    project.set("record", "status", NodeStatus.SUCCESS, step="stepone", index="0")
+    project.set("option", "quiet", True)
+
+    copy = SchedulerNode.from_descriptor(
+        node.get_descriptor("base.pkg.json", journal=journal.get_records()))
+    assert copy.project.get("record", "status", step="stepone", index="0") == \
+        NodeStatus.SUCCESS
+    assert copy.project.get("option", "quiet") is True
+
+
+def test_descriptor_size(project):
+    for n in range(5):
+        project.set("option", "jobname", f"job{n}")
+        project._record_history()
+
+    node = SchedulerNode(project, "steptwo", "0")
+    assert len(pickle.dumps(node.get_descriptor("base.pkg.json"))) * 100 < \
+        len(pickle.dumps(node))
+
+
 def test_threads(project):
     node = SchedulerNode(project, "steptwo", "0")
     node.task.set_threads(1)
@@ -225,6 +281,7 @@ def test_halt(project):
         node.halt()
     assert project.get("record", "status", step="steptwo", index="0") == NodeStatus.ERROR
     assert os.path.exists("build/testdesign/job0/steptwo/0/outputs/testdesign.pkg.json")
+    assert os.path.exists("build/testdesign/job0/steptwo/0/outputs/testdesign.pkg.json.journal")
 
 
 def test_halt_with_reason(project, monkeypatch, caplog):
@@ -776,6 +833,85 @@ def test_requires_run_all_keys_failed(project, monkeypatch):
         node.requires_run()
 
 
+def test_requires_run_fingerprint(project, monkeypatch):
+    assert project.run()
+
+    # Check against the configuration of the previous run
+    project = Project.from_manifest(
+        filepath=SchedulerNode(project, "steptwo", "0").get_manifest(input=True))
+    node = SchedulerNode(project, "steptwo", "0")
+    node.requires_run()
+
+    fingerprints = NodeFingerprints(NodeFingerprints.get_path(jobdir(project)))
+    manifests = NodeFingerprints.get_stats([node.get_manifest(input=True), node.get_manifest()])
+    fingerprint = fingerprints.get("steptwo", "0", manifests)
+    assert fingerprint["status"]["status"] == NodeStatus.SUCCESS
+
+    # Keypaths are stored as lists
+    option = ["tool", "builtin", "task", "nop", "option"]
+    assert option in fingerprint["value_keys"]
+    assert option in [key for key, _ in fingerprint["keys"]]
+
+    # Check again without loading the manifests
+    def dummy_from_manifest(*args, **kwargs):
+        raise RuntimeError("manifest loaded")
+    monkeypatch.setattr(Project, "from_manifest", dummy_from_manifest)
+    node.requires_run()
+
+    assert project.set("tool", "builtin", "task", "nop", "option", "-change",
+                       step="steptwo", index="0")
+    with pytest.raises(SchedulerNodeReset,
+                       match=r"^\[tool,builtin,task,nop,option\] in steptwo/0 has been "
+                             r"modified from previous run$"):
+        node.requires_run()
+
+
+def test_requires_run_fingerprint_manifest_changed(project):
+    assert project.run()
+
+    # Check against the configuration of the previous run
+    project = Project.from_manifest(
+        filepath=SchedulerNode(project, "steptwo", "0").get_manifest(input=True))
+    node = SchedulerNode(project, "steptwo", "0")
+    node.requires_run()
+
+    # Rewrite the output manifest with a failed status
+    manifest = Project.from_manifest(filepath=node.get_manifest())
+    manifest.set("record", "status", NodeStatus.ERROR, step="steptwo", index="0")
+    manifest.write_manifest(node.get_manifest())
+
+    with pytest.raises(SchedulerNodeResetSilent,
+                       match=r"^Previous step was not successful$"):
+        node.requires_run()
+
+
+def test_requires_run_fingerprint_hash(project, monkeypatch):
+    os.makedirs("refdir")
+    with open("refdir/testfile.txt", "w") as f:
+        f.write("test")
+    project.set("option", "hash", True)
+    project.set("tool", "builtin", "task", "nop", "refdir", "refdir", step="steptwo", index="0")
+    assert project.run()
+
+    # Check against the configuration of the previous run
+    project = Project.from_manifest(
+        filepath=SchedulerNode(project, "steptwo", "0").get_manifest(input=True))
+    node = SchedulerNode(project, "steptwo", "0")
+    node.requires_run()
+
+    # Unchanged files are not hashed again
+    with patch("siliconcompiler.Project.hash_files") as hash_files:
+        node.requires_run()
+        hash_files.assert_not_called()
+
+    with open("refdir/testfile.txt", "w") as f:
+        f.write("changed")
+    with pytest.raises(SchedulerNodeReset,
+                       match=r"^\[tool,builtin,task,nop,refdir\] \(file hash\) in steptwo/0 "
+                             r"has been modified from previous run$"):
+        node.requires_run()
+
+
 def test_check_logfile(project, datadir, monkeypatch, caplog):
     monkeypatch.setattr(project, "_Project__logger", logging.getLogger())
     project.logger.setLevel(logging.INFO)
@@ -979,6 +1115,26 @@ def test_setup_input_directory(project):
     assert not os.path.isfile(input_dir / "dummy.pkg.json")
 
 
+def test_setup_input_directory_journal_sidecar(project):
+    output_dir = Path(workdir(project, step="stepone", index="0")) / "outputs"
+    input_dir = Path(workdir(project, step="steptwo", index="0")) / "inputs"
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(input_dir, exist_ok=True)
+
+    (output_dir / "testdesign.pkg.json").touch()
+    (output_dir / "testdesign.pkg.json.journal").touch()
+    (output_dir / "file0.txt").touch()
+
+    project.set("record", "inputnode", ("stepone", "0"), step="steptwo", index="0")
+    project.set("tool", "builtin", "task", "nop", "input", "file0.txt", step="steptwo", index="0")
+
+    node = SchedulerNode(project, "steptwo", "0")
+    with node.runtime():
+        node.setup_input_directory()
+
+    assert os.listdir(input_dir) == ["file0.txt"]
+
+
 def test_setup_input_directory_directory(project):
     output_dir = Path(workdir(project, step="stepone", index="0")) / "outputs"
     input_dir = Path(workdir(project, step="steptwo", index="0")) / "inputs"
@@ -1239,6 +1395,25 @@ def test_report_output_files_extra_outputs(echo_project, monkeypatch, caplog):
     assert "Halting steptwo/0 due to errors" in caplog.text
 
 
+def test_report_output_files_journal_sidecar(echo_project, monkeypatch, caplog):
+    monkeypatch.setattr(echo_project, "_Project__logger", logging.getLogger())
+    echo_project.set("tool", "echo", "task", "echo", "output", "echothis.txt",
+                     step="steptwo", index="0")
+
+    node = SchedulerNode(echo_project, "steptwo", "0")
+    with node.runtime():
+        os.makedirs(os.path.join(node.workdir, "outputs"), exist_ok=True)
+        echo_project.write_manifest(node.get_manifest())
+        with open(f"{node.get_manifest()}.journal", 'w') as f:
+            f.write("")
+
+        with open(os.path.join(node.workdir, "outputs", "echothis.txt"), 'w') as f:
+            f.write("test")
+
+        node._SchedulerNode__report_output_files()
+    assert "Unexpected output files found" not in caplog.text
+
+
 def test_run_pass(project):
     node = SchedulerNode(project, "stepone", "0")
     node.task.setup_work_directory(node.workdir)
@@ -1537,6 +1712,31 @@ def test_copy_from(project, monkeypatch, caplog, has_graphviz):
     assert output_schema.get("option", "jobname") == "newname"
 
 
+def test_copy_from_journal_sidecar(project):
+    node = SchedulerNode(project, "stepone", "0")
+    with node.runtime():
+        node.task.setup_work_directory(node.workdir)
+        journal = Journal.access(project)
+        journal.start()
+        project.set("option", "clean", True)
+        project.write_manifest(node.get_manifest("output"))
+        journal.write_sidecar(node.get_manifest("output"))
+        journal.stop()
+    source_sidecar = Journal.get_sidecar_path(node.get_manifest("output"))
+    with open(source_sidecar) as f:
+        source = f.read()
+
+    project.set("option", "jobname", "newname")
+    node = SchedulerNode(project, "stepone", "0")
+    node.copy_from("job0")
+
+    assert os.path.exists(node.get_manifest("output"))
+    assert not os.path.exists(Journal.get_sidecar_path(node.get_manifest("output")))
+    with open(source_sidecar) as f:
+        assert f.read() == source
+    assert Journal.read_sidecar(node.get_manifest("output")) is None
+
+
 def test_switch_node(project):
     node0 = SchedulerNode(project, "stepone", "0")
     node1 = node0.switch_node("steptwo", "2")
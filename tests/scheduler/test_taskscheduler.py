@@ -1,17 +1,23 @@
+import glob
 import logging
+import multiprocessing
+import os
 
 import pytest
 
 from threading import Lock
+from unittest.mock import patch
 
 from siliconcompiler import NodeStatus
 from siliconcompiler import Project, Flowgraph, Design
+from siliconcompiler.schema import Journal
 from siliconcompiler.scheduler import TaskScheduler
 from siliconcompiler.scheduler.taskscheduler import utils as imported_utils
 from siliconcompiler.scheduler import SchedulerNode, SCRuntimeError
 
 from siliconcompiler.tools.builtin.nop import NOPTask
 from siliconcompiler.tools.builtin.join import JoinTask
+from siliconcompiler.utils.paths import jobdir
 
 
 @pytest.fixture
@@ -174,6 +180,293 @@ def test_run_dashboard(large_flow, make_tasks, monkeypatch):
     assert len(dashboard.calls[-1]["starttimes"]) == 13
 
 
+@pytest.mark.timeout(180)
+@pytest.mark.parametrize("recycle", [False, True])
+def test_run_workerpool(large_flow, make_tasks, monkeypatch, recycle):
+    def dummy_get_cores(*args, **kwargs):
+        return 2
+    monkeypatch.setattr(imported_utils, "get_cores", dummy_get_cores)
+
+    large_flow.option.scheduler.set_workerpool(True)
+    large_flow.option.scheduler.set_workerrecycle(recycle)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+
+@pytest.mark.timeout(180)
+def test_run_descriptors(large_flow, make_tasks, monkeypatch):
+    # Send nodes to their processes as descriptors, as done for non-fork start methods
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda *args, **kwargs: "spawn")
+    monkeypatch.setattr(TaskScheduler, "_TaskScheduler__max_dispatch_records", 10)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+    assert not glob.glob(os.path.join(jobdir(large_flow), "*.dispatch*.pkg.json"))
+    assert not Journal.access(large_flow).is_journaling()
+
+
+@pytest.mark.timeout(180)
+def test_run_descriptors_project_journaling(large_flow, make_tasks, monkeypatch):
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda *args, **kwargs: "spawn")
+
+    journal = Journal.access(large_flow)
+    journal.start()
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+    # The project's journal is left as it was
+    assert journal.is_journaling()
+    assert any(tuple(record["key"]) == ("record", "status")
+               for record in journal.get_records())
+    assert not glob.glob(os.path.join(jobdir(large_flow), "*.dispatch*.pkg.json"))
+
+
+def test_run_descriptors_cleanup(large_flow, make_tasks, monkeypatch):
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+
+    def run_loop():
+        scheduler._TaskScheduler__get_descriptor(("stepone", "0"))
+        assert glob.glob(os.path.join(jobdir(large_flow), "*.dispatch*.pkg.json"))
+        raise RuntimeError("failed")
+
+    monkeypatch.setattr(scheduler, "_TaskScheduler__run_loop", run_loop)
+    with pytest.raises(RuntimeError, match="^failed$"):
+        scheduler.run(logging.NullHandler())
+
+    assert not glob.glob(os.path.join(jobdir(large_flow), "*.dispatch*.pkg.json"))
+    large_flow.set("option", "clean", True)
+    assert scheduler._TaskScheduler__dispatch_journal.get_records() == []
+
+
+def test_run_failed_inputs(large_flow, make_tasks):
+    for n in range(3):
+        large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index=str(n))
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    assert scheduler.get_nodes_waiting_to_run() == scheduler.get_nodes()
+    scheduler.run(logging.NullHandler())
+
+    assert scheduler.get_running_nodes() == []
+    assert scheduler.get_nodes_waiting_to_run() == [
+        ('steptwo', '0'), ('steptwo', '1'), ('steptwo', '2'),
+        ('jointwo', '0'),
+        ('stepthree', '0'), ('stepthree', '1'), ('stepthree', '2'),
+        ('jointhree', '0')]
+    for step, index in scheduler.get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.PENDING
+
+
+class _SimulatedRun:
+    """
+    Replaces the node processes of a scheduler with simulated processes
+    which complete after a fixed duration.
+    """
+
+    class Process:
+        exitcode = 0
+
+        def __init__(self, sim, node):
+            self.sim = sim
+            self.node = node
+            self.end = None
+
+        def start(self):
+            self.end = self.sim.time + self.sim.durations[self.node]
+            self.sim.running.append(self)
+            self.sim.launches.append((self.sim.time, self.node))
+
+        def is_alive(self):
+            return self in self.sim.running
+
+    def __init__(self, proj, scheduler, durations, monkeypatch):
+        self.proj = proj
+        self.durations = durations
+        self.time = 0
+        self.running = []
+        self.launches = []
+
+        for node in scheduler.get_nodes():
+            scheduler._TaskScheduler__nodes[node]["proc"] = _SimulatedRun.Process(self, node)
+        monkeypatch.setattr(scheduler, "_TaskScheduler__wait_for_nodes", self.wait)
+
+    def wait(self):
+        self.time = min([proc.end for proc in self.running])
+        for proc in list(self.running):
+            if proc.end == self.time:
+                self.running.remove(proc)
+                self.proj.set("record", "status", NodeStatus.SUCCESS,
+                              step=proc.node[0], index=proc.node[1])
+
+
+@pytest.fixture
+def wide_flow(monkeypatch):
+    def dummy_get_cores(*args, **kwargs):
+        return 2
+    monkeypatch.setattr(imported_utils, "get_cores", dummy_get_cores)
+
+    flow = Flowgraph("testflow")
+    flow.node("start", NOPTask())
+    flow.node("place", NOPTask())
+    flow.node("route", NOPTask())
+    flow.node("finish", NOPTask())
+    flow.edge("start", "place")
+    flow.edge("place", "route")
+    flow.edge("route", "finish")
+    for n in range(6):
+        flow.node("check", NOPTask(), index=n)
+        flow.edge("start", "check", head_index=n)
+
+    design = Design("testdesign")
+    with design.active_fileset("rtl"):
+        design.set_topmodule("top")
+
+    proj = Project(design)
+    proj.add_fileset("rtl")
+    proj.set_flow(flow)
+
+    for step, index in flow.get_nodes():
+        SchedulerNode(proj, step, index).setup()
+        proj.set("record", "status", NodeStatus.PENDING, step=step, index=index)
+
+    durations = {("start", "0"): 1, ("place", "0"): 10, ("route", "0"): 10, ("finish", "0"): 10}
+    for n in range(6):
+        durations[("check", str(n))] = 5
+
+    return proj, durations
+
+
+def test_run_critical_path_from_history(wide_flow, make_tasks, monkeypatch):
+    proj, durations = wide_flow
+
+    for (step, index), duration in durations.items():
+        proj.set("metric", "tasktime", duration, step=step, index=index)
+    proj._record_history()
+    proj.unset("metric", "tasktime")
+
+    scheduler = TaskScheduler(proj, make_tasks(proj))
+    sim = _SimulatedRun(proj, scheduler, durations, monkeypatch)
+    scheduler.run(logging.NullHandler())
+
+    assert sim.launches[0:3] == [(0, ("start", "0")), (1, ("place", "0")), (1, ("check", "0"))]
+    assert (11, ("route", "0")) in sim.launches
+    assert (21, ("finish", "0")) in sim.launches
+    assert sim.time == 31
+
+
+def test_run_critical_path_tool_defaults(wide_flow, make_tasks, monkeypatch):
+    proj, durations = wide_flow
+
+    # builtin tasks have no default duration, so nodes run in execution order
+    scheduler = TaskScheduler(proj, make_tasks(proj))
+    sim = _SimulatedRun(proj, scheduler, durations, monkeypatch)
+    scheduler.run(logging.NullHandler())
+
+    assert [node for _, node in sim.launches] == scheduler.get_nodes()
+    assert sim.time == 46
+
+
+def _max_concurrent(sim, durations, step):
+    starts = [(time, node) for time, node in sim.launches if node[0] == step]
+    return max([len([node for start, node in starts
+                     if start <= time < start + durations[node]])
+                for time, _ in starts])
+
+
+@pytest.mark.parametrize("maxmemory,expect", [(10000, 2), (1000, 1), (None, 6)])
+def test_run_memory_declared(wide_flow, make_tasks, monkeypatch, maxmemory, expect):
+    proj, durations = wide_flow
+
+    monkeypatch.setattr(imported_utils, "get_cores", lambda *args, **kwargs: 8)
+    monkeypatch.setattr(imported_utils, "get_available_memory", lambda: 100000 * 1024 * 1024)
+
+    proj.option.scheduler.set_maxmemory(maxmemory)
+    for n in range(6):
+        proj.option.scheduler.set_memory(4000, step="check", index=n)
+
+    scheduler = TaskScheduler(proj, make_tasks(proj))
+    sim = _SimulatedRun(proj, scheduler, durations, monkeypatch)
+    scheduler.run(logging.NullHandler())
+
+    assert _max_concurrent(sim, durations, "check") == expect
+    for step, index in scheduler.get_nodes():
+        assert proj.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+
+def test_run_memory_from_history(wide_flow, make_tasks, monkeypatch):
+    proj, durations = wide_flow
+
+    monkeypatch.setattr(imported_utils, "get_cores", lambda *args, **kwargs: 8)
+    monkeypatch.setattr(imported_utils, "get_available_memory", lambda: 100000 * 1024 * 1024)
+
+    for n in range(6):
+        proj.set("metric", "memory", 4000 * 1024 * 1024, step="check", index=n)
+    proj._record_history()
+    proj.unset("metric", "memory")
+
+    proj.option.scheduler.set_maxmemory(10000)
+
+    scheduler = TaskScheduler(proj, make_tasks(proj))
+    sim = _SimulatedRun(proj, scheduler, durations, monkeypatch)
+    scheduler.run(logging.NullHandler())
+
+    assert _max_concurrent(sim, durations, "check") == 2
+
+
+def test_history_read_once(wide_flow, make_tasks):
+    proj, _ = wide_flow
+
+    for n in range(6):
+        proj.set("metric", "memory", 4000 * 1024 * 1024, step="check", index=n)
+    proj._record_history()
+    proj.set("option", "jobname", "job1")
+    proj._record_history()
+    proj.set("option", "jobname", "job0")
+
+    with patch.object(proj, "history", wraps=proj.history) as history:
+        TaskScheduler(proj, make_tasks(proj))
+    assert sorted([call.args[0] for call in history.call_args_list]) == ["job0", "job1"]
+
+
+def test_history_not_read_without_local_nodes(wide_flow, make_tasks, monkeypatch):
+    proj, _ = wide_flow
+
+    proj._record_history()
+
+    monkeypatch.setattr(SchedulerNode, "is_local", property(lambda self: False))
+    with patch.object(proj, "history", wraps=proj.history) as history:
+        TaskScheduler(proj, make_tasks(proj))
+    history.assert_not_called()
+
+
+def test_run_memory_available(wide_flow, make_tasks, monkeypatch):
+    proj, durations = wide_flow
+
+    monkeypatch.setattr(imported_utils, "get_cores", lambda *args, **kwargs: 8)
+    monkeypatch.setattr(imported_utils, "get_available_memory", lambda: 3000 * 1024 * 1024)
+
+    proj.option.scheduler.set_maxmemory(100000)
+    for n in range(6):
+        proj.option.scheduler.set_memory(4000, step="check", index=n)
+
+    scheduler = TaskScheduler(proj, make_tasks(proj))
+    sim = _SimulatedRun(proj, scheduler, durations, monkeypatch)
+    scheduler.run(logging.NullHandler())
+
+    assert _max_concurrent(sim, durations, "check") == 1
+
+
 def test_run_control_c(large_flow, make_tasks, monkeypatch):
     scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
 
@@ -0,0 +1,118 @@
+import multiprocessing.connection
+import os
+import sys
+
+import pytest
+
+from siliconcompiler.scheduler.workerpool import WorkerPool
+
+
+class _Logger:
+    handlers = []
+
+
+class _Node:
+    """
+    Minimal node which records the process it ran in.
+    """
+    logger = _Logger()
+    project = None
+
+    def __init__(self, path, exitcode=None):
+        self.path = path
+        self.exitcode = exitcode
+
+    @classmethod
+    def from_descriptor(cls, descriptor):
+        return cls(descriptor["path"], exitcode=descriptor["exitcode"])
+
+    def get_descriptor(self):
+        return {"cls": type(self), "path": self.path, "exitcode": self.exitcode}
+
+    def set_queue(self, pipe, queue):
+        pass
+
+    def run(self):
+        with open(self.path, "w") as f:
+            f.write(str(os.getpid()))
+        if self.exitcode is not None:
+            sys.exit(self.exitcode)
+
+
+@pytest.fixture
+def no_packages(monkeypatch):
+    monkeypatch.setattr("siliconcompiler.scheduler.workerpool.Resolver.get_cache",
+                        lambda project: {})
+
+
+def _run(pool, node):
+    task = pool.task(node.get_descriptor)
+    task.start()
+    task.join()
+    assert not task.is_alive()
+    with open(node.path) as f:
+        return task, int(f.read())
+
+
+@pytest.mark.timeout(60)
+def test_pool_reuse(no_packages):
+    pool = WorkerPool(1)
+    pool.start()
+    try:
+        task, pid0 = _run(pool, _Node("node0"))
+        assert task.exitcode == 0
+        assert task.packages == {}
+
+        task, pid1 = _run(pool, _Node("node1"))
+        assert task.exitcode == 0
+    finally:
+        pool.close()
+
+    assert pid0 == pid1
+    assert pid0 != os.getpid()
+
+
+@pytest.mark.timeout(60)
+def test_pool_recycle(no_packages):
+    pool = WorkerPool(1, recycle=True)
+    pool.start()
+    try:
+        _, pid0 = _run(pool, _Node("node0"))
+        _, pid1 = _run(pool, _Node("node1"))
+    finally:
+        pool.close()
+
+    assert pid0 != pid1
+
+
+@pytest.mark.timeout(60)
+def test_pool_failed_node(no_packages):
+    pool = WorkerPool(1)
+    pool.start()
+    try:
+        task, pid0 = _run(pool, _Node("node0", exitcode=1))
+        assert task.exitcode == 1
+        assert task.packages is None
+
+        # Worker is replaced after a failure
+        task, pid1 = _run(pool, _Node("node1"))
+        assert task.exitcode == 0
+    finally:
+        pool.close()
+
+    assert pid0 != pid1
+
+
+@pytest.mark.timeout(60)
+def test_pool_sentinel(no_packages):
+    pool = WorkerPool(2)
+    pool.start()
+    try:
+        task = pool.task(_Node("node0").get_descriptor)
+        task.start()
+
+        assert multiprocessing.connection.wait([task.sentinel], timeout=30) == [task.sentinel]
+        assert not task.is_alive()
+        assert task.exitcode == 0
+    finally:
+        pool.close()
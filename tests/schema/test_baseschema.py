@@ -1,5 +1,7 @@
+import json
 import logging
 import pytest
+import shutil
 
 import os.path
 
@@ -9,6 +11,7 @@ from unittest.mock import patch
 from siliconcompiler.schema import BaseSchema, LazyLoad
 from siliconcompiler.schema import EditableSchema
 from siliconcompiler.schema import Parameter, PerNode
+from siliconcompiler.schema import baseschema
 from siliconcompiler.schema import Journal
 
 
@@ -82,6 +85,345 @@ def test_copy_with_child_default():
         check_copy.get("test0", field="schema")
 
 
+def test_copy_shares_children():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+    edit.insert("test3", "test4", Parameter("str"))
+
+    check_copy = schema.copy()
+
+    assert check_copy._BaseSchema__manifest["test0"] is schema._BaseSchema__manifest["test0"]
+    assert check_copy._BaseSchema__manifest["test3"] is schema._BaseSchema__manifest["test3"]
+
+
+def test_copy_modify_copy():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+    edit.insert("test3", "test4", Parameter("str"))
+    assert schema.set("test0", "test1", "test2", "orig")
+
+    check_copy = schema.copy()
+    assert check_copy.set("test0", "test1", "test2", "copy")
+
+    assert schema.get("test0", "test1", "test2") == "orig"
+    assert check_copy.get("test0", "test1", "test2") == "copy"
+
+    # Only the modified path is duplicated
+    assert check_copy._BaseSchema__manifest["test0"] is not \
+        schema._BaseSchema__manifest["test0"]
+    assert check_copy._BaseSchema__manifest["test3"] is schema._BaseSchema__manifest["test3"]
+
+
+def test_copy_modify_original():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+    assert schema.set("test0", "test1", "test2", "orig")
+
+    check_copy = schema.copy()
+    assert schema.set("test0", "test1", "test2", "new")
+
+    assert schema.get("test0", "test1", "test2") == "new"
+    assert check_copy.get("test0", "test1", "test2") == "orig"
+    assert check_copy.get("test0", "test1", field="schema")._parent() is \
+        check_copy.get("test0", field="schema")
+
+
+def test_copy_modify_original_held_section():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+    section = schema.get("test0", "test1", field="schema")
+
+    check_copy = schema.copy()
+    assert section.set("test2", "new")
+
+    assert schema.get("test0", "test1", "test2") == "new"
+    assert check_copy.get("test0", "test1", "test2") is None
+
+
+def test_copy_modify_original_held_parameter():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    param = schema.get("test0", "test1", field=None)
+
+    check_copy = schema.copy()
+    assert param.set("new")
+
+    assert schema.get("test0", "test1") == "new"
+    assert check_copy.get("test0", "test1") is None
+
+
+def test_copy_modify_original_held_parameter_after_set():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    param = schema.get("test0", "test1", field=None)
+    assert param.set("old")
+
+    check_copy = schema.copy()
+    assert param.set("new")
+
+    assert schema.get("test0", "test1") == "new"
+    assert check_copy.get("test0", "test1") == "old"
+
+    check_copy = schema.copy()
+    param.get(field=None).set("newer")
+
+    assert schema.get("test0", "test1") == "newer"
+    assert check_copy.get("test0", "test1") == "new"
+
+
+def test_copy_modify_original_held_values():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[file]"))
+    assert schema.set("test0", "test1", "test.v")
+    vals = schema.get("test0", "test1", field=None).getvalues(return_values=False)
+
+    check_copy = schema.copy()
+    vals[0][0].set("mutated.v")
+
+    assert schema.get("test0", "test1") == ["mutated.v"]
+    assert check_copy.get("test0", "test1") == ["test.v"]
+
+
+def test_copy_modify_original_set_value_field():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[file]"))
+    values = schema.set("test0", "test1", "test.v")
+
+    check_copy = schema.copy()
+    values[0].set("root", field="dataroot")
+
+    assert schema.get("test0", "test1", field="dataroot") == ["root"]
+    assert check_copy.get("test0", "test1", field="dataroot") == [None]
+
+
+def test_copy_modify_original_default_pernode():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("int", pernode=PerNode.OPTIONAL))
+
+    schema = schema.copy()
+    assert schema.set("test0", "key", "test1", 2, step="step", index="0")
+    assert schema.set("test0", "key", "test1", 8, step="step")
+
+    check_copy = schema.copy()
+    assert schema.set("test0", "key", "test1", 7)
+    assert schema.set("test0", "key", "test1", 9, step="step", index="0")
+
+    assert schema.get("test0", "key", "test1") == 7
+    assert schema.get("test0", "key", "test1", step="step", index="0") == 9
+    assert check_copy.get("test0", "key", "test1") is None
+    assert check_copy.get("test0", "key", "test1", step="step", index="0") == 2
+    assert check_copy.get("test0", "key", "test1", step="step", index="1") == 8
+    assert check_copy.get("test0", "key", field="schema")._parent() is \
+        check_copy.get("test0", field="schema")
+
+
+def test_copy_modify_copy_default_pernode():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("int", pernode=PerNode.OPTIONAL))
+
+    check_copy = schema.copy()
+    assert check_copy.set("test0", "key", "test1", 2, step="step")
+    assert check_copy.set("test0", "key", "test1", 3)
+
+    assert schema.getkeys("test0") == tuple()
+    assert check_copy.get("test0", "key", "test1") == 3
+    assert check_copy.get("test0", "key", "test1", step="step") == 2
+
+
+def test_copy_insert_remove():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    edit.insert("test0", "test2", Parameter("str"))
+
+    check_copy = schema.copy()
+    EditableSchema(check_copy).insert("test0", "test3", Parameter("str"))
+    EditableSchema(schema).remove("test0", "test2")
+
+    assert schema.getkeys("test0") == ("test1",)
+    assert check_copy.getkeys("test0") == ("test1", "test2", "test3")
+
+
+def test_copy_of_copy():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+
+    copy0 = schema.copy()
+    copy1 = copy0.copy()
+    assert schema.set("test0", "test1", "orig")
+    assert copy0.set("test0", "test1", "copy0")
+
+    assert schema.get("test0", "test1") == "orig"
+    assert copy0.get("test0", "test1") == "copy0"
+    assert copy1.get("test0", "test1") is None
+
+
+def test_copy_pickle():
+    import pickle
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "orig")
+
+    check_copy = pickle.loads(pickle.dumps(schema.copy()))
+    assert check_copy.get("test0", "test1") == "orig"
+    assert check_copy.get("test0", field="schema")._parent() is check_copy
+
+    assert schema.set("test0", "test1", "new")
+    assert check_copy.get("test0", "test1") == "orig"
+
+
+def test_copy_lazy():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    schema = NewSchema()
+    schema.set("test0", "test1", "orig")
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        new_schema = NewSchema.from_manifest(cfg=schema.getdict(), lazyload=True)
+        check_copy = new_schema.copy()
+        assert check_copy.set("test0", "test1", "copy")
+
+    assert new_schema.get("test0", "test1") == "orig"
+    assert check_copy.get("test0", "test1") == "copy"
+
+
+def test_keypath_index_skips_search():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+
+    assert schema.set("test0", "test1", "value")
+    assert schema.get("test0", "test1") == "value"
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__search") as search:
+        assert schema.set("test0", "test1", "newvalue")
+        assert schema.get("test0", "test1") == "newvalue"
+        assert schema.valid("test0", "test1")
+        search.assert_not_called()
+
+
+def test_keypath_index_insert_remove():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str", defvalue="first"))
+
+    assert schema.get("test0", "test1") == "first"
+
+    edit.remove("test0", "test1")
+    assert not schema.valid("test0", "test1")
+    with pytest.raises(KeyError):
+        schema.get("test0", "test1")
+
+    edit.insert("test0", "test1", Parameter("str", defvalue="second"))
+    assert schema.get("test0", "test1") == "second"
+
+
+def test_keypath_index_default():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str", defvalue="default"))
+
+    assert schema.get("test0", "key", "test1") == "default"
+    assert not schema.valid("test0", "key", "test1")
+    assert schema.valid("test0", "key", "test1", default_valid=True)
+
+    assert schema.set("test0", "key", "test1", "value")
+    assert schema.get("test0", "key", "test1") == "value"
+    assert schema.get("test0", "default", "test1") == "default"
+    assert schema.valid("test0", "key", "test1")
+
+    schema.remove("test0", "key")
+    assert schema.get("test0", "key", "test1") == "default"
+
+
+def test_keypath_index_copy():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "orig")
+
+    check_copy = schema.copy()
+    assert schema.set("test0", "test1", "modified")
+    assert check_copy.set("test0", "test1", "copy")
+
+    assert schema.get("test0", "test1") == "modified"
+    assert check_copy.get("test0", "test1") == "copy"
+
+
+def test_keypath_index_copy_keeps_source():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    other = BaseSchema()
+    EditableSchema(other).insert("test0", "test1", Parameter("str"))
+
+    assert schema.set("test0", "test1", "orig")
+    assert other.set("test0", "test1", "other")
+
+    schema.copy()
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__search") as search:
+        assert schema.get("test0", "test1") == "orig"
+        assert other.get("test0", "test1") == "other"
+        search.assert_not_called()
+
+
+def test_keypath_index_copy_detached():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+    assert schema.set("test0", "test1", "test2", "orig")
+
+    check_copy = schema.copy()
+    assert check_copy.get("test0", "test1", "test2") == "orig"
+
+    # The copy replaces the sections it borrowed
+    assert schema.set("test0", "test1", "test2", "modified")
+    assert check_copy.get("test0", "test1", "test2") == "orig"
+
+    assert check_copy.set("test0", "test1", "test2", "copy")
+    assert schema.get("test0", "test1", "test2") == "modified"
+    assert check_copy.get("test0", "test1", "test2") == "copy"
+
+
+def test_keypath_index_read_manifest(tmp_path):
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "saved")
+    schema.write_manifest(tmp_path / "test.json")
+
+    assert schema.set("test0", "test1", "modified")
+    assert schema.get("test0", "test1") == "modified"
+
+    schema.read_manifest(tmp_path / "test.json")
+    assert schema.get("test0", "test1") == "saved"
+
+
 def test_get_value():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -467,6 +809,85 @@ def test_allkeys_end_parameter():
     assert schema.allkeys("test1", "test3") == set()
 
 
+def test_allkeys_cached():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+
+    keys = schema.allkeys()
+    assert keys == {('test0', 'default', 'test1')}
+    keys.add(('test2',))
+
+    with patch("siliconcompiler.schema.Parameter.get") as get:
+        assert schema.allkeys() == {('test0', 'default', 'test1')}
+        assert schema.allkeys("test0") == {('default', 'test1')}
+        get.assert_not_called()
+
+
+def test_allkeys_cache_cleared():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert schema.allkeys(include_default=False) == set()
+
+    # default expansion
+    assert schema.set("test0", "test2", "test1", "hello")
+    assert schema.allkeys(include_default=False) == {('test0', 'test2', 'test1')}
+
+    # remove
+    schema.remove("test0", "test2")
+    assert schema.allkeys(include_default=False) == set()
+
+    # insert and remove in a child
+    child = schema.get("test0", field="schema")
+    assert child.allkeys() == {('default', 'test1')}
+    edit.insert("test0", "test3", Parameter("str"))
+    assert child.allkeys() == {('default', 'test1'), ('test3',)}
+    assert schema.allkeys() == {('test0', 'default', 'test1'), ('test0', 'test3')}
+    EditableSchema(child).remove("test3")
+    assert schema.allkeys() == {('test0', 'default', 'test1')}
+
+
+def test_allkeys_cache_copy():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert schema.allkeys() == {('test0', 'default', 'test1')}
+
+    check_copy = schema.copy()
+    assert check_copy.set("test0", "test2", "test1", "hello")
+
+    assert schema.allkeys() == {('test0', 'default', 'test1')}
+    assert check_copy.allkeys() == {('test0', 'default', 'test1'), ('test0', 'test2', 'test1')}
+
+
+def test_allpathkeys():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "file", Parameter("[file]"))
+    edit.insert("test0", "default", "dir", Parameter("dir"))
+    edit.insert("test0", "default", "str", Parameter("str"))
+    edit.insert("test1", Parameter("(str,file)"))
+
+    assert schema.set("test0", "test2", "str", "hello")
+
+    assert schema._allpathkeys() == {
+        ('test0', 'default', 'file'),
+        ('test0', 'default', 'dir'),
+        ('test0', 'test2', 'file'),
+        ('test0', 'test2', 'dir'),
+        ('test1',)
+    }
+    assert schema._allpathkeys(include_default=False) == {
+        ('test0', 'test2', 'file'),
+        ('test0', 'test2', 'dir'),
+        ('test1',)
+    }
+    assert schema._allpathkeys("test0", "test2") == {('file',), ('dir',)}
+    assert schema._allpathkeys("test1") == set()
+    assert schema._allpathkeys("notthis") == set()
+
+
 def test_getdict():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -918,6 +1339,448 @@ def test_write_manifest_gz_stdjson(monkeypatch):
     assert os.path.isfile("test.json.gz")
 
 
+def test_write_manifest_zst():
+    zstandard = pytest.importorskip("zstandard")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "value")
+
+    assert not os.path.isfile("test.json.zst")
+    schema.write_manifest("test.json.zst")
+    assert os.path.isfile("test.json.zst")
+
+    with open("test.json.zst", "rb") as f:
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(f.read())
+    assert json.loads(data) == BaseSchema._read_manifest("test.json.zst")
+
+    new_schema = BaseSchema()
+    EditableSchema(new_schema).insert("test0", "test1", Parameter("str"))
+    new_schema.read_manifest("test.json.zst")
+    assert new_schema.get("test0", "test1") == "value"
+
+
+def test_read_manifest_zst_multiple_frames():
+    zstandard = pytest.importorskip("zstandard")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "value")
+    schema.write_manifest("test.json")
+
+    with open("test.json", "rb") as f:
+        data = f.read()
+    compressor = zstandard.ZstdCompressor()
+    with open("test.json.zst", "wb") as f:
+        f.write(compressor.compress(data[:10]))
+        f.write(compressor.compress(data[10:]))
+
+    new_schema = BaseSchema()
+    EditableSchema(new_schema).insert("test0", "test1", Parameter("str"))
+    new_schema.read_manifest("test.json.zst")
+    assert new_schema.get("test0", "test1") == "value"
+
+
+def test_write_manifest_zst_no_zstd(monkeypatch):
+    from siliconcompiler.schema import baseschema
+    monkeypatch.setattr(baseschema, '_has_zstd', False)
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+
+    assert not os.path.isfile("test.json.zst")
+    with pytest.raises(RuntimeError,
+                       match=r"^zstd is not available, install siliconcompiler\[zstd\]$"):
+        schema.write_manifest("test.json.zst")
+    assert not os.path.isfile("test.json.zst")
+
+
+def test_read_manifest_zst_no_zstd(monkeypatch):
+    pytest.importorskip("zstandard")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    schema.write_manifest("test.json.zst")
+
+    from siliconcompiler.schema import baseschema
+    monkeypatch.setattr(baseschema, '_has_zstd', False)
+    with pytest.raises(RuntimeError,
+                       match=r"^zstd is not available, install siliconcompiler\[zstd\]$"):
+        BaseSchema._read_manifest("test.json.zst")
+
+
+@pytest.mark.parametrize("ext", ["json", "json.gz", "json.zst"])
+def test_read_manifest_detect_compression(ext):
+    if ext.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.set("test0", "test1", "value")
+    schema.write_manifest(f"test.{ext}")
+
+    # Compression is detected from the contents rather than the extension
+    os.rename(f"test.{ext}", "test.json")
+    assert BaseSchema._read_manifest("test.json") == schema.getdict()
+
+
+@pytest.fixture
+def encoding_schema():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str"))
+            edit.insert("test0", "test2", Parameter("[int]"))
+            edit.insert("test3", "default", "test4", Parameter("str"))
+            edit.insert("test5", "test6", "test7", Parameter("bool"))
+
+    return NewSchema()
+
+
+def _check_written_manifest(schema):
+    import json as stdjson
+    from siliconcompiler.schema import baseschema
+    with open("test.json") as f:
+        content = f.read()
+    if baseschema._has_orjson:
+        expect = baseschema.json.dumps(schema.getdict(), option=baseschema.json.OPT_INDENT_2)
+        assert content == expect.decode()
+    else:
+        assert content == stdjson.dumps(schema.getdict(), indent=2)
+
+
+def test_write_manifest_encoding(encoding_schema):
+    encoding_schema.set("test3", "test8", "test4", "hello")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema.set("test0", "test1", "world")
+    encoding_schema.add("test0", "test2", 1)
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema.set("test3", "test9", "test4", "new")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema.remove("test3", "test8")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_manifest_encoding_stdjson(monkeypatch, encoding_schema):
+    import json
+    from siliconcompiler.schema import baseschema
+    monkeypatch.setattr(baseschema, 'json', json)
+    monkeypatch.setattr(baseschema, '_has_orjson', False)
+
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema.set("test0", "test1", "world")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_manifest_encoding_cached(encoding_schema):
+    encoding_schema.write_manifest("test.json")
+
+    test0 = encoding_schema.get("test0", field="schema")
+    test5 = encoding_schema.get("test5", field="schema")
+    encoding_schema.write_manifest("test.json")
+
+    assert test0._BaseSchema__encoding.pieces is not None
+    assert test5._BaseSchema__encoding.pieces is not None
+    test5_pieces = test5._BaseSchema__encoding.pieces
+    test6 = test5._BaseSchema__manifest["test6"]
+    test6_pieces = test6._BaseSchema__encoding.pieces
+    assert test6_pieces is not None
+
+    # Twice to use the keypath index
+    for value in ("hello", "world"):
+        encoding_schema.set("test0", "test1", value)
+        assert test0._BaseSchema__encoding.pieces is None
+        assert encoding_schema._BaseSchema__encoding.pieces is None
+        encoding_schema.write_manifest("test.json")
+        _check_written_manifest(encoding_schema)
+
+    assert test5._BaseSchema__encoding.pieces is test5_pieces
+    assert test6._BaseSchema__encoding.pieces is test6_pieces
+
+
+def test_write_manifest_encoding_section(encoding_schema):
+    encoding_schema.write_manifest("test.json")
+
+    test5 = encoding_schema.get("test5", field="schema")
+    encoding_schema.write_manifest("test.json")
+    assert encoding_schema._BaseSchema__encoding.pieces is not None
+
+    test5.set("test6", "test7", True)
+    assert encoding_schema._BaseSchema__encoding.pieces is None
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_manifest_encoding_held_parameter(encoding_schema):
+    encoding_schema.write_manifest("test.json")
+
+    param = encoding_schema.get("test5", "test6", "test7", field=None)
+    encoding_schema.write_manifest("test.json")
+    param.set(True)
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    param.set(False)
+    del param
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_manifest_encoding_set_values(encoding_schema):
+    test0 = encoding_schema.get("test0", field="schema")
+    test3 = encoding_schema.get("test3", field="schema")
+    test5 = encoding_schema.get("test5", field="schema")
+
+    encoding_schema.set("test0", "test1", "hello")
+    encoding_schema.set("test0", "test2", [1, 2])
+    encoding_schema.set("test3", "test8", "test4", "world")
+    encoding_schema.set("test5", "test6", "test7", True)
+    encoding_schema.get("test0", "test1", field=None)
+    encoding_schema.write_manifest("test.json")
+
+    test0_pieces = test0._BaseSchema__encoding.pieces
+    test3_pieces = test3._BaseSchema__encoding.pieces
+    assert test0_pieces is not None
+    assert test3_pieces is not None
+    assert test5._BaseSchema__encoding.pieces is not None
+
+    encoding_schema.set("test5", "test6", "test7", False)
+    with patch("siliconcompiler.schema.baseschema._encode_json",
+               wraps=baseschema._encode_json) as encode:
+        encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    # Only the modified parameter is encoded again
+    params = [call.args[0] for call in encode.call_args_list
+              if isinstance(call.args[0], dict) and "type" in call.args[0]]
+    assert params == [encoding_schema.getdict("test5", "test6", "test7")]
+    assert test0._BaseSchema__encoding.pieces is test0_pieces
+    assert test3._BaseSchema__encoding.pieces is test3_pieces
+    assert test5._BaseSchema__encoding.pieces is not None
+
+
+def test_write_manifest_encoding_held_values(encoding_schema):
+    value = encoding_schema.set("test0", "test1", "hello")
+    encoding_schema.write_manifest("test.json")
+    assert encoding_schema._BaseSchema__encoding.pieces is not None
+
+    value.set("world")
+    assert encoding_schema._BaseSchema__encoding.pieces is None
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+    assert encoding_schema.get("test0", "test1") == "world"
+
+
+def test_write_manifest_encoding_journal(encoding_schema):
+    encoding_schema.write_manifest("test.json")
+
+    journal = Journal.access(encoding_schema)
+    journal.start()
+    journal.add_type("get")
+    encoding_schema.set("test0", "test1", "hello")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema.get("test5", "test6", "test7")
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    journal.stop()
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_manifest_encoding_copy(encoding_schema):
+    encoding_schema.write_manifest("test.json")
+
+    schema_copy = encoding_schema.copy()
+    schema_copy.set("test0", "test1", "copy")
+    schema_copy.write_manifest("test.json")
+    _check_written_manifest(schema_copy)
+
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+    assert encoding_schema.get("test0", "test1") is None
+
+
+def _read_schema(schema, filepath, lazyload=LazyLoad.ON):
+    # Classes defined in tests cannot be found from the manifest
+    new_schema = schema.__class__()
+    new_schema._from_dict(BaseSchema._read_manifest(filepath, lazy=True), [], lazyload=lazyload)
+    return new_schema
+
+
+def test_write_external_manifest(encoding_schema):
+    encoding_schema.set("test5", "test6", "test7", True)
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+
+    assert BaseSchema._read_manifest("test5.json") == test5.getdict()
+
+    # Manifests include the section
+    encoding_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+    encoding_schema._write_linked_manifest("test.json")
+    with open("test.json") as f:
+        manifest = json.load(f)
+    assert manifest["test5"] == {"__external__": "test5.json"}
+    assert manifest["__linked__"] == ["test5"]
+    assert BaseSchema._read_manifest("test.json")["test5"] == \
+        {"__external__": os.path.abspath("test5.json")}
+
+    new_schema = _read_schema(encoding_schema, "test.json")
+    assert new_schema.get("test5", "test6", "test7") is True
+    assert new_schema.getdict() == encoding_schema.getdict()
+    assert new_schema.getdict("test5") == encoding_schema.getdict("test5")
+
+    # Reading does not modify the section
+    new_schema._write_linked_manifest("test.json")
+    with open("test.json") as f:
+        assert json.load(f)["test5"] == {"__external__": "test5.json"}
+
+
+def test_write_external_manifest_lazy_child(encoding_schema):
+    encoding_schema._write_external_manifest("root.json")
+
+    new_schema = _read_schema(encoding_schema, "root.json")
+    test5 = new_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+
+    assert test5.get("test6", "test7") is False
+    new_schema._write_linked_manifest("test.json")
+    manifest = BaseSchema._read_manifest("test.json")
+    assert manifest["test5"] == {"__external__": os.path.abspath("test5.json")}
+
+
+def test_write_external_manifest_modified(encoding_schema):
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+
+    # Twice to use the keypath index
+    for value in (True, False):
+        encoding_schema._write_linked_manifest("test.json")
+        encoding_schema.set("test5", "test6", "test7", value)
+        encoding_schema._write_linked_manifest("test.json")
+        _check_written_manifest(encoding_schema)
+
+
+def test_write_external_manifest_held_parameter(encoding_schema):
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+
+    param = test5.get("test6", "test7", field=None)
+    param.set(True)
+    encoding_schema._write_linked_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_external_manifest_alternate(encoding_schema):
+    encoding_schema.set("test5", "test6", "test7", True)
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+
+    for _ in range(2):
+        encoding_schema._write_linked_manifest("test.json")
+        assert BaseSchema._read_manifest("test.json")["test5"] == \
+            {"__external__": os.path.abspath("test5.json")}
+
+        encoding_schema.write_manifest("test.json")
+        _check_written_manifest(encoding_schema)
+
+
+def test_write_external_manifest_binary(encoding_schema):
+    encoding_schema.set("test0", "test1", "hello")
+    test0 = encoding_schema.get("test0", field="schema")
+    test0._write_external_manifest("test0.pkg.bin")
+
+    encoding_schema._write_linked_manifest("test.pkg.bin")
+    assert BaseSchema._read_manifest("test.pkg.bin")["test0"] == \
+        {"__external__": os.path.abspath("test0.pkg.bin")}
+
+    new_schema = _read_schema(encoding_schema, "test.pkg.bin")
+    assert new_schema.get("test0", "test1") == "hello"
+    assert new_schema.getdict() == encoding_schema.getdict()
+
+    encoding_schema.write_manifest("test.pkg.bin")
+    assert BaseSchema._read_manifest("test.pkg.bin") == encoding_schema.getdict()
+
+    # Other .bin files are written as JSON
+    encoding_schema.write_manifest("test.bin")
+    with open("test.bin") as f:
+        assert json.load(f) == encoding_schema.getdict()
+
+
+def test_write_external_manifest_read_linked(encoding_schema):
+    encoding_schema.set("test5", "test6", "test7", True)
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+    encoding_schema._write_linked_manifest("test.json")
+
+    # Manifests written from a linked manifest include the section
+    new_schema = _read_schema(encoding_schema, "test.json")
+    new_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_external_manifest_moved(encoding_schema):
+    os.makedirs("build/records")
+    encoding_schema.set("test5", "test6", "test7", True)
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("build/records/test5.json")
+    encoding_schema._write_linked_manifest("build/test.json")
+
+    shutil.move("build", "moved")
+
+    new_schema = _read_schema(encoding_schema, "moved/test.json")
+    assert new_schema.get("test5", "test6", "test7") is True
+
+    new_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
+def test_write_external_manifest_missing(encoding_schema):
+    test5 = encoding_schema.get("test5", field="schema")
+    test5._write_external_manifest("test5.json")
+    encoding_schema._write_linked_manifest("test.json")
+    shutil.move("test5.json", "removed.json")
+
+    for lazyload in (LazyLoad.ON, LazyLoad.OFF):
+        new_schema = _read_schema(encoding_schema, "test.json", lazyload)
+        assert new_schema.get("test0", "test1") is None
+        with pytest.raises(FileNotFoundError,
+                           match=r"^\[test5\] is stored in .*test5\.json, which does not exist$"):
+            new_schema.get("test5", "test6", "test7")
+
+    # The reference is kept when writing
+    os.makedirs("copy")
+    new_schema.write_manifest("copy/test.json")
+    with open("copy/test.json") as f:
+        assert json.load(f)["test5"] == {"__external__": os.path.join("..", "test5.json")}
+
+    # Recovers once the section is restored
+    shutil.move("removed.json", "test5.json")
+    assert new_schema.get("test5", "test6", "test7") is False
+    new_schema.write_manifest("test.json")
+    _check_written_manifest(encoding_schema)
+
+
 def test_from_manifest_file():
     from siliconcompiler.schema.baseschema import _has_orjson
     assert _has_orjson
@@ -1703,7 +2566,7 @@ def test_find_files_with_package():
         os.path.abspath("package_path/test1.txt"),
     ]
 
-    assert resolve0.called == 2
+    assert resolve0.called == 1
     assert resolve1.called == 0
 
 
@@ -1739,7 +2602,7 @@ def test_find_files_with_package_not_found():
                              r"\[package,file\]: .*$"):
         schema._find_files("package", "file", dataroots=package_map)
 
-    assert resolve0.called == 2
+    assert resolve0.called == 1
     assert resolve1.called == 0
 
 
@@ -2147,6 +3010,191 @@ def test_set_with_journal():
     assert schema.get("test0", "test1") == "hello"
 
 
+@pytest.fixture
+def set_many_schema():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str", pernode=PerNode.OPTIONAL))
+    edit.insert("test0", "test2", Parameter("[file]", pernode=PerNode.OPTIONAL))
+    edit.insert("test3", "default", Parameter("int"))
+    return schema
+
+
+def test_set_many(set_many_schema):
+    entries = [
+        (("test0", "test1"), "hello"),
+        (("test0", "test2"), ["one.v", "two.v"], "syn", "0"),
+        (("test3", "new"), 2),
+        (("test0", "test1"), "world", "syn", 0),
+        (["test0", "test1"], "again"),
+    ]
+
+    check = set_many_schema.copy()
+    Journal.access(check).start()
+    for entry in entries:
+        keypath, value, *node = entry
+        step, index = node if node else (None, None)
+        check.set(*keypath, value, step=step, index=index)
+
+    Journal.access(set_many_schema).start()
+    set_many_schema.set_many(entries)
+
+    assert Journal.access(set_many_schema).get() == Journal.access(check).get()
+    Journal.access(set_many_schema).stop()
+    Journal.access(check).stop()
+    assert set_many_schema.getdict() == check.getdict()
+    assert set_many_schema.get("test0", "test1") == "again"
+    assert set_many_schema.get("test0", "test1", step="syn", index="0") == "world"
+    assert set_many_schema.get("test0", "test2", step="syn", index="0") == ["one.v", "two.v"]
+    assert set_many_schema.getkeys("test3") == ("new",)
+
+
+def test_set_many_empty(set_many_schema):
+    Journal.access(set_many_schema).start()
+    set_many_schema.set_many([])
+    assert Journal.access(set_many_schema).get() == []
+
+
+def test_set_many_field(set_many_schema):
+    set_many_schema.set("test0", "test2", ["one.v", "two.v"])
+    set_many_schema.set_many([(("test0", "test2"), ["a", "b"])], field="filehash")
+    assert set_many_schema.get("test0", "test2", field="filehash") == ["a", "b"]
+
+
+def test_set_many_no_clobber(set_many_schema):
+    set_many_schema.set("test0", "test1", "hello", step="syn", index="0")
+    Journal.access(set_many_schema).start()
+    set_many_schema.set_many([
+        (("test0", "test1"), "world", "syn", "0"),
+        (("test0", "test1"), "world", "syn", "1")], clobber=False)
+
+    assert set_many_schema.get("test0", "test1", step="syn", index="0") == "hello"
+    assert set_many_schema.get("test0", "test1", step="syn", index="1") == "world"
+    assert [record["index"] for record in Journal.access(set_many_schema).get()] == ["1"]
+
+
+def test_set_many_locked(set_many_schema):
+    set_many_schema.set("test0", "test1", True, field="lock")
+    Journal.access(set_many_schema).start()
+    set_many_schema.set_many([(("test0", "test1"), "hello")])
+
+    assert set_many_schema.get("test0", "test1") is None
+    assert Journal.access(set_many_schema).get() == []
+
+
+def test_set_many_invalid_key(set_many_schema):
+    with pytest.raises(KeyError, match=r"^'\[test0,test4\] is not a valid keypath'$"):
+        set_many_schema.set_many([(("test0", "test4"), "hello")])
+
+
+def test_set_many_invalid_value(set_many_schema):
+    Journal.access(set_many_schema).start()
+    with pytest.raises(ValueError, match=r"^error while setting \[test3,new\]: "
+                                         r"\"notint\" unable to convert to int$"):
+        set_many_schema.set_many([
+            (("test0", "test1"), "hello"),
+            (("test3", "new"), "notint")])
+
+    assert set_many_schema.get("test0", "test1") == "hello"
+    assert [record["key"] for record in Journal.access(set_many_schema).get()] == \
+        [("test0", "test1")]
+
+
+def test_set_many_invalid_value_journal_order(set_many_schema):
+    Journal.access(set_many_schema).start()
+    with pytest.raises(ValueError, match=r"^error while setting \[test3,new\]"):
+        set_many_schema.set_many([
+            (("test0", "test1"), "hello"),
+            (("test0", "test2"), ["one.v"]),
+            (("test3", "new"), "notint"),
+            (("test0", "test1"), "world", "syn", "0")])
+
+    # Entries set before the error are journaled in the order given
+    assert [(record["key"], record["step"]) for record in
+            Journal.access(set_many_schema).get()] == [
+        (("test0", "test1"), None),
+        (("test0", "test2"), None),
+        (("test0", "test1"), "syn")]
+
+
+def test_set_many_invalid_value_grouped(set_many_schema):
+    Journal.access(set_many_schema).start()
+    with pytest.raises(ValueError, match=r"^error while setting \[test3,new\]"):
+        set_many_schema.set_many([
+            (("test0", "test1"), "a"),
+            (("test3", "new"), "notint"),
+            (("test0", "test1"), "b"),
+            (("test0", "test2"), ["one.v"])])
+
+    # The entries are applied grouped by parameter, so the entry for the parameter
+    # of the first entry given after the error is set, but not the later parameter
+    assert set_many_schema.get("test0", "test1") == "b"
+    assert set_many_schema.get("test0", "test2") == []
+    assert [(record["key"], record["value"]) for record in
+            Journal.access(set_many_schema).get()] == [
+        (("test0", "test1"), "a"),
+        (("test0", "test1"), "b")]
+
+
+def test_set_many_invalid_value_within_group(set_many_schema):
+    Journal.access(set_many_schema).start()
+    with pytest.raises(ValueError, match=r"^error while setting \[test3,new\]"):
+        set_many_schema.set_many([
+            (("test3", "new"), 1),
+            (("test3", "new"), "notint"),
+            (("test3", "new"), 3)])
+
+    # Entries of the parameter before the error remain set and are journaled
+    assert set_many_schema.get("test3", "new") == 1
+    assert [record["value"] for record in Journal.access(set_many_schema).get()] == [1]
+
+
+def test_set_many_invalid_step(set_many_schema):
+    set_many_schema.set("test0", "test1", PerNode.NEVER, field="pernode")
+    with pytest.raises(KeyError, match="use of step and index are not valid"):
+        set_many_schema.set_many([(("test0", "test1"), "hello", "syn", "0")])
+
+
+def test_set_many_active(set_many_schema):
+    with set_many_schema._active(dataroot="testroot", lock=True):
+        set_many_schema.set_many([(("test0", "test2"), ["one.v"], "syn", "0")])
+
+    assert set_many_schema.get("test0", "test2", field="dataroot", step="syn", index="0") == \
+        ["testroot"]
+    assert set_many_schema.get("test0", "test2", field="lock") is True
+
+
+def test_set_active_dataroot_and_lock(set_many_schema):
+    with set_many_schema._active(dataroot="testroot", lock=True):
+        set_many_schema.set("test0", "test2", ["one.v"])
+
+    assert set_many_schema.get("test0", "test2", field="dataroot") == ["testroot"]
+    assert set_many_schema.get("test0", "test2", field="lock") is True
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_set_many_gc(set_many_schema, enabled):
+    import gc
+    was_enabled = gc.isenabled()
+    try:
+        if enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+        set_many_schema.set_many([(("test0", "test1"), "hello")])
+        assert gc.isenabled() is enabled
+
+        with pytest.raises(KeyError):
+            set_many_schema.set_many([(("test0", "test4"), "hello")])
+        assert gc.isenabled() is enabled
+    finally:
+        if was_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+
 def test_getdict_with_journal():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -3389,6 +4437,144 @@ def test_read_manifest_file():
     assert new_schema.getdict() == schema.getdict()
 
 
+def test_write_manifest_bin():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    schema.set("test0", "test1", "testthis")
+
+    assert not os.path.isfile("test.pkg.bin")
+    schema.write_manifest("test.pkg.bin")
+    assert os.path.isfile("test.pkg.bin")
+
+    with open("test.pkg.bin", "rb") as f:
+        assert f.read(8) == b"SCPKGBIN"
+
+
+def test_read_manifest_bin():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str"))
+            edit.insert("test2", "test3", Parameter("[int]"))
+    schema = NewSchema()
+    schema.set("test0", "test1", "testthis")
+    schema.set("test2", "test3", [1, 2])
+
+    schema.write_manifest("test.pkg.bin")
+
+    new_schema = NewSchema()
+    new_schema.read_manifest(filepath="test.pkg.bin")
+    assert new_schema.get("test0", "test1") == "testthis"
+    assert new_schema.get("test2", "test3") == [1, 2]
+    assert new_schema.getdict() == schema.getdict()
+
+
+def test_read_manifest_detect_format():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    schema.set("test0", "test1", "testthis")
+
+    schema.write_manifest("test.pkg.bin")
+    os.rename("test.pkg.bin", "binary.pkg.json")
+    schema.write_manifest("test.pkg.json")
+    os.rename("test.pkg.json", "json.pkg.bin")
+
+    assert BaseSchema._read_manifest("binary.pkg.json") == schema.getdict()
+    assert BaseSchema._read_manifest("json.pkg.bin") == schema.getdict()
+
+
+def test_read_manifest_bin_truncated():
+    with open("test.pkg.bin", "wb") as f:
+        f.write(b"SCPKGBIN")
+
+    with pytest.raises(ValueError, match="^not a binary manifest$"):
+        BaseSchema._read_manifest("test.pkg.bin")
+
+
+def test_read_manifest_bin_rewrite():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    edit.insert("test2", "test3", Parameter("str"))
+    schema.set("test0", "test1", "testthis")
+    schema.set("test2", "test3", "other")
+    schema.write_manifest("test.pkg.bin")
+
+    new_schema = BaseSchema()
+    edit = EditableSchema(new_schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    edit.insert("test2", "test3", Parameter("str"))
+    new_schema.read_manifest("test.pkg.bin")
+    new_schema.set("test0", "test1", "changed")
+    new_schema.write_manifest("test.pkg.bin")
+
+    assert new_schema.get("test2", "test3") == "other"
+    assert BaseSchema._read_manifest("test.pkg.bin") == new_schema.getdict()
+
+
+@pytest.fixture
+def bin_schema_class():
+    class NewSchema(BaseSchema):
+        def __init__(self):
+            super().__init__()
+            edit = EditableSchema(self)
+            edit.insert("test0", "test1", Parameter("str"))
+            edit.insert("test2", "test3", Parameter("[int]"))
+
+        @classmethod
+        def _getdict_type(cls):
+            return "NewSchema"
+
+    with patch("siliconcompiler.schema.BaseSchema._BaseSchema__get_child_classes") as children:
+        children.return_value = {
+            "BaseSchema": BaseSchema,
+            "NewSchema": NewSchema
+        }
+        yield NewSchema
+
+
+@pytest.mark.parametrize("lazyload", [True, False])
+def test_from_manifest_bin(bin_schema_class, lazyload):
+    schema = bin_schema_class()
+    schema.set("test0", "test1", "testthis")
+    schema.set("test2", "test3", [1, 2])
+
+    schema.write_manifest("test.pkg.json")
+    schema.write_manifest("test.pkg.bin")
+
+    json_schema = bin_schema_class.from_manifest(filepath="test.pkg.json", lazyload=lazyload)
+    bin_schema = bin_schema_class.from_manifest(filepath="test.pkg.bin", lazyload=lazyload)
+    assert bin_schema.get("test0", "test1") == "testthis"
+    assert bin_schema.get("test2", "test3") == [1, 2]
+    assert bin_schema.getdict() == json_schema.getdict()
+
+
+def test_from_manifest_bin_lazy_write(bin_schema_class):
+    schema = bin_schema_class()
+    schema.set("test0", "test1", "testthis")
+    schema.set("test2", "test3", [1, 2])
+    schema.write_manifest("test.pkg.bin")
+
+    new_schema = bin_schema_class.from_manifest(filepath="test.pkg.bin", lazyload=True)
+    new_schema.write_manifest("test.pkg.bin")
+
+    check = bin_schema_class.from_manifest(filepath="test.pkg.bin", lazyload=False)
+    assert check.getdict() == schema.getdict()
+
+
+def test_from_manifest_bin_copy(bin_schema_class):
+    import copy
+    schema = bin_schema_class()
+    schema.set("test0", "test1", "testthis")
+    schema.write_manifest("test.pkg.bin")
+
+    new_schema = bin_schema_class.from_manifest(filepath="test.pkg.bin", lazyload=True)
+    assert copy.deepcopy(new_schema).get("test0", "test1") == "testthis"
+
+
 def test_hash_files_non_path():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -3426,7 +4612,7 @@ def test_hash_files_scalar_dir():
     assert schema.set("directory", "test")
 
     assert schema._hash_files("directory") == \
-        "3b9c358f36f0a31b6ad3e14f309c7cf198ac9246e8316f9ce543d5b19ac02b80"
+        "a1aea216107827f0bf41b36385a01d69f8285048a733081f6211ca5c6c6196e8"
 
 
 def test_hash_files_scalar_file_not_found():
@@ -3509,8 +4695,8 @@ def test_hash_files_list_dir():
     assert schema.set("directory", ["test0", "test1"])
 
     assert schema._hash_files("directory") == [
-        "590c9f8430c7435807df8ba9a476e3f1295d46ef210f6efae2043a4c085a569e",
-        "1b4f0e9851971998e732078544c96b36c3d01cedf7caa332359d6f1d83567014"
+        "91e1e8f72cc873c4601139faeb35904790d3b0fe2ae5328c81aa8932f69fd75b",
+        "13c138747af25817e9f1c87bde3ebfeda342c1c31c6d727b90400fe5e5a7c996"
     ]
 
 
@@ -3572,7 +4758,7 @@ def test_hash_files_list_dir_not_found_missing_ok():
     assert schema.set("directory", ["test0", "test1"])
 
     assert schema._hash_files("directory", missing_ok=True) == [
-        "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+        "ecdc53dde26ca472c39abbbfb552eb09da30d6673c5ce4bc16be4f90ffb6cc96",
         None
     ]
 
@@ -3591,7 +4777,7 @@ def test_hash_files_with_cwd():
     assert schema.set("directory", ["test0", "test1"])
 
     assert schema._hash_files("directory", cwd="./cwd") == [
-        "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+        "ecdc53dde26ca472c39abbbfb552eb09da30d6673c5ce4bc16be4f90ffb6cc96",
         None
     ]
 
@@ -3631,7 +4817,7 @@ def test_hash_files_with_package():
         "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
     ]
 
-    assert resolve0.called == 2
+    assert resolve0.called == 1
     assert resolve1.called == 0
 
 
@@ -3667,7 +4853,7 @@ def test_hash_files_with_package_not_found():
             match=r"^Could not find \"test1.txt\" in this_package \[package,file\]: .*$"):
         schema._hash_files("package", "file", dataroots=package_map)
 
-    assert resolve0.called == 2
+    assert resolve0.called == 1
     assert resolve1.called == 0
 
 
@@ -0,0 +1,191 @@
+import copy
+import pickle
+import pytest
+
+from siliconcompiler.schema import binarymanifest
+from siliconcompiler.schema.binarymanifest import BinaryManifestSection
+
+
+@pytest.fixture
+def manifest():
+    return {
+        "test0": {
+            "test1": {
+                "type": "str",
+                "node": {"global": {"global": {"value": "hello"}}}
+            },
+            "test2": {
+                "test3": {
+                    "type": "[int]",
+                    "node": {"global": {"global": {"value": [1, 2]}}}
+                }
+            }
+        },
+        "test4": {
+            "test5": {
+                "type": "bool",
+                "node": {"global": {"global": {"value": True}}}
+            }
+        },
+        "__meta__": {"class": "BaseSchema"}
+    }
+
+
+@pytest.mark.parametrize("path,expect", [
+    ("test.pkg.bin", True),
+    ("test.PKG.BIN", True),
+    ("test.bin", False),
+    ("test.pkg.json", False),
+    ("test.json.gz", False),
+])
+def test_is_binary_manifest(path, expect):
+    assert binarymanifest.is_binary_manifest(path) is expect
+
+
+@pytest.mark.parametrize("data,expect", [
+    (b"SCPKGBIN\x01\x00\x00\x00", True),
+    (b"SCPKGBIN", True),
+    (b"SCPKG", False),
+    (b'{"test": 1}', False),
+])
+def test_is_binary_data(data, expect):
+    assert binarymanifest.is_binary_data(data) is expect
+
+
+def test_encode_decode(manifest):
+    section = binarymanifest.decode(binarymanifest.encode(manifest))
+    assert isinstance(section, BinaryManifestSection)
+    assert section.to_dict() == manifest
+
+
+def test_encode_decode_no_sections():
+    section = binarymanifest.decode(binarymanifest.encode({"test": 1}))
+    assert isinstance(section, BinaryManifestSection)
+    assert section.to_dict() == {"test": 1}
+
+
+def test_decode_invalid():
+    with pytest.raises(ValueError, match="^not a binary manifest$"):
+        binarymanifest.decode(b'{"test": 1}')
+
+
+def test_decode_too_short():
+    with pytest.raises(ValueError, match="^not a binary manifest$"):
+        binarymanifest.decode(b'SC')
+
+
+def test_decode_corrupt(manifest):
+    data = binarymanifest.encode(manifest)
+    with pytest.raises(ValueError, match="^corrupt binary manifest$"):
+        binarymanifest.decode(data[:-10])
+
+
+def test_decode_version(manifest):
+    data = bytearray(binarymanifest.encode(manifest))
+    data[8] = 99
+    with pytest.raises(ValueError, match="^unsupported binary manifest version: 99$"):
+        binarymanifest.decode(bytes(data))
+
+
+def test_section_lazy(manifest):
+    section = binarymanifest.decode(binarymanifest.encode(manifest))
+
+    items = section._BinaryManifestSection__items
+    assert set(items.keys()) == {"test0", "test4", "__meta__"}
+    assert all(isinstance(item, binarymanifest._Encoded) for item in items.values())
+
+    assert "test0" in section
+    assert list(section) == ["test0", "test4", "__meta__"]
+    assert len(section) == 3
+    assert all(isinstance(item, binarymanifest._Encoded) for item in items.values())
+
+    test0 = section["test0"]
+    assert isinstance(test0, BinaryManifestSection)
+    assert section["test0"] is test0
+    assert isinstance(items["test4"], binarymanifest._Encoded)
+    assert isinstance(items["__meta__"], binarymanifest._Encoded)
+
+    assert test0["test1"] == manifest["test0"]["test1"]
+    assert isinstance(test0._BinaryManifestSection__items["test2"], binarymanifest._Encoded)
+
+
+def test_section_modify(manifest):
+    section = binarymanifest.decode(binarymanifest.encode(manifest))
+
+    del section["test4"]
+    section["test6"] = {"value": 1}
+    assert section.to_dict() == {
+        "test0": manifest["test0"],
+        "__meta__": manifest["__meta__"],
+        "test6": {"value": 1}
+    }
+
+
+def test_section_pickle(manifest):
+    section = binarymanifest.decode(binarymanifest.encode(manifest))
+    assert pickle.loads(pickle.dumps(section)) == manifest
+
+
+def test_section_deepcopy(manifest):
+    section = binarymanifest.decode(binarymanifest.encode(manifest))
+    assert copy.deepcopy(section) == manifest
+
+
+def test_write_read(manifest):
+    binarymanifest.write("test.pkg.bin", manifest)
+    section = binarymanifest.read("test.pkg.bin")
+    assert section.to_dict() == manifest
+
+
+@pytest.mark.parametrize("data,match", [
+    (b"", "^not a binary manifest$"),
+    (b"SCPKGBIN", "^not a binary manifest$"),
+    (b"SCPKGBIN\x01\x00\x00\x00", "^truncated binary manifest$"),
+    (b"SCPKGBIN\x02\x00\x00\x00\x00", "^unsupported binary manifest version: 2$"),
+])
+def test_read_invalid(data, match):
+    with open("test.pkg.bin", "wb") as f:
+        f.write(data)
+    with pytest.raises(ValueError, match=match):
+        binarymanifest.read("test.pkg.bin")
+
+
+def test_write_keeps_mapping(manifest):
+    binarymanifest.write("test.pkg.bin", manifest)
+    section = binarymanifest.read("test.pkg.bin")
+    test0 = section["test0"]
+    mapping = section._BinaryManifestSection__mapping
+
+    binarymanifest.write("test.pkg.bin", {"test": {"test": {"value": 1}}})
+    assert mapping.buffer.closed
+    assert section._BinaryManifestSection__mapping is None
+    assert section.to_dict() == manifest
+    assert test0.to_dict() == manifest["test0"]
+    assert binarymanifest.read("test.pkg.bin").to_dict() == {"test": {"test": {"value": 1}}}
+
+
+def test_write_keeps_removed_section(manifest):
+    binarymanifest.write("test.pkg.bin", manifest)
+    section = binarymanifest.read("test.pkg.bin")
+    test0 = section["test0"]
+    del section["test0"]
+
+    binarymanifest.write("test.pkg.bin", {"test": {"test": {"value": 1}}})
+    assert test0.to_dict() == manifest["test0"]
+
+
+def test_write_other_file_keeps_mapping(manifest):
+    binarymanifest.write("test.pkg.bin", manifest)
+    section = binarymanifest.read("test.pkg.bin")
+
+    binarymanifest.write("other.pkg.bin", manifest)
+    assert not section._BinaryManifestSection__mapping.buffer.closed
+
+
+def test_write_read_stdjson(monkeypatch, manifest):
+    import json
+    monkeypatch.setattr(binarymanifest, 'json', json)
+    monkeypatch.setattr(binarymanifest, '_has_orjson', False)
+
+    binarymanifest.write("test.pkg.bin", manifest)
+    assert binarymanifest.read("test.pkg.bin").to_dict() == manifest
@@ -0,0 +1,205 @@
+import hashlib
+import os
+import time
+
+import os.path
+
+from unittest.mock import patch
+
+from siliconcompiler.schema.filehash import FileHashCache
+from siliconcompiler.schema.parametervalue import PathNodeValue
+
+
+def write_file(path, text, age=10):
+    with open(path, "w") as f:
+        f.write(text)
+    # Age the file so it can be cached
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def test_hash_file_large():
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    with open("large.bin", "wb") as f:
+        f.write(data)
+    assert PathNodeValue.hash_file("large.bin", hashfunction="sha256") == \
+        hashlib.sha256(data).hexdigest()
+
+
+def test_hash_files():
+    write_file("a.txt", "a")
+    write_file("b.txt", "b")
+
+    cache = FileHashCache()
+    assert cache.hash_files(["a.txt", "b.txt"], "sha256") == [sha256("a"), sha256("b")]
+    assert cache.hash_file("a.txt", "sha1") == hashlib.sha1(b"a").hexdigest()
+
+
+def test_hash_files_cached():
+    write_file("a.txt", "a")
+
+    cache = FileHashCache()
+    assert cache.hash_file("a.txt", "sha256") == sha256("a")
+
+    with patch("siliconcompiler.schema.parametervalue.PathNodeValue.hash_file") as hash_file:
+        assert cache.hash_file("a.txt", "sha256") == sha256("a")
+        hash_file.assert_not_called()
+
+
+def test_hash_files_changed():
+    write_file("a.txt", "a")
+
+    cache = FileHashCache()
+    assert cache.hash_file("a.txt", "sha256") == sha256("a")
+
+    write_file("a.txt", "b", age=5)
+    assert cache.hash_file("a.txt", "sha256") == sha256("b")
+
+
+def test_hash_files_recently_modified():
+    write_file("a.txt", "a", age=0)
+
+    cache = FileHashCache()
+    assert cache.hash_file("a.txt", "sha256") == sha256("a")
+
+    with patch("siliconcompiler.schema.parametervalue.PathNodeValue.hash_file") as hash_file:
+        hash_file.return_value = "rehashed"
+        assert cache.hash_file("a.txt", "sha256") == "rehashed"
+
+
+def test_hash_files_memory_limit(monkeypatch):
+    monkeypatch.setattr(FileHashCache, "_FileHashCache__MAX_HASHES", 2)
+    FileHashCache.clear()
+    for name in ("a", "b", "c"):
+        write_file(f"{name}.txt", name)
+
+    cache = FileHashCache()
+    cache.hash_files(["a.txt", "b.txt"], "sha256")
+    # Use a.txt, so b.txt is the least recently used
+    cache.hash_file("a.txt", "sha256")
+    cache.hash_file("c.txt", "sha256")
+
+    with patch("siliconcompiler.schema.parametervalue.PathNodeValue.hash_file") as hash_file:
+        hash_file.return_value = "rehashed"
+        assert cache.hash_files(["a.txt", "c.txt"], "sha256") == [sha256("a"), sha256("c")]
+        assert cache.hash_file("b.txt", "sha256") == "rehashed"
+
+
+def test_hash_files_persisted():
+    write_file("a.txt", "a")
+
+    with FileHashCache("hashes.db") as cache:
+        assert cache.hash_file("a.txt", "sha256") == sha256("a")
+    assert os.path.exists("hashes.db")
+
+    FileHashCache.clear()
+    with FileHashCache("hashes.db") as cache, \
+            patch("siliconcompiler.schema.parametervalue.PathNodeValue.hash_file") as hash_file:
+        assert cache.hash_file("a.txt", "sha256") == sha256("a")
+        hash_file.assert_not_called()
+
+
+def test_hash_files_persisted_changed():
+    write_file("a.txt", "a")
+
+    with FileHashCache("hashes.db") as cache:
+        assert cache.hash_file("a.txt", "sha256") == sha256("a")
+
+    write_file("a.txt", "b", age=5)
+    FileHashCache.clear()
+    with FileHashCache("hashes.db") as cache:
+        assert cache.hash_file("a.txt", "sha256") == sha256("b")
+
+
+def merkle(entries):
+    hashobj = hashlib.sha256()
+    for name, entry_type, entry_hash in sorted(entries):
+        hashobj.update(f"{entry_type} {entry_hash} {name}\0".encode("utf-8"))
+    return hashobj.hexdigest()
+
+
+def make_tree():
+    os.makedirs("tree/sub/deep")
+    os.makedirs("tree/other")
+    write_file("tree/a.txt", "a")
+    write_file("tree/sub/b.txt", "b")
+    write_file("tree/sub/deep/c.txt", "c")
+    write_file("tree/other/d.txt", "d")
+
+
+def test_hash_directory():
+    make_tree()
+
+    deep = merkle([("c.txt", "f", sha256("c"))])
+    sub = merkle([("b.txt", "f", sha256("b")), ("deep", "d", deep)])
+    other = merkle([("d.txt", "f", sha256("d"))])
+    tree = merkle([("a.txt", "f", sha256("a")), ("sub", "d", sub), ("other", "d", other)])
+
+    assert FileHashCache().hash_directory("tree", "sha256") == tree
+
+
+def test_hash_directory_pinned():
+    make_tree()
+
+    assert FileHashCache().hash_directory("tree", "sha256") == \
+        "9f205961aec4929206110b881172547434eb721f5cae3a0bf68302434a696506"
+
+
+def test_hash_directory_empty():
+    os.makedirs("empty/sub")
+    assert FileHashCache().hash_directory("empty", "sha256") is None
+    assert PathNodeValue.hash_directory("empty", hashfunction="sha256") is None
+
+
+def test_hash_directory_missing():
+    assert FileHashCache().hash_directory("missing", "sha256") is None
+    assert PathNodeValue.hash_directory("missing", hashfunction="sha256") is None
+
+
+def test_hash_directory_not_directory():
+    write_file("file.txt", "a")
+    assert FileHashCache().hash_directory("file.txt", "sha256") is None
+    assert PathNodeValue.hash_directory("file.txt", hashfunction="sha256") is None
+
+
+def test_hash_directory_file_or_directory():
+    os.makedirs("tree0/entry")
+    os.makedirs("tree1")
+    write_file("tree1/entry", "")
+
+    cache = FileHashCache()
+    assert cache.hash_directory("tree0", "sha256") != cache.hash_directory("tree1", "sha256")
+
+
+def test_hash_directory_rehash_changed():
+    make_tree()
+
+    cache = FileHashCache()
+    check = cache.hash_directory("tree", "sha256")
+
+    write_file("tree/sub/deep/c.txt", "changed", age=5)
+
+    hashed = []
+    hash_file = PathNodeValue.hash_file
+
+    def count_hash_file(filename, **kwargs):
+        hashed.append(filename)
+        return hash_file(filename, **kwargs)
+
+    with patch("siliconcompiler.schema.parametervalue.PathNodeValue.hash_file") as mock_hash:
+        mock_hash.side_effect = count_hash_file
+        assert cache.hash_directory("tree", "sha256") != check
+
+    assert hashed == [os.path.join("tree", "sub", "deep", "c.txt")]
+
+
+def test_hash_directory_symlink_not_followed():
+    make_tree()
+    check = FileHashCache().hash_directory("tree", "sha256")
+
+    os.symlink(os.path.abspath("tree/sub"), "tree/link")
+    assert FileHashCache().hash_directory("tree", "sha256") == check
@@ -1,10 +1,15 @@
 import json
+import pickle
 import pytest
+import random
+
+import os.path
 
 from siliconcompiler.schema import BaseSchema
 from siliconcompiler.schema import EditableSchema
 from siliconcompiler.schema import Parameter
 from siliconcompiler.schema import Journal
+from siliconcompiler.schema import PerNode
 
 
 def test_init():
@@ -374,6 +379,32 @@ def test_replay_all_types():
     ])
 
 
+def test_replay_mixed_sets():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", Parameter("[file]", pernode=PerNode.OPTIONAL))
+
+    check_schema = schema.copy()
+
+    journal = Journal.access(schema)
+    journal.start()
+
+    assert schema.set("test0", "test1", "hello0", step="syn", index="0")
+    assert schema.set("test0", "test2", "hello1")
+    assert schema.set("test0", "test1", "root", field="dataroot", step="syn", index="0")
+    schema.unset("test0", "test2")
+    assert schema.add("test0", "test2", "hello2")
+    assert schema.set("test0", "test1", True, field="lock")
+    assert not schema.set("test0", "test1", "hello3", step="syn", index="0")
+
+    journal.replay(check_schema)
+    assert check_schema.get("test0", "test1", step="syn", index="0") == ["hello0"]
+    assert check_schema.get("test0", "test1", field="dataroot", step="syn", index="0") == \
+        ["root"]
+    assert check_schema.get("test0", "test2") == ["hello2"]
+    assert check_schema.get("test0", "test1", field="lock") is True
+
+
 def test_replay_invalid_type():
     journal = Journal()
     journal._Journal__journal = [{
@@ -412,6 +443,7 @@ def test_forward_exception_with_key_set_replay(error, monkeypatch):
     def dummy_set(*args, **kwargs):
         raise error("this is an error from the param")
     monkeypatch.setattr(param, 'set', dummy_set)
+    monkeypatch.setattr(param, '_set_many', dummy_set)
 
     journal = Journal()
     journal._Journal__journal = [
@@ -484,6 +516,359 @@ def test_replay_file():
     assert schema.get("test0", "test1") == ["hello"]
 
 
+def test_replay_file_bin():
+    from siliconcompiler.schema import binarymanifest
+    replay = [
+        {
+            "type": "add",
+            "key": ("test0", "test1"),
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        }
+    ]
+    binarymanifest.write("replay.pkg.bin", {"__journal__": replay})
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    param = Parameter("[str]")
+    edit.insert("test0", "test1", param)
+
+    assert schema.get("test0", "test1") == []
+    Journal.replay_file(schema, "replay.pkg.bin")
+    assert schema.get("test0", "test1") == ["hello"]
+
+
+def test_record_many():
+    journal = Journal(keyprefix=["test0"])
+    journal.start()
+    journal.record_many("set", [
+        (["test1"], "hello", "value", None, None),
+        (["test1"], {"world"}, "value", "syn", 0),
+        (("test2",), "hello", "value", None, None)])
+
+    assert journal.get() == [
+        {
+            "type": "set",
+            "key": ("test0", "test1"),
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        },
+        {
+            "type": "set",
+            "key": ("test0", "test1"),
+            "value": ["world"],
+            "field": "value",
+            "step": "syn",
+            "index": "0"
+        },
+        {
+            "type": "set",
+            "key": ("test0", "test2"),
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        }
+    ]
+
+
+def test_record_many_not_journaling():
+    journal = Journal()
+    journal.record_many("set", [(["test1"], "hello", "value", None, None)])
+    assert journal.get() is None
+
+    journal.start()
+    journal.record_many("get", [(["test1"], "hello", "value", None, None)])
+    assert journal.get() == []
+
+
+def test_attach():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    recorder = Journal()
+    Journal.access(schema).attach(recorder)
+
+    # Not recorded until started
+    schema.add("test0", "test1", "hello")
+    assert recorder.get_records() == []
+
+    recorder.start()
+    schema.add("test0", "test1", "world")
+    assert [record["value"] for record in recorder.get_records()] == ["world"]
+
+    # The schema is not journaling
+    assert not Journal.access(schema).is_journaling()
+    assert "__journal__" not in schema.getdict()
+    schema.write_manifest("test.json")
+    with open("test.json") as f:
+        assert "__journal__" not in json.load(f)
+
+    Journal.access(schema).detach(recorder)
+    schema.add("test0", "test1", "again")
+    assert [record["value"] for record in recorder.get_records()] == ["world"]
+
+
+def test_attach_journaling():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    recorder = Journal()
+    recorder.start()
+    journal.attach(recorder)
+
+    schema.add("test0", "test1", "hello")
+    journal.add_type("get")
+    schema.get("test0", "test1")
+
+    assert [record["type"] for record in journal.get_records()] == ["add", "get"]
+    assert [record["type"] for record in recorder.get_records()] == ["add"]
+
+
+def test_attach_not_copied():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    recorder = Journal()
+    recorder.start()
+    Journal.access(schema).attach(recorder)
+
+    schema_copy = schema.copy()
+    schema_copy.add("test0", "test1", "hello")
+    pickle.loads(pickle.dumps(schema)).add("test0", "test1", "hello")
+    assert recorder.get_records() == []
+
+
+def test_get_sidecar_path():
+    assert Journal.get_sidecar_path("test.pkg.json") == "test.pkg.json.journal"
+
+
+def test_write_sidecar():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    journal.write_sidecar("test.pkg.json")
+
+    with open("test.pkg.json.journal") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "type": "add",
+            "key": ["test0", "test1"],
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        },
+        {"__records__": 1, "__manifest__": None}
+    ]
+    assert Journal.read_sidecar("test.pkg.json") == json.loads(json.dumps(journal.get()))
+
+
+def test_write_sidecar_append():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    journal.write_sidecar("test.pkg.json")
+    schema.add("test0", "test1", "world")
+    journal.write_sidecar("test.pkg.json")
+
+    with open("test.pkg.json.journal") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[1]) == {"__records__": 1, "__manifest__": None}
+    assert json.loads(lines[3]) == {"__records__": 2, "__manifest__": None}
+
+    assert [record["value"] for record in Journal.read_sidecar("test.pkg.json")] == \
+        ["hello", "world"]
+
+
+def test_write_sidecar_restart():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    journal.write_sidecar("test.pkg.json")
+
+    journal.start()
+    schema.add("test0", "test1", "world")
+    journal.write_sidecar("test.pkg.json")
+
+    assert [record["value"] for record in Journal.read_sidecar("test.pkg.json")] == ["world"]
+
+
+def test_write_sidecar_not_journaling():
+    journal = Journal()
+    journal.write_sidecar("test.pkg.json")
+    assert Journal.read_sidecar("test.pkg.json") == []
+
+
+def test_write_sidecar_manifest():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    schema.write_manifest("test.pkg.json")
+    journal.write_sidecar("test.pkg.json")
+
+    stat = os.stat("test.pkg.json")
+    with open("test.pkg.json.journal") as f:
+        lines = f.read().splitlines()
+    assert json.loads(lines[-1]) == {"__records__": 1,
+                                     "__manifest__": [stat.st_size, stat.st_mtime_ns]}
+    assert [record["value"] for record in Journal.read_sidecar("test.pkg.json")] == ["hello"]
+
+
+def test_read_sidecar_manifest_rewritten():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    schema.write_manifest("test.pkg.json")
+    journal.write_sidecar("test.pkg.json")
+
+    schema.add("test0", "test1", "world")
+    schema.write_manifest("test.pkg.json")
+    assert Journal.read_sidecar("test.pkg.json") is None
+
+    # The journal is read from the manifest instead
+    assert [record["value"] for record in Journal.read_file("test.pkg.json")] == \
+        ["hello", "world"]
+
+
+def test_read_sidecar_manifest_removed():
+    journal = Journal()
+    journal.start()
+    journal.record("set", ["str"], "a", field="value")
+    with open("test.pkg.json", "w") as f:
+        f.write("{}")
+    journal.write_sidecar("test.pkg.json")
+    os.remove("test.pkg.json")
+
+    assert Journal.read_sidecar("test.pkg.json") is None
+
+
+def test_read_sidecar_missing():
+    assert Journal.read_sidecar("test.pkg.json") is None
+
+
+def test_read_sidecar_incomplete():
+    records = [{"type": "set", "key": ["test"], "value": str(n), "field": "value",
+                "step": None, "index": None} for n in range(3)]
+    with open("test.pkg.json.journal", "w") as f:
+        f.write(json.dumps(records[0]) + "\n")
+        f.write(json.dumps({"__records__": 1}) + "\n")
+        f.write(json.dumps(records[1]) + "\n")
+        f.write(json.dumps(records[2])[:10])
+
+    assert Journal.read_sidecar("test.pkg.json") == records[0:1]
+
+
+def test_read_sidecar_no_marker():
+    with open("test.pkg.json.journal", "w") as f:
+        f.write(json.dumps({"type": "set"}) + "\n")
+
+    assert Journal.read_sidecar("test.pkg.json") is None
+
+
+def test_read_sidecar_bad_count():
+    with open("test.pkg.json.journal", "w") as f:
+        f.write(json.dumps({"type": "set"}) + "\n")
+        f.write(json.dumps({"__records__": 1}) + "\n")
+        f.write(json.dumps({"type": "set"}) + "\n")
+        f.write(json.dumps({"__records__": 3}) + "\n")
+
+    assert Journal.read_sidecar("test.pkg.json") == [{"type": "set"}]
+
+
+def test_replay_file_sidecar():
+    with open("replay.json", "w") as f:
+        f.write("this is not read")
+
+    source = BaseSchema()
+    edit = EditableSchema(source)
+    edit.insert("test0", "test1", Parameter("[str]"))
+    journal = Journal.access(source)
+    journal.start()
+    source.add("test0", "test1", "hello")
+    journal.write_sidecar("replay.json")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    assert schema.get("test0", "test1") == []
+    Journal.replay_file(schema, "replay.json")
+    assert schema.get("test0", "test1") == ["hello"]
+
+
+def test_replay_file_sidecar_incomplete():
+    replay = [
+        {
+            "type": "add",
+            "key": ("test0", "test1"),
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        }
+    ]
+    with open("replay.json", "w") as f:
+        json.dump({"__journal__": replay}, f)
+    with open("replay.json.journal", "w") as f:
+        f.write(json.dumps(replay[0]) + "\n")
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    Journal.replay_file(schema, "replay.json")
+    assert schema.get("test0", "test1") == ["hello"]
+
+
+def test_write_sidecar_stdjson(monkeypatch):
+    from siliconcompiler.schema import journal as journal_module
+    monkeypatch.setattr(journal_module, 'json', json)
+    monkeypatch.setattr(journal_module, '_has_orjson', False)
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("[str]"))
+
+    journal = Journal.access(schema)
+    journal.start()
+    schema.add("test0", "test1", "hello")
+    journal.write_sidecar("test.pkg.json")
+
+    assert [record["value"] for record in Journal.read_sidecar("test.pkg.json")] == ["hello"]
+
+
 def test_replay_file_empty():
     with open("replay.json", "w") as f:
         json.dump({}, f)
@@ -496,3 +881,198 @@ def test_replay_file_empty():
     assert schema.get("test0", "test1") == []
     Journal.replay_file(schema, "replay.json")
     assert schema.get("test0", "test1") == []
+
+
+def __compact_schema():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("str", Parameter("str", pernode=PerNode.OPTIONAL))
+    edit.insert("list", Parameter("[str]", pernode=PerNode.OPTIONAL))
+    edit.insert("file", Parameter("file", pernode=PerNode.OPTIONAL))
+    edit.insert("section", "default", "value", Parameter("[str]"))
+    return schema
+
+
+def __compact_record(record_type, key, value=None, field="value", step=None, index=None):
+    return {
+        "type": record_type,
+        "key": key,
+        "value": value,
+        "field": field,
+        "step": step,
+        "index": index
+    }
+
+
+def test_compact():
+    journal = Journal()
+    journal.start()
+    journal.add_type("get")
+    journal.record("set", ["str"], "a", field="value")
+    journal.record("set", ["str"], "b", field="value", step="s0", index="0")
+    journal.record("set", ["str"], "c", field="value")
+    journal.record("add", ["list"], ["a"], field="value")
+    journal.record("add", ["list"], ["b"], field="value")
+    journal.record("set", ["list"], ["c"], field="value")
+    journal.record("add", ["list"], ["d"], field="value")
+    journal.record("get", ["str"])
+    journal.record("set", ["str"], "d", field="value", step="s0", index=0)
+
+    journal.compact()
+    assert journal.get() == [
+        __compact_record("set", ("str",), "c"),
+        __compact_record("set", ("list",), ["c"]),
+        __compact_record("add", ("list",), ["d"]),
+        __compact_record("get", ("str",), field=None),
+        __compact_record("set", ("str",), "d", step="s0", index="0"),
+    ]
+
+
+def test_compact_field_change():
+    journal = Journal()
+    journal.start()
+    journal.record("set", ["file"], "a", field="value")
+    journal.record("set", ["file"], "2025", field="date")
+    journal.record("set", ["file"], "b", field="value")
+    journal.record("set", ["file"], "c", field="value")
+
+    journal.compact()
+    assert journal.get() == [
+        __compact_record("set", ("file",), "a"),
+        __compact_record("set", ("file",), "2025", field="date"),
+        __compact_record("set", ("file",), "c"),
+    ]
+
+
+@pytest.mark.parametrize("barrier", [
+    __compact_record("unset", ["str"], field=None),
+    __compact_record("set", ["str"], True, field="lock"),
+    __compact_record("remove", ["str"], field=None),
+])
+def test_compact_barrier(barrier):
+    journal = Journal()
+    journal.from_dict([
+        __compact_record("set", ["str"], "a"),
+        barrier,
+        __compact_record("set", ["str"], "b"),
+    ])
+
+    journal.compact()
+    assert len(journal.get()) == 3
+
+
+def test_compact_remove_other():
+    journal = Journal()
+    journal.from_dict([
+        __compact_record("set", ["section", "a", "value"], ["a"]),
+        __compact_record("remove", ["section", "b"], field=None),
+        __compact_record("set", ["section", "a", "value"], ["b"]),
+    ])
+
+    journal.compact()
+    assert journal.get() == [
+        __compact_record("remove", ["section", "b"], field=None),
+        __compact_record("set", ["section", "a", "value"], ["b"]),
+    ]
+
+
+def test_compact_empty():
+    journal = Journal()
+    journal.compact()
+    assert journal.get() is None
+
+    journal.start()
+    journal.compact()
+    assert journal.get() == []
+
+
+def test_compact_sidecar():
+    journal = Journal()
+    journal.start()
+    journal.record("set", ["str"], "a", field="value")
+    journal.write_sidecar("test.pkg.json")
+    journal.record("set", ["str"], "b", field="value")
+    journal.compact()
+    journal.write_sidecar("test.pkg.json")
+
+    assert Journal.read_sidecar("test.pkg.json") == [
+        __compact_record("set", ["str"], "b")
+    ]
+
+
+def test_replay_compacts():
+    journal = Journal()
+    journal.from_dict([
+        __compact_record("set", ["str"], "a"),
+        __compact_record("set", ["str"], "b"),
+    ])
+
+    schema = __compact_schema()
+    sets = []
+
+    class Recorder(BaseSchema):
+        def set_many(self, values, **kwargs):
+            sets.extend(values)
+            return schema.set_many(values, **kwargs)
+
+    journal.replay(Recorder())
+    assert sets == [(["str"], "b", None, None)]
+    assert schema.get("str") == "b"
+    assert len(journal.get()) == 2
+
+
+def __compact_random_ops(schema, rng):
+    nodes = [(None, None), ("s0", "0"), ("s1", "1"), ("s0", None)]
+    values = ["a", "b", "c"]
+
+    for _ in range(rng.randint(1, 60)):
+        step, index = rng.choice(nodes)
+        op = rng.random()
+        if op < 0.25:
+            schema.set("str", rng.choice(values), step=step, index=index)
+        elif op < 0.4:
+            schema.set("list", rng.sample(values, rng.randint(1, 2)), step=step, index=index)
+        elif op < 0.55:
+            schema.add("list", rng.choice(values), step=step, index=index)
+        elif op < 0.65:
+            schema.set("file", rng.choice(values), step=step, index=index)
+        elif op < 0.7:
+            schema.set("file", rng.choice(values), field="date", step=step, index=index)
+        elif op < 0.75:
+            schema.add("file", rng.choice(values), field="author", step=step, index=index)
+        elif op < 0.85:
+            schema.unset(rng.choice(["str", "list", "file"]), step=step, index=index)
+        elif op < 0.9:
+            schema.set("section", rng.choice(values), "value", rng.choice(values))
+        elif op < 0.95:
+            schema.remove("section", rng.choice(values))
+        elif op < 0.97:
+            schema.set("str", rng.choice(values), field="help")
+        else:
+            schema.set(rng.choice(["str", "list"]), True, field="lock")
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_compact_replay_property(seed):
+    rng = random.Random(seed)
+
+    source = __compact_schema()
+    journal = Journal.access(source)
+    journal.start()
+    __compact_random_ops(source, rng)
+    records = journal.get()
+    journal.stop()
+
+    compacted = Journal()
+    compacted.from_dict(json.loads(json.dumps(records)))
+    compacted.compact()
+    assert len(compacted.get()) <= len(records)
+
+    recompacted = Journal()
+    recompacted.from_dict(compacted.get())
+    recompacted.compact()
+    assert recompacted.get() == compacted.get()
+
+    schema = __compact_schema()
+    compacted.replay(schema)
+    assert schema.getdict() == source.getdict()
@@ -1,4 +1,5 @@
 import argparse
+import pickle
 import pytest
 
 from unittest.mock import patch
@@ -783,6 +784,341 @@ def test_copy():
     assert param.getdict() == copy_param.getdict()
 
 
+def test_copy_shared_until_modified():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL, defvalue=["test0"])
+
+    copy_param = param.copy()
+    assert copy_param._Parameter__node is param._Parameter__node
+    assert copy_param._Parameter__defvalue is param._Parameter__defvalue
+
+    assert copy_param.add("test1")
+    assert copy_param._Parameter__node is not param._Parameter__node
+
+    assert param.get() == ["test0"]
+    assert copy_param.get() == ["test0", "test1"]
+
+
+def test_copy_values_handed_out_modified():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL)
+    assert param.set(["test0"])
+    values = param.get(field=None)
+
+    copy_param = param.copy()
+    assert copy_param._Parameter__node is param._Parameter__node
+
+    values[0].set("test1")
+    assert copy_param._Parameter__node is not param._Parameter__node
+    assert param.get() == ["test1"]
+    assert copy_param.get() == ["test0"]
+
+
+def test_copy_values_handed_out_copy_of_copy():
+    param = Parameter("str")
+    value = param.set("test0")
+
+    copy0 = param.copy()
+    copy1 = copy0.copy()
+    value.set("test1")
+
+    assert param.get() == "test1"
+    assert copy0.get() == "test0"
+    assert copy1.get() == "test0"
+    # The copies still share their values
+    assert copy0._Parameter__node is copy1._Parameter__node
+
+
+def test_copy_values_handed_out_original_modified():
+    param = Parameter("str", pernode=PerNode.OPTIONAL)
+    value = param.set("test0", step="step", index="0")
+
+    copy_param = param.copy()
+    assert param.set("test1", step="other", index="0")
+    value.set("test2")
+
+    assert param.get(step="step", index="0") == "test2"
+    assert param.get(step="other", index="0") == "test1"
+    assert copy_param.get(step="step", index="0") == "test0"
+    assert copy_param.get(step="other", index="0") is None
+
+
+def test_copy_values_handed_out_field_modified():
+    param = Parameter("[file]")
+    values = param.set("test.v")
+
+    copy_param = param.copy()
+    values[0].set("root", field="dataroot")
+
+    assert param.get(field="dataroot") == ["root"]
+    assert copy_param.get(field="dataroot") == [None]
+
+
+def test_copy_values_handed_out_list_modified():
+    param = Parameter("[file]")
+    assert param.set("test.v")
+    vals = param.getvalues(return_values=False)
+
+    copy_param = param.copy()
+    vals[0][0].set("mutated.v")
+
+    assert param.get() == ["mutated.v"]
+    assert copy_param.get() == ["test.v"]
+
+
+def test_copy_values_handed_out_holders_pruned():
+    param = Parameter("str")
+    assert param.set("test0")
+
+    for _ in range(100):
+        param.copy()
+    shared = param._Parameter__shared
+    assert len(shared.holders) <= 2 * shared.count + 17
+
+
+def test_set_owner_notified_once():
+    class Owner:
+        calls = 0
+
+        def notify(self):
+            self.calls += 1
+
+    param = Parameter("file", pernode=PerNode.OPTIONAL)
+    owner = Owner()
+    param._set_owner(owner.notify)
+
+    value = param.set("test0")
+    assert owner.calls == 1
+    assert param.set("test1")
+    assert owner.calls == 2
+    param._set_many([("test2", None, None), ("test3", "step", "0")])
+    assert owner.calls == 3
+    assert param.set("root", field="dataroot")
+    assert owner.calls == 4
+
+    value.set("test4")
+    assert owner.calls == 5
+
+
+def test_set_owner_notified_after_failed_set():
+    class Owner:
+        calls = 0
+
+        def notify(self):
+            self.calls += 1
+
+    param = Parameter("int")
+    owner = Owner()
+    param._set_owner(owner.notify)
+
+    value = param.set(1)
+    with pytest.raises(ValueError):
+        param.set("notint")
+    calls = owner.calls
+
+    value.set(2)
+    assert owner.calls == calls + 1
+
+
+def test_copy_shared_after_set():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL)
+    assert param.set(["test0"])
+    assert param.add("test1", step="step", index="0")
+
+    copy_param = param.copy()
+    assert copy_param._Parameter__node is param._Parameter__node
+
+    assert param.get() == ["test0"]
+    assert copy_param.get(step="step", index="0") == ["test1"]
+
+
+def test_copy_shared_after_values_released():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL)
+    assert param.set(["test0"])
+    values = param.get(field=None)
+    del values
+
+    copy_param = param.copy()
+    assert copy_param._Parameter__node is param._Parameter__node
+
+    assert copy_param.set(["test1"])
+    assert param.get() == ["test0"]
+    assert copy_param.get() == ["test1"]
+
+
+def test_copy_modify_original():
+    param = Parameter("str", pernode=PerNode.OPTIONAL)
+    assert param.set("test0")
+
+    copy_param = param.copy()
+    assert param.set("test1", step="step", index="0")
+    assert param.unset()
+
+    assert param.get() is None
+    assert param.get(step="step", index="0") == "test1"
+    assert copy_param.get() == "test0"
+    assert copy_param.get(step="step", index="0") == "test0"
+
+
+def test_copy_edit_values():
+    param = Parameter("str")
+    assert param.set("test0")
+
+    copy_param = param.copy()
+    copy_param.get(field=None).set("test1")
+
+    assert param.get() == "test0"
+    assert copy_param.get() == "test1"
+
+
+def test_metadata_shared():
+    param0 = Parameter("[file]", switch="-input", shorthelp="input files", help="help")
+    param1 = Parameter("[file]", switch="-input", shorthelp="input files", help="help")
+
+    assert param0._Parameter__meta is param1._Parameter__meta
+    assert param0.copy()._Parameter__meta is param0._Parameter__meta
+
+
+def test_metadata_set_field():
+    param0 = Parameter("str", switch="-input", example="cli: -input")
+    param1 = param0.copy()
+
+    assert param0.set("newhelp", field="help")
+    assert param0.add("-in", field="switch")
+    assert param0.get(field="help") == "newhelp"
+    assert param0.get(field="switch") == ["-input", "-in"]
+    assert param1.get(field="help") is None
+    assert param1.get(field="switch") == ["-input"]
+    assert param0._Parameter__meta is not param1._Parameter__meta
+
+    assert param0.set(None, field="help")
+    assert param0.set("-input", field="switch")
+    assert param0._Parameter__meta is param1._Parameter__meta
+
+
+def test_metadata_returned_lists():
+    param = Parameter("str", switch="-input", example="cli: -input")
+
+    param.get(field="switch").append("-in")
+    param.get(field="example").clear()
+    param.getdict()["switch"].append("-in")
+
+    assert param.get(field="switch") == ["-input"]
+    assert param.get(field="example") == ["cli: -input"]
+
+
+def test_metadata_pickle():
+    param = Parameter("[file]", switch="-input")
+
+    new_param = pickle.loads(pickle.dumps(param))
+    assert new_param._Parameter__meta is param._Parameter__meta
+    assert new_param.get(field="switch") == ["-input"]
+
+
+def test_getdict_encoded():
+    param = Parameter("str")
+    calls = []
+
+    def encoder(manifest):
+        calls.append(manifest)
+        return len(calls)
+
+    assert param._getdict_encoded(encoder, "key") == 1
+    assert param._getdict_encoded(encoder, "key") == 1
+    assert calls == [param.getdict()]
+
+    assert param._getdict_encoded(encoder, "other") == 2
+    assert param._getdict_encoded(encoder, "other") == 2
+
+
+@pytest.mark.parametrize("modify", [
+    lambda param: param.set(True, field="lock"),
+    lambda param: param.set("help", field="help"),
+    lambda param: param.add("-test", field="switch"),
+    lambda param: param.unset(),
+    lambda param: param.reset(),
+    lambda param: param._from_dict(Parameter("str").getdict(), ("test",), None),
+])
+def test_getdict_encoded_modified(modify):
+    param = Parameter("str")
+
+    def encoder(manifest):
+        return manifest
+
+    before = param._getdict_encoded(encoder, "key")
+    modify(param)
+    after = param._getdict_encoded(encoder, "key")
+    assert after is not before
+    assert after == param.getdict()
+
+
+def test_getdict_encoded_value_modified():
+    param = Parameter("str")
+
+    def encoder(manifest):
+        return manifest
+
+    value = param.set("hello")
+    encoded = param._getdict_encoded(encoder, "key")
+    assert param._getdict_encoded(encoder, "key") is encoded
+    assert encoded["node"]["global"]["global"]["value"] == "hello"
+
+    value.set("world")
+    encoded = param._getdict_encoded(encoder, "key")
+    assert encoded["node"]["global"]["global"]["value"] == "world"
+
+
+def test_getdict_encoded_list_value_modified():
+    param = Parameter("[str]")
+
+    def encoder(manifest):
+        return manifest
+
+    values = param.set(["hello", "world"])
+    encoded = param._getdict_encoded(encoder, "key")
+    assert param._getdict_encoded(encoder, "key") is encoded
+
+    values[0].set("test")
+    encoded = param._getdict_encoded(encoder, "key")
+    assert encoded["node"]["global"]["global"]["value"] == ["test", "world"]
+
+    param._default.set(["default"])
+    encoded = param._getdict_encoded(encoder, "key")
+    assert encoded["node"]["default"]["default"]["value"] == ["default"]
+
+
+def test_getdict_encoded_set_repeated():
+    param = Parameter("str")
+
+    def encoder(manifest):
+        return manifest
+
+    for value in ("hello", "world"):
+        param.set(value)
+    assert param._getdict_encoded(encoder, "key") is param._getdict_encoded(encoder, "key")
+
+
+def test_getdict_encoded_copy():
+    param = Parameter("str")
+
+    def encoder(manifest):
+        return manifest
+
+    encoded = param._getdict_encoded(encoder, "key")
+    assert param.copy()._getdict_encoded(encoder, "key") is encoded
+
+
+def test_getdict_encoded_pickle():
+    param = Parameter("str")
+
+    def encoder(manifest):
+        return manifest
+
+    param._getdict_encoded(encoder, "key")
+
+    new_param = pickle.loads(pickle.dumps(param))
+    assert new_param._Parameter__encoded.key is None
+    assert new_param._getdict_encoded(encoder, "key") == param.getdict()
+
+
 def test_tcl_optional():
     param = Parameter("str", pernode=PerNode.OPTIONAL)
 
@@ -1194,6 +1530,87 @@ def test_set_on_locked():
     assert param.get() is None
 
 
+def test_set_many():
+    param = Parameter("[str]", pernode=PerNode.OPTIONAL)
+    check = Parameter("[str]", pernode=PerNode.OPTIONAL)
+
+    values = [("global", None, None), (["syn0", "syn1"], "syn", "0"),
+              ("place", "place", None), ("syn2", "syn", 0)]
+    ret = param._set_many(values)
+    for value, step, index in values:
+        check.set(value, step=step, index=index)
+
+    assert len(ret) == 4
+    assert all(ret)
+    assert param.getdict() == check.getdict()
+    assert param.get(step="syn", index="0") == ["syn2"]
+
+
+def test_set_many_scalar():
+    param = Parameter("int", pernode=PerNode.OPTIONAL)
+    check = Parameter("int", pernode=PerNode.OPTIONAL)
+    param.set(5, step="syn", index="0")
+    check.set(5, step="syn", index="0")
+
+    values = [("1", None, None), (2, "syn", 0), (3.0, "syn", "1"), (None, "place", "0")]
+    ret = param._set_many(values)
+    for value, step, index in values:
+        check.set(value, step=step, index=index)
+
+    assert all(ret)
+    assert param.getdict() == check.getdict()
+    assert param.get(step="syn", index="1") == 3
+    assert param.get(step="place", index="0") is None
+
+
+def test_set_many_error_ret():
+    param = Parameter("int", pernode=PerNode.OPTIONAL)
+    ret = []
+    with pytest.raises(ValueError, match="unable to convert to int"):
+        param._set_many([(1, "syn", "0"), ("notint", "syn", "1"), (3, "syn", "2")], ret=ret)
+    assert len(ret) == 1
+    assert ret[0].get() == 1
+    assert param.get(step="syn", index="0") == 1
+    assert param.get(step="syn", index="2") is None
+
+
+def test_set_many_no_clobber():
+    param = Parameter("str", pernode=PerNode.OPTIONAL)
+    param.set("first", step="syn", index="0")
+
+    ret = param._set_many([("second", "syn", "0"), ("second", "syn", "1")], clobber=False)
+    assert ret[0] is False
+    assert ret[1]
+    assert param.get(step="syn", index="0") == "first"
+    assert param.get(step="syn", index="1") == "second"
+
+
+def test_set_many_on_locked():
+    param = Parameter("int", lock=True)
+    assert param._set_many([(1, None, None), (2, None, None)]) == [False, False]
+    assert param.get() is None
+
+
+def test_set_many_field():
+    param = Parameter("str")
+    assert param._set_many([("short help", None, None)], field="shorthelp") == [True]
+    assert param.get(field="shorthelp") == "short help"
+
+
+@pytest.mark.parametrize("pernode,step,index,error", [
+    (PerNode.NEVER, "syn", "0", "use of step and index are not valid"),
+    (PerNode.REQUIRED, None, None, "step and index are required"),
+    (PerNode.OPTIONAL, None, "0", "step is required if index is provided"),
+    (PerNode.OPTIONAL, "default", "0", "illegal step name: default is reserved"),
+    (PerNode.OPTIONAL, "syn", "default", "illegal index name: default is reserved"),
+])
+def test_set_many_invalid_step_index(pernode, step, index, error):
+    param = Parameter("str", pernode=pernode)
+    with pytest.raises(KeyError, match=error):
+        param._set_many([("ok", "syn", "0") if pernode is not PerNode.NEVER else ("ok", None, None),
+                         ("test", step, index)])
+
+
 def test_unlock():
     param = Parameter("int", lock=True)
     assert param.get(field='lock')
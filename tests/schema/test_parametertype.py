@@ -1,6 +1,6 @@
 import pytest
 
-from pathlib import Path
+from pathlib import Path, PureWindowsPath
 
 from siliconcompiler.schema.parametertype import \
     NodeType, NodeEnumType
@@ -225,6 +225,23 @@ def test_to_tcl_unsupported():
         NodeType.to_tcl(12, "invalid")
 
 
+@pytest.mark.parametrize(
+    "type,value,expect", [
+        ("int", 1, 1),
+        ("int", True, 1),
+        ("int", 1.5, 1),
+        ("float", 1.5, 1.5),
+        ("float", 1, 1.0),
+        ("str", "test", "test"),
+        ("bool", True, True),
+        ("bool", 1, True),
+    ])
+def test_normalize_result_type(type, value, expect):
+    norm = NodeType.normalize(value, type)
+    assert norm == expect
+    assert norm.__class__ is expect.__class__
+
+
 def test_normalize_value_enum():
     enum = NodeEnumType("test0", "test1", "test2")
     assert NodeType.normalize("test0", enum) == "test0"
@@ -306,6 +323,58 @@ def test_normalize_invalid_str():
         NodeType.normalize(tuple(['a', 'b']), 'str')
 
 
+@pytest.mark.parametrize(
+    "type,value,expect", [
+        ("str", 1, "1"),
+        ("int", "2", 2),
+        ("bool", "t", True),
+        ("[str]", (1, "2"), ["1", "2"]),
+        ("[int]", [1, "2"], [1, 2]),
+        ("[file]", ["a\\b.v", Path("c.v")], ["a/b.v", "c.v"]),
+        ("{str}", [1, 2], set(["1", "2"])),
+        ("(str,int)", "(test0,1)", ("test0", 1)),
+        ("[<one,two>]", "one", ["one"]),
+        (NodeType("(str,float)"), (1, 2.5), ("1", 2.5))
+    ])
+def test_compile(type, value, expect):
+    normalize = NodeType.compile(NodeType.parse(type))
+    assert normalize(value) == expect
+    assert normalize(None) == NodeType.normalize(None, NodeType.parse(type))
+
+
+@pytest.mark.parametrize("path", [
+    "", ".", "./", "a", "a/b.v", "/a/b", "\\a\\b", "a\\b\\", "a//b", "./a/./b/.",
+    "../a", "a/../b", ".hidden/a", "a /b ", "C:\\a\\b", "c:a", "//server/share/a",
+    "\\\\server\\share", "/\\a", "$VAR/a", "~/a"
+])
+def test_normalize_file_matches_windows_path(path):
+    assert NodeType.normalize(path, "file") == PureWindowsPath(path).as_posix()
+
+
+def test_compile_shared():
+    assert NodeType.compile(NodeType.parse("[file]")) is NodeType.compile(NodeType.parse("[file]"))
+    assert NodeType.compile(NodeType.parse("<one,two>")) is \
+        NodeType.compile(NodeType.parse("<two,one>"))
+    assert NodeType.compile(NodeType.parse("[str]")) is not \
+        NodeType.compile(NodeType.parse("{str}"))
+    assert NodeType.compile("[str]") is not NodeType.compile(NodeType.parse("[str]"))
+
+
+def test_compile_invalid_type():
+    normalize = NodeType.compile(int)
+    assert normalize(None) is None
+    with pytest.raises(ValueError, match="^Invalid type specifier: <class 'int'>$"):
+        normalize("1")
+
+
+def test_compile_invalid_list_entry():
+    normalize = NodeType.compile(["int"])
+    with pytest.raises(ValueError, match="^\"a\" unable to convert to int$"):
+        normalize(["a"])
+    with pytest.raises(ValueError, match="^\"<class 'list'>\" unable to convert to int$"):
+        normalize(["1", "a"])
+
+
 @pytest.mark.parametrize("sctype", [
     "str",
     "bool",
@@ -135,6 +135,41 @@ def test_copy():
     assert value is not new_value
 
 
+def test_copy_file():
+    value = FileNodeValue("test.txt", dataroot="root")
+    value.set("hash", field="filehash")
+    value.set("today", field="date")
+    value.add("author0", field="author")
+
+    new_value = value.copy()
+    assert isinstance(new_value, FileNodeValue)
+    assert new_value.getdict() == value.getdict()
+
+    new_value.add("author1", field="author")
+    new_value.set("other.txt")
+    assert value.get(field="author") == ["author0"]
+    assert value.get() == "test.txt"
+
+
+def test_copy_shares_type():
+    value = NodeValue("<one,two>")
+
+    new_value = value.copy()
+
+    assert value is not new_value
+    assert value.type is new_value.type
+
+
+@pytest.mark.parametrize("value", [
+    NodeValue("str"),
+    DirectoryNodeValue(),
+    FileNodeValue(),
+    NodeListValue(NodeValue("str")),
+    NodeSetValue(NodeValue("str"))])
+def test_slots(value):
+    assert not hasattr(value, "__dict__")
+
+
 def test_value_init():
     assert NodeValue("str").get() is None
     assert NodeValue("str", value="test").get() == "test"
@@ -645,6 +680,30 @@ def test_nodelist_copy():
     assert param.getdict() == check_param.getdict()
 
 
+def test_nodelist_copy_independent():
+    param = NodeListValue(FileNodeValue())
+    param.set(["test1", "test2"])
+    param.add("author0", field="author")
+
+    check_param = param.copy()
+    check_param.add("author1", field="author")
+    check_param.add("test3")
+
+    assert param.get() == ["test1", "test2"]
+    assert param.get(field="author") == [["author0"], ["author0"]]
+
+
+def test_nodelist_copy_shares_type():
+    param = NodeListValue(NodeValue("<one,two>"))
+
+    param.set(["one", "two"])
+
+    check_param = param.copy()
+
+    assert check_param.values[0].type is param.values[0].type
+    assert check_param.values[1].type is param.values[0].type
+
+
 def test_nodelist_values():
     value = NodeListValue(NodeValue("str", value="thisvalue"))
     assert value.values[0].get() == "thisvalue"
@@ -731,12 +790,12 @@ def test_file_hash_none_algoritm():
 
 
 @pytest.mark.parametrize('algorithm,expected', [
-    ('md5', 'b9e044ee9606b2b5ac73e2213c2eedc7'),
-    ('sha1', 'cbe04d19f873b43f08697f26bd3f9bab9f41f272'),
-    ('sha224', '61211b3bcfc7c926a022725085ac4a4c831c430a5ba1b1771500131f'),
-    ('sha256', '6d9a946394ed8d2815169e42e225efc52cf6f92aa9f50e88fd05c0750d6c336c'),
-    ('sha384', '852b0d05b70e7a7cdef6d81d695140bc1a4cb0303b65968e640577437bf74c43b39fbfcf2ae81e98889b870b11f0dde3'),  # noqa E501
-    ('sha512', '137d887ec115f7d9737543858671cc8c4a4d38feb9501416cccbef35b3616111ee1c83d08a80e9036ecdd92373e96afe7027c155516280df1781c3d59d068567')])  # noqa E501
+    ('md5', 'ede7666928027853c176ce87edc8d055'),
+    ('sha1', '40f77d39571c0c2688e863feade3aa9353ff7211'),
+    ('sha224', 'a9b8dfe4cf167ea4d8aaf08acc94cf6b84db4601fa967e53b42c6327'),
+    ('sha256', '3c35ca1614677729fea887ea09498e659b731f215a57b000e7b001b0a1dbe2ae'),
+    ('sha384', '49be1439ff9a19b88be7a35a1c1370ea9fe0448841eaa5dedd86b5f101b011fa45867c773d897c40d7c3ea401a572b94'),  # noqa E501
+    ('sha512', 'eb4d6d0348eaa354a7b4e6f7fa5f1311d996cd675a9f610aff08056837ff21ff1fd97a623e74d42da68bb1e68be3636eb0affbdd353a0c6bfd66e78fa5f1a501')])  # noqa E501
 def test_directory_hash(algorithm, expected):
     os.makedirs('test1', exist_ok=True)
     # Create foo.txt and compute its hash
@@ -760,11 +819,11 @@ def test_directory_hash_rename():
 
     param = DirectoryNodeValue()
     param.set("test1")
-    assert param.hash('md5') == 'b9e044ee9606b2b5ac73e2213c2eedc7'
+    assert param.hash('md5') == 'ede7666928027853c176ce87edc8d055'
 
     os.rename('test1/foo1.txt', 'test1/foo2.txt')
 
-    assert param.hash('md5') == 'c9a6f64ac4dc51b43387b6cc67ead697'
+    assert param.hash('md5') == '30534d593f21bdb1056b9a0187e62d29'
 
 
 def test_directory_hash_none():
@@ -0,0 +1,203 @@
+import collections
+import contextlib
+import os
+import pytest
+
+import os.path
+
+from unittest.mock import patch
+
+from siliconcompiler.schema import BaseSchema, EditableSchema, Parameter
+from siliconcompiler.schema.parametervalue import PathNodeValue
+from siliconcompiler.schema.pathcache import PathResolutionCache
+
+
+def write_file(path):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("test")
+
+
+@contextlib.contextmanager
+def count_syscalls():
+    calls = collections.Counter()
+    with contextlib.ExitStack() as stack:
+        for name in ("stat", "lstat", "listdir", "scandir", "getcwd"):
+            def counted(*args, _name=name, _func=getattr(os, name), **kwargs):
+                calls[_name] += 1
+                return _func(*args, **kwargs)
+            stack.enter_context(patch.object(os, name, counted))
+        yield calls
+
+
+def test_active():
+    assert PathResolutionCache.get_active() is None
+
+    cache = PathResolutionCache()
+    with cache.active() as active:
+        assert active is cache
+        assert PathResolutionCache.get_active() is cache
+
+        other = PathResolutionCache()
+        with other.active():
+            assert PathResolutionCache.get_active() is other
+        assert PathResolutionCache.get_active() is cache
+
+    assert PathResolutionCache.get_active() is None
+
+
+def test_listdir():
+    write_file("collected/a.txt")
+
+    cache = PathResolutionCache()
+    with patch("os.listdir", wraps=os.listdir) as listdir:
+        assert cache.listdir("collected") == {"a.txt"}
+        assert cache.listdir("collected") == {"a.txt"}
+        assert cache.listdir("missing") is None
+        assert cache.listdir("missing") is None
+        assert listdir.call_count == 2
+
+
+def test_resolve_path():
+    write_file("a.txt")
+
+    cache = PathResolutionCache()
+    value = PathNodeValue("file", value="a.txt")
+    assert value.resolve_path(cache=cache) == os.path.abspath("a.txt")
+
+    with patch("os.path.exists") as exists:
+        assert value.resolve_path(cache=cache) == os.path.abspath("a.txt")
+        exists.assert_not_called()
+
+
+def test_resolve_path_missing():
+    cache = PathResolutionCache()
+    value = PathNodeValue("file", value="a.txt")
+    with pytest.raises(FileNotFoundError, match="^a.txt$"):
+        value.resolve_path(cache=cache)
+
+    # Not found is remembered until invalidated
+    write_file("a.txt")
+    with pytest.raises(FileNotFoundError, match="^a.txt$"):
+        value.resolve_path(cache=cache)
+
+    cache.invalidate()
+    assert value.resolve_path(cache=cache) == os.path.abspath("a.txt")
+
+
+def test_resolve_path_search():
+    write_file("dir0/a.txt")
+    write_file("dir1/a.txt")
+
+    cache = PathResolutionCache()
+    value = PathNodeValue("file", value="a.txt")
+    assert value.resolve_path(search=[os.path.abspath("dir0")], cache=cache) == \
+        os.path.abspath("dir0/a.txt")
+    assert value.resolve_path(search=[os.path.abspath("dir1")], cache=cache) == \
+        os.path.abspath("dir1/a.txt")
+
+
+def test_resolve_path_dataroot():
+    write_file("a.txt")
+    os.makedirs("collected")
+
+    cache = PathResolutionCache()
+    value = PathNodeValue("file", value="a.txt")
+    assert value.resolve_path(collection_dir="collected", cache=cache) == \
+        os.path.abspath("a.txt")
+
+    value.set("root", field="dataroot")
+    collected = PathNodeValue.generate_hashed_path("a.txt", "root")
+    write_file(os.path.join("collected", collected))
+    cache.invalidate("collected")
+    assert value.resolve_path(collection_dir="collected", cache=cache) == \
+        os.path.abspath(os.path.join("collected", collected))
+
+
+def test_invalidate_collection():
+    write_file("a.txt")
+    os.makedirs("collected")
+    os.makedirs("other")
+
+    cache = PathResolutionCache()
+    value = PathNodeValue("file", value="a.txt")
+    assert value.resolve_path(collection_dir="collected", cache=cache) == \
+        os.path.abspath("a.txt")
+    assert value.resolve_path(collection_dir="other", cache=cache) == \
+        os.path.abspath("a.txt")
+
+    write_file(os.path.join("collected", value.get_hashed_filename()))
+    write_file(os.path.join("other", value.get_hashed_filename()))
+    cache.invalidate("collected")
+
+    assert value.resolve_path(collection_dir="collected", cache=cache) == \
+        os.path.abspath(os.path.join("collected", value.get_hashed_filename()))
+    assert value.resolve_path(collection_dir="other", cache=cache) == \
+        os.path.abspath("a.txt")
+
+
+def test_find_files_active():
+    schema = BaseSchema()
+    EditableSchema(schema).insert("file", Parameter("[file]"))
+
+    files = [f"file{n}.txt" for n in range(10)]
+    for name in files:
+        write_file(name)
+    os.makedirs("collected")
+    assert schema.set("file", files)
+
+    expect = [os.path.abspath(name) for name in files]
+    with patch("os.listdir", wraps=os.listdir) as listdir:
+        assert schema._find_files("file", collection_dir="collected") == expect
+        assert listdir.call_count == 10
+
+        listdir.reset_mock()
+        with PathResolutionCache().active():
+            assert schema._find_files("file", collection_dir="collected") == expect
+            with patch("os.path.exists") as exists:
+                assert schema._find_files("file", collection_dir="collected") == expect
+                exists.assert_not_called()
+        assert listdir.call_count == 1
+
+
+def test_check_filepaths_shared():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("file0", Parameter("file"))
+    edit.insert("file1", Parameter("file"))
+
+    write_file("a.txt")
+    assert schema.set("file0", "a.txt")
+    assert schema.set("file1", "a.txt")
+
+    with patch("os.path.exists", wraps=os.path.exists) as exists:
+        assert schema._check_filepaths()
+        assert exists.call_count == 1
+    assert PathResolutionCache.get_active() is None
+
+
+def test_find_files_syscalls():
+    schema = BaseSchema()
+    EditableSchema(schema).insert("file", Parameter("[file]"))
+
+    files = [os.path.abspath(f"file{n}.txt") for n in range(100)]
+    for name in files:
+        write_file(name)
+    os.makedirs("collected")
+    assert schema.set("file", files)
+
+    with count_syscalls() as calls:
+        assert schema._find_files("file", collection_dir="collected") == files
+    assert calls["listdir"] == 100
+    assert sum(calls.values()) >= 200
+
+    with PathResolutionCache().active():
+        with count_syscalls() as calls:
+            assert schema._find_files("file", collection_dir="collected") == files
+        assert calls["listdir"] == 1
+        assert sum(calls.values()) <= 101 + calls["getcwd"]
+
+        with count_syscalls() as calls:
+            assert schema._find_files("file", collection_dir="collected") == files
+        assert sum(calls.values()) == calls["getcwd"]
@@ -17,6 +17,9 @@ def test_keys():
         ('jobincr',),
         ('scheduler', 'maxthreads'),
         ('scheduler', 'maxnodes'),
+        ('scheduler', 'maxmemory'),
+        ('scheduler', 'workerpool'),
+        ('scheduler', 'workerrecycle'),
         ('nodisplay',),
         ('scheduler', 'memory'),
         ('credentials',),
@@ -27,6 +30,8 @@ def test_keys():
         ('env', 'default'),
         ('timeout',),
         ('hash',),
+        ('nodecache',),
+        ('nodecachesize',),
         ('breakpoint',),
         ('scheduler', 'options'),
         ('track',), ('continue',),
@@ -131,6 +136,22 @@ def test_hash():
     assert option.get_hash() is True
 
 
+def test_nodecache():
+    option = OptionSchema()
+    assert option.get_nodecache() is False
+    option.set_nodecache(True)
+    assert option.get_nodecache() is True
+    option.set_nodecache(False, step="syn", index="0")
+    assert option.get_nodecache(step="syn", index="0") is False
+
+
+def test_nodecachesize():
+    option = OptionSchema()
+    assert option.get_nodecachesize() == 10240
+    option.set_nodecachesize(20480)
+    assert option.get_nodecachesize() == 20480
+
+
 def test_nodisplay():
     option = OptionSchema()
     assert option.get_nodisplay() is False
@@ -406,6 +427,26 @@ def test_maxnodes():
     assert scheduler.get_maxnodes() == 4
 
 
+def test_maxmemory():
+    scheduler = OptionSchema().scheduler
+    scheduler.set_maxmemory(64000)
+    assert scheduler.get_maxmemory() == 64000
+
+
+def test_workerpool():
+    scheduler = OptionSchema().scheduler
+    assert scheduler.get_workerpool() is False
+    scheduler.set_workerpool(True)
+    assert scheduler.get_workerpool() is True
+
+
+def test_workerrecycle():
+    scheduler = OptionSchema().scheduler
+    assert scheduler.get_workerrecycle() is False
+    scheduler.set_workerrecycle(True)
+    assert scheduler.get_workerrecycle() is True
+
+
 def test_maxthreads():
     scheduler = OptionSchema().scheduler
     scheduler.set_maxthreads(8)
@@ -572,7 +572,7 @@ def test_hash_files_dir():
     assert schema.set("dir", "testpath")
 
     assert schema.hash_files("dir") == \
-        "9fca19f3378585fc7800eaf99ae48169848baf0eedbb1b63c0bde3a0d6c2bf10"
+        "537e218add076b9f4d1c47b0692f1e9bf45183ec5d58a915073181a3d2d5d3f0"
 
 
 def test_hash_files_list_dir():
@@ -594,8 +594,8 @@ def test_hash_files_list_dir():
 
     assert schema.hash_files("dir") == \
         [
-            "0ebe9064753ebf28a96a7ef4bf6a2b707091acf7f0063566d1c339aeeb64c759",
-            "c7e3c20a832a68749bd28d790d5fa1cbf5168a80fd38989f2cceefd8b1a69a46"
+            "864200f8907e8fb302ffc56fabcbb1689348d67080e9253f04c51fa651ae3965",
+            "53be8c9dae5ea5192de5ce90a1fded04cfc589ac77703b54b96b6eb98d77b281"
         ]
 
 
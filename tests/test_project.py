@@ -1,6 +1,9 @@
+import glob
+import json
 import logging
 import pickle
 import pytest
+import shutil
 
 import os.path
 
@@ -20,7 +23,7 @@ from siliconcompiler.schema_support.option import OptionSchema
 from siliconcompiler.schema_support.dependencyschema import DependencySchema
 
 from siliconcompiler.utils.logging import SCColorLoggerFormatter, SCLoggerFormatter
-from siliconcompiler.utils.paths import jobdir
+from siliconcompiler.utils.paths import jobdir, historydir
 
 from siliconcompiler.project import SCColorLoggerFormatter as dut_sc_color_logger
 from siliconcompiler.scheduler import SCRuntimeError
@@ -235,6 +238,154 @@ def test_history_missing():
         Project().history("job0")
 
 
+def test_record_history_stored_in_historydir():
+    proj = Project("testname")
+    proj._record_history()
+
+    path, = glob.glob(os.path.join(historydir(proj), "job0-*.pkg.bin"))
+
+    proj._write_linked_manifest("test.json")
+    with open("test.json") as f:
+        manifest = json.load(f)
+    assert manifest["history"]["job0"]["__external__"] == os.path.relpath(path)
+    assert manifest["history"]["job0"]["__meta__"]["class"] == "siliconcompiler.project/Project"
+
+    # Manifests include the record
+    proj.write_manifest("test.json")
+    with open("test.json") as f:
+        manifest = json.load(f)
+    assert "__external__" not in manifest["history"]["job0"]
+    assert "jobname" in manifest["history"]["job0"]["option"]
+
+
+def test_record_history_rerun():
+    proj = Project("testname")
+    proj.set("option", "clean", True)
+    proj._record_history()
+    os.makedirs(jobdir(proj))
+    proj._write_linked_manifest(os.path.join(jobdir(proj), "first.pkg.json"))
+
+    proj.set("option", "clean", False)
+    proj._record_history()
+    assert len(glob.glob(os.path.join(historydir(proj), "job0-*.pkg.bin"))) == 2
+
+    # Earlier manifests still reference the earlier record
+    first = Project.from_manifest(os.path.join(jobdir(proj), "first.pkg.json"))
+    assert first.history("job0").get("option", "clean") is True
+    assert proj.history("job0").get("option", "clean") is False
+
+
+def test_remove_replaced_history():
+    proj = Project("testname")
+    os.makedirs(jobdir(proj))
+    manifest = os.path.join(jobdir(proj), "testname.pkg.json")
+
+    for clean in (True, False):
+        proj.set("option", "clean", clean)
+        proj._record_history()
+        proj._write_linked_manifest(manifest)
+        proj._remove_replaced_history()
+        assert len(glob.glob(os.path.join(historydir(proj), "job0-*.pkg.bin"))) == 1
+
+    assert Project.from_manifest(manifest).history("job0").get("option", "clean") is False
+
+
+def test_remove_replaced_history_referenced():
+    proj = Project("testname")
+    proj.set("option", "clean", True)
+    proj._record_history()
+
+    proj.set("option", "jobname", "job1")
+    proj._record_history()
+    os.makedirs(jobdir(proj))
+    job1_manifest = os.path.join(jobdir(proj), "testname.pkg.json")
+    proj._write_linked_manifest(job1_manifest)
+
+    proj.set("option", "jobname", "job0")
+    proj.set("option", "clean", False)
+    proj._record_history()
+    os.makedirs(jobdir(proj))
+    proj._write_linked_manifest(os.path.join(jobdir(proj), "testname.pkg.json"))
+    proj._remove_replaced_history()
+
+    # The manifest of job1 still references the earlier record of job0
+    assert len(glob.glob(os.path.join(historydir(proj), "job0-*.pkg.bin"))) == 2
+    assert len(glob.glob(os.path.join(historydir(proj), "job1-*.pkg.bin"))) == 1
+    job1 = Project.from_manifest(job1_manifest)
+    assert job1.history("job0").get("option", "clean") is True
+
+
+def test_remove_replaced_history_other_jobs():
+    proj = Project("testname")
+    proj.set("option", "jobname", "job0-1")
+    proj._record_history()
+    proj.set("option", "jobname", "job0")
+    proj._record_history()
+
+    proj._remove_replaced_history()
+    assert len(glob.glob(os.path.join(historydir(proj), "job0-1-*.pkg.bin"))) == 1
+
+
+def test_record_history_missing():
+    proj = Project("testname")
+    proj._record_history()
+    proj._write_linked_manifest("test.json")
+    shutil.rmtree(historydir(proj))
+
+    new_proj = Project.from_manifest("test.json")
+    assert new_proj.getkeys("history") == ("job0",)
+    with pytest.raises(FileNotFoundError, match=r"^\[history,job0\] is stored in "):
+        new_proj.history("job0")
+
+
+def test_record_history_read_lazily():
+    proj = Project("testname")
+    proj.set("option", "jobname", "job1")
+    proj._record_history()
+    proj._write_linked_manifest("test.json")
+
+    new_proj = Project.from_manifest("test.json")
+    assert new_proj.getkeys("history") == ("job1",)
+    assert new_proj.history("job1").name == "testname"
+    assert new_proj.history("job1").get("option", "jobname") == "job1"
+    assert new_proj.history("job1").logger is new_proj.logger
+
+    # Reading the record keeps the reference
+    new_proj._write_linked_manifest("test.json")
+    with open("test.json") as f:
+        assert "__external__" in json.load(f)["history"]["job1"]
+
+
+def test_record_history_modified():
+    proj = Project("testname")
+    proj._record_history()
+
+    proj.history("job0").set("option", "jobname", "modified")
+    proj._write_linked_manifest("test.json")
+    with open("test.json") as f:
+        manifest = json.load(f)
+    assert "__external__" not in manifest["history"]["job0"]
+
+    new_proj = Project.from_manifest("test.json")
+    assert new_proj.history("job0").get("option", "jobname") == "modified"
+
+
+def test_record_history_historydir_unwritable(monkeypatch, caplog):
+    proj = Project("testname")
+    monkeypatch.setattr(proj, "_Project__logger", logging.getLogger())
+    proj.logger.setLevel(logging.WARNING)
+
+    with open("build", "w") as f:
+        f.write("not a directory")
+
+    proj._record_history()
+    assert "Unable to store job job0 in the history directory" in caplog.text
+
+    proj.write_manifest("test.json")
+    new_proj = Project.from_manifest("test.json")
+    assert new_proj.history("job0").name == "testname"
+
+
 def test_add_fileset():
     design = Design("test")
     with design.active_fileset("rtl"):
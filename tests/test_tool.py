@@ -4,6 +4,7 @@ import logging
 import pathlib
 import pytest
 import os
+import sys
 import time
 
 import os.path
@@ -516,6 +517,70 @@ def test_get_exe_version_internal_error(running_node, monkeypatch, caplog):
     assert "builtin/nop failed to parse version string: myversion" in caplog.text
 
 
+def test_get_exe_version_cached(running_node, monkeypatch):
+    os.makedirs("bin")
+    exe = os.path.abspath(os.path.join("bin", "testexe"))
+
+    def write_exe(version):
+        with open(exe, "w") as f:
+            f.write(f"#!{sys.executable}\n")
+            f.write("with open(__file__ + '.count', 'a') as f:\n")
+            f.write("    f.write('x')\n")
+            f.write(f"print('{version}')\n")
+        os.chmod(exe, 0o755)
+
+    def get_count():
+        with open(f"{exe}.count") as f:
+            return len(f.read())
+
+    monkeypatch.setattr(running_node.task, 'parse_version', lambda stdout: stdout.strip())
+    monkeypatch.setenv("PATH", os.path.abspath("bin") + os.pathsep + os.environ["PATH"])
+
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'exe', 'testexe')
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'vswitch', '-version')
+
+    write_exe("1.0.0")
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "1.0.0"
+        assert runtool.get_exe_version() == "1.0.0"
+    assert get_count() == 1
+
+    # Executable changed
+    write_exe("10.0.0")
+    with running_node.task.runtime(running_node) as runtool:
+        assert runtool.get_exe_version() == "10.0.0"
+        assert runtool.get_exe_version() == "10.0.0"
+    assert get_count() == 2
+
+
+def test_get_exe_version_failed_not_cached(running_node, monkeypatch):
+    os.makedirs("bin")
+    exe = os.path.abspath(os.path.join("bin", "testexe"))
+    with open(exe, "w") as f:
+        f.write(f"#!{sys.executable}\n")
+        f.write("with open(__file__ + '.count', 'a') as f:\n")
+        f.write("    f.write('x')\n")
+        f.write("print('license unavailable')\n")
+        f.write("raise SystemExit(1)\n")
+    os.chmod(exe, 0o755)
+
+    def parse_version(stdout):
+        raise ValueError("no version")
+
+    monkeypatch.setattr(running_node.task, 'parse_version', parse_version)
+    monkeypatch.setenv("PATH", os.path.abspath("bin") + os.pathsep + os.environ["PATH"])
+
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'exe', 'testexe')
+    assert running_node.project.set('tool', 'builtin', 'task', 'nop', 'vswitch', '-version')
+
+    with running_node.task.runtime(running_node) as runtool:
+        for _ in range(2):
+            with pytest.raises(ValueError, match="^no version$"):
+                runtool.get_exe_version()
+    with open(f"{exe}.count") as f:
+        assert f.read() == "xx"
+
+
 def test_check_exe_version_not_set(running_node):
     with running_node.task.runtime(running_node) as runtool:
         assert runtool.check_exe_version(None) is True
@@ -383,6 +383,21 @@ def test_archive_archive_name(monkeypatch, caplog):
     assert os.path.isfile("test.tar.gz")
 
 
+def test_archive_archive_name_zstd(monkeypatch, caplog):
+    pytest.importorskip("zstandard")
+
+    proj = Project(Design("testdesign"))
+    monkeypatch.setattr(proj, "_Project__logger", logging.getLogger())
+    proj.logger.setLevel(logging.INFO)
+    proj._record_history()
+
+    archive(proj, archive_name="test.tar.zst")
+
+    assert "Creating archive test.tar.zst..." in caplog.text
+    with open("test.tar.zst", "rb") as f:
+        assert f.read(4) == b"\x28\xb5\x2f\xfd"
+
+
 def test_archive(monkeypatch, caplog):
     design = Design("testdesign")
     design.set_topmodule("top", fileset="test")
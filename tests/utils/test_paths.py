@@ -6,7 +6,8 @@ from pathlib import Path
 
 from siliconcompiler import Project, Design
 
-from siliconcompiler.utils.paths import cwdir, cwdirsafe, builddir, jobdir, workdir, collectiondir
+from siliconcompiler.utils.paths import cwdir, cwdirsafe, builddir, jobdir, workdir, \
+    collectiondir, historydir
 
 
 def test_cwdir():
@@ -95,3 +96,10 @@ def test_collectiondir():
 @pytest.mark.parametrize("arg", [None, Design(), "string"])
 def test_collectiondir_notproject(arg):
     assert collectiondir(arg) is None
+
+
+def test_historydir():
+    proj = Project("testname")
+    proj.set("option", "jobname", "job1")
+    assert historydir(proj) == \
+        os.path.abspath(os.path.join("build", "testname", "sc_history"))
@@ -0,0 +1,125 @@
+import os
+import pytest
+import tarfile
+
+from siliconcompiler.utils import tarball
+from siliconcompiler.utils.tarball import is_zstd, open_tarball
+
+
+def write_file(path, content="test"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.mark.parametrize("path,expect", [
+    ("test.tar.zst", True),
+    ("test.TZST", True),
+    ("test.tgz", False),
+    ("test.tar.gz", False),
+    ("test.zst", False)])
+def test_is_zstd(path, expect):
+    assert is_zstd(path) is expect
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError, match="^a is not a valid mode$"):
+        with open_tarball("test.tgz", "a"):
+            pass
+
+
+def test_gzip():
+    write_file("outputs/a.txt", "a")
+
+    with open_tarball("test.tgz", "w") as tar:
+        tar.add("outputs")
+
+    with tarfile.open("test.tgz", "r:gz") as tar:
+        assert sorted(tar.getnames()) == ["outputs", "outputs/a.txt"]
+
+
+@pytest.mark.parametrize("name", ["test.tar.zst", "test.tzst"])
+def test_zstd(name):
+    pytest.importorskip("zstandard")
+
+    write_file("outputs/a.txt", "a")
+    write_file("outputs/sub/b.txt", "b")
+
+    with open_tarball(name, "w") as tar:
+        tar.add("outputs")
+
+    with open(name, "rb") as f:
+        assert f.read(4) == b"\x28\xb5\x2f\xfd"
+
+    with open_tarball(name, "r") as tar:
+        tar.extractall(path="extract")
+
+    with open("extract/outputs/a.txt") as f:
+        assert f.read() == "a"
+    with open("extract/outputs/sub/b.txt") as f:
+        assert f.read() == "b"
+
+
+def test_zstd_multiple_frames():
+    zstandard = pytest.importorskip("zstandard")
+
+    write_file("outputs/a.txt", "a" * 100000)
+    write_file("outputs/b.txt", "b")
+
+    with tarfile.open("test.tar", "w") as tar:
+        tar.add("outputs")
+    with open("test.tar", "rb") as f:
+        data = f.read()
+    compressor = zstandard.ZstdCompressor()
+    with open("test.tar.zst", "wb") as f:
+        for start in range(0, len(data), 4096):
+            f.write(compressor.compress(data[start:start + 4096]))
+
+    with open_tarball("test.tar.zst", "r") as tar:
+        tar.extractall(path="extract")
+
+    with open("extract/outputs/a.txt") as f:
+        assert f.read() == "a" * 100000
+    with open("extract/outputs/b.txt") as f:
+        assert f.read() == "b"
+
+
+def test_read_detect():
+    pytest.importorskip("zstandard")
+
+    write_file("outputs/a.txt", "a")
+
+    with open_tarball("test.tar.zst", "w") as tar:
+        tar.add("outputs")
+    with open_tarball("test.tgz", "w") as tar:
+        tar.add("outputs")
+
+    # Compression is detected from the contents rather than the extension
+    os.rename("test.tar.zst", "zstd.tgz")
+    for name in ("zstd.tgz", "test.tgz"):
+        with open_tarball(name, "r") as tar:
+            assert sorted(member.name for member in tar) == ["outputs", "outputs/a.txt"]
+
+
+def test_zstd_not_available(monkeypatch):
+    monkeypatch.setattr(tarball, "_has_zstd", False)
+
+    with pytest.raises(RuntimeError, match=r"^zstd is not available to open test.tar.zst, "
+                                           r"install siliconcompiler\[zstd\]$"):
+        with open_tarball("test.tar.zst", "w"):
+            pass
+    assert not os.path.exists("test.tar.zst")
+
+
+def test_zstd_not_available_read(monkeypatch):
+    pytest.importorskip("zstandard")
+
+    write_file("outputs/a.txt", "a")
+    with open_tarball("test.tar.zst", "w") as tar:
+        tar.add("outputs")
+
+    monkeypatch.setattr(tarball, "_has_zstd", False)
+    with pytest.raises(RuntimeError, match=r"^zstd is not available to open test.tar.zst, "
+                                           r"install siliconcompiler\[zstd\]$"):
+        with open_tarball("test.tar.zst", "r"):
+            pass
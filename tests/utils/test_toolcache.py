@@ -0,0 +1,88 @@
+import os
+import pytest
+import stat
+import sys
+
+import os.path
+
+from siliconcompiler.utils.toolcache import ToolCache
+
+
+@pytest.fixture
+def fake_exe():
+    '''
+    Executable which prints its version and counts its invocations
+    '''
+    os.makedirs("bin")
+    path = os.path.abspath(os.path.join("bin", "fakeexe"))
+
+    def write(version):
+        with open(path, "w") as f:
+            f.write(f"#!{sys.executable}\n")
+            f.write("with open(__file__ + '.count', 'a') as f:\n")
+            f.write("    f.write('x')\n")
+            f.write(f"print('fakeexe {version}')\n")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+    write("1.0")
+    return path, write
+
+
+def get_count(path):
+    if not os.path.exists(f"{path}.count"):
+        return 0
+    with open(f"{path}.count") as f:
+        return len(f.read())
+
+
+def test_get_path():
+    assert ToolCache.get_path().endswith(os.path.join(".sc", "cache", "toolversions.db"))
+
+
+def test_which(fake_exe):
+    path, _ = fake_exe
+    assert ToolCache.which("fakeexe", os.path.abspath("bin")) == path
+    assert ToolCache.which("fakeexe", os.path.abspath("bin")) == path
+    assert ToolCache.which("missing", os.path.abspath("bin")) is None
+
+
+def test_which_removed(fake_exe):
+    path, _ = fake_exe
+    assert ToolCache.which("fakeexe", os.path.abspath("bin")) == path
+    os.remove(path)
+    assert ToolCache.which("fakeexe", os.path.abspath("bin")) is None
+
+
+def test_get_missing(fake_exe):
+    path, _ = fake_exe
+    cache = ToolCache("cache.db")
+    assert cache.get(path, ["-version"], {}) is None
+    assert cache.get("missing", ["-version"], {}) is None
+    assert not os.path.exists("cache.db")
+
+
+def test_set_get(fake_exe):
+    path, _ = fake_exe
+    cache = ToolCache("cache.db")
+    cache.set(path, ["-version"], {"PATH": "bin"}, 0, "fakeexe 1.0")
+    assert cache.get(path, ["-version"], {"PATH": "bin"}) == (0, "fakeexe 1.0")
+    assert cache.get(path, ["-v"], {"PATH": "bin"}) is None
+    assert cache.get(path, ["-version"], {"PATH": "other"}) is None
+
+
+def test_get_persisted(fake_exe):
+    path, _ = fake_exe
+    ToolCache("cache.db").set(path, ["-version"], {}, 1, "fakeexe 1.0")
+    ToolCache.clear()
+    assert ToolCache("cache.db").get(path, ["-version"], {}) == (1, "fakeexe 1.0")
+
+
+def test_get_executable_changed(fake_exe):
+    path, write = fake_exe
+    cache = ToolCache("cache.db")
+    cache.set(path, ["-version"], {}, 0, "fakeexe 1.0")
+
+    write("10.0")
+    assert cache.get(path, ["-version"], {}) is None
+    ToolCache.clear()
+    assert cache.get(path, ["-version"], {}) is None